@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from datetime import timedelta
+from dashboard.repositories.rollup_repository import RollupRepository
+
+class Command(BaseCommand):
+    help = 'Backfill or verify the daily order rollups used by the dashboard'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=None,
+            help='Only process the last N days (default: all history)'
+        )
+        parser.add_argument(
+            '--check',
+            action='store_true',
+            help='Only compare rollups with a live aggregate, do not rebuild'
+        )
+
+    def handle(self, *args, **options):
+        start_date = None
+        if options['days'] is not None:
+            start_date = timezone.localdate() - timedelta(days=options['days'])
+
+        if options['check']:
+            mismatches = RollupRepository.check_order_rollups(start_date=start_date)
+            for mismatch in mismatches:
+                self.stdout.write(self.style.WARNING(str(mismatch)))
+            if mismatches:
+                self.stdout.write(
+                    self.style.ERROR(f'{len(mismatches)} rollup mismatches found')
+                )
+            else:
+                self.stdout.write(self.style.SUCCESS('Order rollups are consistent'))
+            return
+
+        rows = RollupRepository.rebuild_order_rollups(start_date=start_date)
+        self.stdout.write(
+            self.style.SUCCESS(f'Successfully rebuilt {rows} order rollup rows')
+        )
@@ -0,0 +1,9 @@
+from .order_daily_rollup import OrderDailyRollup
+from .order_creator_daily_rollup import OrderCreatorDailyRollup
+from .product_sales_daily import ProductSalesDaily
+
+__all__ = [
+    'OrderDailyRollup',
+    'OrderCreatorDailyRollup',
+    'ProductSalesDaily'
+]
@@ -0,0 +1,31 @@
+from django.db import models
+
+class OrderCreatorDailyRollup(models.Model):
+    """
+    Pre-aggregated order totals per day for the user who created the orders.
+    """
+    date = models.DateField()
+    user = models.ForeignKey(
+        'users.User',
+        on_delete=models.CASCADE,
+        related_name='order_rollups'
+    )
+    order_count = models.IntegerField(default=0)
+    total_amount = models.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        default=0
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['date']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'date'],
+                name='unique_order_creator_daily_rollup'
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.date} {self.user_id}: {self.order_count}"
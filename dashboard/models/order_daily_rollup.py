@@ -0,0 +1,34 @@
+from django.db import models
+
+class OrderDailyRollup(models.Model):
+    """
+    Pre-aggregated order totals per day, status and payment status.
+
+    Each order contributes to exactly one row: the day of its last
+    update combined with its current status and payment status.
+    """
+    date = models.DateField()
+    status = models.CharField(max_length=50)
+    payment_status = models.CharField(max_length=50)
+    order_count = models.IntegerField(default=0)
+    total_amount = models.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        default=0
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['date']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['date', 'status', 'payment_status'],
+                name='unique_order_daily_rollup'
+            )
+        ]
+        indexes = [
+            models.Index(fields=['status', 'date']),
+        ]
+
+    def __str__(self):
+        return f"{self.date} {self.status}/{self.payment_status}: {self.order_count}"
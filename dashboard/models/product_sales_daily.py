@@ -0,0 +1,49 @@
+from django.db import models
+
+class ProductSalesDaily(models.Model):
+    """
+    Pre-aggregated units sold and revenue per inventory item, order day and
+    seller. Only orders in a counted status contribute.
+    """
+    date = models.DateField()
+    inventory_item = models.ForeignKey(
+        'inventories.InventoryItem',
+        on_delete=models.CASCADE,
+        related_name='daily_sales'
+    )
+    seller = models.ForeignKey(
+        'users.User',
+        on_delete=models.CASCADE,
+        related_name='product_sales',
+        null=True,
+        blank=True
+    )
+    quantity = models.BigIntegerField(default=0)
+    revenue = models.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        default=0
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['date']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['date', 'inventory_item', 'seller'],
+                condition=models.Q(seller__isnull=False),
+                name='unique_product_sales_daily_seller'
+            ),
+            models.UniqueConstraint(
+                fields=['date', 'inventory_item'],
+                condition=models.Q(seller__isnull=True),
+                name='unique_product_sales_daily_no_seller'
+            )
+        ]
+        indexes = [
+            models.Index(fields=['date', 'inventory_item']),
+            models.Index(fields=['seller', 'date']),
+        ]
+
+    def __str__(self):
+        return f"{self.date} {self.inventory_item_id}: {self.quantity}"
@@ -4,15 +4,24 @@ from datetime import datetime, timedelta
 from users.models.user import User
 from inventories.models.inventory_item import InventoryItem
 from orders.models.order import Order
-from orders.models.order_item import OrderItem
 from products.models import (
     DairyProduction,
     DairyInventory
 )
 from users.models.user_activity_log import UserActivityLog
-from notifications.models.notification import Notification
+from notifications.repositories.notification_repository import NotificationRepository
 from django.db import connection
+from django.conf import settings
+from utils.request_metrics import request_metrics
+from search.metrics import search_metrics
 from ..serializers.activity_log_serializer import UserActivityLogSerializer
+from .rollup_repository import RollupRepository
+from .metric_batch import MetricBatch
+from .health_repository import HealthRepository
+from .product_sales_repository import ProductSalesRepository
+from inventories.repositories.inventory_summary_repository import InventorySummaryRepository
+from reports.repositories.report_repository import ReportRepository
+from dashboard.models import OrderDailyRollup
 from notifications.serializers.notification_serializer import NotificationSerializer
 from exceptions import RepositoryException
 from utils import setup_logger
@@ -22,16 +31,20 @@ logger = setup_logger(__name__)
 class DashboardRepository:
     @staticmethod
     def get_user_notifications(user_id):
-        """Get notifications for a specific user"""
+        """Get the latest notifications and maintained counts for a user"""
         try:
-            notifications = Notification.objects.filter(
-                user_id=user_id
-            ).order_by('-created_at')
-            serializer = NotificationSerializer(notifications, many=True)
-            return serializer.data
-        except RepositoryException as e:
+            notifications, next_cursor = NotificationRepository.get_feed(
+                user_id,
+                limit=getattr(settings, 'DASHBOARD_NOTIFICATION_LIMIT', 5)
+            )
+            return {
+                'latest': NotificationSerializer(notifications, many=True).data,
+                'next_cursor': next_cursor,
+                **NotificationRepository.get_counts(user_id)
+            }
+        except Exception as e:
             logger.error(f"Repository: Error fetching notifications: {str(e)}")
-            []
+            raise RepositoryException(f"Error fetching notifications: {str(e)}")
     
     @staticmethod
     def get_time_range_filter(time_range):
@@ -56,23 +69,131 @@ class DashboardRepository:
             logger.error(f"Repository: Error fetching recent activities: {str(e)}")
             return []
 
+    # Batched Metrics
+    ORDER_METRICS = (
+        'total_orders',
+        'pending_orders',
+        'order_status_distribution',
+        'total_revenue'
+    )
+    INVENTORY_METRICS = (
+        'total_items',
+        'stock_value',
+        'low_stock_count'
+    )
+    USER_METRICS = (
+        'total_users',
+        'active_users'
+    )
+
+    @staticmethod
+    def get_order_metrics(time_range, metrics=ORDER_METRICS):
+        """
+        Get order metrics in a single query over the daily rollups.
+
+        Every order sits in exactly one rollup bucket, so all-time figures
+        such as pending orders are sums over all dates.
+        """
+        start_date = timezone.localdate(
+            DashboardRepository.get_time_range_filter(time_range)
+        )
+        in_range = Q(date__gte=start_date)
+        batch = MetricBatch()
+        if 'total_orders' in metrics:
+            batch.sum('total_orders', OrderDailyRollup, 'order_count', in_range)
+        if 'pending_orders' in metrics:
+            batch.sum(
+                'pending_orders',
+                OrderDailyRollup,
+                'order_count',
+                Q(status='pending')
+            )
+        if 'total_revenue' in metrics:
+            batch.sum(
+                'total_revenue',
+                OrderDailyRollup,
+                'total_amount',
+                in_range & Q(status='delivered')
+            )
+        if 'order_status_distribution' in metrics:
+            batch.distribution(
+                'order_status_distribution',
+                OrderDailyRollup,
+                'status',
+                [value for value, _ in Order.STATUS_CHOICES],
+                aggregate=lambda condition: Sum('order_count', filter=condition)
+            )
+        return batch.execute()
+
+    @staticmethod
+    def get_inventory_metrics(metrics=INVENTORY_METRICS):
+        """Get inventory aggregates from the running summary totals"""
+        totals = InventorySummaryRepository.get_totals()
+        results = {}
+        if 'total_items' in metrics:
+            results['total_items'] = {
+                'count': totals['item_count'],
+                'total_quantity': float(totals['total_quantity'])
+            }
+        if 'stock_value' in metrics:
+            results['stock_value'] = float(totals['total_value'])
+        if 'low_stock_count' in metrics:
+            results['low_stock_count'] = totals['low_stock_count']
+        return results
+
+    @staticmethod
+    def get_inventory_breakdown():
+        """Get stock totals per dairy type and storage condition"""
+        return [
+            {
+                **row,
+                'total_quantity': float(row['total_quantity']),
+                'total_value': float(row['total_value'])
+            }
+            for row in InventorySummaryRepository.get_breakdown()
+        ]
+
+    @staticmethod
+    def get_report_storage():
+        """Get stored report file totals with the retention and quota settings"""
+        storage = ReportRepository().get_storage_metrics()
+        for row in storage['top_users']:
+            row['generated_by_id'] = str(row['generated_by_id'])
+        return {
+            **storage,
+            'compression_ratio': round(
+                storage['stored_bytes'] / storage['content_bytes'], 3
+            ) if storage['content_bytes'] else None,
+            'retention_days': getattr(settings, 'REPORT_RETENTION_DAYS', 30),
+            'user_quota_bytes': getattr(settings, 'REPORT_USER_QUOTA_BYTES', 0)
+        }
+
+    @staticmethod
+    def get_user_metrics(metrics=USER_METRICS):
+        """Get user counts in a single query"""
+        batch = MetricBatch()
+        if 'total_users' in metrics:
+            batch.count('total_users', User)
+        if 'active_users' in metrics:
+            batch.count(
+                'active_users',
+                User,
+                Q(last_login__gte=timezone.now() - timedelta(days=30))
+            )
+        return batch.execute()
+
     # Inventory Methods
     @staticmethod
     def get_total_inventory_items():
         """Get total inventory items count and quantity"""
-        result = InventoryItem.objects.aggregate(
-            total_items=Count('id'),
-            total_quantity=Sum('quantity')
-        )
-        return {
-            'count': result.get('total_items') or 0,
-            'total_quantity': float(result.get('total_quantity') or 0)
-        }
+        return DashboardRepository.get_inventory_metrics(('total_items',))['total_items']
 
     @staticmethod
     def get_low_stock_items():
-        """Get items with quantity below reorder point"""
+        """Get active items with quantity below reorder point"""
+        # Matches the low_stock_count kept in InventorySummary
         items = InventoryItem.objects.filter(
+            is_active=True,
             quantity__lte=F('reorder_point')
         ).values('id', 'name', 'quantity', 'reorder_point')
         return list(items)
@@ -80,10 +201,7 @@ class DashboardRepository:
     @staticmethod
     def get_total_stock_value():
         """Get total value of current inventory"""
-        result = InventoryItem.objects.aggregate(
-            total_value=Sum(F('quantity') * F('price'))
-        )
-        return float(result.get('total_value') or 0)
+        return DashboardRepository.get_inventory_metrics(('stock_value',))['stock_value']
 
     @staticmethod
     def get_expiring_stock():
@@ -103,9 +221,7 @@ class DashboardRepository:
     def get_total_orders(time_range):
         """Get total orders within time range"""
         start_date = DashboardRepository.get_time_range_filter(time_range)
-        return Order.objects.filter(
-            updated_at__gte=start_date
-        ).count()
+        return RollupRepository.get_order_count(timezone.localdate(start_date))
 
     @staticmethod
     def get_pending_orders():
@@ -126,33 +242,23 @@ class DashboardRepository:
     def get_total_revenue(time_range):
         """Get total revenue within time range"""
         start_date = DashboardRepository.get_time_range_filter(time_range)
-        result = Order.objects.filter(
-            updated_at__gte=start_date,
-            status='delivered'
-        ).aggregate(
-            total_revenue=Sum('total_amount')
-        )
-        return result.get('total_revenue') or 0
+        return RollupRepository.get_revenue(timezone.localdate(start_date))
 
     # User Performance Methods
     @staticmethod
     def get_user_sales(user_id, time_range):
         start_date = DashboardRepository.get_time_range_filter(time_range)
-        return Order.objects.filter(
-            created_by_id=user_id,
-            updated_at__gte=start_date
-        ).values('updated_at__date').annotate(
-            daily_sales=Count('id'),
-            daily_revenue=Sum('total_amount')
-        ).order_by('updated_at__date')
+        return RollupRepository.get_user_sales(
+            user_id,
+            timezone.localdate(start_date)
+        )
 
     @staticmethod
     def get_user_popular_products(user_id):
-        return OrderItem.objects.filter(
-            order__created_by_id=user_id
-        ).values('product__name').annotate(
-            total_quantity=Sum('quantity')
-        ).order_by('-total_quantity')[:10]
+        return ProductSalesRepository.get_top_products(
+            seller_id=user_id,
+            order_by='quantity'
+        )
 
     @staticmethod
     def get_user_revenue_summary(user_id, time_range):
@@ -179,29 +285,27 @@ class DashboardRepository:
     @staticmethod
     def get_revenue_trends(time_range):
         start_date = DashboardRepository.get_time_range_filter(time_range)
-        return Order.objects.filter(
-            updated_at__gte=start_date,
-            status='delivered'
-        ).values('updated_at__date').annotate(
-            daily_revenue=Sum('total_amount')
-        ).order_by('updated_at__date')
+        return RollupRepository.get_revenue_trends(timezone.localdate(start_date))
 
     @staticmethod
-    def get_top_products(time_range):
+    def get_top_products(time_range, seller_id=None):
         start_date = DashboardRepository.get_time_range_filter(time_range)
-        return OrderItem.objects.filter(
-            order__updated_at__gte=start_date
-        ).values('product__name').annotate(
-            total_quantity=Sum('quantity'),
-            total_revenue=Sum(F('quantity') * F('price'))
-        ).order_by('-total_revenue')[:10]
+        return ProductSalesRepository.get_top_products(
+            timezone.localdate(start_date),
+            seller_id=seller_id
+        )
 
     @staticmethod
     def get_system_health():
+        """Get the last scheduled health probe results from the cache"""
+        health = HealthRepository.get_cached_health()
+        components = health['components']
         return {
-            'system_status': 'healthy',
-            'database_status': 'connected',
-            'cache_status': 'operational'
+            'system_status': health['system_status'],
+            'database_status': components.get('database', {}).get('status', 'unknown'),
+            'cache_status': components.get('cache', {}).get('status', 'unknown'),
+            'checked_at': health['checked_at'],
+            'components': components
         }
 
     @staticmethod
@@ -217,13 +321,6 @@ class DashboardRepository:
     def get_active_shops_count():
         return User.objects.filter(role='shop_owner', is_active=True).count()
 
-    @staticmethod
-    def get_expiring_stock():
-        thirty_days_from_now = timezone.now() + timedelta(days=30)
-        return InventoryItem.objects.filter(
-            expiry_date__lte=thirty_days_from_now
-        ).select_related('product')
-
     @staticmethod
     def get_stock_movements(time_range):
         start_date = DashboardRepository.get_time_range_filter(time_range)
@@ -233,11 +330,10 @@ class DashboardRepository:
 
     @staticmethod
     def get_top_moving_items():
-        return OrderItem.objects.values(
-            'product__name'
-        ).annotate(
-            total_movement=Sum('quantity')
-        ).order_by('-total_movement')[:10]
+        return [
+            {**row, 'total_movement': row['total_quantity']}
+            for row in ProductSalesRepository.get_top_products(order_by='quantity')
+        ]
 
     @staticmethod
     def get_stock_alerts():
@@ -259,11 +355,11 @@ class DashboardRepository:
 
     @staticmethod
     def get_shop_popular_products(shop_owner_id):
-        return OrderItem.objects.filter(
-            order__shop_owner_id=shop_owner_id
-        ).values('product__name').annotate(
-            total_quantity=Sum('quantity')
-        ).order_by('-total_quantity')[:10]
+        # Orders carry no shop owner; the creating user is the seller
+        return ProductSalesRepository.get_top_products(
+            seller_id=shop_owner_id,
+            order_by='quantity'
+        )
 
     @staticmethod
     def get_customer_satisfaction(shop_owner_id):
@@ -355,21 +451,71 @@ class DashboardRepository:
         ).order_by('-count')
 
     @staticmethod
-    def get_api_performance_metrics():
-        """Get API performance metrics"""
-        return {
-            'average_response_time': '120ms',
-            'error_rate': '0.1%',
-            'uptime': '99.9%'
-        }
+    def get_api_performance_metrics(windows=None):
+        """Get request latency percentiles and throughput per sliding window"""
+        windows = windows or settings.REQUEST_METRICS_WINDOWS
+        summaries = {}
+        for minutes in windows:
+            summary = request_metrics.summarize(minutes)
+            routes = summary.pop('routes')
+            summary['slowest_routes'] = sorted(
+                (
+                    {'route': route, **stats}
+                    for route, stats in routes.items()
+                ),
+                key=lambda item: item['p95_ms'] or 0,
+                reverse=True
+            )[:10]
+            summaries[f'{minutes}m'] = summary
+        return summaries
+
+    @staticmethod
+    def get_search_metrics(minutes=60):
+        """Get search counts and latency per query path over a sliding window"""
+        paths = search_metrics.summarize(minutes)['routes']
+        return sorted(
+            (
+                {
+                    'path': path,
+                    'searches': stats['requests'],
+                    'average_ms': stats['average_ms'],
+                    'p95_ms': stats['p95_ms']
+                }
+                for path, stats in paths.items()
+            ),
+            key=lambda item: item['searches'],
+            reverse=True
+        )
 
     @staticmethod
-    def get_error_rates():
-        """Get system error rates"""
+    def get_error_rates(minutes=60):
+        """Get per-route error rates over a sliding window"""
+        routes = request_metrics.summarize(minutes)['routes']
+
+        def ranked(key, count_of):
+            rows = [
+                {
+                    'route': route,
+                    'count': count_of(stats),
+                    'rate': stats[key] if key else round(
+                        count_of(stats) / stats['requests'], 4
+                    )
+                }
+                for route, stats in routes.items()
+                if count_of(stats)
+            ]
+            return sorted(rows, key=lambda row: row['count'], reverse=True)
+
         return {
-            'api_errors': [],
-            'system_errors': [],
-            'user_errors': []
+            'api_errors': ranked(
+                'server_error_rate',
+                lambda stats: stats['status_classes'].get('5xx', 0)
+            ),
+            'system_errors': ranked(None, lambda stats: stats['exceptions']),
+            'user_errors': ranked(
+                'client_error_rate',
+                lambda stats: stats['status_classes'].get('4xx', 0)
+            )
         }
 
     @staticmethod
@@ -0,0 +1,223 @@
+import asyncio
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+from threading import Lock
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.conf import settings
+from django.core.cache import cache
+from django.db import close_old_connections, connection
+from django.utils import timezone
+from dfi.celery import app as celery_app
+from utils import setup_logger
+
+logger = setup_logger(__name__)
+
+UP = 'up'
+DEGRADED = 'degraded'
+DOWN = 'down'
+UNKNOWN = 'unknown'
+
+_executor = None
+_executor_lock = Lock()
+
+def get_executor():
+    """Pool of its own, so hung probes never take dashboard section workers"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='health-probe')
+        return _executor
+
+class HealthRepository:
+    """
+    Probes backing services and caches the results.
+
+    Probes are run by a scheduled task; dashboard reads only look at the
+    cached result so a slow dependency never delays a request.
+    """
+    STATUS_KEY = 'health:status'
+    HEARTBEAT_KEY = 'health:worker_heartbeat'
+
+    @staticmethod
+    def _timeout():
+        return getattr(settings, 'HEALTH_PROBE_TIMEOUT', 2.0)
+
+    @staticmethod
+    def _timed(name, probe):
+        # Failures are logged, never returned: readiness is public
+        started = time.perf_counter()
+        try:
+            result = probe() or {}
+            status = result.pop('status', UP)
+        except Exception as e:
+            logger.error(f"Health probe {name} failed: {type(e).__name__}: {str(e)}")
+            result, status = {}, DOWN
+        return {
+            'status': status,
+            'latency_ms': round((time.perf_counter() - started) * 1000, 2),
+            **result
+        }
+
+    @staticmethod
+    def _with_deadline(probe):
+        """Run a probe on a worker thread, failing it after HEALTH_PROBE_TIMEOUT"""
+        def run():
+            close_old_connections()
+            try:
+                return probe()
+            finally:
+                close_old_connections()
+
+        def bounded():
+            timeout = HealthRepository._timeout()
+            try:
+                return get_executor().submit(run).result(timeout=timeout)
+            except TimeoutError:
+                raise TimeoutError(f"No answer within {timeout}s")
+        return bounded
+
+    # Probes
+    @staticmethod
+    def probe_database():
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT 1')
+            cursor.fetchone()
+
+    @staticmethod
+    def probe_cache():
+        key = f'health:probe:{uuid.uuid4().hex}'
+        cache.set(key, 1, 10)
+        if cache.get(key) != 1:
+            raise RuntimeError('Cache read did not return the written value')
+        cache.delete(key)
+
+    @staticmethod
+    def probe_broker():
+        timeout = HealthRepository._timeout()
+        with celery_app.connection_for_read() as conn:
+            conn.ensure_connection(max_retries=1, timeout=timeout)
+            queues = {}
+            for queue in getattr(settings, 'HEALTH_MONITORED_QUEUES', ['celery']):
+                declared = conn.default_channel.queue_declare(queue=queue, passive=True)
+                queues[queue] = declared.message_count
+
+        max_depth = getattr(settings, 'HEALTH_MAX_QUEUE_DEPTH', 1000)
+        return {
+            'status': DEGRADED if any(d > max_depth for d in queues.values()) else UP,
+            'queue_depth': queues
+        }
+
+    @staticmethod
+    def probe_result_backend():
+        backend = celery_app.backend
+        client = getattr(backend, 'client', None)
+        if client is None or not hasattr(client, 'ping'):
+            return {'status': UNKNOWN}
+        client.ping()
+
+    @staticmethod
+    def probe_channel_layer():
+        layer = get_channel_layer()
+        if layer is None:
+            return {'status': UNKNOWN}
+
+        async def round_trip():
+            channel = await layer.new_channel()
+            await layer.send(channel, {'type': 'health.probe'})
+            return await asyncio.wait_for(
+                layer.receive(channel),
+                HealthRepository._timeout()
+            )
+
+        async_to_sync(round_trip)()
+
+    @staticmethod
+    def probe_worker_heartbeat():
+        beat = cache.get(HealthRepository.HEARTBEAT_KEY)
+        if beat is None:
+            return {'status': DOWN, 'heartbeat_age_seconds': None}
+        age = round(time.time() - beat, 1)
+        max_age = getattr(settings, 'HEALTH_HEARTBEAT_MAX_AGE', 180)
+        return {
+            'status': UP if age <= max_age else DOWN,
+            'heartbeat_age_seconds': age
+        }
+
+    @staticmethod
+    def record_worker_heartbeat():
+        cache.set(HealthRepository.HEARTBEAT_KEY, time.time(), None)
+
+    PROBES = {
+        'database': 'probe_database',
+        'cache': 'probe_cache',
+        'broker': 'probe_broker',
+        'result_backend': 'probe_result_backend',
+        'channel_layer': 'probe_channel_layer',
+        'workers': 'probe_worker_heartbeat',
+    }
+
+    # Essential components take the overall status down, the rest degrade it
+    ESSENTIAL = ('database', 'cache')
+
+    @staticmethod
+    def run_probes():
+        """Run every probe, cache and return the combined result"""
+        components = {
+            name: HealthRepository._timed(name, getattr(HealthRepository, probe))
+            for name, probe in HealthRepository.PROBES.items()
+        }
+
+        if any(components[name]['status'] == DOWN for name in HealthRepository.ESSENTIAL):
+            overall = 'unhealthy'
+        elif any(c['status'] in (DOWN, DEGRADED) for c in components.values()):
+            overall = 'degraded'
+        else:
+            overall = 'healthy'
+
+        result = {
+            'system_status': overall,
+            'checked_at': timezone.now().isoformat(),
+            'components': components
+        }
+        try:
+            cache.set(
+                HealthRepository.STATUS_KEY,
+                result,
+                getattr(settings, 'HEALTH_STATUS_TTL', 300)
+            )
+        except Exception as e:
+            logger.error(f"Error caching health probe results: {str(e)}")
+        return result
+
+    @staticmethod
+    def get_cached_health():
+        """Get the last probe results without touching any dependency"""
+        try:
+            result = cache.get(HealthRepository.STATUS_KEY)
+        except Exception as e:
+            logger.error(f"Error reading cached health: {str(e)}")
+            result = None
+
+        if result is None:
+            return {
+                'system_status': UNKNOWN,
+                'checked_at': None,
+                'components': {}
+            }
+        return result
+
+    @staticmethod
+    def check_readiness():
+        """Fast live check of the dependencies needed to serve requests"""
+        # A hung connection must not hold the load balancer's request
+        components = {
+            'database': HealthRepository._timed(
+                'database',
+                HealthRepository._with_deadline(HealthRepository.probe_database)
+            ),
+            'cache': HealthRepository._timed('cache', HealthRepository.probe_cache)
+        }
+        ready = all(c['status'] == UP for c in components.values())
+        return ready, components
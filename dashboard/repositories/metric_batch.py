@@ -0,0 +1,86 @@
+from django.db.models import Count, Sum, Q
+from utils import setup_logger
+
+logger = setup_logger(__name__)
+
+class MetricBatch:
+    """
+    Collects aggregate metrics and resolves them with one query per source.
+
+    Metrics are registered against a source (a model or a queryset) as
+    filtered aggregates. `execute()` compiles all metrics of a source into a
+    single `aggregate()` call, so adding metrics never adds queries.
+
+        batch = MetricBatch()
+        batch.count('pending', Order, Q(status='pending'))
+        batch.sum('revenue', Order, 'total_amount', Q(status='delivered'))
+        results = batch.execute()
+    """
+
+    def __init__(self):
+        self._sources = {}
+        self._metrics = {}
+        self._distributions = {}
+        self._aliases = 0
+
+    def _next_alias(self):
+        self._aliases += 1
+        return f"metric_{self._aliases}"
+
+    def _source_aggregates(self, source):
+        return self._sources.setdefault(source, {})
+
+    def add(self, name, source, aggregate, default=0):
+        """Register any aggregate expression under `name`"""
+        if name in self._metrics or name in self._distributions:
+            raise ValueError(f"Metric {name} is already registered")
+        aggregates = self._source_aggregates(source)
+        alias = self._next_alias()
+        aggregates[alias] = aggregate
+        self._metrics[name] = (source, alias, default)
+        return self
+
+    def count(self, name, source, filter=None, field='pk'):
+        return self.add(name, source, Count(field, filter=filter))
+
+    def sum(self, name, source, expression, filter=None):
+        return self.add(name, source, Sum(expression, filter=filter))
+
+    def distribution(self, name, source, field, values, aggregate=None):
+        """
+        Register a breakdown of `source` by the given values of `field`.
+
+        Resolves to a list of `{field: value, 'count': n}` for values with a
+        non-zero count, ordered by value, like a `values().annotate()`.
+        """
+        if name in self._metrics or name in self._distributions:
+            raise ValueError(f"Metric {name} is already registered")
+        aggregate = aggregate or (lambda condition: Count('pk', filter=condition))
+        aggregates = self._source_aggregates(source)
+        aliases = []
+        for value in values:
+            alias = self._next_alias()
+            aggregates[alias] = aggregate(Q(**{field: value}))
+            aliases.append((value, alias))
+        self._distributions[name] = (source, field, aliases)
+        return self
+
+    def execute(self):
+        """Run one aggregate query per source and map results back to names"""
+        rows = {}
+        for source, aggregates in self._sources.items():
+            queryset = source if hasattr(source, 'aggregate') else source.objects
+            rows[source] = queryset.aggregate(**aggregates)
+
+        results = {}
+        for name, (source, alias, default) in self._metrics.items():
+            value = rows[source].get(alias)
+            results[name] = default if value is None else value
+
+        for name, (source, field, aliases) in self._distributions.items():
+            results[name] = [
+                {field: value, 'count': rows[source].get(alias) or 0}
+                for value, alias in sorted(aliases, key=lambda item: str(item[0]))
+                if rows[source].get(alias)
+            ]
+        return results
@@ -0,0 +1,252 @@
+from datetime import timedelta
+from django.db import transaction, IntegrityError
+from django.db.models import Sum, F
+from django.utils import timezone
+from orders.models import Order, OrderItem
+from dashboard.models import ProductSalesDaily
+from utils import setup_logger
+
+logger = setup_logger(__name__)
+
+class ProductSalesRepository:
+    """
+    Maintains and reads the per-day product sales counters.
+
+    An order item counts towards the day its order was placed, for the user
+    who created the order, while the order is in a counted status.
+    """
+    EXCLUDED_STATUSES = ('draft', 'cancelled', 'returned')
+    ITEM_FIELDS = ('order_id', 'inventory_item_id', 'quantity', 'total_price')
+    DEFAULT_WINDOW_DAYS = 30
+
+    @staticmethod
+    def is_counted(status):
+        return status not in ProductSalesRepository.EXCLUDED_STATUSES
+
+    # Incremental maintenance
+    @staticmethod
+    def get_item_snapshot(item_id):
+        """Get the persisted sales-relevant state of an order item"""
+        return OrderItem.objects.filter(pk=item_id)\
+            .values(*ProductSalesRepository.ITEM_FIELDS).first()
+
+    @staticmethod
+    def snapshot_from_item(item):
+        return {
+            field: getattr(item, field)
+            for field in ProductSalesRepository.ITEM_FIELDS
+        }
+
+    @staticmethod
+    def _order_state(order_id):
+        return Order.objects.filter(pk=order_id)\
+            .values('order_date', 'status', 'created_by_id').first()
+
+    @staticmethod
+    def apply_item_change(old, new):
+        """Move an order item's contribution after it was written or deleted"""
+        if old == new:
+            return
+        try:
+            with transaction.atomic():
+                for snapshot, sign in ((old, -1), (new, 1)):
+                    if not snapshot:
+                        continue
+                    order = ProductSalesRepository._order_state(snapshot['order_id'])
+                    if order and ProductSalesRepository.is_counted(order['status']):
+                        ProductSalesRepository._apply(
+                            timezone.localdate(order['order_date']),
+                            order['created_by_id'],
+                            [snapshot],
+                            sign
+                        )
+        except Exception as e:
+            # Drift is corrected by the reconciliation task
+            logger.error(f"Repository: Error applying product sales change: {str(e)}")
+
+    @staticmethod
+    def apply_order_change(order, old):
+        """Add or remove all items of an order when its counted state changes"""
+        if old is None:
+            # New orders have no items yet; items add themselves
+            return
+
+        was_counted = ProductSalesRepository.is_counted(old['status'])
+        is_counted = ProductSalesRepository.is_counted(order.status)
+        if was_counted == is_counted and (
+            not is_counted or old['created_by_id'] == order.created_by_id
+        ):
+            return
+
+        try:
+            with transaction.atomic():
+                items = list(
+                    OrderItem.objects.filter(order_id=order.pk)
+                    .values(*ProductSalesRepository.ITEM_FIELDS)
+                )
+                day = timezone.localdate(order.order_date)
+                if was_counted:
+                    ProductSalesRepository._apply(day, old['created_by_id'], items, -1)
+                if is_counted:
+                    ProductSalesRepository._apply(day, order.created_by_id, items, 1)
+        except Exception as e:
+            logger.error(f"Repository: Error applying order sales change: {str(e)}")
+
+    @staticmethod
+    def _apply(day, seller_id, items, sign):
+        for item in items:
+            lookup = {
+                'date': day,
+                'inventory_item_id': item['inventory_item_id'],
+                'seller_id': seller_id
+            }
+            quantity = item['quantity'] * sign
+            revenue = (item['total_price'] or 0) * sign
+
+            updated = ProductSalesDaily.objects.filter(**lookup).update(
+                quantity=F('quantity') + quantity,
+                revenue=F('revenue') + revenue
+            )
+            if updated:
+                continue
+            if sign < 0:
+                logger.warning(f"Repository: Missing ProductSalesDaily row for {lookup}")
+                continue
+            try:
+                with transaction.atomic():
+                    ProductSalesDaily.objects.create(
+                        quantity=quantity,
+                        revenue=revenue,
+                        **lookup
+                    )
+            except IntegrityError:
+                # Created concurrently by another writer
+                ProductSalesDaily.objects.filter(**lookup).update(
+                    quantity=F('quantity') + quantity,
+                    revenue=F('revenue') + revenue
+                )
+
+    # Backfill and consistency
+    @staticmethod
+    def _live_buckets(start_date=None, end_date=None):
+        queryset = OrderItem.objects.exclude(
+            order__status__in=ProductSalesRepository.EXCLUDED_STATUSES
+        )
+        if start_date:
+            queryset = queryset.filter(order__order_date__date__gte=start_date)
+        if end_date:
+            queryset = queryset.filter(order__order_date__date__lte=end_date)
+
+        rows = queryset.values(
+            'order__order_date__date',
+            'inventory_item_id',
+            'order__created_by_id'
+        ).annotate(
+            total_quantity=Sum('quantity'),
+            total_revenue=Sum('total_price')
+        ).order_by()
+        return {
+            (
+                row['order__order_date__date'],
+                row['inventory_item_id'],
+                row['order__created_by_id']
+            ): (row['total_quantity'], row['total_revenue'] or 0)
+            for row in rows
+        }
+
+    @staticmethod
+    def _stored(start_date=None, end_date=None):
+        queryset = ProductSalesDaily.objects.all()
+        if start_date:
+            queryset = queryset.filter(date__gte=start_date)
+        if end_date:
+            queryset = queryset.filter(date__lte=end_date)
+        return queryset
+
+    @staticmethod
+    def rebuild(start_date=None, end_date=None):
+        """Recompute counters for a date range (all dates when omitted)"""
+        buckets = ProductSalesRepository._live_buckets(start_date, end_date)
+        with transaction.atomic():
+            ProductSalesRepository._stored(start_date, end_date).delete()
+            ProductSalesDaily.objects.bulk_create([
+                ProductSalesDaily(
+                    date=day,
+                    inventory_item_id=item_id,
+                    seller_id=seller_id,
+                    quantity=quantity,
+                    revenue=revenue
+                )
+                for (day, item_id, seller_id), (quantity, revenue) in buckets.items()
+            ], batch_size=1000)
+
+        logger.info(f"Rebuilt {len(buckets)} product sales rows")
+        return len(buckets)
+
+    @staticmethod
+    def check(start_date=None, end_date=None):
+        """Compare counters with a live aggregate and return the mismatches"""
+        live = ProductSalesRepository._live_buckets(start_date, end_date)
+        stored = {
+            (row.date, row.inventory_item_id, row.seller_id): (row.quantity, row.revenue)
+            for row in ProductSalesRepository._stored(start_date, end_date)
+        }
+
+        mismatches = []
+        for key in set(live) | set(stored):
+            live_quantity, live_revenue = live.get(key, (0, 0))
+            stored_quantity, stored_revenue = stored.get(key, (0, 0))
+            if live_quantity != stored_quantity or live_revenue != stored_revenue:
+                mismatches.append({
+                    'key': key,
+                    'expected_quantity': live_quantity,
+                    'actual_quantity': stored_quantity,
+                    'expected_revenue': live_revenue,
+                    'actual_revenue': stored_revenue
+                })
+        return mismatches
+
+    # Reads
+    @staticmethod
+    def get_top_products(start_date=None, seller_id=None, order_by='revenue', limit=10):
+        """
+        Get the top inventory items over a bounded window of daily rows.
+
+        `start_date` defaults to the last DEFAULT_WINDOW_DAYS days.
+        """
+        if start_date is None:
+            start_date = timezone.localdate() - timedelta(
+                days=ProductSalesRepository.DEFAULT_WINDOW_DAYS
+            )
+        queryset = ProductSalesDaily.objects.filter(date__gte=start_date)
+        if seller_id is not None:
+            queryset = queryset.filter(seller_id=seller_id)
+
+        sort_field = 'total_revenue' if order_by == 'revenue' else 'total_quantity'
+        rows = queryset.values(
+            'inventory_item_id',
+            'inventory_item__name'
+        ).annotate(
+            total_quantity=Sum('quantity'),
+            total_revenue=Sum('revenue')
+        ).filter(
+            total_quantity__gt=0
+        ).order_by(f'-{sort_field}', 'inventory_item__name')[:limit]
+        return list(rows)
+
+    @staticmethod
+    def get_seller_breakdown(inventory_item_id, start_date=None):
+        """Get sales of one inventory item per seller"""
+        if start_date is None:
+            start_date = timezone.localdate() - timedelta(
+                days=ProductSalesRepository.DEFAULT_WINDOW_DAYS
+            )
+        return list(
+            ProductSalesDaily.objects.filter(
+                inventory_item_id=inventory_item_id,
+                date__gte=start_date
+            ).values('seller_id').annotate(
+                total_quantity=Sum('quantity'),
+                total_revenue=Sum('revenue')
+            ).order_by('-total_revenue')
+        )
@@ -0,0 +1,286 @@
+from django.db import transaction, IntegrityError
+from django.db.models import Sum, Count, F
+from django.utils import timezone
+from orders.models import Order
+from dashboard.models import OrderDailyRollup, OrderCreatorDailyRollup
+from utils import setup_logger
+
+logger = setup_logger(__name__)
+
+class RollupRepository:
+    """
+    Maintains and reads the daily order rollups.
+
+    Rollups are bucketed by the date of an order's last update so that
+    reads return the same figures as the `updated_at__gte` queries they
+    replace, at day granularity.
+    """
+    ORDER_FIELDS = (
+        'updated_at',
+        'status',
+        'payment_status',
+        'total_amount',
+        'created_by_id'
+    )
+
+    # Incremental maintenance
+    @staticmethod
+    def get_order_snapshot(order_id):
+        """Get the persisted rollup-relevant state of an order"""
+        return Order.objects.filter(pk=order_id)\
+            .values(*RollupRepository.ORDER_FIELDS).first()
+
+    @staticmethod
+    def snapshot_from_instance(order):
+        """Get the rollup-relevant state of an in-memory order"""
+        return {
+            field: getattr(order, field)
+            for field in RollupRepository.ORDER_FIELDS
+        }
+
+    @staticmethod
+    def apply_order_change(old, new):
+        """Move an order's contribution from its old bucket to its new one"""
+        if old and new and RollupRepository._same_bucket(old, new):
+            return
+
+        try:
+            with transaction.atomic():
+                if old and old.get('updated_at'):
+                    RollupRepository._apply_snapshot(old, -1)
+                if new and new.get('updated_at'):
+                    RollupRepository._apply_snapshot(new, 1)
+        except Exception as e:
+            # Drift is corrected by the reconciliation task
+            logger.error(f"Repository: Error applying order rollup change: {str(e)}")
+
+    @staticmethod
+    def _same_bucket(old, new):
+        return all(
+            old.get(field) == new.get(field)
+            for field in ('status', 'payment_status', 'total_amount', 'created_by_id')
+        ) and (
+            old.get('updated_at') and new.get('updated_at') and
+            timezone.localdate(old['updated_at']) == timezone.localdate(new['updated_at'])
+        )
+
+    @staticmethod
+    def _apply_snapshot(snapshot, sign):
+        day = timezone.localdate(snapshot['updated_at'])
+        amount = (snapshot.get('total_amount') or 0) * sign
+
+        RollupRepository._bump(
+            OrderDailyRollup,
+            {
+                'date': day,
+                'status': snapshot['status'],
+                'payment_status': snapshot['payment_status']
+            },
+            sign,
+            amount
+        )
+
+        if snapshot.get('created_by_id'):
+            RollupRepository._bump(
+                OrderCreatorDailyRollup,
+                {'date': day, 'user_id': snapshot['created_by_id']},
+                sign,
+                amount
+            )
+
+    @staticmethod
+    def _bump(model, lookup, count, amount):
+        updated = model.objects.filter(**lookup).update(
+            order_count=F('order_count') + count,
+            total_amount=F('total_amount') + amount
+        )
+        if updated:
+            return
+
+        if count < 0:
+            logger.warning(f"Repository: Missing {model.__name__} row for {lookup}")
+            return
+
+        try:
+            with transaction.atomic():
+                model.objects.create(
+                    order_count=count,
+                    total_amount=amount,
+                    **lookup
+                )
+        except IntegrityError:
+            # Created concurrently by another writer
+            model.objects.filter(**lookup).update(
+                order_count=F('order_count') + count,
+                total_amount=F('total_amount') + amount
+            )
+
+    # Backfill and consistency
+    @staticmethod
+    def _order_range(start_date=None, end_date=None):
+        queryset = Order.objects.all()
+        if start_date:
+            queryset = queryset.filter(updated_at__date__gte=start_date)
+        if end_date:
+            queryset = queryset.filter(updated_at__date__lte=end_date)
+        return queryset
+
+    @staticmethod
+    def _rollup_range(model, start_date=None, end_date=None):
+        queryset = model.objects.all()
+        if start_date:
+            queryset = queryset.filter(date__gte=start_date)
+        if end_date:
+            queryset = queryset.filter(date__lte=end_date)
+        return queryset
+
+    @staticmethod
+    def _live_order_buckets(start_date=None, end_date=None):
+        rows = RollupRepository._order_range(start_date, end_date).values(
+            'updated_at__date', 'status', 'payment_status'
+        ).annotate(
+            order_count=Count('id'),
+            total=Sum('total_amount')
+        ).order_by()
+        return {
+            (row['updated_at__date'], row['status'], row['payment_status']):
+                (row['order_count'], row['total'] or 0)
+            for row in rows
+        }
+
+    @staticmethod
+    def _live_creator_buckets(start_date=None, end_date=None):
+        rows = RollupRepository._order_range(start_date, end_date).filter(
+            created_by__isnull=False
+        ).values(
+            'updated_at__date', 'created_by_id'
+        ).annotate(
+            order_count=Count('id'),
+            total=Sum('total_amount')
+        ).order_by()
+        return {
+            (row['updated_at__date'], row['created_by_id']):
+                (row['order_count'], row['total'] or 0)
+            for row in rows
+        }
+
+    @staticmethod
+    def rebuild_order_rollups(start_date=None, end_date=None):
+        """Recompute rollups for a date range (all dates when omitted)"""
+        order_buckets = RollupRepository._live_order_buckets(start_date, end_date)
+        creator_buckets = RollupRepository._live_creator_buckets(start_date, end_date)
+
+        with transaction.atomic():
+            RollupRepository._rollup_range(
+                OrderDailyRollup, start_date, end_date
+            ).delete()
+            RollupRepository._rollup_range(
+                OrderCreatorDailyRollup, start_date, end_date
+            ).delete()
+
+            OrderDailyRollup.objects.bulk_create([
+                OrderDailyRollup(
+                    date=day,
+                    status=status,
+                    payment_status=payment_status,
+                    order_count=count,
+                    total_amount=total
+                )
+                for (day, status, payment_status), (count, total) in order_buckets.items()
+            ], batch_size=1000)
+            OrderCreatorDailyRollup.objects.bulk_create([
+                OrderCreatorDailyRollup(
+                    date=day,
+                    user_id=user_id,
+                    order_count=count,
+                    total_amount=total
+                )
+                for (day, user_id), (count, total) in creator_buckets.items()
+            ], batch_size=1000)
+
+        logger.info(
+            f"Rebuilt {len(order_buckets)} order rollups and "
+            f"{len(creator_buckets)} creator rollups"
+        )
+        return len(order_buckets) + len(creator_buckets)
+
+    @staticmethod
+    def check_order_rollups(start_date=None, end_date=None):
+        """Compare rollups with a live aggregate and return the mismatches"""
+        expected = RollupRepository._live_order_buckets(start_date, end_date)
+        actual = {
+            (row.date, row.status, row.payment_status): (row.order_count, row.total_amount)
+            for row in RollupRepository._rollup_range(
+                OrderDailyRollup, start_date, end_date
+            )
+        }
+        expected_creators = RollupRepository._live_creator_buckets(start_date, end_date)
+        actual_creators = {
+            (row.date, row.user_id): (row.order_count, row.total_amount)
+            for row in RollupRepository._rollup_range(
+                OrderCreatorDailyRollup, start_date, end_date
+            )
+        }
+
+        mismatches = []
+        for kind, live, stored in (
+            ('order', expected, actual),
+            ('creator', expected_creators, actual_creators)
+        ):
+            for key in set(live) | set(stored):
+                live_count, live_total = live.get(key, (0, 0))
+                stored_count, stored_total = stored.get(key, (0, 0))
+                if live_count != stored_count or live_total != stored_total:
+                    mismatches.append({
+                        'rollup': kind,
+                        'key': key,
+                        'expected_count': live_count,
+                        'actual_count': stored_count,
+                        'expected_amount': live_total,
+                        'actual_amount': stored_total
+                    })
+        return mismatches
+
+    # Reads
+    @staticmethod
+    def get_order_count(start_date, status=None):
+        queryset = OrderDailyRollup.objects.filter(date__gte=start_date)
+        if status:
+            queryset = queryset.filter(status=status)
+        return queryset.aggregate(total=Sum('order_count'))['total'] or 0
+
+    @staticmethod
+    def get_revenue(start_date, status='delivered'):
+        return OrderDailyRollup.objects.filter(
+            date__gte=start_date,
+            status=status
+        ).aggregate(total=Sum('total_amount'))['total'] or 0
+
+    @staticmethod
+    def get_revenue_trends(start_date, status='delivered'):
+        rows = OrderDailyRollup.objects.filter(
+            date__gte=start_date,
+            status=status
+        ).values('date').annotate(
+            daily_revenue=Sum('total_amount')
+        ).order_by('date')
+        return [
+            {'updated_at__date': row['date'], 'daily_revenue': row['daily_revenue']}
+            for row in rows
+        ]
+
+    @staticmethod
+    def get_user_sales(user_id, start_date):
+        rows = OrderCreatorDailyRollup.objects.filter(
+            user_id=user_id,
+            date__gte=start_date,
+            order_count__gt=0
+        ).values('date', 'order_count', 'total_amount').order_by('date')
+        return [
+            {
+                'updated_at__date': row['date'],
+                'daily_sales': row['order_count'],
+                'daily_revenue': row['total_amount']
+            }
+            for row in rows
+        ]
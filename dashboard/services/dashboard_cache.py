@@ -0,0 +1,158 @@
+from django.conf import settings
+from django.core.cache import caches
+from utils import setup_logger
+
+logger = setup_logger(__name__)
+
+class DashboardCache:
+    """
+    Versioned cache for assembled dashboard sections.
+
+    Every section depends on a set of tags. Writes bump the version of a tag,
+    which changes the key of every section depending on it, so stale entries
+    are never read again and simply expire. Cache failures never fail the
+    dashboard; the section is rebuilt instead.
+    """
+    KEY_PREFIX = 'dashboard'
+    DEFAULT_TTL = 60
+    DEFAULT_TTLS = {
+        'system_metrics': 60,
+        'financial_metrics': 300,
+        'inventory_metrics': 120,
+        'inventory_overview': 120,
+        'order_metrics': 60,
+        'market_metrics': 600,
+        'api_metrics': 30,
+        'notifications': 60,
+        'recent_activities': 30,
+        'report_storage': 300,
+    }
+
+    def __init__(self, alias=None):
+        self.alias = alias or getattr(settings, 'DASHBOARD_CACHE_ALIAS', 'default')
+        self.ttls = {
+            **self.DEFAULT_TTLS,
+            **getattr(settings, 'DASHBOARD_CACHE_TTLS', {})
+        }
+
+    @property
+    def backend(self):
+        return caches[self.alias]
+
+    @staticmethod
+    def user_tag(tag, user_id):
+        """Tag scoped to a single user, e.g. `notifications:42`"""
+        return f"{tag}:{user_id}"
+
+    def _version_key(self, tag):
+        return f"{self.KEY_PREFIX}:version:{tag}"
+
+    def _stats_key(self, section, outcome):
+        return f"{self.KEY_PREFIX}:stats:{section}:{outcome}"
+
+    def get_versions(self, tags):
+        """Get current versions for the given tags in one round trip"""
+        if not tags:
+            return []
+        keys = [self._version_key(tag) for tag in tags]
+        found = self.backend.get_many(keys)
+        return [found.get(key, 1) for key in keys]
+
+    def invalidate(self, *tags):
+        """Bump the version of each tag so dependent sections are rebuilt"""
+        for tag in tags:
+            key = self._version_key(tag)
+            try:
+                try:
+                    self.backend.incr(key)
+                except ValueError:
+                    # First write for this tag; readers default to version 1
+                    if not self.backend.add(key, 2, timeout=None):
+                        self.backend.incr(key)
+            except Exception as e:
+                logger.error(f"Error invalidating dashboard cache tag {tag}: {str(e)}")
+
+    def build_key(self, section, role, time_range, user_id, versions):
+        version = '.'.join(str(v) for v in versions) or '0'
+        return (
+            f"{self.KEY_PREFIX}:section:{section}:{role or '-'}:"
+            f"{time_range or '-'}:{user_id or '-'}:v{version}"
+        )
+
+    def get_or_build(self, section, builder, role=None, time_range=None,
+                     user_id=None, tags=()):
+        """
+        Return a cached section or build and store it.
+
+        `builder` must return fully evaluated, picklable data.
+        """
+        try:
+            key = self.build_key(
+                section,
+                role,
+                time_range,
+                user_id,
+                self.get_versions(tags)
+            )
+            value = self.backend.get(key)
+        except Exception as e:
+            logger.error(f"Error reading dashboard cache for {section}: {str(e)}")
+            return builder()
+
+        if value is not None:
+            self._count(section, 'hits')
+            return value
+
+        self._count(section, 'misses')
+        value = builder()
+        try:
+            self.backend.set(key, value, self.ttls.get(section, self.DEFAULT_TTL))
+        except Exception as e:
+            logger.error(f"Error writing dashboard cache for {section}: {str(e)}")
+        return value
+
+    def _count(self, section, outcome):
+        for name in (section, 'all'):
+            key = self._stats_key(name, outcome)
+            try:
+                try:
+                    self.backend.incr(key)
+                except ValueError:
+                    if not self.backend.add(key, 1, timeout=None):
+                        self.backend.incr(key)
+            except Exception:
+                pass
+
+    def get_stats(self, sections=None):
+        """Get hit/miss counters overall and per section"""
+        names = ['all', *(sections or self.ttls.keys())]
+        keys = [
+            self._stats_key(name, outcome)
+            for name in names
+            for outcome in ('hits', 'misses')
+        ]
+        try:
+            found = self.backend.get_many(keys)
+        except Exception as e:
+            logger.error(f"Error reading dashboard cache stats: {str(e)}")
+            found = {}
+
+        stats = {}
+        for name in names:
+            hits = found.get(self._stats_key(name, 'hits'), 0)
+            misses = found.get(self._stats_key(name, 'misses'), 0)
+            total = hits + misses
+            stats[name] = {
+                'hits': hits,
+                'misses': misses,
+                'hit_rate': round(hits / total, 4) if total else 0
+            }
+        return stats
+
+    def reset_stats(self):
+        names = ['all', *self.ttls.keys()]
+        self.backend.delete_many([
+            self._stats_key(name, outcome)
+            for name in names
+            for outcome in ('hits', 'misses')
+        ])
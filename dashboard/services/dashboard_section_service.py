@@ -0,0 +1,192 @@
+from functools import partial
+from dashboard.services.dashboard_cache import DashboardCache
+from dashboard.services.section_runner import SectionRunner
+from utils import setup_logger
+
+logger = setup_logger(__name__)
+
+class DashboardSectionService:
+    """
+    Assembles dashboard sections per role through the section cache.
+
+    Builders return evaluated data (lists and dicts, never querysets) so the
+    result can be stored as is.
+    """
+    # Tags whose writes invalidate a section
+    SECTION_TAGS = {
+        'system_metrics': ('users',),
+        'financial_metrics': ('orders',),
+        'inventory_metrics': ('inventory',),
+        'inventory_overview': ('inventory',),
+        'order_metrics': ('orders',),
+        'market_metrics': ('inventory', 'orders'),
+    }
+
+    ROLE_SECTIONS = {
+        'admin': (
+            'system_metrics',
+            'financial_metrics',
+            'inventory_metrics',
+            'order_metrics',
+            'api_metrics',
+            'report_storage'
+        ),
+        'inventory_manager': ('inventory_metrics', 'order_metrics'),
+        'sales_representative': ('order_metrics', 'inventory_metrics'),
+        'farmer': (),
+        'b2b': ('order_metrics', 'inventory_overview', 'market_metrics'),
+    }
+
+    # Sections shown on every dashboard, always scoped to the user
+    COMMON_SECTIONS = ('notifications', 'recent_activities')
+
+    # Sections whose content depends on the requesting user
+    USER_SCOPED_SECTIONS = {
+        ('b2b', 'order_metrics'),
+    }
+
+    def __init__(self, service, cache=None, runner=None):
+        self.service = service
+        self.cache = cache or DashboardCache()
+        self.runner = runner or SectionRunner()
+
+    def get_dashboard(self, role, user, time_range):
+        """
+        Evaluate the common and role sections as independent tasks.
+
+        Returns `(data, statuses)`; sections that fail or miss their deadline
+        are absent from `data` and reported in `statuses`.
+        """
+        sections = (*self.COMMON_SECTIONS, *self.ROLE_SECTIONS.get(role, ()))
+        data, statuses = self.runner.run({
+            section: partial(self.build_section, section, role, user, time_range)
+            for section in sections
+        })
+
+        if role == 'admin':
+            data['cache_metrics'] = self.cache.get_stats()
+        return data, statuses
+
+    def get_common_sections(self, user):
+        """Get the per-user sections shown on every dashboard"""
+        return {
+            section: self.get_section(section, None, user, None)
+            for section in self.COMMON_SECTIONS
+        }
+
+    def get_role_sections(self, role, user, time_range):
+        """Get the metric sections for a role, building only cache misses"""
+        metrics = {}
+        for section in self.ROLE_SECTIONS.get(role, ()):
+            metrics[section] = self.get_section(section, role, user, time_range)
+
+        if role == 'admin':
+            metrics['cache_metrics'] = self.cache.get_stats()
+        return metrics
+
+    def get_section(self, section, role, user, time_range):
+        """Get a section, falling back to an empty one if it cannot be built"""
+        try:
+            return self.build_section(section, role, user, time_range)
+        except Exception as e:
+            logger.error(f"Error building dashboard section {section} for {role}: {str(e)}")
+            return {}
+
+    def build_section(self, section, role, user, time_range):
+        """Get a section through the cache; build errors propagate"""
+        builder = getattr(self, f'_build_{section}')
+        if section in self.COMMON_SECTIONS:
+            return self.cache.get_or_build(
+                section,
+                lambda: builder(role, user, time_range),
+                user_id=user.id,
+                tags=self._user_tags(section, user)
+            )
+
+        user_id = user.id if (role, section) in self.USER_SCOPED_SECTIONS else None
+        return self.cache.get_or_build(
+            section,
+            lambda: builder(role, user, time_range),
+            role=role,
+            time_range=time_range,
+            user_id=user_id,
+            tags=self.SECTION_TAGS.get(section, ())
+        )
+
+    @staticmethod
+    def _user_tags(section, user):
+        if section == 'notifications':
+            return (DashboardCache.user_tag('notifications', user.id),)
+        return ()
+
+    # Section builders
+    def _build_notifications(self, role, user, time_range):
+        return self.service.get_user_notifications(user.id)
+
+    def _build_recent_activities(self, role, user, time_range):
+        return list(self.service.get_recent_activities(user.id))
+
+    def _build_system_metrics(self, role, user, time_range):
+        return {
+            **self.service.get_user_metrics(),
+            "system_health": self.service.get_system_health()
+        }
+
+    def _build_financial_metrics(self, role, user, time_range):
+        return {
+            **self.service.get_order_metrics(time_range, ('total_revenue',)),
+            "revenue_trends": list(self.service.get_revenue_trends(time_range))
+        }
+
+    def _build_inventory_metrics(self, role, user, time_range):
+        requested = ['total_items']
+        if role in ('admin', 'inventory_manager'):
+            requested.append('stock_value')
+        metrics = {
+            **self.service.get_inventory_metrics(requested),
+            "low_stock_items": list(self.service.get_low_stock_items())
+        }
+        if role in ('admin', 'inventory_manager'):
+            metrics["stock_breakdown"] = self.service.get_inventory_breakdown()
+        if role == 'inventory_manager':
+            metrics["expiring_stock"] = list(self.service.get_expiring_stock())
+        return metrics
+
+    def _build_inventory_overview(self, role, user, time_range):
+        return {
+            "available_items": self.service.get_inventory_metrics(
+                ('total_items',)
+            )['total_items'],
+            "low_stock_alerts": list(self.service.get_low_stock_items())
+        }
+
+    def _build_order_metrics(self, role, user, time_range):
+        if role == 'b2b':
+            # Scoped to the shop owner, so not served from the shared rollups
+            return {
+                "pending_orders": self.service.get_pending_orders(),
+                "order_status_distribution": list(
+                    self.service.get_order_status_distribution(shop_owner_id=user.id)
+                )
+            }
+
+        requested = ['pending_orders', 'order_status_distribution']
+        if role in ('admin', 'inventory_manager'):
+            requested.append('total_orders')
+        return self.service.get_order_metrics(time_range, requested)
+
+    def _build_api_metrics(self, role, user, time_range):
+        return {
+            "performance": self.service.get_api_performance_metrics(),
+            "error_rates": self.service.get_error_rates(),
+            "search_paths": self.service.get_search_metrics()
+        }
+
+    def _build_report_storage(self, role, user, time_range):
+        return self.service.get_report_storage()
+
+    def _build_market_metrics(self, role, user, time_range):
+        return {
+            "market_prices": self.service.get_market_prices(),
+            "demand_forecast": self.service.get_demand_forecast()
+        }
@@ -15,7 +15,7 @@ class DashboardService:
             return self.repository.get_user_notifications(user_id)
         except RepositoryException as e:
             self.logger.error(f"Error fetching notifications for user {user_id}: {str(e)}")
-            return []
+            raise ServiceException(f"Error fetching notifications: {str(e)}")
 
     def get_recent_activities(self, user_id):
         try:
@@ -25,6 +25,52 @@ class DashboardService:
             self.logger.error(f"Error fetching recent activities for user {user_id}: {str(e)}")
             return []
 
+    # Batched Metrics
+    def get_order_metrics(self, time_range, metrics=None):
+        try:
+            self.logger.info(f"Fetching batched order metrics for time range: {time_range}")
+            return self.repository.get_order_metrics(
+                time_range,
+                metrics or self.repository.ORDER_METRICS
+            )
+        except RepositoryException as e:
+            self.logger.error(f"Error fetching order metrics: {str(e)}")
+            raise ServiceException(f"Error fetching order metrics: {str(e)}")
+
+    def get_inventory_metrics(self, metrics=None):
+        try:
+            self.logger.info("Fetching batched inventory metrics")
+            return self.repository.get_inventory_metrics(
+                metrics or self.repository.INVENTORY_METRICS
+            )
+        except RepositoryException as e:
+            self.logger.error(f"Error fetching inventory metrics: {str(e)}")
+            raise ServiceException(f"Error fetching inventory metrics: {str(e)}")
+
+    def get_inventory_breakdown(self):
+        try:
+            return self.repository.get_inventory_breakdown()
+        except RepositoryException as e:
+            self.logger.error(f"Error fetching inventory breakdown: {str(e)}")
+            raise ServiceException(f"Error fetching inventory breakdown: {str(e)}")
+
+    def get_report_storage(self):
+        try:
+            return self.repository.get_report_storage()
+        except RepositoryException as e:
+            self.logger.error(f"Error fetching report storage metrics: {str(e)}")
+            raise ServiceException(f"Error fetching report storage metrics: {str(e)}")
+
+    def get_user_metrics(self, metrics=None):
+        try:
+            self.logger.info("Fetching batched user metrics")
+            return self.repository.get_user_metrics(
+                metrics or self.repository.USER_METRICS
+            )
+        except RepositoryException as e:
+            self.logger.error(f"Error fetching user metrics: {str(e)}")
+            raise ServiceException(f"Error fetching user metrics: {str(e)}")
+
     # Admin Dashboard Methods
     def get_total_users(self):
         try:
@@ -130,6 +176,14 @@ class DashboardService:
             self.logger.error(f"Error fetching API performance metrics: {str(e)}")
             raise ServiceException(f"Error fetching API performance metrics: {str(e)}")
 
+    def get_search_metrics(self):
+        try:
+            self.logger.info("Fetching search metrics")
+            return self.repository.get_search_metrics()
+        except RepositoryException as e:
+            self.logger.error(f"Error fetching search metrics: {str(e)}")
+            raise ServiceException(f"Error fetching search metrics: {str(e)}")
+
     def get_error_rates(self):
         try:
             self.logger.info("Fetching error rates")
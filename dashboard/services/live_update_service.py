@@ -0,0 +1,192 @@
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+from dashboard.repositories.dashboard_repository import DashboardRepository
+from dashboard.repositories.rollup_repository import RollupRepository
+from utils import setup_logger
+
+logger = setup_logger(__name__)
+
+class LiveUpdateService:
+    """
+    Pushes small dashboard metric deltas to role-scoped WebSocket groups.
+
+    Writes only mark a topic as dirty. The first write in an interval
+    schedules a publish for the end of it, so a burst of writes produces one
+    message per topic and interval. The publish compares current values with
+    the last published ones and only sends what changed.
+    """
+    KEY_PREFIX = 'dashboard:live'
+    GROUP_PREFIX = 'dashboard'
+
+    # metric -> (topic, roles that receive it)
+    LIVE_METRICS = {
+        'pending_orders': (
+            'orders',
+            ('admin', 'inventory_manager', 'sales_representative')
+        ),
+        'revenue_today': ('orders', ('admin',)),
+        'low_stock_items': (
+            'inventory',
+            ('admin', 'inventory_manager', 'sales_representative')
+        ),
+    }
+
+    @staticmethod
+    def interval():
+        return getattr(settings, 'DASHBOARD_LIVE_INTERVAL', 5)
+
+    @staticmethod
+    def enabled():
+        return getattr(settings, 'DASHBOARD_LIVE_UPDATES', True)
+
+    @staticmethod
+    def group_name(role):
+        return f"{LiveUpdateService.GROUP_PREFIX}_{role}"
+
+    @staticmethod
+    def _pending_key(topic):
+        return f"{LiveUpdateService.KEY_PREFIX}:pending:{topic}"
+
+    @staticmethod
+    def _last_key(metric):
+        return f"{LiveUpdateService.KEY_PREFIX}:last:{metric}"
+
+    @staticmethod
+    def metrics_for_role(role):
+        return [
+            metric for metric, (_, roles) in LiveUpdateService.LIVE_METRICS.items()
+            if role in roles
+        ]
+
+    @staticmethod
+    def metrics_for_topic(topic):
+        return [
+            metric for metric, (metric_topic, _) in LiveUpdateService.LIVE_METRICS.items()
+            if metric_topic == topic
+        ]
+
+    # Metric values, kept JSON serializable
+    @staticmethod
+    def _pending_orders():
+        return DashboardRepository.get_order_metrics(
+            'week',
+            ('pending_orders',)
+        )['pending_orders']
+
+    @staticmethod
+    def _revenue_today():
+        return float(RollupRepository.get_revenue(timezone.localdate()))
+
+    @staticmethod
+    def _low_stock_items():
+        return {
+            str(item['id']): {
+                'id': str(item['id']),
+                'name': item['name'],
+                'quantity': float(item['quantity']),
+                'reorder_point': float(item['reorder_point'])
+            }
+            for item in DashboardRepository.get_low_stock_items()
+        }
+
+    @staticmethod
+    def compute(metrics):
+        return {
+            metric: getattr(LiveUpdateService, f'_{metric}')()
+            for metric in metrics
+        }
+
+    @staticmethod
+    def _diff(metric, old, new):
+        """Change to send for a metric, or None when it did not change"""
+        if old == new:
+            return None
+        if metric == 'low_stock_items':
+            old = old or {}
+            return {
+                'added': [item for key, item in new.items() if old.get(key) != item],
+                'removed': [key for key in old if key not in new]
+            }
+        return {
+            'value': new,
+            'delta': None if old is None else round(new - old, 2)
+        }
+
+    @staticmethod
+    def get_snapshot(role):
+        """Current values of every live metric the role receives"""
+        values = LiveUpdateService.compute(LiveUpdateService.metrics_for_role(role))
+        if 'low_stock_items' in values:
+            values['low_stock_items'] = list(values['low_stock_items'].values())
+        return values
+
+    # Scheduling
+    def mark_dirty(self, topic):
+        """Schedule a publish for the topic unless one is already pending"""
+        if not self.enabled():
+            return
+        from dashboard.tasks import publish_dashboard_updates
+
+        interval = self.interval()
+        try:
+            # The marker outlives the interval so a lost task cannot leave the
+            # topic pending for long
+            if not cache.add(self._pending_key(topic), 1, interval * 5):
+                return
+            publish_dashboard_updates.apply_async(
+                args=[topic],
+                countdown=interval,
+                retry=False
+            )
+        except Exception as e:
+            logger.error(f"Error scheduling dashboard live update for {topic}: {str(e)}")
+            cache.delete(self._pending_key(topic))
+
+    def publish(self, topic):
+        """Send the changes of a topic's metrics to every subscribed role"""
+        # Cleared before reading so later writes schedule a new publish
+        cache.delete(self._pending_key(topic))
+
+        metrics = self.metrics_for_topic(topic)
+        current = self.compute(metrics)
+        previous = cache.get_many([self._last_key(metric) for metric in metrics])
+
+        changes = {}
+        for metric, value in current.items():
+            change = self._diff(metric, previous.get(self._last_key(metric)), value)
+            if change is not None:
+                changes[metric] = change
+        if not changes:
+            return {}
+
+        cache.set_many(
+            {self._last_key(metric): current[metric] for metric in changes},
+            None
+        )
+
+        layer = get_channel_layer()
+        if layer is None:
+            return changes
+
+        sent_at = timezone.now().isoformat()
+        roles = {
+            role for metric in changes
+            for role in self.LIVE_METRICS[metric][1]
+        }
+        for role in roles:
+            role_changes = {
+                metric: change for metric, change in changes.items()
+                if role in self.LIVE_METRICS[metric][1]
+            }
+            async_to_sync(layer.group_send)(
+                self.group_name(role),
+                {
+                    'type': 'dashboard.update',
+                    'changes': role_changes,
+                    'sent_at': sent_at
+                }
+            )
+        return changes
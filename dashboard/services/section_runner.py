@@ -0,0 +1,125 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+from threading import Lock
+from django.conf import settings
+from django.db import close_old_connections
+from utils import setup_logger
+
+logger = setup_logger(__name__)
+
+_executor = None
+_executor_lock = Lock()
+
+def get_executor():
+    """Shared pool so the number of section workers is bounded per process"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=getattr(settings, 'DASHBOARD_SECTION_WORKERS', 4),
+                thread_name_prefix='dashboard-section'
+            )
+        return _executor
+
+def _run_in_worker(task):
+    # Each worker thread has its own DB connection; release it with the
+    # same rules Django applies at the end of a request.
+    close_old_connections()
+    try:
+        return task(), time.monotonic()
+    finally:
+        close_old_connections()
+
+class SectionRunner:
+    """
+    Evaluates independent dashboard sections with a deadline per section.
+
+    A section that raises or misses its deadline is reported in the status
+    map and left out of the results; the other sections are still returned.
+    Late sections keep running in the background and populate the section
+    cache for the next request.
+    """
+    OK = 'ok'
+    ERROR = 'error'
+    TIMEOUT = 'timeout'
+
+    def __init__(self, concurrent=None, default_timeout=None, timeouts=None):
+        # Unset options are read from settings on every run
+        self._concurrent = concurrent
+        self._default_timeout = default_timeout
+        self._timeouts = timeouts or {}
+
+    @property
+    def concurrent(self):
+        if self._concurrent is not None:
+            return self._concurrent
+        return getattr(settings, 'DASHBOARD_CONCURRENT_SECTIONS', True)
+
+    def get_timeout(self, section):
+        if section in self._timeouts:
+            return self._timeouts[section]
+        configured = getattr(settings, 'DASHBOARD_SECTION_TIMEOUTS', {})
+        if section in configured:
+            return configured[section]
+        if self._default_timeout is not None:
+            return self._default_timeout
+        return getattr(settings, 'DASHBOARD_SECTION_TIMEOUT', 5.0)
+
+    def run(self, tasks):
+        """
+        Run `{section: callable}` and return `(results, statuses)`.
+
+        Statuses map each section to `{'status': ..., 'duration_ms': ...}`.
+        """
+        if self.concurrent and len(tasks) > 1:
+            return self._run_concurrently(tasks)
+        return self._run_sequentially(tasks)
+
+    def _run_sequentially(self, tasks):
+        results, statuses = {}, {}
+        for section, task in tasks.items():
+            started = time.monotonic()
+            try:
+                results[section] = task()
+                status = self.OK
+            except Exception as e:
+                logger.error(f"Error building dashboard section {section}: {str(e)}")
+                status = self.ERROR
+            statuses[section] = self._status(status, started)
+        return results, statuses
+
+    def _run_concurrently(self, tasks):
+        started = time.monotonic()
+        executor = get_executor()
+        futures = {
+            section: executor.submit(_run_in_worker, task)
+            for section, task in tasks.items()
+        }
+
+        results, statuses = {}, {}
+        for section, future in futures.items():
+            # Deadlines run from the start of the request, not from the
+            # moment we begin waiting on this section
+            remaining = started + self.get_timeout(section) - time.monotonic()
+            finished = None
+            try:
+                results[section], finished = future.result(timeout=max(remaining, 0))
+                status = self.OK
+            except TimeoutError:
+                logger.warning(
+                    f"Dashboard section {section} missed its "
+                    f"{self.get_timeout(section)}s deadline"
+                )
+                status = self.TIMEOUT
+            except Exception as e:
+                logger.error(f"Error building dashboard section {section}: {str(e)}")
+                status = self.ERROR
+            statuses[section] = self._status(status, started, finished)
+        return results, statuses
+
+    @staticmethod
+    def _status(status, started, finished=None):
+        return {
+            'status': status,
+            'duration_ms': round(((finished or time.monotonic()) - started) * 1000, 1)
+        }
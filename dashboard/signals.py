@@ -0,0 +1,87 @@
+from django.db import transaction
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+from orders.models import Order, OrderItem
+from inventories.models import InventoryItem
+from notifications.models import Notification
+from users.models import User
+from dashboard.repositories.rollup_repository import RollupRepository
+from dashboard.repositories.product_sales_repository import ProductSalesRepository
+from dashboard.services.dashboard_cache import DashboardCache
+from dashboard.services.live_update_service import LiveUpdateService
+
+dashboard_cache = DashboardCache()
+live_updates = LiveUpdateService()
+
+def invalidate_on_commit(*tags):
+    transaction.on_commit(lambda: dashboard_cache.invalidate(*tags))
+
+@receiver(pre_save, sender=Order)
+def capture_order_rollup_state(sender, instance, raw=False, **kwargs):
+    if raw or instance._state.adding:
+        instance._rollup_previous = None
+        return
+    instance._rollup_previous = RollupRepository.get_order_snapshot(instance.pk)
+
+@receiver(post_save, sender=Order)
+def update_order_rollups(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    previous = getattr(instance, '_rollup_previous', None)
+    RollupRepository.apply_order_change(
+        previous,
+        RollupRepository.snapshot_from_instance(instance)
+    )
+    ProductSalesRepository.apply_order_change(instance, previous)
+    instance._rollup_previous = None
+
+@receiver(post_delete, sender=Order)
+def remove_order_from_rollups(sender, instance, **kwargs):
+    RollupRepository.apply_order_change(
+        RollupRepository.snapshot_from_instance(instance),
+        None
+    )
+
+@receiver(pre_save, sender=OrderItem)
+def capture_order_item_state(sender, instance, raw=False, **kwargs):
+    if raw or instance._state.adding:
+        instance._sales_previous = None
+        return
+    instance._sales_previous = ProductSalesRepository.get_item_snapshot(instance.pk)
+
+@receiver(post_save, sender=OrderItem)
+def update_product_sales(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    ProductSalesRepository.apply_item_change(
+        getattr(instance, '_sales_previous', None),
+        ProductSalesRepository.snapshot_from_item(instance)
+    )
+    instance._sales_previous = None
+
+@receiver(post_delete, sender=OrderItem)
+def remove_order_item_from_sales(sender, instance, **kwargs):
+    ProductSalesRepository.apply_item_change(
+        ProductSalesRepository.snapshot_from_item(instance),
+        None
+    )
+
+# Dashboard cache invalidation
+@receiver([post_save, post_delete], sender=Order)
+@receiver([post_save, post_delete], sender=OrderItem)
+def invalidate_order_sections(sender, instance, **kwargs):
+    invalidate_on_commit('orders')
+    transaction.on_commit(lambda: live_updates.mark_dirty('orders'))
+
+@receiver([post_save, post_delete], sender=InventoryItem)
+def invalidate_inventory_sections(sender, instance, **kwargs):
+    invalidate_on_commit('inventory')
+    transaction.on_commit(lambda: live_updates.mark_dirty('inventory'))
+
+@receiver([post_save, post_delete], sender=User)
+def invalidate_user_sections(sender, instance, **kwargs):
+    invalidate_on_commit('users')
+
+@receiver([post_save, post_delete], sender=Notification)
+def invalidate_notification_sections(sender, instance, **kwargs):
+    invalidate_on_commit(DashboardCache.user_tag('notifications', instance.user_id))
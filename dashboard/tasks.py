@@ -0,0 +1,80 @@
+from celery import shared_task
+from django.utils import timezone
+from datetime import timedelta
+from dashboard.repositories.rollup_repository import RollupRepository
+from dashboard.repositories.health_repository import HealthRepository
+from dashboard.repositories.product_sales_repository import ProductSalesRepository
+from dashboard.services.live_update_service import LiveUpdateService
+from utils import setup_logger
+
+logger = setup_logger(__name__)
+
+@shared_task
+def reconcile_order_rollups(days=None):
+    """Compare order rollups with the live Order table and repair drift"""
+    try:
+        start_date = None
+        if days is not None:
+            start_date = timezone.localdate() - timedelta(days=days)
+
+        mismatches = RollupRepository.check_order_rollups(start_date=start_date)
+        if mismatches:
+            logger.warning(
+                f"Found {len(mismatches)} drifted order rollups, rebuilding"
+            )
+            RollupRepository.rebuild_order_rollups(start_date=start_date)
+
+        logger.info(f"Reconciled order rollups ({len(mismatches)} mismatches)")
+        return len(mismatches)
+    except Exception as e:
+        logger.error(f"Error reconciling order rollups: {str(e)}")
+        return False
+
+@shared_task
+def reconcile_product_sales(days=None):
+    """Compare product sales counters with live order items and repair drift"""
+    try:
+        start_date = None
+        if days is not None:
+            start_date = timezone.localdate() - timedelta(days=days)
+
+        mismatches = ProductSalesRepository.check(start_date=start_date)
+        if mismatches:
+            logger.warning(
+                f"Found {len(mismatches)} drifted product sales rows, rebuilding"
+            )
+            ProductSalesRepository.rebuild(start_date=start_date)
+
+        logger.info(f"Reconciled product sales ({len(mismatches)} mismatches)")
+        return len(mismatches)
+    except Exception as e:
+        logger.error(f"Error reconciling product sales: {str(e)}")
+        return False
+
+@shared_task
+def run_health_probes():
+    """Probe backing services and cache the results for dashboard reads"""
+    try:
+        result = HealthRepository.run_probes()
+        if result['system_status'] != 'healthy':
+            logger.warning(f"System health is {result['system_status']}")
+        return result['system_status']
+    except Exception as e:
+        logger.error(f"Error running health probes: {str(e)}")
+        return False
+
+@shared_task
+def record_worker_heartbeat():
+    """Mark that a worker is consuming the default queue"""
+    HealthRepository.record_worker_heartbeat()
+    return True
+
+@shared_task
+def publish_dashboard_updates(topic):
+    """Push the coalesced metric changes of a topic to dashboard sockets"""
+    try:
+        changes = LiveUpdateService().publish(topic)
+        return list(changes)
+    except Exception as e:
+        logger.error(f"Error publishing dashboard updates for {topic}: {str(e)}")
+        return False
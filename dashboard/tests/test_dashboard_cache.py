@@ -0,0 +1,127 @@
+from decimal import Decimal
+from unittest import mock
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from orders.models import Order
+from notifications.models import Notification
+from users.models import User, UserRole
+from dashboard.services.dashboard_cache import DashboardCache
+from dashboard.services.dashboard_service import DashboardService
+from dashboard.services.dashboard_section_service import DashboardSectionService
+from dashboard.repositories.dashboard_repository import DashboardRepository
+
+
+class DashboardCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.cache = DashboardCache()
+
+    def test_hit_after_miss(self):
+        builder = mock.Mock(return_value={'value': 1})
+
+        first = self.cache.get_or_build('order_metrics', builder, role='admin', tags=('orders',))
+        second = self.cache.get_or_build('order_metrics', builder, role='admin', tags=('orders',))
+
+        self.assertEqual(first, second)
+        self.assertEqual(builder.call_count, 1)
+        stats = self.cache.get_stats()
+        self.assertEqual(stats['order_metrics']['hits'], 1)
+        self.assertEqual(stats['order_metrics']['misses'], 1)
+        self.assertEqual(stats['all']['hit_rate'], 0.5)
+
+    def test_invalidate_only_affects_tagged_sections(self):
+        orders = mock.Mock(return_value=[])
+        inventory = mock.Mock(return_value=[])
+        for _ in range(2):
+            self.cache.get_or_build('order_metrics', orders, tags=('orders',))
+            self.cache.get_or_build('inventory_metrics', inventory, tags=('inventory',))
+            self.cache.invalidate('orders')
+
+        self.assertEqual(orders.call_count, 2)
+        self.assertEqual(inventory.call_count, 1)
+
+    def test_keys_are_scoped_by_role_and_time_range(self):
+        builder = mock.Mock(return_value={})
+        self.cache.get_or_build('order_metrics', builder, role='admin', time_range='week')
+        self.cache.get_or_build('order_metrics', builder, role='b2b', time_range='week')
+        self.cache.get_or_build('order_metrics', builder, role='admin', time_range='month')
+
+        self.assertEqual(builder.call_count, 3)
+
+    def test_backend_errors_fall_back_to_builder(self):
+        broken = mock.Mock()
+        broken.get_many.side_effect = ConnectionError('down')
+        broken.get.side_effect = ConnectionError('down')
+        with mock.patch.object(DashboardCache, 'backend', broken):
+            value = self.cache.get_or_build('order_metrics', lambda: {'ok': True})
+
+        self.assertEqual(value, {'ok': True})
+
+
+# Live pushes need a broker and are covered in test_live_updates
+@override_settings(DASHBOARD_LIVE_UPDATES=False)
+class DashboardSectionInvalidationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.role = UserRole.objects.create(name='admin')
+        self.user = User.objects.create(
+            email='admin@example.com',
+            first_name='Admin',
+            last_name='User',
+            role=self.role
+        )
+        self.sections = DashboardSectionService(DashboardService(DashboardRepository))
+
+    def create_order(self, number):
+        return Order.objects.create(
+            order_number=number,
+            customer_name='Customer',
+            customer_email='customer@example.com',
+            customer_phone='123',
+            shipping_address='Address',
+            billing_address='Address',
+            subtotal=Decimal('10.00'),
+            total_amount=Decimal('10.00')
+        )
+
+    def test_order_write_invalidates_order_sections(self):
+        self.create_order('ORD-1')
+        first = self.sections.get_section('order_metrics', 'admin', self.user, 'week')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.create_order('ORD-2')
+
+        second = self.sections.get_section('order_metrics', 'admin', self.user, 'week')
+        self.assertEqual(first['total_orders'], 1)
+        self.assertEqual(second['total_orders'], 2)
+
+    def test_cached_section_served_without_queries(self):
+        self.sections.get_section('inventory_metrics', 'admin', self.user, 'week')
+
+        with self.assertNumQueries(0):
+            self.sections.get_section('inventory_metrics', 'admin', self.user, 'week')
+
+    def test_notifications_invalidated_per_user(self):
+        other = User.objects.create(
+            email='other@example.com',
+            first_name='Other',
+            last_name='User',
+            role=self.role
+        )
+        self.sections.get_common_sections(self.user)
+        self.sections.get_common_sections(other)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Notification.objects.create(
+                notification_type='system',
+                notification_title='Hello',
+                message='Hello',
+                user=self.user
+            )
+
+        with self.assertNumQueries(0):
+            self.sections.get_common_sections(other)['notifications']
+        self.assertEqual(
+            self.sections.get_common_sections(self.user)['notifications']['unread_count'],
+            1
+        )
@@ -0,0 +1,100 @@
+import time
+from unittest import mock
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+from dashboard.repositories.health_repository import HealthRepository
+from dashboard.repositories.dashboard_repository import DashboardRepository
+
+
+@mock.patch.object(HealthRepository, 'probe_result_backend', return_value=None)
+@mock.patch.object(
+    HealthRepository,
+    'probe_broker',
+    return_value={'queue_depth': {'celery': 3}}
+)
+class HealthProbeTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_probes_measure_each_component(self, *mocks):
+        HealthRepository.record_worker_heartbeat()
+
+        result = HealthRepository.run_probes()
+
+        self.assertEqual(result['system_status'], 'healthy')
+        components = result['components']
+        self.assertEqual(
+            set(components),
+            {'database', 'cache', 'broker', 'result_backend', 'channel_layer', 'workers'}
+        )
+        self.assertEqual(components['broker']['queue_depth'], {'celery': 3})
+        self.assertIsNotNone(components['database']['latency_ms'])
+        self.assertLess(components['workers']['heartbeat_age_seconds'], 5)
+
+    def test_missing_heartbeat_degrades(self, *mocks):
+        result = HealthRepository.run_probes()
+
+        self.assertEqual(result['system_status'], 'degraded')
+        self.assertEqual(result['components']['workers']['status'], 'down')
+
+    def test_database_failure_is_unhealthy(self, *mocks):
+        with mock.patch.object(
+            HealthRepository,
+            'probe_database',
+            side_effect=ConnectionError('refused')
+        ):
+            with self.assertLogs('dashboard.repositories.health_repository', 'ERROR') as logs:
+                result = HealthRepository.run_probes()
+
+        self.assertEqual(result['system_status'], 'unhealthy')
+        self.assertEqual(set(result['components']['database']), {'status', 'latency_ms'})
+        self.assertIn('refused', logs.output[0])
+
+    def test_dashboard_reads_cached_results_only(self, broker, backend):
+        HealthRepository.run_probes()
+        broker.reset_mock()
+
+        with self.assertNumQueries(0):
+            health = DashboardRepository.get_system_health()
+
+        broker.assert_not_called()
+        self.assertEqual(health['database_status'], 'up')
+        self.assertIsNotNone(health['checked_at'])
+
+    def test_unknown_before_first_probe(self, *mocks):
+        health = DashboardRepository.get_system_health()
+        self.assertEqual(health['system_status'], 'unknown')
+
+
+class ReadinessViewTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+
+    def test_ready(self):
+        response = self.client.get('/api/v1/dashboard/health/ready')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.data['status'])
+
+    def test_not_ready_when_database_fails(self):
+        with mock.patch.object(
+            HealthRepository,
+            'probe_database',
+            side_effect=ConnectionError('refused')
+        ):
+            response = self.client.get('/api/v1/dashboard/health/ready')
+        self.assertEqual(response.status_code, 503)
+        self.assertNotIn('refused', str(response.data))
+
+    @override_settings(HEALTH_PROBE_TIMEOUT=0.1)
+    def test_not_ready_when_database_hangs(self):
+        with mock.patch.object(
+            HealthRepository,
+            'probe_database',
+            side_effect=lambda: time.sleep(1)
+        ):
+            started = time.monotonic()
+            response = self.client.get('/api/v1/dashboard/health/ready')
+
+        self.assertEqual(response.status_code, 503)
+        self.assertLess(time.monotonic() - started, 1)
@@ -0,0 +1,151 @@
+from unittest import mock
+from asgiref.sync import async_to_sync, sync_to_async
+from channels.layers import get_channel_layer
+from channels.sessions import CookieMiddleware
+from channels.testing import WebsocketCommunicator
+from django.core.cache import cache
+from django.test import TestCase, TransactionTestCase, override_settings
+from rest_framework_simplejwt.tokens import AccessToken
+from dfi.consumers import DashboardConsumer
+from dashboard.services.live_update_service import LiveUpdateService
+from dashboard.tests.test_metric_batch import DashboardDataMixin
+
+
+class LiveUpdateServiceTests(DashboardDataMixin, TestCase):
+    def setUp(self):
+        cache.clear()
+        self.service = LiveUpdateService()
+        self.layer = get_channel_layer()
+        self.channel = async_to_sync(self.layer.new_channel)()
+        async_to_sync(self.layer.group_add)(
+            LiveUpdateService.group_name('inventory_manager'),
+            self.channel
+        )
+
+    def tearDown(self):
+        async_to_sync(self.layer.flush)()
+
+    def receive(self):
+        return async_to_sync(self.layer.receive)(self.channel)
+
+    @mock.patch('dashboard.tasks.publish_dashboard_updates.apply_async')
+    def test_bursts_schedule_one_publish_per_interval(self, apply_async):
+        with override_settings(DASHBOARD_LIVE_INTERVAL=7):
+            for _ in range(5):
+                self.service.mark_dirty('orders')
+            self.service.mark_dirty('inventory')
+
+        self.assertEqual(apply_async.call_count, 2)
+        apply_async.assert_any_call(args=['orders'], countdown=7, retry=False)
+
+        self.service.publish('orders')
+        self.service.mark_dirty('orders')
+        self.assertEqual(apply_async.call_count, 3)
+
+    def test_publish_sends_only_changes_to_subscribed_roles(self):
+        self.create_order('ORD-1', status='pending')
+        self.create_order('ORD-2', status='pending')
+
+        changes = self.service.publish('orders')
+
+        self.assertEqual(changes['pending_orders'], {'value': 2, 'delta': None})
+        message = self.receive()
+        self.assertEqual(message['type'], 'dashboard.update')
+        # Revenue is only pushed to admins
+        self.assertEqual(list(message['changes']), ['pending_orders'])
+
+        self.create_order('ORD-3', status='pending')
+        self.assertEqual(
+            self.service.publish('orders')['pending_orders'],
+            {'value': 3, 'delta': 1}
+        )
+        self.assertEqual(self.service.publish('orders'), {})
+
+    def test_low_stock_list_is_sent_as_diff(self):
+        low = self.create_item('B-1', '2')
+        self.create_item('B-2', '50')
+
+        added = self.service.publish('inventory')['low_stock_items']
+        self.assertEqual([item['id'] for item in added['added']], [str(low.id)])
+
+        low.update_stock(100, 'add')
+        changes = self.service.publish('inventory')['low_stock_items']
+        self.assertEqual(changes, {'added': [], 'removed': [str(low.id)]})
+
+    @override_settings(DASHBOARD_LIVE_UPDATES=False)
+    @mock.patch('dashboard.tasks.publish_dashboard_updates.apply_async')
+    def test_disabled(self, apply_async):
+        self.service.mark_dirty('orders')
+        apply_async.assert_not_called()
+
+    def test_snapshot_is_role_scoped(self):
+        self.create_item('B-1', '2')
+
+        self.assertEqual(
+            set(LiveUpdateService.get_snapshot('admin')),
+            {'pending_orders', 'revenue_today', 'low_stock_items'}
+        )
+        self.assertEqual(LiveUpdateService.get_snapshot('farmer'), {})
+        self.assertEqual(
+            len(LiveUpdateService.get_snapshot('inventory_manager')['low_stock_items']),
+            1
+        )
+
+
+@override_settings(DASHBOARD_LIVE_UPDATES=False)
+class DashboardConsumerTests(DashboardDataMixin, TransactionTestCase):
+    """Committed data, as the consumer reads it from other threads"""
+
+    def setUp(self):
+        cache.clear()
+        self.manager = self.create_user('inventory_manager', 'manager@example.com')
+        self.guest = self.create_user('guest', 'guest@example.com')
+        self.create_item('BATCH-LOW', '2', reorder_point='10')
+
+    def communicator(self, user=None):
+        headers = []
+        if user is not None:
+            headers.append((b'cookie', f'accessToken={AccessToken.for_user(user)}'.encode()))
+        return WebsocketCommunicator(
+            CookieMiddleware(DashboardConsumer.as_asgi()),
+            '/ws/dashboard/',
+            headers=headers
+        )
+
+    async def test_unauthenticated_sockets_are_closed(self):
+        for communicator in (
+            self.communicator(),
+            WebsocketCommunicator(
+                CookieMiddleware(DashboardConsumer.as_asgi()),
+                '/ws/dashboard/',
+                headers=[(b'cookie', b'accessToken=invalid')]
+            )
+        ):
+            connected, code = await communicator.connect()
+            self.assertFalse(connected)
+            self.assertEqual(code, 4001)
+
+    async def test_roles_without_live_metrics_are_closed(self):
+        connected, code = await self.communicator(self.guest).connect()
+
+        self.assertFalse(connected)
+        self.assertEqual(code, 4003)
+
+    async def test_snapshot_then_group_updates(self):
+        communicator = self.communicator(self.manager)
+        connected, _ = await communicator.connect()
+        self.assertTrue(connected)
+
+        snapshot = await communicator.receive_json_from()
+        self.assertEqual(snapshot['type'], 'dashboard.snapshot')
+        self.assertEqual(set(snapshot['metrics']), {'pending_orders', 'low_stock_items'})
+        self.assertEqual(snapshot['metrics']['low_stock_items'][0]['name'], 'Item BATCH-LOW')
+
+        await sync_to_async(self.create_order)('ORD-LIVE')
+        await sync_to_async(LiveUpdateService().publish)('orders')
+
+        update = await communicator.receive_json_from()
+        self.assertEqual(update['type'], 'dashboard.update')
+        self.assertEqual(update['changes']['pending_orders']['value'], 1)
+        self.assertNotIn('revenue_today', update['changes'])
+        await communicator.disconnect()
@@ -0,0 +1,162 @@
+from decimal import Decimal
+from datetime import date, timedelta
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Q
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from orders.models import Order
+from suppliers.models import Supplier
+from inventories.models import InventoryItem
+from users.models import User, UserRole
+from dashboard.repositories.metric_batch import MetricBatch
+from dashboard.repositories.dashboard_repository import DashboardRepository
+from dashboard.services.dashboard_service import DashboardService
+from dashboard.services.dashboard_section_service import DashboardSectionService
+
+
+class DashboardDataMixin:
+    def create_user(self, role_name, email):
+        role, _ = UserRole.objects.get_or_create(name=role_name)
+        return User.objects.create(
+            email=email,
+            first_name='Test',
+            last_name='User',
+            role=role
+        )
+
+    def create_order(self, number, status='pending', total='10.00'):
+        return Order.objects.create(
+            order_number=number,
+            customer_name='Customer',
+            customer_email='customer@example.com',
+            customer_phone='123',
+            shipping_address='Address',
+            billing_address='Address',
+            status=status,
+            subtotal=Decimal(total),
+            total_amount=Decimal(total)
+        )
+
+    def create_item(self, batch_number, quantity, price='2.00', reorder_point='5'):
+        supplier = Supplier.objects.first() or Supplier.objects.create(
+            name='Supplier',
+            contact_person='Contact',
+            email='supplier@example.com',
+            phone='123',
+            address='Address'
+        )
+        return InventoryItem.objects.create(
+            name=f'Item {batch_number}',
+            dairy_type='milk',
+            batch_number=batch_number,
+            quantity=Decimal(quantity),
+            unit='l',
+            price=Decimal(price),
+            expiry_date=date.today() + timedelta(days=60),
+            manufacturing_date=date.today(),
+            storage_condition='refrigerated',
+            optimal_temperature_min=Decimal('1'),
+            optimal_temperature_max=Decimal('4'),
+            reorder_point=Decimal(reorder_point),
+            minimum_order_quantity=Decimal('1'),
+            supplier=supplier
+        )
+
+
+class MetricBatchTests(DashboardDataMixin, TestCase):
+    def setUp(self):
+        self.create_order('ORD-1', status='pending', total='10.00')
+        self.create_order('ORD-2', status='pending', total='20.00')
+        self.create_order('ORD-3', status='delivered', total='5.00')
+
+    def test_one_query_per_source(self):
+        batch = MetricBatch()
+        batch.count('orders', Order)
+        batch.count('pending', Order, Q(status='pending'))
+        batch.sum('revenue', Order, 'total_amount', Q(status='delivered'))
+        batch.sum('pending_value', Order, 'total_amount', Q(status='pending'))
+        batch.distribution('by_status', Order, 'status', ['pending', 'delivered', 'cancelled'])
+
+        with self.assertNumQueries(1):
+            results = batch.execute()
+
+        self.assertEqual(results['orders'], 3)
+        self.assertEqual(results['pending'], 2)
+        self.assertEqual(results['revenue'], Decimal('5.00'))
+        self.assertEqual(results['pending_value'], Decimal('30.00'))
+        self.assertEqual(results['by_status'], [
+            {'status': 'delivered', 'count': 1},
+            {'status': 'pending', 'count': 2}
+        ])
+
+    def test_empty_aggregates_use_default(self):
+        results = MetricBatch().sum(
+            'revenue', Order, 'total_amount', Q(status='returned')
+        ).execute()
+        self.assertEqual(results['revenue'], 0)
+
+    def test_duplicate_names_rejected(self):
+        batch = MetricBatch().count('orders', Order)
+        with self.assertRaises(ValueError):
+            batch.count('orders', Order)
+
+    def test_order_metrics_match_live_queries(self):
+        metrics = DashboardRepository.get_order_metrics('week')
+
+        self.assertEqual(metrics['total_orders'], Order.objects.count())
+        self.assertEqual(
+            metrics['pending_orders'],
+            Order.objects.filter(status='pending').count()
+        )
+        self.assertEqual(metrics['total_revenue'], Decimal('5.00'))
+        self.assertEqual(
+            metrics['order_status_distribution'],
+            list(DashboardRepository.get_order_status_distribution())
+        )
+
+    def test_inventory_metrics(self):
+        self.create_item('B-1', '10', price='2.00')
+        self.create_item('B-2', '3', price='4.00')
+
+        with self.assertNumQueries(1):
+            metrics = DashboardRepository.get_inventory_metrics()
+
+        self.assertEqual(metrics['total_items'], {'count': 2, 'total_quantity': 13.0})
+        self.assertEqual(metrics['stock_value'], 32.0)
+        self.assertEqual(metrics['low_stock_count'], 1)
+
+
+class DashboardQueryBudgetTests(DashboardDataMixin, TestCase):
+    # Maximum SQL statements to build each role's sections from a cold cache
+    ROLE_QUERY_BUDGETS = {
+        'admin': 9,
+        'inventory_manager': 5,
+        'sales_representative': 3,
+        'farmer': 0,
+        'b2b': 3,
+    }
+
+    def setUp(self):
+        self.sections = DashboardSectionService(DashboardService(DashboardRepository))
+        for i in range(5):
+            self.create_order(f'ORD-{i}', status=('pending', 'delivered')[i % 2])
+            self.create_item(f'B-{i}', str(i * 3))
+
+    def test_role_dashboards_stay_within_budget(self):
+        for role, budget in self.ROLE_QUERY_BUDGETS.items():
+            user = self.create_user(role, f'{role}@example.com')
+            cache.clear()
+            with self.subTest(role=role):
+                with CaptureQueriesContext(connection) as queries:
+                    self.sections.get_role_sections(role, user, 'month')
+                self.assertLessEqual(len(queries), budget)
+
+    def test_budget_independent_of_metric_count(self):
+        with CaptureQueriesContext(connection) as few:
+            DashboardRepository.get_order_metrics('week', ('pending_orders',))
+        with CaptureQueriesContext(connection) as many:
+            DashboardRepository.get_order_metrics('year')
+
+        self.assertEqual(len(few), 1)
+        self.assertEqual(len(many), 1)
@@ -0,0 +1,100 @@
+from decimal import Decimal
+from datetime import timedelta
+from django.test import TestCase
+from django.utils import timezone
+from orders.models import Order
+from users.models import User, UserRole
+from dashboard.models import OrderDailyRollup, OrderCreatorDailyRollup
+from dashboard.repositories.rollup_repository import RollupRepository
+from dashboard.repositories.dashboard_repository import DashboardRepository
+
+
+class OrderRollupTests(TestCase):
+    def setUp(self):
+        role = UserRole.objects.create(name='sales_representative')
+        self.user = User.objects.create(
+            email='rep@example.com',
+            first_name='Sales',
+            last_name='Rep',
+            role=role
+        )
+
+    def create_order(self, number, status='pending', total='100.00', **kwargs):
+        return Order.objects.create(
+            order_number=number,
+            customer_name='Customer',
+            customer_email='customer@example.com',
+            customer_phone='123',
+            shipping_address='Address',
+            billing_address='Address',
+            status=status,
+            subtotal=Decimal(total),
+            total_amount=Decimal(total),
+            created_by=self.user,
+            **kwargs
+        )
+
+    def test_order_save_updates_rollups(self):
+        self.create_order('ORD-1')
+        self.create_order('ORD-2', status='delivered', total='50.00')
+
+        self.assertEqual(DashboardRepository.get_total_orders('week'), 2)
+        self.assertEqual(DashboardRepository.get_total_revenue('week'), Decimal('50.00'))
+        self.assertEqual(
+            RollupRepository.get_order_count(timezone.localdate(), status='pending'),
+            1
+        )
+
+    def test_status_change_moves_bucket(self):
+        order = self.create_order('ORD-1')
+        order.status = 'delivered'
+        order.save()
+
+        self.assertEqual(
+            RollupRepository.get_order_count(timezone.localdate(), status='pending'),
+            0
+        )
+        self.assertEqual(DashboardRepository.get_total_revenue('week'), Decimal('100.00'))
+        self.assertEqual(
+            DashboardRepository.get_revenue_trends('week'),
+            [{'updated_at__date': timezone.localdate(), 'daily_revenue': Decimal('100.00')}]
+        )
+
+    def test_delete_removes_contribution(self):
+        order = self.create_order('ORD-1')
+        order.delete()
+
+        self.assertEqual(DashboardRepository.get_total_orders('week'), 0)
+        self.assertEqual(RollupRepository.check_order_rollups(), [])
+
+    def test_user_sales_reads_creator_rollups(self):
+        self.create_order('ORD-1')
+        self.create_order('ORD-2', total='25.00')
+
+        sales = DashboardRepository.get_user_sales(self.user.id, 'week')
+        self.assertEqual(len(sales), 1)
+        self.assertEqual(sales[0]['daily_sales'], 2)
+        self.assertEqual(sales[0]['daily_revenue'], Decimal('125.00'))
+
+    def test_checker_detects_and_rebuild_repairs_drift(self):
+        self.create_order('ORD-1')
+        # Bulk updates bypass signals and leave the rollups stale
+        Order.objects.update(status='confirmed')
+
+        self.assertTrue(RollupRepository.check_order_rollups())
+
+        RollupRepository.rebuild_order_rollups()
+
+        self.assertEqual(RollupRepository.check_order_rollups(), [])
+        self.assertEqual(OrderDailyRollup.objects.get().status, 'confirmed')
+        self.assertEqual(OrderCreatorDailyRollup.objects.get().order_count, 1)
+
+    def test_rollup_window_excludes_older_days(self):
+        order = self.create_order('ORD-1', status='delivered')
+        Order.objects.filter(pk=order.pk).update(
+            updated_at=timezone.now() - timedelta(days=20)
+        )
+        RollupRepository.rebuild_order_rollups()
+
+        self.assertEqual(DashboardRepository.get_total_revenue('week'), 0)
+        self.assertEqual(DashboardRepository.get_total_revenue('month'), Decimal('100.00'))
@@ -0,0 +1,112 @@
+from decimal import Decimal
+from django.test import TestCase
+from orders.models import Order, OrderItem
+from dashboard.models import ProductSalesDaily
+from dashboard.repositories.product_sales_repository import ProductSalesRepository
+from dashboard.repositories.dashboard_repository import DashboardRepository
+from dashboard.tests.test_metric_batch import DashboardDataMixin
+
+
+class ProductSalesTests(DashboardDataMixin, TestCase):
+    def setUp(self):
+        self.seller = self.create_user('sales_representative', 'rep@example.com')
+        self.milk = self.create_item('B-1', '100', price='2.00')
+        self.cheese = self.create_item('B-2', '100', price='10.00')
+
+    def place_order(self, number, lines, status='pending', seller=None):
+        order = self.create_order(number, status=status)
+        order.created_by = seller or self.seller
+        order.save()
+        for item, quantity in lines:
+            OrderItem.objects.create(
+                order=order,
+                inventory_item=item,
+                quantity=quantity,
+                unit_price=item.price,
+                total_price=0
+            )
+        return order
+
+    def top(self, **kwargs):
+        return {
+            row['inventory_item__name']: (row['total_quantity'], row['total_revenue'])
+            for row in ProductSalesRepository.get_top_products(**kwargs)
+        }
+
+    def test_items_are_counted_when_written(self):
+        self.place_order('ORD-1', [(self.milk, 5), (self.cheese, 1)])
+        self.place_order('ORD-2', [(self.milk, 2)])
+
+        self.assertEqual(self.top(), {
+            'Item B-1': (7, Decimal('14.00')),
+            'Item B-2': (1, Decimal('10.00'))
+        })
+        self.assertEqual(ProductSalesRepository.check(), [])
+
+    def test_item_update_and_delete(self):
+        order = self.place_order('ORD-1', [(self.milk, 5)])
+        item = order.items.get()
+        item.quantity = 3
+        item.save()
+        self.assertEqual(self.top(), {'Item B-1': (3, Decimal('6.00'))})
+
+        item.delete()
+        self.assertEqual(self.top(), {})
+        self.assertEqual(ProductSalesRepository.check(), [])
+
+    def test_excluded_statuses_do_not_count(self):
+        self.place_order('ORD-1', [(self.milk, 5)], status='draft')
+        self.assertEqual(self.top(), {})
+
+        order = Order.objects.get(order_number='ORD-1')
+        order.status = 'pending'
+        order.save()
+        self.assertEqual(self.top(), {'Item B-1': (5, Decimal('10.00'))})
+
+        order.status = 'cancelled'
+        order.save()
+        self.assertEqual(self.top(), {})
+        self.assertEqual(ProductSalesRepository.check(), [])
+
+    def test_order_delete_removes_items(self):
+        order = self.place_order('ORD-1', [(self.milk, 5), (self.cheese, 2)])
+        order.delete()
+
+        self.assertEqual(self.top(), {})
+        self.assertEqual(ProductSalesRepository.check(), [])
+
+    def test_per_seller_breakdown(self):
+        other = self.create_user('sales_representative', 'other@example.com')
+        self.place_order('ORD-1', [(self.milk, 5)])
+        self.place_order('ORD-2', [(self.milk, 1), (self.cheese, 4)], seller=other)
+
+        self.assertEqual(
+            [row['inventory_item__name'] for row in
+             DashboardRepository.get_user_popular_products(other.id)],
+            ['Item B-2', 'Item B-1']
+        )
+        breakdown = ProductSalesRepository.get_seller_breakdown(self.milk.id)
+        self.assertEqual(
+            {row['seller_id']: row['total_quantity'] for row in breakdown},
+            {self.seller.id: 5, other.id: 1}
+        )
+
+    def test_top_products_ordering(self):
+        self.place_order('ORD-1', [(self.milk, 12), (self.cheese, 3)])
+
+        by_revenue = DashboardRepository.get_top_products('week')
+        by_quantity = DashboardRepository.get_top_moving_items()
+
+        self.assertEqual(by_revenue[0]['inventory_item__name'], 'Item B-2')
+        self.assertEqual(by_quantity[0]['inventory_item__name'], 'Item B-1')
+        self.assertEqual(by_quantity[0]['total_movement'], 12)
+
+    def test_rebuild_repairs_drift(self):
+        self.place_order('ORD-1', [(self.milk, 5)])
+        OrderItem.objects.update(quantity=9, total_price=Decimal('18.00'))
+        self.assertTrue(ProductSalesRepository.check())
+
+        ProductSalesRepository.rebuild()
+
+        self.assertEqual(ProductSalesRepository.check(), [])
+        self.assertEqual(ProductSalesDaily.objects.get().quantity, 9)
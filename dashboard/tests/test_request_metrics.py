@@ -0,0 +1,87 @@
+from django.test import SimpleTestCase, TestCase, RequestFactory, override_settings
+from django.http import HttpResponse
+from django.urls import resolve
+from utils.request_metrics import RequestMetrics, LocalMetricsStore
+from middlewares.request_metrics_middleware import RequestMetricsMiddleware
+from dashboard.repositories.dashboard_repository import DashboardRepository
+from utils.request_metrics import request_metrics
+
+
+class RequestMetricsTests(SimpleTestCase):
+    def setUp(self):
+        self.metrics = RequestMetrics(store=LocalMetricsStore())
+
+    def test_percentiles_from_buckets(self):
+        for _ in range(90):
+            self.metrics.record('orders', 8, 200)
+        for _ in range(10):
+            self.metrics.record('orders', 700, 200)
+
+        summary = self.metrics.summarize(5)
+
+        self.assertEqual(summary['requests'], 100)
+        self.assertTrue(5 <= summary['p50_ms'] <= 10)
+        self.assertTrue(500 <= summary['p95_ms'] <= 1000)
+        self.assertEqual(summary['throughput_per_minute'], 20.0)
+
+    def test_status_classes_and_error_rates(self):
+        self.metrics.record('orders', 10, 200)
+        self.metrics.record('orders', 10, 404)
+        self.metrics.record('orders', 10, 500, exception=True)
+        self.metrics.record('orders', 10, 503)
+
+        route = self.metrics.summarize(5)['routes']['orders']
+
+        self.assertEqual(route['status_classes'], {'2xx': 1, '4xx': 1, '5xx': 2})
+        self.assertEqual(route['server_error_rate'], 0.5)
+        self.assertEqual(route['client_error_rate'], 0.25)
+        self.assertEqual(route['exceptions'], 1)
+
+    def test_workers_merge_through_shared_store(self):
+        store = LocalMetricsStore()
+        first, second = RequestMetrics(store=store), RequestMetrics(store=store)
+        first.record('orders', 20, 200)
+        second.record('orders', 20, 200)
+        second.record('reports', 3000, 200)
+        first.flush()
+        second.flush()
+
+        routes = RequestMetrics(store=store).summarize(5)['routes']
+
+        self.assertEqual(routes['orders']['requests'], 2)
+        # Interpolated within the 2500-5000ms bucket
+        self.assertEqual(routes['reports']['p99_ms'], 4975.0)
+
+    def test_records_are_buffered_until_flush_interval(self):
+        store = LocalMetricsStore()
+        metrics = RequestMetrics(store=store)
+        with override_settings(REQUEST_METRICS_FLUSH_INTERVAL=3600):
+            metrics.record('orders', 20, 200)
+        self.assertFalse(any(store._minutes.values()))
+
+        metrics.flush()
+        self.assertTrue(any(store._minutes.values()))
+
+
+class RequestMetricsMiddlewareTests(TestCase):
+    def setUp(self):
+        request_metrics.clear()
+
+    def test_middleware_records_route_and_exceptions(self):
+        request = RequestFactory().get('/api/v1/dashboard/summary')
+        request.resolver_match = resolve('/api/v1/dashboard/summary')
+
+        def view(request):
+            middleware.process_exception(request, RuntimeError('boom'))
+            return HttpResponse(status=500)
+
+        middleware = RequestMetricsMiddleware(view)
+        middleware(request)
+
+        errors = DashboardRepository.get_error_rates()
+        self.assertEqual(errors['api_errors'][0]['route'], 'dashboard-summary')
+        self.assertEqual(errors['system_errors'][0]['count'], 1)
+
+        performance = DashboardRepository.get_api_performance_metrics()
+        self.assertEqual(performance['5m']['requests'], 1)
+        self.assertEqual(performance['5m']['slowest_routes'][0]['route'], 'dashboard-summary')
@@ -0,0 +1,105 @@
+import time
+from unittest import mock
+from django.core.cache import cache
+from django.test import TestCase, SimpleTestCase, override_settings
+from rest_framework.test import APIClient
+from users.models import User, UserRole
+from dashboard.services.section_runner import SectionRunner
+from dashboard.services.dashboard_section_service import DashboardSectionService
+
+
+def slow(value, delay):
+    def task():
+        time.sleep(delay)
+        return value
+    return task
+
+def failing():
+    raise RuntimeError('boom')
+
+
+class SectionRunnerTests(SimpleTestCase):
+    def test_sections_run_concurrently(self):
+        runner = SectionRunner(concurrent=True, default_timeout=2)
+        started = time.monotonic()
+        results, statuses = runner.run({
+            'a': slow(1, 0.2),
+            'b': slow(2, 0.2),
+            'c': slow(3, 0.2)
+        })
+
+        self.assertLess(time.monotonic() - started, 0.5)
+        self.assertEqual(results, {'a': 1, 'b': 2, 'c': 3})
+        self.assertTrue(all(s['status'] == 'ok' for s in statuses.values()))
+
+    def test_late_and_failing_sections_return_partial_results(self):
+        runner = SectionRunner(
+            concurrent=True,
+            default_timeout=1,
+            timeouts={'slow': 0.05}
+        )
+        results, statuses = runner.run({
+            'fast': slow('ok', 0),
+            'slow': slow('late', 0.3),
+            'broken': failing
+        })
+
+        self.assertEqual(results, {'fast': 'ok'})
+        self.assertEqual(statuses['fast']['status'], SectionRunner.OK)
+        self.assertEqual(statuses['slow']['status'], SectionRunner.TIMEOUT)
+        self.assertEqual(statuses['broken']['status'], SectionRunner.ERROR)
+
+    def test_sequential_mode_reports_errors(self):
+        runner = SectionRunner(concurrent=False)
+        results, statuses = runner.run({'fast': lambda: 1, 'broken': failing})
+
+        self.assertEqual(results, {'fast': 1})
+        self.assertEqual(statuses['broken']['status'], SectionRunner.ERROR)
+
+    def test_dashboard_returns_partial_sections(self):
+        cache.clear()
+        service = mock.Mock()
+        service.get_user_notifications.return_value = []
+        service.get_recent_activities.side_effect = RuntimeError('down')
+        service.get_inventory_metrics.return_value = {'total_items': {'count': 1}}
+        service.get_low_stock_items.return_value = []
+        service.get_order_metrics.return_value = {'pending_orders': 2}
+        user = mock.Mock(id=1)
+
+        sections = DashboardSectionService(
+            service,
+            runner=SectionRunner(concurrent=True, default_timeout=2)
+        )
+        data, statuses = sections.get_dashboard('sales_representative', user, 'week')
+
+        self.assertEqual(data['order_metrics'], {'pending_orders': 2})
+        self.assertNotIn('recent_activities', data)
+        self.assertEqual(statuses['recent_activities']['status'], 'error')
+        self.assertEqual(statuses['inventory_metrics']['status'], 'ok')
+
+
+@override_settings(DASHBOARD_CONCURRENT_SECTIONS=False)
+class DashboardSummaryViewTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        role = UserRole.objects.create(name='inventory_manager')
+        self.user = User.objects.create(
+            email='manager@example.com',
+            first_name='Inventory',
+            last_name='Manager',
+            role=role
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_response_includes_section_statuses(self):
+        response = self.client.get('/api/v1/dashboard/summary')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            set(response.data['sections']),
+            {'notifications', 'recent_activities', 'inventory_metrics', 'order_metrics'}
+        )
+        self.assertEqual(response.data['sections']['order_metrics']['status'], 'ok')
+        self.assertIn('order_metrics', response.data['data'])
+        self.assertNotIn('market_metrics', response.data['data'])
@@ -2,7 +2,9 @@
 
 from django.urls import path
 from dashboard.views.dashboard_summary_view import DashboardSummaryView
+from dashboard.views.readiness_view import ReadinessView
 
 urlpatterns = [
     path("summary", DashboardSummaryView.as_view(), name="dashboard-summary"),
+    path("health/ready", ReadinessView.as_view(), name="dashboard-readiness"),
 ]
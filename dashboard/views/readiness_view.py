@@ -0,0 +1,26 @@
+from rest_framework.response import Response
+from rest_framework import status
+from rest_framework.views import APIView
+from rest_framework.permissions import AllowAny
+from dashboard.repositories.health_repository import HealthRepository
+from datetime import datetime
+from utils import setup_logger
+
+logger = setup_logger(__name__)
+
+class ReadinessView(APIView):
+    """Unauthenticated readiness probe for load balancers"""
+    permission_classes = [AllowAny]
+    authentication_classes = []
+
+    def get(self, request):
+        ready, components = HealthRepository.check_readiness()
+        if not ready:
+            logger.warning(f"Readiness check failed: {components}")
+
+        return Response({
+            "status": ready,
+            "message": "Ready." if ready else "Not ready.",
+            "components": components,
+            "timestamp": datetime.now().isoformat()
+        }, status=status.HTTP_200_OK if ready else status.HTTP_503_SERVICE_UNAVAILABLE)
@@ -9,6 +9,7 @@ from chats.serializers.chat_serializers import MessageSerializer
 from chats.serializers.chat_serializers import UserSerializer
 from asgiref.sync import sync_to_async
 from channels.db import database_sync_to_async
+from dashboard.services.live_update_service import LiveUpdateService
 from utils import setup_logger
 
 logger = setup_logger(__name__)
@@ -158,4 +159,66 @@ class ChatConsumer(AsyncWebsocketConsumer):
 
     @database_sync_to_async
     def serialize_user(self, user):
-        return UserSerializer(user).data
\ No newline at end of file
+        return UserSerializer(user).data
+
+
+class DashboardConsumer(AsyncWebsocketConsumer):
+    """
+    Live dashboard counters for the connected user's role.
+
+    Sends a snapshot on connect, then the coalesced changes published by
+    LiveUpdateService.
+    """
+    async def connect(self):
+        cookies = self.scope.get('cookies', {})
+        access_token = cookies.get('accessToken')
+
+        if not access_token:
+            await self.close(code=4001)
+            return
+
+        user = await get_user_from_token(access_token)
+        if user is None:
+            await self.close(code=4001)
+            return
+
+        self.user = user
+        self.role_name = await self.get_role_name(user)
+
+        if not LiveUpdateService.metrics_for_role(self.role_name):
+            await self.close(code=4003)
+            return
+
+        self.group_name = LiveUpdateService.group_name(self.role_name)
+        await self.channel_layer.group_add(self.group_name, self.channel_name)
+        await self.accept()
+
+        logger.info(f"User {self.user.id} subscribed to {self.group_name}")
+
+        await self.send(text_data=json.dumps({
+            'type': 'dashboard.snapshot',
+            'metrics': await self.get_snapshot()
+        }))
+
+    async def disconnect(self, close_code):
+        if hasattr(self, 'group_name'):
+            await self.channel_layer.group_discard(
+                self.group_name,
+                self.channel_name
+            )
+
+    async def dashboard_update(self, event):
+        """Handler for dashboard.update events"""
+        await self.send(text_data=json.dumps({
+            'type': 'dashboard.update',
+            'changes': event['changes'],
+            'sent_at': event['sent_at']
+        }))
+
+    @database_sync_to_async
+    def get_role_name(self, user):
+        return user.role.name if user.role else None
+
+    @database_sync_to_async
+    def get_snapshot(self):
+        return LiveUpdateService.get_snapshot(self.role_name)
@@ -1,6 +1,7 @@
 from django.urls import re_path
-from .consumers import ChatConsumer
+from .consumers import ChatConsumer, DashboardConsumer
 
 websocket_urlpatterns = [
     re_path(r'^ws/chat/(?P<receiver_id>[^/]+)/$', ChatConsumer.as_asgi()),
+    re_path(r'^ws/dashboard/$', DashboardConsumer.as_asgi()),
 ]
\ No newline at end of file
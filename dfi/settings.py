@@ -65,6 +65,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'corsheaders',
     'rest_framework',
     'django_filters',
@@ -89,6 +90,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'middlewares.request_metrics_middleware.RequestMetricsMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -136,15 +138,6 @@ DATABASES = {
 }
 
 
-# WebSocket Configuration
-
-CHANNEL_LAYERS = {
-    'default': {
-        'BACKEND': 'channels.layers.InMemoryChannelLayer',
-    },
-}
-
-
 # Password validation
 # https://docs.djangoproject.com/en/3.2/ref/settings/#auth-password-validators
 
@@ -369,6 +362,159 @@ LOGGING = {
 REDIS_HOST = env('REDIS_HOST', default='localhost')
 REDIS_PORT = env('REDIS_PORT', default='6379')
 
+# Cache Configuration
+CACHE_BACKEND = env('CACHE_BACKEND', default='redis')
+
+if CACHE_BACKEND == 'redis':
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': f'redis://{REDIS_HOST}:{REDIS_PORT}/1',
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'dfi-local',
+        }
+    }
+
+# Dashboard section cache TTLs in seconds, overriding the defaults
+DASHBOARD_CACHE_TTLS = {}
+
+# Dashboard sections are evaluated concurrently on a bounded thread pool,
+# each with its own deadline in seconds
+DASHBOARD_CONCURRENT_SECTIONS = env.bool('DASHBOARD_CONCURRENT_SECTIONS', default=True)
+DASHBOARD_SECTION_WORKERS = env.int('DASHBOARD_SECTION_WORKERS', default=4)
+DASHBOARD_SECTION_TIMEOUT = env.float('DASHBOARD_SECTION_TIMEOUT', default=5.0)
+DASHBOARD_SECTION_TIMEOUTS = {}
+
+# Latest notifications embedded in the dashboard, the rest are read from the
+# notification feed
+DASHBOARD_NOTIFICATION_LIMIT = env.int('DASHBOARD_NOTIFICATION_LIMIT', default=5)
+
+# Live dashboard updates over WebSockets, coalesced to one push per topic
+# and interval in seconds
+DASHBOARD_LIVE_UPDATES = env.bool('DASHBOARD_LIVE_UPDATES', default=True)
+DASHBOARD_LIVE_INTERVAL = env.int('DASHBOARD_LIVE_INTERVAL', default=5)
+
+# WebSocket Configuration
+# Live updates are published from Celery workers, so the channel layer has
+# to be shared with the Daphne processes; the in-memory layer is only for
+# local development and tests
+if CACHE_BACKEND == 'redis':
+    CHANNEL_LAYERS = {
+        'default': {
+            'BACKEND': 'channels_redis.core.RedisChannelLayer',
+            'CONFIG': {
+                'hosts': [f'redis://{REDIS_HOST}:{REDIS_PORT}/2'],
+            },
+        },
+    }
+else:
+    CHANNEL_LAYERS = {
+        'default': {
+            'BACKEND': 'channels.layers.InMemoryChannelLayer',
+        },
+    }
+
+# Health probes run by Celery beat and cached for the dashboard; the
+# readiness probe checks the database and cache live. The database, broker
+# and channel layer probes give up after HEALTH_PROBE_TIMEOUT seconds
+HEALTH_PROBE_TIMEOUT = 2.0
+HEALTH_STATUS_TTL = 300
+HEALTH_HEARTBEAT_MAX_AGE = 180
+HEALTH_MONITORED_QUEUES = ['celery']
+HEALTH_MAX_QUEUE_DEPTH = 1000
+
+# Request latency metrics, flushed from each worker to a shared store
+REQUEST_METRICS_BACKEND = 'redis' if CACHE_BACKEND == 'redis' else 'local'
+REQUEST_METRICS_REDIS_URL = f'redis://{REDIS_HOST}:{REDIS_PORT}/1'
+REQUEST_METRICS_FLUSH_INTERVAL = env.int('REQUEST_METRICS_FLUSH_INTERVAL', default=10)
+REQUEST_METRICS_RETENTION_MINUTES = 24 * 60
+REQUEST_METRICS_WINDOWS = (5, 60)
+
+# Report generation runs in Celery; limits count pending and processing
+# reports, and reports unfinished after REPORT_STALE_AFTER seconds are failed
+REPORT_MAX_ACTIVE_PER_USER = env.int('REPORT_MAX_ACTIVE_PER_USER', default=2)
+REPORT_MAX_ACTIVE_GLOBAL = env.int('REPORT_MAX_ACTIVE_GLOBAL', default=10)
+REPORT_TASK_SOFT_TIME_LIMIT = env.int('REPORT_TASK_SOFT_TIME_LIMIT', default=600)
+REPORT_STALE_AFTER = 3600
+
+# Rows fetched from the database and written per chunk when exporting
+REPORT_EXPORT_CHUNK_SIZE = env.int('REPORT_EXPORT_CHUNK_SIZE', default=2000)
+
+# Reports up to this many rows are fetched once and summarised in memory;
+# larger ones are summarised by the database and streamed
+REPORT_SCAN_MAX_ROWS = env.int('REPORT_SCAN_MAX_ROWS', default=50000)
+
+# Larger reports are summarised per date partition by a thread pool:
+# calendar months ('month') or slices of about REPORT_PARTITION_ROWS rows
+# ('rows'). Each worker uses its own database connection.
+REPORT_PARTITION_BY = env('REPORT_PARTITION_BY', default='month')
+REPORT_PARTITION_ROWS = env.int('REPORT_PARTITION_ROWS', default=100000)
+REPORT_PARTITION_WORKERS = env.int('REPORT_PARTITION_WORKERS', default=4)
+
+# Let the web server send report files: 'x-accel-redirect' (nginx, with an
+# internal location at REPORT_DOWNLOAD_ACCEL_PREFIX aliased to MEDIA_ROOT)
+# or 'x-sendfile' (Apache mod_xsendfile, lighttpd). Unset serves from Django.
+REPORT_DOWNLOAD_OFFLOAD = env('REPORT_DOWNLOAD_OFFLOAD', default=None)
+REPORT_DOWNLOAD_ACCEL_PREFIX = '/protected-media/'
+
+# CSV and PDF reports are stored compressed ('gzip', or 'zstd' when the
+# zstandard package is installed; unset stores them as is). Finished reports
+# older than REPORT_RETENTION_DAYS are deleted, and users cannot start new
+# reports once their files take REPORT_USER_QUOTA_BYTES (0 disables).
+REPORT_COMPRESSION = env('REPORT_COMPRESSION', default='gzip')
+REPORT_COMPRESSED_FORMATS = ('csv', 'pdf')
+REPORT_RETENTION_DAYS = env.int('REPORT_RETENTION_DAYS', default=30)
+REPORT_RETENTION_BATCH_SIZE = 500
+REPORT_USER_QUOTA_BYTES = env.int('REPORT_USER_QUOTA_BYTES', default=500 * 1024 * 1024)
+
+# Report subscriptions are generated during the off-peak window, local hours
+# [start, end) that may wrap around midnight, once their period has closed,
+# and at other times only when their scheduled time has passed
+REPORT_OFF_PEAK_HOURS = (
+    env.int('REPORT_OFF_PEAK_START', default=0),
+    env.int('REPORT_OFF_PEAK_END', default=6)
+)
+REPORT_SUBSCRIPTION_BATCH_SIZE = 20
+
+# Frontend route of a report, appended to TRUSTED_ORIGIN in the emails of
+# report subscriptions
+REPORT_LINK_PATH = env('REPORT_LINK_PATH', default='/reports/{report_id}')
+
+# PDF detail rows are rendered as one table per page. Reports with at least
+# REPORT_PDF_PARALLEL_ROWS rows (0 disables) are rendered in segments of
+# REPORT_PDF_SEGMENT_ROWS rows by a process pool; this needs pypdf and a
+# worker that may fork (e.g. celery -P solo or threads)
+REPORT_PDF_ROWS_PER_TABLE = 24
+REPORT_PDF_PARALLEL_ROWS = env.int('REPORT_PDF_PARALLEL_ROWS', default=0)
+REPORT_PDF_SEGMENT_ROWS = 10000
+REPORT_PDF_WORKERS = env.int('REPORT_PDF_WORKERS', default=4)
+
+# Global search reads one SearchDocument table, indexed by a PostgreSQL
+# tsvector column or an SQLite FTS5 table.
+# SEARCH_TEXT_CONFIG is the text search configuration of the vectors;
+# 'simple' does not stem, which keeps batch and order numbers intact
+SEARCH_TEXT_CONFIG = 'simple'
+SEARCH_RESULTS_PER_TYPE = 5
+
+# Fuzzy matching of batch numbers, order numbers and customer names, by
+# pg_trgm word similarity or the SearchTrigram table elsewhere. A value
+# matches when it has at least this share (0 to 1) of the query's trigrams
+SEARCH_TRIGRAM_THRESHOLD = env.float('SEARCH_TRIGRAM_THRESHOLD', default=0.5)
+
+# Queries matching one of these (case-insensitive) are looked up by prefix
+# on the identifier's indexed column instead of going to full-text search.
+# UUIDs and emails are recognized without patterns
+SEARCH_QUERY_PATTERNS = {
+    'order_number': r'ORD-[A-Z0-9-]*',
+    'invoice_number': r'INV-[A-Z0-9-]*',
+    'batch_number': r'(BATCH|LOT)-[A-Z0-9-]*',
+}
+
 # Celery Configuration
 CELERY_BROKER_URL = f'redis://{REDIS_HOST}:{REDIS_PORT}/0'
 CELERY_RESULT_BACKEND = f'redis://{REDIS_HOST}:{REDIS_PORT}/0'
@@ -389,5 +535,47 @@ CELERY_BEAT_SCHEDULE = {
     'check-overdue-orders': {
         'task': 'notifications.tasks.check_overdue_orders',
         'schedule': crontab(hour=9, minute=0)
+    },
+    'reconcile-recent-order-rollups': {
+        'task': 'dashboard.tasks.reconcile_order_rollups',
+        'schedule': crontab(minute=15),
+        'kwargs': {'days': 2}
+    },
+    'reconcile-all-order-rollups': {
+        'task': 'dashboard.tasks.reconcile_order_rollups',
+        'schedule': crontab(hour=3, minute=30)
+    },
+    'reconcile-product-sales': {
+        'task': 'dashboard.tasks.reconcile_product_sales',
+        'schedule': crontab(hour=3, minute=45),
+        'kwargs': {'days': 35}
+    },
+    'reconcile-notification-counters': {
+        'task': 'notifications.tasks.reconcile_notification_counters',
+        'schedule': crontab(hour=4, minute=0)
+    },
+    'fail-stale-reports': {
+        'task': 'reports.tasks.fail_stale_reports',
+        'schedule': crontab(minute='*/10')
+    },
+    'run-report-subscriptions': {
+        'task': 'reports.tasks.run_report_subscriptions',
+        'schedule': crontab(minute='*/10')
+    },
+    'delete-expired-reports': {
+        'task': 'reports.tasks.delete_expired_reports',
+        'schedule': crontab(hour=2, minute=30)
+    },
+    'verify-inventory-summary': {
+        'task': 'inventories.tasks.verify_inventory_summary',
+        'schedule': crontab(minute=5)
+    },
+    'run-health-probes': {
+        'task': 'dashboard.tasks.run_health_probes',
+        'schedule': crontab(minute='*/1'),
+    },
+    'record-worker-heartbeat': {
+        'task': 'dashboard.tasks.record_worker_heartbeat',
+        'schedule': crontab(minute='*/1'),
     }
-}
\ No newline at end of file
+}
@@ -2,12 +2,14 @@ from .exceptions import (
     DatabaseException,
     ServiceException,
     RepositoryException,
-    InvalidDataException
+    InvalidDataException,
+    LimitExceededException
 )
 
 __all__ = [
     "DatabaseException",
     "ServiceException",
     "RepositoryException",
-    "InvalidDataException"
+    "InvalidDataException",
+    "LimitExceededException"
 ]
\ No newline at end of file
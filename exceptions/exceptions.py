@@ -13,4 +13,7 @@ class InvalidDataException(ServiceException):
 class InvalidCredentialsException(ServiceException):
     pass
 
+class LimitExceededException(ServiceException):
+    pass
+
 
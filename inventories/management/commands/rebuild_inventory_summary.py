@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+from inventories.repositories.inventory_summary_repository import InventorySummaryRepository
+
+class Command(BaseCommand):
+    help = 'Rebuild or verify the running inventory totals used by the dashboard'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--check',
+            action='store_true',
+            help='Only compare totals with a live aggregate, do not rebuild'
+        )
+
+    def handle(self, *args, **options):
+        if options['check']:
+            mismatches = InventorySummaryRepository.check()
+            for mismatch in mismatches:
+                self.stdout.write(self.style.WARNING(str(mismatch)))
+            if mismatches:
+                self.stdout.write(
+                    self.style.ERROR(f'{len(mismatches)} inventory summary mismatches found')
+                )
+            else:
+                self.stdout.write(self.style.SUCCESS('Inventory summary is consistent'))
+            return
+
+        rows = InventorySummaryRepository.rebuild()
+        self.stdout.write(
+            self.style.SUCCESS(f'Successfully rebuilt {rows} inventory summary rows')
+        )
@@ -1,3 +1,4 @@
 from .inventory_item import InventoryItem
+from .inventory_summary import InventorySummary
 
-__all__ = ['InventoryItem'] 
\ No newline at end of file
+__all__ = ['InventoryItem', 'InventorySummary']
@@ -1,5 +1,6 @@
 from django.db import models
 from django.core.validators import MinValueValidator, MaxValueValidator
+from search.model_indexes import trigram_indexes
 from .base_model import BaseModel
 import uuid
 
@@ -86,6 +87,7 @@ class InventoryItem(BaseModel):
             models.Index(fields=['batch_number']),
             models.Index(fields=['expiry_date']),
             models.Index(fields=['dairy_type']),
+            *trigram_indexes('inventory_batch_number_trgm', 'batch_number'),
         ]
 
     @property
@@ -0,0 +1,34 @@
+from django.db import models
+
+class InventorySummary(models.Model):
+    """
+    Running totals of active inventory per dairy type and storage condition,
+    kept current by InventoryItem signals.
+    """
+    dairy_type = models.CharField(max_length=20)
+    storage_condition = models.CharField(max_length=20)
+    item_count = models.IntegerField(default=0)
+    total_quantity = models.DecimalField(
+        max_digits=16,
+        decimal_places=2,
+        default=0
+    )
+    total_value = models.DecimalField(
+        max_digits=20,
+        decimal_places=4,
+        default=0
+    )
+    low_stock_count = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['dairy_type', 'storage_condition']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['dairy_type', 'storage_condition'],
+                name='unique_inventory_summary'
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.dairy_type}/{self.storage_condition}: {self.item_count}"
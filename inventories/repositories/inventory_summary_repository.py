@@ -0,0 +1,195 @@
+from django.db import transaction, IntegrityError
+from django.db.models import Sum, Count, F, Q, DecimalField, ExpressionWrapper
+from inventories.models import InventoryItem, InventorySummary
+from utils import setup_logger
+
+logger = setup_logger(__name__)
+
+class InventorySummaryRepository:
+    """
+    Maintains and reads running inventory totals.
+
+    Only active items contribute; soft deleting an item removes it from the
+    totals and restoring it adds it back.
+    """
+    ITEM_FIELDS = (
+        'dairy_type',
+        'storage_condition',
+        'is_active',
+        'quantity',
+        'price',
+        'reorder_point'
+    )
+
+    # Incremental maintenance
+    @staticmethod
+    def get_item_snapshot(item_id):
+        """Get the persisted summary-relevant state of an item"""
+        return InventoryItem.objects.filter(pk=item_id)\
+            .values(*InventorySummaryRepository.ITEM_FIELDS).first()
+
+    @staticmethod
+    def snapshot_from_instance(item):
+        return {
+            field: getattr(item, field)
+            for field in InventorySummaryRepository.ITEM_FIELDS
+        }
+
+    @staticmethod
+    def _contribution(snapshot):
+        """Bucket and deltas an item adds to the totals, or None"""
+        if not snapshot or not snapshot['is_active']:
+            return None
+        quantity = snapshot['quantity'] or 0
+        return (
+            (snapshot['dairy_type'], snapshot['storage_condition']),
+            {
+                'item_count': 1,
+                'total_quantity': quantity,
+                'total_value': quantity * (snapshot['price'] or 0),
+                'low_stock_count': int(quantity <= (snapshot['reorder_point'] or 0))
+            }
+        )
+
+    @staticmethod
+    def apply_change(old, new):
+        """Move an item's contribution from its old state to its new one"""
+        before = InventorySummaryRepository._contribution(old)
+        after = InventorySummaryRepository._contribution(new)
+        if before == after:
+            return
+
+        try:
+            with transaction.atomic():
+                if before:
+                    InventorySummaryRepository._apply(*before, sign=-1)
+                if after:
+                    InventorySummaryRepository._apply(*after, sign=1)
+        except Exception as e:
+            # Drift is corrected by the verification task
+            logger.error(f"Repository: Error applying inventory summary change: {str(e)}")
+
+    @staticmethod
+    def _apply(key, deltas, sign):
+        dairy_type, storage_condition = key
+        lookup = {'dairy_type': dairy_type, 'storage_condition': storage_condition}
+        updates = {
+            field: F(field) + value * sign
+            for field, value in deltas.items()
+        }
+
+        if InventorySummary.objects.filter(**lookup).update(**updates):
+            return
+        if sign < 0:
+            logger.warning(f"Repository: Missing InventorySummary row for {lookup}")
+            return
+        try:
+            with transaction.atomic():
+                InventorySummary.objects.create(**lookup, **deltas)
+        except IntegrityError:
+            # Created concurrently by another writer
+            InventorySummary.objects.filter(**lookup).update(**updates)
+
+    # Verification
+    @staticmethod
+    def _live_totals():
+        rows = InventoryItem.objects.filter(is_active=True).values(
+            'dairy_type',
+            'storage_condition'
+        ).annotate(
+            live_items=Count('id'),
+            live_quantity=Sum('quantity'),
+            live_value=Sum(ExpressionWrapper(
+                F('quantity') * F('price'),
+                output_field=DecimalField(max_digits=20, decimal_places=4)
+            )),
+            live_low_stock=Count('id', filter=Q(quantity__lte=F('reorder_point')))
+        ).order_by()
+        return {
+            (row['dairy_type'], row['storage_condition']): {
+                'item_count': row['live_items'],
+                'total_quantity': row['live_quantity'] or 0,
+                'total_value': row['live_value'] or 0,
+                'low_stock_count': row['live_low_stock']
+            }
+            for row in rows
+        }
+
+    @staticmethod
+    def _stored_totals():
+        return {
+            (row.dairy_type, row.storage_condition): {
+                'item_count': row.item_count,
+                'total_quantity': row.total_quantity,
+                'total_value': row.total_value,
+                'low_stock_count': row.low_stock_count
+            }
+            for row in InventorySummary.objects.all()
+        }
+
+    @staticmethod
+    def check():
+        """Compare stored totals with a live aggregate and return mismatches"""
+        empty = {
+            'item_count': 0,
+            'total_quantity': 0,
+            'total_value': 0,
+            'low_stock_count': 0
+        }
+        live = InventorySummaryRepository._live_totals()
+        stored = InventorySummaryRepository._stored_totals()
+
+        mismatches = []
+        for key in set(live) | set(stored):
+            expected = live.get(key, empty)
+            actual = stored.get(key, empty)
+            if expected != actual:
+                mismatches.append({
+                    'key': key,
+                    'expected': expected,
+                    'actual': actual
+                })
+        return mismatches
+
+    @staticmethod
+    def rebuild():
+        """Recompute all totals from the inventory table"""
+        live = InventorySummaryRepository._live_totals()
+        with transaction.atomic():
+            InventorySummary.objects.all().delete()
+            InventorySummary.objects.bulk_create([
+                InventorySummary(
+                    dairy_type=dairy_type,
+                    storage_condition=storage_condition,
+                    **totals
+                )
+                for (dairy_type, storage_condition), totals in live.items()
+            ])
+        logger.info(f"Rebuilt {len(live)} inventory summary rows")
+        return len(live)
+
+    # Reads
+    @staticmethod
+    def get_totals():
+        """Get overall totals in a single query over the summary rows"""
+        totals = InventorySummary.objects.aggregate(
+            item_count=Sum('item_count'),
+            total_quantity=Sum('total_quantity'),
+            total_value=Sum('total_value'),
+            low_stock_count=Sum('low_stock_count')
+        )
+        return {key: value or 0 for key, value in totals.items()}
+
+    @staticmethod
+    def get_breakdown():
+        """Get totals per dairy type and storage condition"""
+        return list(
+            InventorySummary.objects.filter(item_count__gt=0).values(
+                'dairy_type',
+                'storage_condition',
+                'item_count',
+                'total_quantity',
+                'total_value',
+                'low_stock_count'
+            )
+        )
@@ -0,0 +1,28 @@
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+from inventories.models import InventoryItem
+from inventories.repositories.inventory_summary_repository import InventorySummaryRepository
+
+@receiver(pre_save, sender=InventoryItem)
+def capture_inventory_summary_state(sender, instance, raw=False, **kwargs):
+    if raw or instance._state.adding:
+        instance._summary_previous = None
+        return
+    instance._summary_previous = InventorySummaryRepository.get_item_snapshot(instance.pk)
+
+@receiver(post_save, sender=InventoryItem)
+def update_inventory_summary(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    InventorySummaryRepository.apply_change(
+        getattr(instance, '_summary_previous', None),
+        InventorySummaryRepository.snapshot_from_instance(instance)
+    )
+    instance._summary_previous = None
+
+@receiver(post_delete, sender=InventoryItem)
+def remove_item_from_inventory_summary(sender, instance, **kwargs):
+    InventorySummaryRepository.apply_change(
+        InventorySummaryRepository.snapshot_from_instance(instance),
+        None
+    )
@@ -0,0 +1,22 @@
+from celery import shared_task
+from inventories.repositories.inventory_summary_repository import InventorySummaryRepository
+from utils import setup_logger
+
+logger = setup_logger(__name__)
+
+@shared_task
+def verify_inventory_summary():
+    """Compare the running inventory totals with the live table and repair drift"""
+    try:
+        mismatches = InventorySummaryRepository.check()
+        if mismatches:
+            logger.warning(
+                f"Found {len(mismatches)} drifted inventory summary rows, rebuilding"
+            )
+            InventorySummaryRepository.rebuild()
+
+        logger.info(f"Verified inventory summary ({len(mismatches)} mismatches)")
+        return len(mismatches)
+    except Exception as e:
+        logger.error(f"Error verifying inventory summary: {str(e)}")
+        return False
@@ -0,0 +1,99 @@
+from decimal import Decimal
+from io import StringIO
+from django.core.management import call_command
+from django.test import TestCase
+from inventories.models import InventoryItem, InventorySummary
+from inventories.repositories.inventory_summary_repository import InventorySummaryRepository
+from dashboard.repositories.dashboard_repository import DashboardRepository
+from dashboard.tests.test_metric_batch import DashboardDataMixin
+
+
+class InventorySummaryTests(DashboardDataMixin, TestCase):
+    def totals(self):
+        return InventorySummaryRepository.get_totals()
+
+    def assertConsistent(self):
+        self.assertEqual(InventorySummaryRepository.check(), [])
+
+    def test_created_items_are_counted(self):
+        self.create_item('B-1', '10', price='2.00')
+        self.create_item('B-2', '3', price='4.00')
+
+        self.assertEqual(self.totals(), {
+            'item_count': 2,
+            'total_quantity': Decimal('13.00'),
+            'total_value': Decimal('32.0000'),
+            'low_stock_count': 1
+        })
+        self.assertConsistent()
+
+    def test_update_stock_moves_low_stock_state(self):
+        item = self.create_item('B-1', '10', price='2.00')
+
+        item.update_stock(Decimal('7'), 'subtract')
+        self.assertEqual(self.totals()['low_stock_count'], 1)
+        self.assertEqual(self.totals()['total_value'], Decimal('6.0000'))
+
+        item.update_stock(Decimal('20'), 'add')
+        self.assertEqual(self.totals()['low_stock_count'], 0)
+        self.assertEqual(self.totals()['total_quantity'], Decimal('23.00'))
+        self.assertConsistent()
+
+    def test_price_change_updates_value(self):
+        item = self.create_item('B-1', '10', price='2.00')
+        item.price = Decimal('3.50')
+        item.save()
+
+        self.assertEqual(self.totals()['total_value'], Decimal('35.0000'))
+        self.assertConsistent()
+
+    def test_soft_delete_and_restore(self):
+        item = self.create_item('B-1', '10')
+        self.create_item('B-2', '4')
+
+        item.soft_delete()
+        self.assertEqual(self.totals()['item_count'], 1)
+        self.assertConsistent()
+
+        item.restore()
+        self.assertEqual(self.totals()['item_count'], 2)
+        self.assertConsistent()
+
+    def test_low_stock_list_matches_the_count(self):
+        self.create_item('B-1', '3')
+        self.create_item('B-2', '4').soft_delete()
+
+        items = DashboardRepository.get_low_stock_items()
+        self.assertEqual([item['name'] for item in items], ['Item B-1'])
+        self.assertEqual(len(items), self.totals()['low_stock_count'])
+
+    def test_delete_and_bucket_change(self):
+        item = self.create_item('B-1', '10')
+        item.storage_condition = 'frozen'
+        item.save()
+
+        self.assertEqual(
+            [(row['storage_condition'], row['item_count'])
+             for row in InventorySummaryRepository.get_breakdown()],
+            [('frozen', 1)]
+        )
+
+        item.delete()
+        self.assertEqual(self.totals()['item_count'], 0)
+        self.assertConsistent()
+
+    def test_rebuild_repairs_drift(self):
+        self.create_item('B-1', '10', price='2.00')
+        InventoryItem.objects.update(quantity=Decimal('1'))
+        self.assertTrue(InventorySummaryRepository.check())
+
+        out = StringIO()
+        call_command('rebuild_inventory_summary', '--check', stdout=out)
+        self.assertIn('1 inventory summary mismatches found', out.getvalue())
+
+        out = StringIO()
+        call_command('rebuild_inventory_summary', stdout=out)
+
+        self.assertIn('Successfully rebuilt 1 inventory summary rows', out.getvalue())
+        self.assertConsistent()
+        self.assertEqual(InventorySummary.objects.get().low_stock_count, 1)
@@ -0,0 +1,30 @@
+import time
+from utils.request_metrics import request_metrics
+
+class RequestMetricsMiddleware:
+    """Records per-route latency and status class for every request"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        started = time.perf_counter()
+        response = self.get_response(request)
+        request_metrics.record(
+            self.get_route(request),
+            (time.perf_counter() - started) * 1000,
+            response.status_code,
+            exception=getattr(request, '_metrics_exception', False)
+        )
+        return response
+
+    def process_exception(self, request, exception):
+        request._metrics_exception = True
+        return None
+
+    @staticmethod
+    def get_route(request):
+        match = getattr(request, 'resolver_match', None)
+        if match is None:
+            return 'unresolved'
+        return match.url_name or match.route or match.view_name
@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+from notifications.repositories.notification_counter_repository import NotificationCounterRepository
+
+class Command(BaseCommand):
+    help = 'Rebuild or verify the per-user notification counters'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--check',
+            action='store_true',
+            help='Only compare counters with a live count, do not rebuild'
+        )
+
+    def handle(self, *args, **options):
+        if options['check']:
+            mismatches = NotificationCounterRepository.check()
+            for mismatch in mismatches:
+                self.stdout.write(self.style.WARNING(str(mismatch)))
+            if mismatches:
+                self.stdout.write(
+                    self.style.ERROR(f'{len(mismatches)} notification counter mismatches found')
+                )
+            else:
+                self.stdout.write(self.style.SUCCESS('Notification counters are consistent'))
+            return
+
+        rows = NotificationCounterRepository.rebuild()
+        self.stdout.write(
+            self.style.SUCCESS(f'Successfully rebuilt {rows} notification counters')
+        )
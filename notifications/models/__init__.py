@@ -1,3 +1,4 @@
 from .notification import Notification
+from .notification_counter import NotificationCounter
 
-__all__ = ['Notification']
\ No newline at end of file
+__all__ = ['Notification', 'NotificationCounter']
@@ -0,0 +1,19 @@
+from django.db import models
+
+class NotificationCounter(models.Model):
+    """
+    Per-user notification counts, kept current by Notification signals and
+    the repository's bulk update paths.
+    """
+    user = models.OneToOneField(
+        'users.User',
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='notification_counter'
+    )
+    total_count = models.IntegerField(default=0)
+    unread_count = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.user_id}: {self.unread_count}/{self.total_count}"
@@ -0,0 +1,140 @@
+from django.db import transaction, IntegrityError
+from django.db.models import Count, F, Q
+from notifications.models import Notification, NotificationCounter
+from utils import setup_logger
+
+logger = setup_logger(__name__)
+
+class NotificationCounterRepository:
+    """
+    Maintains and reads the per-user notification counts.
+
+    A missing counter row is initialised from a live count the first time it
+    is read, so users created before the counters existed need no backfill.
+    """
+
+    # Incremental maintenance
+    @staticmethod
+    def get_notification_snapshot(notification_id):
+        """Get the persisted count-relevant state of a notification"""
+        return Notification.objects.filter(pk=notification_id)\
+            .values('user_id', 'read').first()
+
+    @staticmethod
+    def snapshot_from_instance(notification):
+        return {'user_id': notification.user_id, 'read': notification.read}
+
+    @staticmethod
+    def apply_change(old, new):
+        """Move a notification's contribution from its old state to its new one"""
+        if old == new:
+            return
+        try:
+            with transaction.atomic():
+                for snapshot, sign in ((old, -1), (new, 1)):
+                    if snapshot:
+                        NotificationCounterRepository.adjust(
+                            snapshot['user_id'],
+                            total=sign,
+                            unread=sign * int(not snapshot['read'])
+                        )
+        except Exception as e:
+            # Drift is corrected by the reconciliation task
+            logger.error(f"Repository: Error applying notification count change: {str(e)}")
+
+    @staticmethod
+    def adjust(user_id, total=0, unread=0):
+        """
+        Apply count deltas for a user.
+
+        Users without a counter row are skipped; their counter is initialised
+        from the table, which already includes the change, on the next read.
+        """
+        if not total and not unread:
+            return
+        NotificationCounter.objects.filter(user_id=user_id).update(
+            total_count=F('total_count') + total,
+            unread_count=F('unread_count') + unread
+        )
+
+    # Reads
+    @staticmethod
+    def _live_counts(user_ids=None):
+        queryset = Notification.objects.all()
+        if user_ids is not None:
+            queryset = queryset.filter(user_id__in=user_ids)
+        rows = queryset.values('user_id').annotate(
+            live_total=Count('id'),
+            live_unread=Count('id', filter=Q(read=False))
+        ).order_by()
+        return {
+            row['user_id']: {
+                'total_count': row['live_total'],
+                'unread_count': row['live_unread']
+            }
+            for row in rows
+        }
+
+    @staticmethod
+    def get_counts(user_id):
+        """Get total and unread counts for a user"""
+        counter = NotificationCounter.objects.filter(user_id=user_id)\
+            .values('total_count', 'unread_count').first()
+        if counter is not None:
+            return counter
+
+        counts = NotificationCounterRepository._live_counts([user_id]).get(
+            user_id,
+            {'total_count': 0, 'unread_count': 0}
+        )
+        try:
+            with transaction.atomic():
+                NotificationCounter.objects.create(user_id=user_id, **counts)
+        except IntegrityError:
+            # Initialised concurrently by another request
+            pass
+        return counts
+
+    # Verification
+    @staticmethod
+    def check():
+        """Compare stored counters with a live count and return mismatches"""
+        live = NotificationCounterRepository._live_counts()
+        stored = {
+            row['user_id']: {
+                'total_count': row['total_count'],
+                'unread_count': row['unread_count']
+            }
+            for row in NotificationCounter.objects.values(
+                'user_id', 'total_count', 'unread_count'
+            )
+        }
+
+        empty = {'total_count': 0, 'unread_count': 0}
+        mismatches = []
+        # Users without a counter row are initialised lazily on read
+        for user_id, actual in stored.items():
+            expected = live.get(user_id, empty)
+            if expected != actual:
+                mismatches.append({
+                    'user_id': user_id,
+                    'expected': expected,
+                    'actual': actual
+                })
+        return mismatches
+
+    @staticmethod
+    def rebuild(user_ids=None):
+        """Recompute counters for the given users (every user when omitted)"""
+        live = NotificationCounterRepository._live_counts(user_ids)
+        with transaction.atomic():
+            stale = NotificationCounter.objects.all()
+            if user_ids is not None:
+                stale = stale.filter(user_id__in=user_ids)
+            stale.delete()
+            NotificationCounter.objects.bulk_create([
+                NotificationCounter(user_id=user_id, **counts)
+                for user_id, counts in live.items()
+            ], batch_size=1000)
+        logger.info(f"Rebuilt {len(live)} notification counters")
+        return len(live)
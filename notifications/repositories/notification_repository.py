@@ -1,10 +1,17 @@
+import base64
+import uuid
+from datetime import datetime
 from django.db import DatabaseError
+from django.db.models import Q
 from notifications.models import Notification
-from exceptions import DatabaseException, RepositoryException
+from notifications.repositories.notification_counter_repository import NotificationCounterRepository
+from exceptions import DatabaseException, RepositoryException, InvalidDataException
+from dashboard.services.dashboard_cache import DashboardCache
 from django.utils import timezone
 from utils import setup_logger
 
 logger = setup_logger(__name__)
+dashboard_cache = DashboardCache()
 
 class NotificationRepository:
     @staticmethod
@@ -46,10 +53,16 @@ class NotificationRepository:
             )
             
             if mark_as_read:
-                notifications.filter(read=False).update(
+                updated = notifications.filter(read=False).update(
                     read=True,
                     read_at=timezone.now()
                 )
+                if updated:
+                    # Bulk updates bypass the counter and invalidation signals
+                    NotificationCounterRepository.adjust(user_id, unread=-updated)
+                    dashboard_cache.invalidate(
+                        DashboardCache.user_tag('notifications', user_id)
+                    )
 
             return notifications
         except DatabaseError as e:
@@ -94,6 +107,10 @@ class NotificationRepository:
             
             if result:
                 logger.info(f"Marked notification {notification_id} as read")
+                NotificationCounterRepository.adjust(user_id, unread=-result)
+                dashboard_cache.invalidate(
+                    DashboardCache.user_tag('notifications', user_id)
+                )
             
             return bool(result)
         except DatabaseError as e:
@@ -118,6 +135,11 @@ class NotificationRepository:
             )
             
             logger.info(f"Marked {result} notifications as read for user {user_id}")
+            if result:
+                NotificationCounterRepository.adjust(user_id, unread=-result)
+                dashboard_cache.invalidate(
+                    DashboardCache.user_tag('notifications', user_id)
+                )
             return result
         except DatabaseError as e:
             logger.error(f"Database error marking all notifications as read: {str(e)}")
@@ -126,6 +148,67 @@ class NotificationRepository:
             logger.error(f"Repository error marking all notifications as read: {str(e)}")
             raise RepositoryException("Failed to mark all notifications as read")
     
+    @staticmethod
+    def encode_cursor(notification):
+        """Opaque cursor for the position after a notification"""
+        raw = f"{notification.created_at.isoformat()}|{notification.id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    @staticmethod
+    def decode_cursor(cursor):
+        try:
+            created_at, notification_id = base64.urlsafe_b64decode(
+                cursor.encode()
+            ).decode().split('|')
+            return datetime.fromisoformat(created_at), uuid.UUID(notification_id)
+        except (ValueError, UnicodeDecodeError):
+            raise InvalidDataException("Invalid notification cursor")
+
+    @staticmethod
+    def get_feed(user_id, cursor=None, limit=20):
+        """
+        Get a page of a user's notifications, newest first.
+
+        Keyset pagination on (created_at, id) walks the (user, -created_at)
+        index, so every page costs the same however deep the cursor is.
+        Returns the page and the cursor of the next one, or None at the end.
+        """
+        try:
+            queryset = Notification.objects.filter(user_id=user_id)
+            if cursor:
+                created_at, notification_id = NotificationRepository.decode_cursor(cursor)
+                queryset = queryset.filter(
+                    Q(created_at__lt=created_at) |
+                    Q(created_at=created_at, id__lt=notification_id)
+                )
+
+            page = list(
+                queryset.select_related('user')
+                .order_by('-created_at', '-id')[:limit + 1]
+            )
+            next_cursor = None
+            if len(page) > limit:
+                page = page[:limit]
+                next_cursor = NotificationRepository.encode_cursor(page[-1])
+            return page, next_cursor
+        except InvalidDataException:
+            raise
+        except DatabaseError as e:
+            logger.error(f"Database error fetching notification feed: {str(e)}")
+            raise DatabaseException("Failed to fetch notification feed")
+        except Exception as e:
+            logger.error(f"Repository error fetching notification feed: {str(e)}")
+            raise RepositoryException("Failed to fetch notification feed")
+
+    @staticmethod
+    def get_counts(user_id):
+        """Get maintained total and unread counts for a user"""
+        try:
+            return NotificationCounterRepository.get_counts(user_id)
+        except Exception as e:
+            logger.error(f"Repository error fetching notification counts: {str(e)}")
+            raise RepositoryException("Failed to fetch notification counts")
+
     def delete_notification(self, notification_id) -> bool:
         """Delete a notification by its ID"""
         try:
@@ -4,7 +4,7 @@ from django.db.models import Q
 from inventories.models import InventoryItem
 from notifications.repositories.notification_repository import NotificationRepository
 from emails.services import EmailService
-from exceptions import RepositoryException
+from exceptions import RepositoryException, InvalidDataException
 from utils import setup_logger
 
 logger = setup_logger(__name__)
@@ -20,15 +20,37 @@ class NotificationService:
             notifications = self.notification_repository.get_notifications_by_user(
                 user_id
             )
+            counts = self.notification_repository.get_counts(user_id)
             return {
                 "notifications": notifications,
-                "total_count": notifications.count(),
-                "unread_count": notifications.filter(read=False).count()
+                "total_count": counts['total_count'],
+                "unread_count": counts['unread_count']
             }
         except Exception as e:
             logger.error(f"Failed to get notifications for user {user_id}: {str(e)}")
             raise RepositoryException("Failed to fetch notifications")
 
+    def get_notification_feed(self, user_id, cursor=None, limit=20):
+        """Get a cursor-paginated page of a user's notifications"""
+        try:
+            notifications, next_cursor = self.notification_repository.get_feed(
+                user_id,
+                cursor=cursor,
+                limit=limit
+            )
+            counts = self.notification_repository.get_counts(user_id)
+            return {
+                "notifications": notifications,
+                "next_cursor": next_cursor,
+                "total_count": counts['total_count'],
+                "unread_count": counts['unread_count']
+            }
+        except InvalidDataException:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to get notification feed for user {user_id}: {str(e)}")
+            raise RepositoryException("Failed to fetch notification feed")
+
     def mark_notifications_as_read(self, user_id, notification_id):
         """Mark specific notifications as read"""
         try:
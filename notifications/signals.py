@@ -0,0 +1,30 @@
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+from notifications.models import Notification
+from notifications.repositories.notification_counter_repository import NotificationCounterRepository
+
+@receiver(pre_save, sender=Notification)
+def capture_notification_count_state(sender, instance, raw=False, **kwargs):
+    if raw or instance._state.adding:
+        instance._counter_previous = None
+        return
+    instance._counter_previous = NotificationCounterRepository.get_notification_snapshot(
+        instance.pk
+    )
+
+@receiver(post_save, sender=Notification)
+def update_notification_counter(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    NotificationCounterRepository.apply_change(
+        getattr(instance, '_counter_previous', None),
+        NotificationCounterRepository.snapshot_from_instance(instance)
+    )
+    instance._counter_previous = None
+
+@receiver(post_delete, sender=Notification)
+def remove_notification_from_counter(sender, instance, **kwargs):
+    NotificationCounterRepository.apply_change(
+        NotificationCounterRepository.snapshot_from_instance(instance),
+        None
+    )
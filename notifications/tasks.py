@@ -8,6 +8,7 @@ from inventories.models import InventoryItem
 from notifications.services import NotificationService
 from django.contrib.auth import get_user_model
 from notifications.services import EmailService
+from notifications.repositories.notification_counter_repository import NotificationCounterRepository
 from utils import setup_logger
 
 logger = setup_logger(__name__)
@@ -422,3 +423,22 @@ def send_notification_email(notification_id):
             f"Error in send_notification_email for \
                 {notification_id}: {str(e)}"
             )
+
+@shared_task
+def reconcile_notification_counters():
+    """Compare notification counters with live counts and repair drift"""
+    try:
+        mismatches = NotificationCounterRepository.check()
+        if mismatches:
+            logger.warning(
+                f"Found {len(mismatches)} drifted notification counters, rebuilding"
+            )
+            NotificationCounterRepository.rebuild(
+                [mismatch['user_id'] for mismatch in mismatches]
+            )
+
+        logger.info(f"Reconciled notification counters ({len(mismatches)} mismatches)")
+        return len(mismatches)
+    except Exception as e:
+        logger.error(f"Error reconciling notification counters: {str(e)}")
+        return False
@@ -0,0 +1,121 @@
+from datetime import timedelta
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from notifications.models import Notification, NotificationCounter
+from notifications.repositories.notification_repository import NotificationRepository
+from notifications.repositories.notification_counter_repository import NotificationCounterRepository
+from users.models import User, UserRole
+
+
+class NotificationTestMixin:
+    def setUp(self):
+        self.user = User.objects.create(
+            email='user@example.com',
+            first_name='Test',
+            last_name='User',
+            role=UserRole.objects.create(name='admin')
+        )
+
+    def notify(self, count=1, **kwargs):
+        return [
+            Notification.objects.create(
+                notification_type='system',
+                notification_title=f'Notification {i}',
+                message='Message',
+                user=kwargs.get('user', self.user)
+            )
+            for i in range(count)
+        ]
+
+
+class NotificationFeedTests(NotificationTestMixin, TestCase):
+    def test_pages_walk_the_feed_without_gaps(self):
+        notifications = self.notify(7)
+        # Identical timestamps are ordered by id
+        Notification.objects.filter(
+            id__in=[n.id for n in notifications[:3]]
+        ).update(created_at=timezone.now() - timedelta(hours=1))
+
+        seen, cursor = [], None
+        while True:
+            page, cursor = NotificationRepository.get_feed(
+                self.user.id,
+                cursor=cursor,
+                limit=3
+            )
+            seen.extend(n.id for n in page)
+            if cursor is None:
+                break
+
+        expected = Notification.objects.filter(user=self.user)\
+            .order_by('-created_at', '-id').values_list('id', flat=True)
+        self.assertEqual(seen, list(expected))
+
+    def test_page_query_does_not_grow_with_users(self):
+        self.notify(5)
+        with self.assertNumQueries(1):
+            page, _ = NotificationRepository.get_feed(self.user.id, limit=5)
+            [n.user.email for n in page]
+
+    def test_feed_view(self):
+        self.notify(3)
+        client = APIClient()
+        client.force_authenticate(self.user)
+
+        response = client.get(reverse('notification-feed'), {'limit': 2})
+        data = response.json()['data']
+        self.assertEqual(len(data['notifications']['results']), 2)
+        self.assertEqual(data['stats'], {'total_count': 3, 'unread_count': 3})
+
+        response = client.get(
+            reverse('notification-feed'),
+            {'cursor': data['notifications']['next_cursor']}
+        )
+        data = response.json()['data']
+        self.assertEqual(len(data['notifications']['results']), 1)
+        self.assertIsNone(data['notifications']['next_cursor'])
+
+        response = client.get(reverse('notification-feed'), {'cursor': 'bogus'})
+        self.assertEqual(response.status_code, 400)
+
+
+class NotificationCounterTests(NotificationTestMixin, TestCase):
+    def counts(self):
+        return NotificationCounterRepository.get_counts(self.user.id)
+
+    def test_counter_initialised_lazily_then_maintained(self):
+        self.notify(2)
+        self.assertFalse(NotificationCounter.objects.exists())
+        self.assertEqual(self.counts(), {'total_count': 2, 'unread_count': 2})
+
+        notification, = self.notify()
+        notification.mark_as_read()
+        with self.assertNumQueries(1):
+            self.assertEqual(self.counts(), {'total_count': 3, 'unread_count': 2})
+
+        notification.delete()
+        self.assertEqual(self.counts(), {'total_count': 2, 'unread_count': 2})
+
+    def test_bulk_read_paths_update_counter(self):
+        first, _, _ = self.notify(3)
+        self.counts()
+
+        NotificationRepository.mark_as_read(self.user.id, first.id)
+        self.assertEqual(self.counts()['unread_count'], 2)
+
+        NotificationRepository.mark_all_as_read(self.user.id)
+        self.assertEqual(self.counts(), {'total_count': 3, 'unread_count': 0})
+        self.assertEqual(NotificationCounterRepository.check(), [])
+
+    def test_reconcile_repairs_drift(self):
+        self.notify(2)
+        self.counts()
+        Notification.objects.update(read=True)
+        self.assertTrue(NotificationCounterRepository.check())
+
+        NotificationCounterRepository.rebuild()
+
+        self.assertEqual(NotificationCounterRepository.check(), [])
+        self.assertEqual(self.counts()['unread_count'], 0)
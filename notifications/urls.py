@@ -3,9 +3,11 @@ from notifications.views.list_view import NotificationListView
 from notifications.views.mark_all_read_view import NotificationMarkAllReadView
 from notifications.views.mark_read_view import NotificationMarkReadView
 from notifications.views.delete_view import NotificationDeleteView
+from notifications.views.feed_view import NotificationFeedView
 
 urlpatterns = [
     path('', NotificationListView.as_view(), name='notification-list'),
+    path('feed', NotificationFeedView.as_view(), name='notification-feed'),
     path('<str:id>', NotificationMarkReadView.as_view(), name='notification-mark-read'),
     path('<str:id>/delete', NotificationDeleteView.as_view(), name='notification-delete'),
     path('mark-all/', NotificationMarkAllReadView.as_view(), name='notification-mark-all-read'),
@@ -0,0 +1,58 @@
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from notifications.services.notification_service import NotificationService
+from notifications.serializers import NotificationSerializer
+from exceptions import InvalidDataException
+from utils import setup_logger
+
+logger = setup_logger(__name__)
+
+class NotificationFeedView(APIView):
+    permission_classes = [IsAuthenticated]
+    notification_service = NotificationService()
+    DEFAULT_LIMIT = 20
+    MAX_LIMIT = 100
+
+    def get(self, request):
+        """Get a page of notifications, continuing from `cursor` when given"""
+        try:
+            try:
+                limit = int(request.query_params.get('limit', self.DEFAULT_LIMIT))
+            except ValueError:
+                limit = self.DEFAULT_LIMIT
+            limit = max(1, min(limit, self.MAX_LIMIT))
+
+            feed = self.notification_service.get_notification_feed(
+                user_id=request.user.id,
+                cursor=request.query_params.get('cursor'),
+                limit=limit
+            )
+            serializer = NotificationSerializer(feed['notifications'], many=True)
+
+            return Response({
+                "status": True,
+                "message": "Notifications fetched successfully",
+                "data": {
+                    "notifications": {
+                        'results': serializer.data,
+                        'next_cursor': feed['next_cursor']
+                    },
+                    "stats": {
+                        'total_count': feed['total_count'],
+                        'unread_count': feed['unread_count']
+                    }
+                }
+            }, status=status.HTTP_200_OK)
+        except InvalidDataException as e:
+            return Response({
+                "status": False,
+                "message": str(e)
+            }, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            logger.error(f"Unexpected error fetching notification feed: {str(e)}")
+            return Response({
+                "status": False,
+                "message": "An unexpected error occurred"
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -1,5 +1,6 @@
 from django.db import models
 from django.core.validators import MinValueValidator
+from search.model_indexes import trigram_indexes
 from .base_model import BaseModel
 import uuid
 
@@ -94,15 +95,25 @@ class Order(BaseModel):
     notes = models.TextField(blank=True, null=True)
     internal_notes = models.TextField(blank=True, null=True)
     tracking_number = models.CharField(max_length=200, blank=True, null=True)
+    created_by = models.ForeignKey(
+        'users.User',
+        on_delete=models.SET_NULL,
+        related_name='orders_created',
+        null=True,
+        blank=True
+    )
 
     class Meta:
         ordering = ['-order_date']
         indexes = [
             models.Index(fields=['order_number']),
             models.Index(fields=['customer_name']),
+            models.Index(fields=['customer_email']),
             models.Index(fields=['status']),
             models.Index(fields=['payment_status']),
-            models.Index(fields=['order_date'])
+            models.Index(fields=['order_date']),
+            *trigram_indexes('order_order_number_trgm', 'order_number'),
+            *trigram_indexes('order_customer_name_trgm', 'customer_name')
         ]
 
     def __str__(self):
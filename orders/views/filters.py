@@ -1,12 +1,14 @@
 import django_filters
 from orders.models import Order, OrderItem
+from search.filters import SimilarityFilter, TrigramFilter
 
 class OrderFilter(django_filters.FilterSet):
     """
     Filter set for Order model.
     """
-    order_number = django_filters.CharFilter(lookup_expr='icontains')
-    customer_name = django_filters.CharFilter(lookup_expr='icontains')
+    order_number = TrigramFilter()
+    customer_name = TrigramFilter()
+    similarity = SimilarityFilter()
     customer_email = django_filters.CharFilter(lookup_expr='icontains')
     status = django_filters.ChoiceFilter(choices=Order.STATUS_CHOICES)
     payment_status = django_filters.ChoiceFilter(choices=Order.PAYMENT_STATUS_CHOICES)
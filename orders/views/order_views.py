@@ -109,7 +109,7 @@ class OrderViewSet(viewsets.ModelViewSet):
     
             if serializer.is_valid():
                 try:
-                    order = serializer.save()
+                    order = serializer.save(created_by=request.user)
                     order.calculate_total()
                     return Response({
                         'status': True,
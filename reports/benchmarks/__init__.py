@@ -0,0 +1,9 @@
+from .data_factory import SyntheticDataFactory, SCALES
+from .report_benchmark import ReportBenchmark, PeakRSS
+
+__all__ = [
+    'SyntheticDataFactory',
+    'SCALES',
+    'ReportBenchmark',
+    'PeakRSS'
+]
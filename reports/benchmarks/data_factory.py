@@ -0,0 +1,245 @@
+import random
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from django.db import transaction
+from dashboard.repositories.rollup_repository import RollupRepository
+from inventories.models import InventoryItem
+from inventories.repositories.inventory_summary_repository import InventorySummaryRepository
+from orders.models import Order, OrderItem
+from sales.models import Sale
+from suppliers.models import Supplier
+from users.models import User, UserRole, UserActivityLog
+
+# Row counts of each benchmark scale; order items and sales follow orders
+SCALES = {
+    'tiny': {'users': 3, 'suppliers': 2, 'inventory_items': 20, 'orders': 40, 'activity_logs': 60},
+    'small': {'users': 20, 'suppliers': 10, 'inventory_items': 500, 'orders': 5000, 'activity_logs': 10000},
+    'medium': {'users': 100, 'suppliers': 50, 'inventory_items': 5000, 'orders': 50000, 'activity_logs': 100000},
+    'large': {'users': 500, 'suppliers': 200, 'inventory_items': 20000, 'orders': 250000, 'activity_logs': 500000},
+}
+
+
+@contextmanager
+def explicit_timestamps(*models):
+    """Let bulk_create keep given auto_now and auto_now_add values"""
+    changed = []
+    for model in models:
+        for field in model._meta.concrete_fields:
+            if getattr(field, 'auto_now', False) or getattr(field, 'auto_now_add', False):
+                changed.append((field, field.auto_now, field.auto_now_add))
+                field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in changed:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+class SyntheticDataFactory:
+    """
+    Seeded synthetic data for report benchmarks.
+
+    The same seed and counts always produce the same rows, ids included,
+    spread over `days` days from `start`, so results of different commits
+    measure the same data. Rows are bulk inserted, which skips signals, so
+    the dashboard rollups and inventory summary are rebuilt afterwards.
+    """
+    BATCH_SIZE = 2000
+    DAIRY_TYPES = [choice for choice, _ in InventoryItem.DAIRY_TYPE_CHOICES]
+    ORDER_STATUSES = [choice for choice, _ in Order.STATUS_CHOICES]
+    ACTIONS = ['login', 'logout', 'view_dashboard', 'create_order', 'update_inventory', 'generate_report']
+
+    def __init__(self, seed=0, days=90, start=datetime(2025, 1, 1, tzinfo=dt_timezone.utc),
+                 items_per_order=3, sale_ratio=0.6, **counts):
+        self.random = random.Random(seed)
+        self.seed = seed
+        self.days = days
+        self.start = start
+        self.items_per_order = items_per_order
+        self.sale_ratio = sale_ratio
+        self.counts = {**SCALES['small'], **counts}
+
+    @classmethod
+    def for_scale(cls, scale, **kwargs):
+        return cls(**{**SCALES[scale], **kwargs})
+
+    @property
+    def end(self):
+        return self.start + timedelta(days=self.days)
+
+    def _uuid(self):
+        return uuid.UUID(int=self.random.getrandbits(128), version=4)
+
+    def _moment(self):
+        return self.start + timedelta(seconds=self.random.randrange(self.days * 86400))
+
+    def _money(self, low, high):
+        return Decimal(self.random.randrange(low * 100, high * 100)) / 100
+
+    def _insert(self, model, rows):
+        model.objects.bulk_create(rows, batch_size=self.BATCH_SIZE)
+        return rows
+
+    def create(self):
+        """Insert the data set and return the number of rows per table"""
+        with transaction.atomic(), explicit_timestamps(
+            User, InventoryItem, Order, OrderItem, Sale, UserActivityLog
+        ):
+            users = self._create_users()
+            suppliers = self._create_suppliers()
+            items = self._create_inventory_items(suppliers)
+            orders = self._create_orders(users)
+            order_items = self._create_order_items(orders, items)
+            sales = self._create_sales(orders, users)
+            logs = self._create_activity_logs(users)
+
+        RollupRepository.rebuild_order_rollups()
+        InventorySummaryRepository.rebuild()
+        return {
+            'users': len(users),
+            'suppliers': len(suppliers),
+            'inventory_items': len(items),
+            'orders': len(orders),
+            'order_items': order_items,
+            'sales': sales,
+            'activity_logs': logs
+        }
+
+    def _create_users(self):
+        role, _ = UserRole.objects.get_or_create(name='admin')
+        return self._insert(User, [
+            User(
+                id=self._uuid(),
+                email=f'benchmark-{self.seed}-{i}@example.com',
+                first_name='Benchmark',
+                last_name=f'User {i}',
+                password='!',
+                role=role,
+                date_joined=self.start,
+                last_login=self.start
+            )
+            for i in range(self.counts['users'])
+        ])
+
+    def _create_suppliers(self):
+        return self._insert(Supplier, [
+            Supplier(
+                id=self._uuid(),
+                name=f'Supplier {i}',
+                contact_person=f'Contact {i}',
+                email=f'supplier{i}@example.com',
+                phone='555-0100',
+                address=f'{i} Dairy Road',
+                rating=self._money(0, 5)
+            )
+            for i in range(self.counts['suppliers'])
+        ])
+
+    def _create_inventory_items(self, suppliers):
+        items = []
+        for i in range(self.counts['inventory_items']):
+            made = self._moment()
+            items.append(InventoryItem(
+                id=self._uuid(),
+                name=f'Product {i}',
+                dairy_type=self.random.choice(self.DAIRY_TYPES),
+                batch_number=f'BATCH-{self.seed}-{i:07d}',
+                quantity=self._money(0, 500),
+                unit='l',
+                price=self._money(1, 50),
+                manufacturing_date=made.date(),
+                expiry_date=(made + timedelta(days=self.random.randrange(5, 120))).date(),
+                storage_condition='refrigerated',
+                optimal_temperature_min=Decimal('1'),
+                optimal_temperature_max=Decimal('4'),
+                reorder_point=Decimal('10'),
+                minimum_order_quantity=Decimal('1'),
+                supplier=self.random.choice(suppliers),
+                created_at=made,
+                updated_at=made
+            ))
+        return self._insert(InventoryItem, items)
+
+    def _create_orders(self, users):
+        orders = []
+        for i in range(self.counts['orders']):
+            created = self._moment()
+            subtotal = self._money(5, 2000)
+            tax = (subtotal * Decimal('0.08')).quantize(Decimal('0.01'))
+            orders.append(Order(
+                id=self._uuid(),
+                order_number=f'ORD-{self.seed}-{i:08d}',
+                order_date=created,
+                customer_name=f'Customer {i % 997}',
+                customer_email=f'customer{i % 997}@example.com',
+                customer_phone='555-0101',
+                shipping_address='1 Market Street',
+                billing_address='1 Market Street',
+                status=self.random.choice(self.ORDER_STATUSES),
+                subtotal=subtotal,
+                tax=tax,
+                total_amount=subtotal + tax,
+                created_by=self.random.choice(users),
+                created_at=created,
+                updated_at=created
+            ))
+        return self._insert(Order, orders)
+
+    def _create_order_items(self, orders, items):
+        created = 0
+        batch = []
+        for order in orders:
+            for _ in range(self.random.randint(1, self.items_per_order * 2 - 1)):
+                quantity = self.random.randint(1, 20)
+                unit_price = self._money(1, 50)
+                batch.append(OrderItem(
+                    id=self._uuid(),
+                    order=order,
+                    inventory_item=self.random.choice(items),
+                    quantity=quantity,
+                    unit_price=unit_price,
+                    total_price=quantity * unit_price,
+                    created_at=order.created_at,
+                    updated_at=order.created_at
+                ))
+            if len(batch) >= self.BATCH_SIZE:
+                created += len(self._insert(OrderItem, batch))
+                batch = []
+        return created + len(self._insert(OrderItem, batch))
+
+    def _create_sales(self, orders, users):
+        sales = [
+            Sale(
+                id=self._uuid(),
+                order=order,
+                invoice_number=f'INV-{self.seed}-{i:08d}',
+                sale_date=order.created_at,
+                total_amount=order.total_amount,
+                tax_amount=order.tax,
+                payment_status='paid',
+                seller=self.random.choice(users),
+                created_at=order.created_at,
+                updated_at=order.created_at
+            )
+            for i, order in enumerate(orders)
+            if self.random.random() < self.sale_ratio
+        ]
+        return len(self._insert(Sale, sales))
+
+    def _create_activity_logs(self, users):
+        created = 0
+        batch = []
+        for _ in range(self.counts['activity_logs']):
+            batch.append(UserActivityLog(
+                id=self._uuid(),
+                user=self.random.choice(users),
+                action=self.random.choice(self.ACTIONS),
+                timestamp=self._moment(),
+                ip_address=f'10.0.{self.random.randrange(256)}.{self.random.randrange(256)}'
+            ))
+            if len(batch) >= self.BATCH_SIZE:
+                created += len(self._insert(UserActivityLog, batch))
+                batch = []
+        return created + len(self._insert(UserActivityLog, batch))
@@ -0,0 +1,194 @@
+import json
+import os
+import platform
+import resource
+import shutil
+import statistics
+import subprocess
+import tempfile
+import threading
+import time
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils.timezone import now
+from reports.models.report import Report
+from reports.repositories.report_repository import ReportRepository
+from reports.services.report_service import ReportService
+
+
+class PeakRSS:
+    """
+    Peak resident memory of this process while the block runs.
+
+    RSS is sampled from /proc every `interval` seconds. Where /proc is not
+    available the process high-water mark is reported instead, which never
+    goes down between measurements.
+    """
+    STATM = '/proc/self/statm'
+
+    def __init__(self, interval=0.005):
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    @classmethod
+    def current(cls):
+        try:
+            with open(cls.STATM) as statm:
+                return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+        except (OSError, ValueError):
+            maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            # Kilobytes on Linux, bytes on macOS
+            return maxrss if platform.system() == 'Darwin' else maxrss * 1024
+
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            self.peak = max(self.peak, self.current())
+
+    def __enter__(self):
+        self.peak = self.current()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, self.current())
+
+
+class ReportBenchmark:
+    """
+    Times ReportService.run_report for every report type and format.
+
+    Each run generates a new report over [date_from, date_to] for `user`,
+    bypassing deduplication and limits, and records its wall time, the
+    number of SQL queries and the peak RSS. Files are written to a
+    temporary MEDIA_ROOT that is removed afterwards.
+    """
+    def __init__(self, user, date_from, date_to, repeat=1):
+        self.user = user
+        self.date_from = date_from
+        self.date_to = date_to
+        self.repeat = repeat
+        self.repository = ReportRepository()
+
+    @staticmethod
+    def combinations(report_types=None, formats=None):
+        return [
+            (report_type, format)
+            for report_type in report_types or ReportService.REPORT_GENERATORS
+            for format in formats or Report.FILE_EXTENSIONS
+        ]
+
+    def _run_once(self, report_type, format):
+        report = self.repository.create_report({
+            'report_type': report_type,
+            'format': format,
+            'generated_by': self.user,
+            'date_from': self.date_from,
+            'date_to': self.date_to,
+            'status': 'pending'
+        })
+        with CaptureQueriesContext(connection) as queries, PeakRSS() as memory:
+            started = time.perf_counter()
+            report = ReportService.run_report(report.id)
+            elapsed = time.perf_counter() - started
+        if report.status != 'completed':
+            raise RuntimeError(f"{report_type} {format} report failed: {report.error_message}")
+        result = {
+            'wall_time': elapsed,
+            'queries': len(queries),
+            'peak_rss': memory.peak,
+            'rows': report.row_count,
+            'file_size': report.file_size
+        }
+        report.file.delete(save=False)
+        return result
+
+    def measure(self, report_type, format):
+        runs = [self._run_once(report_type, format) for _ in range(self.repeat)]
+        return {
+            'report_type': report_type,
+            'format': format,
+            'rows': runs[0]['rows'],
+            'file_size': runs[0]['file_size'],
+            'wall_time': statistics.median(run['wall_time'] for run in runs),
+            'wall_time_min': min(run['wall_time'] for run in runs),
+            'queries': max(run['queries'] for run in runs),
+            'peak_rss': max(run['peak_rss'] for run in runs)
+        }
+
+    def run(self, report_types=None, formats=None):
+        media_root = tempfile.mkdtemp()
+        try:
+            # Live dashboard updates would reach for the broker on every commit
+            with override_settings(MEDIA_ROOT=media_root, DASHBOARD_LIVE_UPDATES=False):
+                return [
+                    self.measure(report_type, format)
+                    for report_type, format in self.combinations(report_types, formats)
+                ]
+        finally:
+            shutil.rmtree(media_root, ignore_errors=True)
+
+    @staticmethod
+    def commit():
+        try:
+            return subprocess.run(
+                ['git', 'rev-parse', '--short', 'HEAD'],
+                capture_output=True, text=True, check=True
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    def save(self, path, results, dataset):
+        """Write results with what they were measured on as JSON"""
+        document = {
+            'commit': self.commit(),
+            'created_at': now().isoformat(),
+            'database': connection.vendor,
+            'python': platform.python_version(),
+            'repeat': self.repeat,
+            'dataset': dataset,
+            'results': results
+        }
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w') as output:
+            json.dump(document, output, indent=2, default=str)
+        return document
+
+    @staticmethod
+    def compare(baseline, current, threshold=0.2, metrics=('wall_time', 'queries', 'peak_rss')):
+        """
+        Regressions of `current` against `baseline`, two saved documents.
+
+        A metric regresses when it grew by more than `threshold` (a ratio).
+        """
+        previous = {
+            (result['report_type'], result['format']): result
+            for result in baseline['results']
+        }
+        regressions = []
+        for result in current['results']:
+            before = previous.get((result['report_type'], result['format']))
+            if before is None:
+                continue
+            for metric in metrics:
+                old, new = before.get(metric), result.get(metric)
+                if not old or new is None:
+                    continue
+                change = (new - old) / old
+                if change > threshold:
+                    regressions.append({
+                        'report_type': result['report_type'],
+                        'format': result['format'],
+                        'metric': metric,
+                        'baseline': old,
+                        'current': new,
+                        'change': round(change, 3)
+                    })
+        return regressions
@@ -0,0 +1,129 @@
+import io
+import time
+import tracemalloc
+from datetime import datetime, timezone as dt_timezone
+from decimal import Decimal
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+from reportlab.platypus import SimpleDocTemplate, Table
+from reportlab.lib.pagesizes import letter, landscape
+from reports.utils.pdf_generator import PDFGenerator, DETAIL_STYLE
+
+COLUMNS = ['id', 'order_number', 'customer_email', 'total_amount', 'status', 'created_at']
+
+
+class SyntheticRows:
+    """Order-shaped detail rows generated on the fly"""
+    columns = COLUMNS
+
+    def __init__(self, count):
+        self.total = count
+
+    def iter_tuples(self):
+        created_at = datetime(2025, 1, 1, tzinfo=dt_timezone.utc)
+        for i in range(self.total):
+            yield (
+                i,
+                f'ORD-{i:08d}',
+                f'customer{i}@example.com',
+                Decimal('123.45'),
+                'pending',
+                created_at
+            )
+
+
+def render_single_table(data, output):
+    """Previous renderer: every detail row in one table"""
+    rows = data['orders']
+    detail_data = [list(rows.columns)]
+    for item in rows.iter_tuples():
+        detail_data.append([str(value) for value in item])
+    col_widths = [
+        min(max(max(len(str(row[i])) * 8 for row in detail_data), 80), 200)
+        for i in range(len(rows.columns))
+    ]
+    table = Table(detail_data, colWidths=col_widths)
+    table.setStyle(DETAIL_STYLE)
+    SimpleDocTemplate(
+        output,
+        pagesize=landscape(letter),
+        rightMargin=72,
+        leftMargin=72,
+        topMargin=72,
+        bottomMargin=72
+    ).build([table])
+
+
+class Command(BaseCommand):
+    help = 'Compare PDF render time per 10k rows of the single-table and chunked renderers'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows',
+            type=int,
+            nargs='+',
+            default=[10000, 50000],
+            help='Detail row counts to render'
+        )
+        parser.add_argument(
+            '--skip-single-table',
+            action='store_true',
+            help='Only time the chunked renderer (the old one is slow on large reports)'
+        )
+        parser.add_argument(
+            '--parallel',
+            action='store_true',
+            help='Also time the process pool renderer'
+        )
+        parser.add_argument(
+            '--memory',
+            action='store_true',
+            help='Also render each report under tracemalloc and print its peak'
+        )
+
+    def _measure(self, render, count):
+        def data():
+            return {'summary': {'total_orders': count}, 'orders': SyntheticRows(count)}
+
+        started = time.perf_counter()
+        render(data(), io.BytesIO())
+        elapsed = time.perf_counter() - started
+
+        if not self.memory:
+            return elapsed, None
+        # Traced separately, tracing slows rendering down several times
+        tracemalloc.start()
+        render(data(), io.BytesIO())
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return elapsed, peak
+
+    def _report(self, label, count, elapsed, peak):
+        line = (
+            f'{label:<14} {count:>8} rows  {elapsed:8.2f}s  '
+            f'{elapsed * 10000 / count * 1000:8.0f} ms/10k rows'
+        )
+        if peak is not None:
+            line += f'  peak {peak / 1024 / 1024:7.1f} MB'
+        self.stdout.write(line)
+
+    def handle(self, *args, **options):
+        self.memory = options['memory']
+        renderers = []
+        if not options['skip_single_table']:
+            renderers.append(('single table', render_single_table))
+        renderers.append(('chunked', PDFGenerator.generate_pdf))
+
+        for count in options['rows']:
+            for label, render in renderers:
+                self._report(label, count, *self._measure(render, count))
+
+            if options['parallel']:
+                with override_settings(REPORT_PDF_PARALLEL_ROWS=1):
+                    # Peak memory only covers this process, not the workers
+                    self._report('parallel', count, *self._measure(
+                        lambda data, output: PDFGenerator.generate_pdf(
+                            data, output, row_count=count
+                        ),
+                        count
+                    ))
@@ -0,0 +1,50 @@
+import json
+from django.core.management.base import BaseCommand, CommandError
+from reports.benchmarks import ReportBenchmark
+
+
+class Command(BaseCommand):
+    help = 'Compare two saved report benchmark results and list regressions'
+
+    def add_arguments(self, parser):
+        parser.add_argument('baseline', help='Results JSON of the earlier commit')
+        parser.add_argument('current', help='Results JSON of the commit to check')
+        parser.add_argument(
+            '--threshold',
+            type=float,
+            default=0.2,
+            help='Relative growth of a metric that counts as a regression (default: 0.2)'
+        )
+
+    def _load(self, path):
+        try:
+            with open(path) as results:
+                return json.load(results)
+        except (OSError, ValueError) as e:
+            raise CommandError(f'Cannot read benchmark results {path}: {e}')
+
+    def handle(self, *args, **options):
+        baseline = self._load(options['baseline'])
+        current = self._load(options['current'])
+        if baseline.get('dataset') != current.get('dataset'):
+            self.stdout.write(self.style.WARNING(
+                'Results were measured on different data sets'
+            ))
+
+        for result in current['results']:
+            self.stdout.write(
+                f"{result['report_type']:<14} {result['format']:<6} "
+                f"{result['rows']:>8} rows  {result['wall_time']:8.2f}s  "
+                f"{result['queries']:>5} queries  {result['peak_rss'] / 1024 / 1024:7.1f} MB"
+            )
+
+        regressions = ReportBenchmark.compare(baseline, current, options['threshold'])
+        for regression in regressions:
+            self.stdout.write(self.style.ERROR(
+                f"{regression['report_type']} {regression['format']} {regression['metric']}: "
+                f"{regression['baseline']} -> {regression['current']} "
+                f"(+{regression['change']:.0%})"
+            ))
+        if regressions:
+            raise CommandError(f'{len(regressions)} regressions found')
+        self.stdout.write(self.style.SUCCESS('No regressions found'))
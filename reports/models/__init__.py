@@ -1,3 +1,4 @@
 from .report import Report
+from .report_subscription import ReportSubscription
 
-__all__ = ['Report']
\ No newline at end of file
+__all__ = ['Report', 'ReportSubscription']
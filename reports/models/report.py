@@ -12,9 +12,16 @@ class Report(models.Model):
 
     FORMAT_TYPES = [
         ('pdf', 'PDF'),
+        ('excel', 'Excel'),
         ('csv', 'CSV'),
     ]
 
+    FILE_EXTENSIONS = {
+        'pdf': 'pdf',
+        'excel': 'xlsx',
+        'csv': 'csv',
+    }
+
     STATUS_CHOICES = [
         ('pending', 'Pending'),
         ('processing', 'Processing'),
@@ -33,12 +40,48 @@ class Report(models.Model):
     date_to = models.DateTimeField()
     filters = models.JSONField(default=dict, blank=True)
     error_message = models.TextField(null=True, blank=True)
+    task_id = models.CharField(max_length=255, null=True, blank=True)
+    progress = models.PositiveSmallIntegerField(default=0)
+    row_count = models.PositiveIntegerField(null=True, blank=True)
+    rows_processed = models.PositiveIntegerField(default=0)
+    started_at = models.DateTimeField(null=True, blank=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+    # Stored bytes, possibly compressed, and bytes of the report itself
+    compression = models.CharField(max_length=10, null=True, blank=True)
+    file_size = models.PositiveBigIntegerField(default=0)
+    content_size = models.PositiveBigIntegerField(default=0)
+    # Identical requests over unchanged data share one generation
+    fingerprint = models.CharField(max_length=64, null=True, blank=True)
+    data_version = models.CharField(max_length=100, null=True, blank=True)
+    shared_from = models.ForeignKey(
+        'self',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='shared_copies'
+    )
+
+    ACTIVE_STATUSES = ('pending', 'processing')
 
     class Meta:
         ordering = ['-generated_at']
         indexes = [
             models.Index(fields=['report_type', 'status']),
             models.Index(fields=['generated_at']),
+            models.Index(fields=['status', 'generated_by']),
+            models.Index(fields=['fingerprint', 'status']),
+            models.Index(fields=['generated_by', 'file_size']),
+        ]
+        constraints = [
+            # One generation per fingerprint at a time; later requests join it
+            models.UniqueConstraint(
+                fields=['fingerprint'],
+                condition=models.Q(
+                    status__in=('pending', 'processing'),
+                    shared_from__isnull=True
+                ),
+                name='unique_active_report_fingerprint'
+            ),
         ]
 
     def __str__(self):
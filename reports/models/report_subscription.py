@@ -0,0 +1,47 @@
+import uuid
+from django.db import models
+from django.conf import settings
+from reports.models.report import Report
+
+class ReportSubscription(models.Model):
+    """A report generated on a cron schedule and delivered to its owner"""
+    PERIOD_CHOICES = [
+        ('daily', 'Previous Day'),
+        ('weekly', 'Previous Week'),
+        ('monthly', 'Previous Month'),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='report_subscriptions'
+    )
+    report_type = models.CharField(max_length=20, choices=Report.REPORT_TYPES)
+    format = models.CharField(max_length=10, choices=Report.FORMAT_TYPES)
+    filters = models.JSONField(default=dict, blank=True)
+    period = models.CharField(max_length=10, choices=PERIOD_CHOICES, default='weekly')
+    # Cron expression in local time: minute hour day-of-month month day-of-week
+    schedule = models.CharField(max_length=100, default='0 7 * * 1')
+    send_email = models.BooleanField(default=True)
+    is_active = models.BooleanField(default=True)
+    next_run_at = models.DateTimeField()
+    last_run_at = models.DateTimeField(null=True, blank=True)
+    last_report = models.ForeignKey(
+        Report,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='subscriptions'
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['next_run_at']
+        indexes = [
+            models.Index(fields=['is_active', 'next_run_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.get_period_display()} {self.report_type} report for {self.user}"
@@ -1,5 +1,7 @@
 from .report_repository import ReportRepository
+from .report_subscription_repository import ReportSubscriptionRepository
 
 __all__ = [
     'ReportRepository',
-]
\ No newline at end of file
+    'ReportSubscriptionRepository',
+]
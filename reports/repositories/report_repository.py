@@ -1,11 +1,12 @@
 from typing import List, Optional
-from django.db.models import Q
+from django.db.models import Q, Count, Max, Sum
 from reports.models.report import Report
 from orders.models import Order
 from inventories.models import InventoryItem
 from users.models import User
 from .base_repository import BaseRepository
-from django.db import DatabaseError
+from django.db import DatabaseError, IntegrityError
+from django.utils.timezone import now
 from exceptions import DatabaseException
 
 class ReportRepository(BaseRepository):
@@ -19,6 +20,9 @@ class ReportRepository(BaseRepository):
         """Create a new report"""
         try:
             return self.model.objects.create(**data)
+        except IntegrityError:
+            # Raised as is so callers can handle concurrent identical reports
+            raise
         except DatabaseError as e:
             raise DatabaseException(f"Failed to create report: {str(e)}")
 
@@ -41,6 +45,134 @@ class ReportRepository(BaseRepository):
         except DatabaseError as e:
             raise DatabaseException(f"Failed to fetch reports: {str(e)}")
 
+    def count_active_reports(self, user_id: Optional[str] = None) -> int:
+        """Count pending and processing reports, for one user or overall"""
+        try:
+            # Shared copies wait for another report and do no work of their own
+            queryset = self.model.objects.filter(
+                status__in=Report.ACTIVE_STATUSES,
+                shared_from__isnull=True
+            )
+            if user_id is not None:
+                queryset = queryset.filter(generated_by_id=user_id)
+            return queryset.count()
+        except DatabaseError as e:
+            raise DatabaseException(f"Failed to count active reports: {str(e)}")
+
+    def update_report(self, report_id: str, **fields) -> int:
+        """Update report fields in place without reloading the report"""
+        try:
+            return self.model.objects.filter(id=report_id).update(**fields)
+        except DatabaseError as e:
+            raise DatabaseException(f"Failed to update report: {str(e)}")
+
+    def get_stale_reports(self, started_before) -> List[Report]:
+        """Get active reports that have not finished since `started_before`"""
+        try:
+            # Shared copies are failed together with the report they wait for
+            return list(self.model.objects.filter(
+                Q(status='processing', started_at__lt=started_before) |
+                Q(status='pending', generated_at__lt=started_before),
+                shared_from__isnull=True
+            ))
+        except DatabaseError as e:
+            raise DatabaseException(f"Failed to fetch stale reports: {str(e)}")
+
+    def get_data_version(self, queryset, timestamp_field: str) -> str:
+        """
+        Version of a report's rows: their count and latest change.
+
+        The count catches deletes, which do not move the timestamp.
+        """
+        try:
+            version = queryset.order_by().aggregate(
+                rows=Count('pk'),
+                latest=Max(timestamp_field)
+            )
+            latest = version['latest'].isoformat() if version['latest'] else '-'
+            return f"{version['rows']}@{latest}"
+        except DatabaseError as e:
+            raise DatabaseException(f"Failed to fetch data version: {str(e)}")
+
+    def get_reusable_reports(self, fingerprint: str) -> List[Report]:
+        """Get active and completed reports with a fingerprint, newest first"""
+        try:
+            return list(
+                self.model.objects.filter(fingerprint=fingerprint)
+                .filter(
+                    Q(status__in=Report.ACTIVE_STATUSES) |
+                    Q(status='completed', file__gt='')
+                )
+                .order_by('-generated_at')
+            )
+        except DatabaseError as e:
+            raise DatabaseException(f"Failed to fetch reports: {str(e)}")
+
+    def get_shared_copies(self, report_id: str) -> List[Report]:
+        """Get the reports still waiting for a report's generation"""
+        try:
+            return list(self.model.objects.filter(
+                shared_from_id=report_id,
+                status__in=Report.ACTIVE_STATUSES
+            ))
+        except DatabaseError as e:
+            raise DatabaseException(f"Failed to fetch shared reports: {str(e)}")
+
+    def get_storage_used(self, user_id: str) -> int:
+        """Bytes taken by a user's stored report files"""
+        try:
+            return self.model.objects.filter(generated_by_id=user_id)\
+                .aggregate(used=Sum('file_size'))['used'] or 0
+        except DatabaseError as e:
+            raise DatabaseException(f"Failed to fetch storage usage: {str(e)}")
+
+    def get_expired_reports(self, generated_before, limit: int) -> List[Report]:
+        """Get up to `limit` finished reports generated before a cutoff"""
+        try:
+            return list(
+                self.model.objects.filter(
+                    generated_at__lt=generated_before,
+                    status__in=('completed', 'failed')
+                ).only('id', 'file').order_by('generated_at')[:limit]
+            )
+        except DatabaseError as e:
+            raise DatabaseException(f"Failed to fetch expired reports: {str(e)}")
+
+    def delete_reports(self, report_ids) -> int:
+        """Delete reports by id without touching their files"""
+        try:
+            deleted, _ = self.model.objects.filter(id__in=report_ids).delete()
+            return deleted
+        except DatabaseError as e:
+            raise DatabaseException(f"Failed to delete reports: {str(e)}")
+
+    def get_storage_metrics(self) -> dict:
+        """Totals of stored report files overall, per format and per user"""
+        try:
+            stored = self.model.objects.filter(file_size__gt=0)
+            by_format = list(
+                stored.values('format').annotate(
+                    files=Count('id'),
+                    stored_bytes=Sum('file_size'),
+                    content_bytes=Sum('content_size')
+                ).order_by('format')
+            )
+            top_users = list(
+                stored.values('generated_by_id', 'generated_by__email').annotate(
+                    files=Count('id'),
+                    stored_bytes=Sum('file_size')
+                ).order_by('-stored_bytes')[:5]
+            )
+            return {
+                'files': sum(row['files'] for row in by_format),
+                'stored_bytes': sum(row['stored_bytes'] for row in by_format),
+                'content_bytes': sum(row['content_bytes'] for row in by_format),
+                'by_format': by_format,
+                'top_users': top_users
+            }
+        except DatabaseError as e:
+            raise DatabaseException(f"Failed to fetch storage metrics: {str(e)}")
+
     def get_report_data(self, report_type: str, date_from: str, date_to: str) -> dict:
         """Get data for report generation based on type"""
         try:
@@ -111,7 +243,16 @@ class ReportRepository(BaseRepository):
             
             if report.file:
                 report.file.delete(save=False)
-                
+
+            # Reports waiting for this one would never finish
+            self.model.objects.filter(
+                shared_from=report,
+                status__in=Report.ACTIVE_STATUSES
+            ).update(
+                status='failed',
+                error_message='The report this one was shared from was deleted',
+                completed_at=now()
+            )
             report.delete()
             return True
         except self.model.DoesNotExist:
@@ -0,0 +1,50 @@
+from typing import List
+from django.db import DatabaseError
+from reports.models.report_subscription import ReportSubscription
+from .base_repository import BaseRepository
+from exceptions import DatabaseException
+
+class ReportSubscriptionRepository(BaseRepository):
+    def __init__(self):
+        super().__init__(ReportSubscription)
+
+    def get_user_subscriptions(self, user_id: str):
+        """Get a user's subscriptions, next to run first"""
+        try:
+            return self.model.objects.filter(user_id=user_id).order_by('next_run_at')
+        except DatabaseError as e:
+            raise DatabaseException(f"Failed to fetch report subscriptions: {str(e)}")
+
+    def get_user_subscription(self, subscription_id: str, user_id: str) -> ReportSubscription:
+        try:
+            return self.model.objects.get(id=subscription_id, user_id=user_id)
+        except ReportSubscription.DoesNotExist:
+            raise ValueError("Report subscription not found")
+        except DatabaseError as e:
+            raise DatabaseException(f"Failed to fetch report subscription: {str(e)}")
+
+    def get_pending_subscriptions(self, run_before, limit: int) -> List[ReportSubscription]:
+        """Get active subscriptions whose next run is before `run_before`"""
+        try:
+            return list(
+                self.model.objects.filter(is_active=True, next_run_at__lt=run_before)
+                .select_related('user')
+                .order_by('next_run_at')[:limit]
+            )
+        except DatabaseError as e:
+            raise DatabaseException(f"Failed to fetch report subscriptions: {str(e)}")
+
+    def get_report_subscriptions(self, report_id: str) -> List[ReportSubscription]:
+        """Get the subscriptions a report was generated for"""
+        try:
+            return list(
+                self.model.objects.filter(last_report_id=report_id).select_related('user')
+            )
+        except DatabaseError as e:
+            raise DatabaseException(f"Failed to fetch report subscriptions: {str(e)}")
+
+    def update_subscription(self, subscription_id: str, **fields) -> int:
+        try:
+            return self.model.objects.filter(id=subscription_id).update(**fields)
+        except DatabaseError as e:
+            raise DatabaseException(f"Failed to update report subscription: {str(e)}")
@@ -1,7 +1,9 @@
 from .report_generate_serializer import ReportGenerateSerializer
 from .report_serializer import ReportSerializer
+from .report_subscription_serializer import ReportSubscriptionSerializer
 
 __all__ = [
     'ReportGenerateSerializer',
-    'ReportSerializer'
-]
\ No newline at end of file
+    'ReportSerializer',
+    'ReportSubscriptionSerializer'
+]
@@ -11,11 +11,20 @@ class ReportSerializer(serializers.ModelSerializer):
         fields = [
             'id', 'report_type', 'format', 'status', 
             'generated_by', 'generated_at', 'date_from', 
-            'date_to', 'filters', 'error_message', 'file_url'
+            'date_to', 'filters', 'error_message', 'file_url',
+            'progress', 'row_count', 'rows_processed',
+            'started_at', 'completed_at'
+        ]
+        read_only_fields = [
+            'id', 'status', 'generated_by', 'generated_at', 'file_url',
+            'progress', 'row_count', 'rows_processed',
+            'started_at', 'completed_at'
         ]
-        read_only_fields = ['id', 'status', 'generated_by', 'generated_at', 'file_url']
 
     def get_file_url(self, obj):
         if obj.file:
-            return self.context['request'].build_absolute_uri(obj.file.url)
+            request = self.context.get('request')
+            if request is None:
+                return obj.file.url
+            return request.build_absolute_uri(obj.file.url)
         return None
\ No newline at end of file
@@ -0,0 +1,26 @@
+from django.utils import timezone
+from rest_framework import serializers
+from reports.models import ReportSubscription
+from reports.utils.report_schedule import ReportSchedule
+
+class ReportSubscriptionSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ReportSubscription
+        fields = [
+            'id', 'report_type', 'format', 'filters', 'period',
+            'schedule', 'send_email', 'is_active', 'next_run_at',
+            'last_run_at', 'last_report', 'created_at'
+        ]
+        read_only_fields = [
+            'id', 'next_run_at', 'last_run_at', 'last_report', 'created_at'
+        ]
+
+    def validate_schedule(self, value):
+        """
+        Check that the schedule is a cron expression that runs
+        """
+        try:
+            ReportSchedule(value).next_after(timezone.now())
+        except ValueError as e:
+            raise serializers.ValidationError(str(e))
+        return value
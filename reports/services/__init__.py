@@ -1,5 +1,7 @@
 from .report_service import ReportService
+from .report_subscription_service import ReportSubscriptionService
 
 __all__ = [
-    'ReportService'
-]
\ No newline at end of file
+    'ReportService',
+    'ReportSubscriptionService'
+]
@@ -1,66 +1,441 @@
+import hashlib
+import json
+import uuid
+from decimal import Decimal
+from datetime import datetime, timedelta, timezone as dt_timezone
+from django.conf import settings
+from django.core.exceptions import FieldError, ValidationError
+from django.db import transaction, IntegrityError
+from django.db.models import Sum, Count, F, Q, DecimalField, ExpressionWrapper
+from django.utils.timezone import now, is_naive, make_aware
 from reports.models.report import Report
-from django.utils.timezone import now
-from users.models import UserActivityLog
+from users.models import User, UserActivityLog
 from orders.models import Order
 from inventories.models import InventoryItem
-from django.db.models import Sum, Count
-from django.core.files.base import ContentFile
-import pandas as pd
-import io
+from inventories.repositories.inventory_summary_repository import InventorySummaryRepository
+from notifications.repositories.notification_repository import NotificationRepository
 from reports.utils.pdf_generator import PDFGenerator
+from reports.utils.report_rows import ReportRows
+from reports.utils.report_scan import ReportPipeline
+from reports.utils.report_partitions import ReportPartitioner
+from reports.utils.csv_writer import CSVWriter
+from reports.utils.excel_writer import ExcelWriter
+from reports.utils.temporary_report_file import TemporaryReportFile
+from reports.utils.shared_report_file import share_report_file
+from reports.utils.report_compression import ReportCompression
 from reports.repositories.report_repository import ReportRepository
-from exceptions import DatabaseException
-from inventories.models import InventoryItem
-from django.db.models import Sum, Count
-from django.core.files.base import ContentFile
-import pandas as pd
-import io
-from reports.utils.pdf_generator import PDFGenerator
-from reports.repositories.report_repository import ReportRepository
-from exceptions import DatabaseException
+from reports.repositories.report_subscription_repository import ReportSubscriptionRepository
+from emails.services import EmailService
+from exceptions import DatabaseException, LimitExceededException
+from utils import setup_logger
+
+logger = setup_logger(__name__)
 
 class ReportService:
+    REPORT_GENERATORS = {
+        'sales': '_generate_sales_report',
+        'inventory': '_generate_inventory_report',
+        'orders': '_generate_orders_report',
+        'user_activity': '_generate_user_activity_report',
+    }
+
+    # Table, date range field and change timestamp of each report type; the
+    # timestamp versions the rows a report reads
+    REPORT_SOURCES = {
+        'sales': (Order, 'created_at', 'updated_at'),
+        'inventory': (InventoryItem, 'updated_at', 'updated_at'),
+        'orders': (Order, 'created_at', 'updated_at'),
+        'user_activity': (UserActivityLog, 'timestamp', 'timestamp'),
+    }
+
     @staticmethod
     def generate_report(user, report_type, date_from, date_to, format='pdf', filters=None):
-        """Generate report based on type and parameters"""
+        """
+        Queue a report for generation and return it in `pending` state.
+
+        The file is produced by a Celery task; clients poll the report or
+        wait for the notification sent when it finishes. A request identical
+        to an earlier one over unchanged data reuses that report's file, or
+        waits for its generation when it is still in progress.
+        """
+        if report_type not in ReportService.REPORT_GENERATORS:
+            raise ValueError(f"Invalid report type: {report_type}")
+
+        repository = ReportRepository()
+        data_version = ReportService.get_data_version(
+            repository, report_type, date_from, date_to, filters
+        )
+        fingerprint = ReportService.fingerprint(
+            report_type, date_from, date_to, format, filters, data_version
+        )
+        fields = {
+            'report_type': report_type,
+            'format': format,
+            'generated_by': user,
+            'date_from': date_from,
+            'date_to': date_to,
+            'filters': filters or {},
+            'fingerprint': fingerprint,
+            'data_version': data_version
+        }
+
+        with transaction.atomic():
+            # Serialises concurrent requests of the same user
+            User.objects.select_for_update().filter(pk=user.pk).first()
+            for _ in range(2):
+                report = ReportService._reuse_report(repository, user, fields)
+                if report is not None:
+                    return report
+
+                ReportService._check_limits(repository, user)
+                try:
+                    with transaction.atomic():
+                        report = repository.create_report({
+                            **fields,
+                            'status': 'pending',
+                            'task_id': str(uuid.uuid4())
+                        })
+                except IntegrityError:
+                    # Another user started the same report, join it
+                    continue
+                transaction.on_commit(lambda: ReportService._enqueue(report))
+                return report
+        raise LimitExceededException(
+            "The same report is being generated, please try again shortly"
+        )
+
+    @staticmethod
+    def report_queryset(report_type, date_from, date_to, filters=None):
+        """Rows of a report: its source table within the date range, filtered"""
+        model, date_field, _ = ReportService.REPORT_SOURCES[report_type]
+        queryset = model.objects.filter(**{f'{date_field}__range': [date_from, date_to]})
+        if filters:
+            queryset = queryset.filter(**filters)
+        return queryset
+
+    @staticmethod
+    def get_data_version(repository, report_type, date_from, date_to, filters=None):
+        """
+        Version of the rows a report reads.
+
+        Only those rows count, so writes elsewhere in the table, such as the
+        activity logged for this very request, leave the version unchanged.
+        """
+        _, _, timestamp_field = ReportService.REPORT_SOURCES[report_type]
+        try:
+            queryset = ReportService.report_queryset(report_type, date_from, date_to, filters)
+        except (FieldError, ValueError, ValidationError):
+            # Invalid filters fail the report itself; version the date range only
+            queryset = ReportService.report_queryset(report_type, date_from, date_to)
+        return repository.get_data_version(queryset, timestamp_field)
+
+    @staticmethod
+    def _canonical_datetime(value):
+        if isinstance(value, datetime):
+            if is_naive(value):
+                value = make_aware(value)
+            return value.astimezone(dt_timezone.utc).isoformat()
+        return str(value)
+
+    @staticmethod
+    def fingerprint(report_type, date_from, date_to, format, filters, data_version):
+        """Hash of a report request and the version of the data it reads"""
+        request = {
+            'report_type': report_type,
+            'date_from': ReportService._canonical_datetime(date_from),
+            'date_to': ReportService._canonical_datetime(date_to),
+            'format': format,
+            'filters': filters or {},
+            'data_version': data_version
+        }
+        canonical = json.dumps(request, sort_keys=True, separators=(',', ':'), default=str)
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    @staticmethod
+    def _reuse_report(repository, user, fields):
+        """
+        Serve a request from an identical report, or return None.
+
+        The user's own matching report is returned as is. Otherwise the user
+        gets a report of their own that shares a completed file, or that is
+        completed together with a report still being generated.
+        """
+        reports = repository.get_reusable_reports(fields['fingerprint'])
+        if not reports:
+            return None
+
+        for report in reports:
+            if report.generated_by_id == user.pk:
+                return report
+
+        ReportService._check_quota(repository, user)
+        completed = next((r for r in reports if r.status == 'completed'), None)
+        if completed is not None:
+            report = repository.create_report({
+                **fields,
+                'status': 'completed',
+                'shared_from': completed,
+                'progress': 100,
+                'row_count': completed.row_count,
+                'rows_processed': completed.rows_processed,
+                'compression': completed.compression,
+                'file_size': completed.file_size,
+                'content_size': completed.content_size,
+                'started_at': now(),
+                'completed_at': now()
+            })
+            report.file.name = share_report_file(completed.file, report)
+            repository.update_report(report.id, file=report.file.name)
+            logger.info(f"Report {report.id} reuses the file of report {completed.id}")
+            return report
+
+        active = reports[0]
+        return repository.create_report({
+            **fields,
+            'status': 'pending',
+            'shared_from_id': active.shared_from_id or active.id
+        })
+
+    @staticmethod
+    def _check_quota(repository, user):
+        quota = getattr(settings, 'REPORT_USER_QUOTA_BYTES', 0)
+        if quota and repository.get_storage_used(user.pk) >= quota:
+            raise LimitExceededException(
+                "Your report storage is full, delete old reports to generate new ones"
+            )
+
+    @staticmethod
+    def _check_limits(repository, user):
+        ReportService._check_quota(repository, user)
+        per_user = getattr(settings, 'REPORT_MAX_ACTIVE_PER_USER', 2)
+        overall = getattr(settings, 'REPORT_MAX_ACTIVE_GLOBAL', 10)
+        if repository.count_active_reports(user.pk) >= per_user:
+            raise LimitExceededException(
+                f"You already have {per_user} reports in progress"
+            )
+        if repository.count_active_reports() >= overall:
+            raise LimitExceededException(
+                "Too many reports are being generated, please try again shortly"
+            )
+
+    @staticmethod
+    def _enqueue(report):
+        from reports.tasks import generate_report_file
+        try:
+            generate_report_file.apply_async(
+                args=[str(report.id)],
+                task_id=report.task_id
+            )
+        except Exception as e:
+            logger.error(f"Error queueing report {report.id}: {str(e)}")
+            ReportService.mark_failed(report.id, f"Failed to queue report: {str(e)}")
+
+    @staticmethod
+    def run_report(report_id):
+        """Generate the file of a queued report, recording progress as it goes"""
+        repository = ReportRepository()
+        report = Report.objects.get(id=report_id)
+        if report.status != 'pending':
+            logger.warning(f"Report {report_id} is {report.status}, not generating")
+            return report
+
+        repository.update_report(
+            report.id,
+            status='processing',
+            started_at=now(),
+            progress=5
+        )
         try:
-            report = Report.objects.create(
-                report_type=report_type,
-                format=format,
-                generated_by=user,
-                date_from=date_from,
-                date_to=date_to,
-                filters=filters or {},
-                status='pending'  # Set initial status
+            generator = getattr(
+                ReportService,
+                ReportService.REPORT_GENERATORS[report.report_type]
             )
+            data = generator(report.date_from, report.date_to, report.filters)
+            detail_key = next(k for k in data.keys() if k != 'summary')
+            row_count = data[detail_key].count()
+            repository.update_report(report.id, progress=10, row_count=row_count)
 
+            def on_progress(rows_processed):
+                repository.update_report(
+                    report.id,
+                    rows_processed=rows_processed,
+                    progress=10 + 80 * rows_processed // max(row_count, 1)
+                )
+
+            extension = Report.FILE_EXTENSIONS.get(report.format, report.format)
+            filename = f"{report.report_type}_report_{now().strftime('%Y%m%d_%H%M%S')}.{extension}"
+            # Rendered to a temporary file that storage moves into place, so
+            # the report never has to fit in memory or be copied
+            output = TemporaryReportFile(suffix=f'.{extension}')
+            stored = output
+            encoding = ReportCompression.encoding_for(report.format)
             try:
-                report.status = 'processing'
-                report.save(update_fields=['status'])
-                report_generators = {
-                    'sales': ReportService._generate_sales_report,
-                    'inventory': ReportService._generate_inventory_report,
-                    'orders': ReportService._generate_orders_report,
-                    'user_activity': ReportService._generate_user_activity_report,
-                }
-        
-                if report_type not in report_generators:
-                    raise ValueError(f"Invalid report type: {report_type}")
-
-                data = report_generators[report_type](date_from, date_to, filters)
-                file_content = ReportService._generate_file(data, format)
-                filename = f"{report_type}_report_{now().strftime('%Y%m%d_%H%M%S')}.{format}"
-                report.file.save(filename, ContentFile(file_content), save=True)
-                report.status = 'completed'
-                report.save()
-                return report
+                ReportService._write_file(data, report.format, output.path, on_progress)
+                repository.update_report(
+                    report.id,
+                    progress=90,
+                    rows_processed=row_count
+                )
+                if encoding:
+                    suffix = ReportCompression.EXTENSIONS[encoding]
+                    stored = TemporaryReportFile(suffix=f'.{extension}.{suffix}')
+                    ReportCompression.compress(output.path, stored.path, encoding)
+                    filename = f'{filename}.{suffix}'
+                sizes = {'content_size': output.size, 'file_size': stored.size}
+                report.file.save(filename, stored.open(), save=False)
+            finally:
+                output.cleanup()
+                stored.cleanup()
+            repository.update_report(
+                report.id,
+                file=report.file.name,
+                compression=encoding,
+                **sizes,
+                status='completed',
+                progress=100,
+                completed_at=now()
+            )
+        except Exception as e:
+            logger.error(f"Error generating report {report_id}: {str(e)}")
+            ReportService.mark_failed(report.id, str(e))
+            raise
+
+        report.refresh_from_db()
+        ReportService.notify(report)
+        ReportService._complete_shared_copies(report)
+        return report
+
+    @staticmethod
+    def _complete_shared_copies(report):
+        """Give the reports that waited for this one their copy of its file"""
+        repository = ReportRepository()
+        for copy in repository.get_shared_copies(report.id):
+            try:
+                repository.update_report(
+                    copy.id,
+                    file=share_report_file(report.file, copy),
+                    status='completed',
+                    progress=100,
+                    row_count=report.row_count,
+                    rows_processed=report.rows_processed,
+                    compression=report.compression,
+                    file_size=report.file_size,
+                    content_size=report.content_size,
+                    started_at=report.started_at,
+                    completed_at=now()
+                )
             except Exception as e:
-                report.status = 'failed'
-                report.error_message = str(e)
-                report.save(update_fields=['status', 'error_message'])
-                raise
+                logger.error(f"Error sharing report {report.id} with {copy.id}: {str(e)}")
+                ReportService.mark_failed(copy.id, f"Failed to share report: {str(e)}")
+                continue
+            copy.refresh_from_db()
+            ReportService.notify(copy)
+
+    @staticmethod
+    def mark_failed(report_id, error_message):
+        ReportRepository().update_report(
+            report_id,
+            status='failed',
+            error_message=error_message,
+            completed_at=now()
+        )
+        report = Report.objects.filter(id=report_id).first()
+        if report:
+            ReportService.notify(report)
+        for copy in ReportRepository().get_shared_copies(report_id):
+            ReportService.mark_failed(copy.id, error_message)
+
+    @staticmethod
+    def notify(report):
+        """Let the requesting user, and its subscriptions, know the report finished"""
+        if not report.generated_by_id:
+            return
+        completed = report.status == 'completed'
+        report_name = dict(Report.REPORT_TYPES).get(report.report_type, 'Report')
+        try:
+            NotificationRepository.create_notification(
+                notification_type='system',
+                title=f"{report_name} {'ready' if completed else 'failed'}",
+                message=(
+                    f"Your {report_name.lower()} is ready to download."
+                    if completed else
+                    f"Your {report_name.lower()} could not be generated."
+                ),
+                user_id=report.generated_by_id,
+                priority='low' if completed else 'medium',
+                related_object_id=report.id,
+                related_object_type='system'
+            )
         except Exception as e:
-            raise ValueError(f"Failed to generate report: {str(e)}")
+            logger.error(f"Error notifying report {report.id} owner: {str(e)}")
+        if completed:
+            ReportService._email_subscriptions(report, report_name)
+
+    @staticmethod
+    def _email_subscriptions(report, report_name):
+        """Email a finished report to the subscriptions it was generated for"""
+        try:
+            subscriptions = ReportSubscriptionRepository().get_report_subscriptions(report.id)
+        except DatabaseException as e:
+            logger.error(f"Error fetching subscriptions of report {report.id}: {str(e)}")
+            return
+        # TRUSTED_ORIGIN is the frontend, which downloads the report for the user
+        origins = getattr(settings, 'TRUSTED_ORIGIN', None) or ['']
+        path = getattr(settings, 'REPORT_LINK_PATH', '/reports/{report_id}')
+        link = origins[0].rstrip('/') + path.format(report_id=report.id)
+        for subscription in subscriptions:
+            if not subscription.send_email:
+                continue
+            user = subscription.user
+            sent = EmailService.send_notification_email(
+                to_email=user.email,
+                subject=f"{subscription.get_period_display()} {report_name}",
+                template_name='emails/notification.html',
+                context={
+                    'subject': f"{report_name} ready",
+                    'recipient_name': f"{user.first_name} {user.last_name}".strip(),
+                    'title': f"{report_name} from {report.date_from:%d %b %Y} to {report.date_to:%d %b %Y}",
+                    'message': f"Your scheduled report is ready to download: {link}"
+                }
+            )
+            if not sent:
+                logger.error(f"Failed to email report {report.id} to {user.email}")
+
+    @staticmethod
+    def fail_stale_reports():
+        """Fail reports whose worker died so they stop counting towards limits"""
+        max_age = getattr(settings, 'REPORT_STALE_AFTER', 3600)
+        stale = ReportRepository().get_stale_reports(
+            now() - timedelta(seconds=max_age)
+        )
+        for report in stale:
+            ReportService.mark_failed(report.id, "Report generation did not finish in time")
+        return len(stale)
+
+    @staticmethod
+    def delete_expired_reports():
+        """Delete finished reports past the retention period, in batches"""
+        days = getattr(settings, 'REPORT_RETENTION_DAYS', 30)
+        batch_size = getattr(settings, 'REPORT_RETENTION_BATCH_SIZE', 500)
+        repository = ReportRepository()
+        cutoff = now() - timedelta(days=days)
+
+        deleted = 0
+        while True:
+            reports = repository.get_expired_reports(cutoff, batch_size)
+            if not reports:
+                break
+            for report in reports:
+                if report.file:
+                    try:
+                        report.file.delete(save=False)
+                    except Exception as e:
+                        logger.error(f"Error deleting file of report {report.id}: {str(e)}")
+            deleted += repository.delete_reports([report.id for report in reports])
+            if len(reports) < batch_size:
+                break
+        logger.info(f"Deleted {deleted} reports older than {days} days")
+        return deleted
 
     @staticmethod
     def delete_report(report_id: str, user) -> bool:
@@ -72,52 +447,77 @@ class ReportService:
         except Exception as e:
             raise ValueError(f"Failed to delete report: {str(e)}")
             
+    @staticmethod
+    def _average(total, count):
+        if not count:
+            return 0
+        return (total / count).quantize(Decimal('0.01'))
+
     @staticmethod
     def _generate_sales_report(date_from, date_to, filters=None):
-        queryset = Order.objects.filter(
-            created_at__range=[date_from, date_to]
-        )
+        queryset = ReportService.report_queryset('sales', date_from, date_to, filters)\
+            .order_by('-created_at', '-id')
 
-        if filters:
-            queryset = queryset.filter(**filters)
+        def summarize(scan):
+            return {
+                'total_sales': scan.decimal_sum('total_amount'),
+                'total_orders': len(scan)
+            }
 
-        data = {
-            'summary': {
-                'total_sales': queryset.aggregate(total=Sum('total_amount'))['total'] or 0,
-                'total_orders': queryset.count(),
-                'average_order_value': queryset.aggregate(
-                    avg=Sum('total_amount')/Count('id')
-                )['avg'] or 0
-            },
-            'orders': list(queryset.values(
-                'id', 
-                'order_number', 
-                'customer_email',  # Changed from customer__email
-                'total_amount', 
-                'status', 
-                'created_at'
-            ))
-        }
-        return data
+        def aggregate(queryset):
+            totals = queryset.aggregate(
+                total_sales=Sum('total_amount'),
+                total_orders=Count('id')
+            )
+            return {**totals, 'total_sales': totals['total_sales'] or 0}
+
+        def finalize(summary):
+            return {
+                **summary,
+                'average_order_value': ReportService._average(
+                    summary['total_sales'],
+                    summary['total_orders']
+                )
+            }
+
+        summary, rows = ReportPipeline.run(queryset, (
+            'id', 
+            'order_number', 
+            'customer_email',  # Changed from customer__email
+            'total_amount', 
+            'status', 
+            'created_at'
+        ), summarize, aggregate, finalize=finalize,
+            partitioner=ReportPartitioner('created_at', date_from, date_to))
+        return {'summary': summary, 'orders': rows}
 
     @staticmethod
     def _generate_inventory_report(date_from, date_to, filters=None):
-        queryset = InventoryItem.objects.filter(
-            updated_at__range=[date_from, date_to]
-        )
+        queryset = ReportService.report_queryset('inventory', date_from, date_to, filters)\
+            .order_by('-updated_at', '-id')
 
-        if filters:
-            queryset = queryset.filter(**filters)
+        def summarize(scan):
+            return {
+                'total_items': len(scan),
+                'low_stock_items': scan.count_at_most('quantity', 10),
+                'total_value': scan.decimal_product_sum('quantity', 'price')
+            }
+
+        def aggregate(queryset):
+            totals = queryset.aggregate(
+                total_items=Count('id'),
+                low_stock_items=Count('id', filter=Q(quantity__lte=10)),
+                total_value=Sum(ExpressionWrapper(
+                    F('quantity') * F('price'),
+                    output_field=DecimalField(max_digits=20, decimal_places=4)
+                ))
+            )
+            return {**totals, 'total_value': Decimal(totals['total_value'] or 0)}
+
+        def finalize(summary):
+            return {**summary, 'total_value': summary['total_value'].quantize(Decimal('0.01'))}
 
-        data = {
-            'summary': {
-                'total_items': queryset.count(),
-                'low_stock_items': queryset.filter(quantity__lte=10).count(),
-                'total_value': queryset.aggregate(
-                    total=Sum('quantity') * Sum('price')
-                )['total'] or 0
-            },
-            'items': list(queryset.values(
+        summary, rows = ReportPipeline.run(queryset, (
             'id', 
             'name', 
             'quantity', 
@@ -127,41 +527,59 @@ class ReportService:
             'expiry_date',
             'reorder_point',
             'updated_at'
-        ))
-        }
-        return data
+        ), summarize, aggregate, finalize=finalize,
+            partitioner=ReportPartitioner('updated_at', date_from, date_to))
+
+        # Stock of every active item today, whatever the range and filters
+        global_stock = InventorySummaryRepository.get_totals()
+        summary.update({
+            'global_stock_items': global_stock['item_count'],
+            'global_stock_quantity': float(global_stock['total_quantity']),
+            'global_stock_value': float(global_stock['total_value']),
+            'global_low_stock_items': global_stock['low_stock_count']
+        })
+        return {'summary': summary, 'items': rows}
 
     @staticmethod
     def _generate_user_activity_report(date_from, date_to, filters=None):
-        queryset = UserActivityLog.objects.filter(
-            timestamp__range=[date_from, date_to]
-        )
+        queryset = ReportService.report_queryset('user_activity', date_from, date_to, filters)\
+            .order_by('-timestamp', '-id')
 
-        if filters:
-            queryset = queryset.filter(**filters)
+        def summarize(scan):
+            return {
+                'total_activities': len(scan),
+                'unique_users': set(scan.values('user_id'))
+            }
 
-        data = {
-            'summary': {
+        def aggregate(queryset):
+            return {
                 'total_activities': queryset.count(),
-                'unique_users': queryset.values('user').distinct().count()
-            },
-            'activities': list(queryset.values(
-                'user__email', 'action', 'timestamp',
-                'ip_address', 'details'
-            ))
-        }
-        return data
+                'unique_users': set(
+                    queryset.order_by().values_list('user_id', flat=True).distinct()
+                )
+            }
+
+        def finalize(summary):
+            return {**summary, 'unique_users': len(summary['unique_users'])}
+
+        summary, rows = ReportPipeline.run(queryset, (
+            'user__email', 'action', 'timestamp',
+            'ip_address'
+        ), summarize, aggregate, extra_columns=('user_id',), finalize=finalize,
+            partitioner=ReportPartitioner('timestamp', date_from, date_to))
+        return {'summary': summary, 'activities': rows}
 
     @staticmethod
-    def _generate_file(data, format):
-        """Generate file in specified format"""
+    def _write_file(data, format, path, on_progress=None):
+        """Write the report file in the specified format to `path`"""
         try:
             if format == 'pdf':
-                return ReportService._generate_pdf(data)
+                ReportService._write_pdf(data, path, on_progress)
             elif format == 'excel':
-                return ReportService._generate_excel(data)
+                ReportService._write_excel(data, path, on_progress)
             elif format == 'csv':
-                return ReportService._generate_csv(data)
+                with open(path, 'wb') as output:
+                    ReportService._write_csv(data, output, on_progress)
             else:
                 raise ValueError(f"Unsupported format: {format}")
         except Exception as e:
@@ -169,122 +587,64 @@ class ReportService:
 
     @staticmethod
     def _generate_orders_report(date_from, date_to, filters=None):
-        queryset = Order.objects.filter(
-            created_at__range=[date_from, date_to]
-        )
+        queryset = ReportService.report_queryset('orders', date_from, date_to, filters)\
+            .order_by('-created_at', '-id')
 
-        if filters:
-            queryset = queryset.filter(**filters)
+        def summarize(scan):
+            return {
+                'total_orders': len(scan),
+                'total_value': scan.decimal_sum('total_amount'),
+                'pending_orders': scan.count_equal('status', 'pending'),
+                'completed_orders': scan.count_equal('status', 'completed')
+            }
 
-        data = {
-            'summary': {
-                'total_orders': queryset.count(),
-                'total_value': queryset.aggregate(total=Sum('total_amount'))['total'] or 0,
-                'pending_orders': queryset.filter(status='pending').count(),
-                'completed_orders': queryset.filter(status='completed').count()
-            },
-            'orders': list(queryset.values(
-                'id', 
-                'order_number',
-                'customer_email',  # Changed from customer__email
-                'customer_name',
-                'total_amount',
-                'status',
-                'created_at',
-                'expected_delivery_date',  # Changed from delivery_date
-                'payment_status'
-            ).order_by('-created_at'))
-        }
-        return data
+        def aggregate(queryset):
+            totals = queryset.aggregate(
+                total_orders=Count('id'),
+                total_value=Sum('total_amount'),
+                pending_orders=Count('id', filter=Q(status='pending')),
+                completed_orders=Count('id', filter=Q(status='completed'))
+            )
+            return {**totals, 'total_value': totals['total_value'] or 0}
 
-    @staticmethod
-    def _generate_pdf(data):
-        return PDFGenerator.generate_pdf(data)
+        summary, rows = ReportPipeline.run(queryset, (
+            'id', 
+            'order_number',
+            'customer_email',  # Changed from customer__email
+            'customer_name',
+            'total_amount',
+            'status',
+            'created_at',
+            'expected_delivery_date',  # Changed from delivery_date
+            'payment_status'
+        ), summarize, aggregate,
+            partitioner=ReportPartitioner('created_at', date_from, date_to))
+        return {'summary': summary, 'orders': rows}
 
     @staticmethod
-    def _generate_excel(data):
-        output = io.BytesIO()
-        
-        # Create Excel writer
-        with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
-            # Write summary
-            pd.DataFrame([data['summary']]).to_excel(writer, sheet_name='Summary', index=False)
-            
-            # Write details
-            detail_key = next(k for k in data.keys() if k != 'summary')
-            pd.DataFrame(data[detail_key]).to_excel(writer, sheet_name='Details', index=False)
+    def _write_pdf(data, path, on_progress=None):
+        detail_key = next(k for k in data.keys() if k != 'summary')
+        rows = data[detail_key]
 
-        return output.getvalue()
+        row_count = None
+        if getattr(settings, 'REPORT_PDF_PARALLEL_ROWS', 0):
+            row_count = rows.count()
+        return PDFGenerator.generate_pdf(data, path, on_progress, row_count=row_count)
 
     @staticmethod
-    def _generate_csv(data):
-        output = io.StringIO()
-        
-        # Get the detail data (orders, items, or activities)
+    def _write_excel(data, path, on_progress=None):
         detail_key = next(k for k in data.keys() if k != 'summary')
-        
-        # Convert to DataFrame and save as CSV
-        df = pd.DataFrame(data[detail_key])
-        df.to_csv(output, index=False)
-        
-        return output.getvalue().encode('utf-8')
-    def _generate_orders_report(date_from, date_to, filters=None):
-        queryset = Order.objects.filter(
-            created_at__range=[date_from, date_to]
-        )
+        rows = data[detail_key]
 
-        if filters:
-            queryset = queryset.filter(**filters)
-
-        data = {
-            'summary': {
-                'total_orders': queryset.count(),
-                'total_value': queryset.aggregate(total=Sum('total_amount'))['total'] or 0,
-                'pending_orders': queryset.filter(status='pending').count(),
-                'completed_orders': queryset.filter(status='completed').count()
-            },
-            'orders': list(queryset.values(
-                'id', 
-                'order_number',
-                'customer_email',  # Changed from customer__email
-                'customer_name',
-                'total_amount',
-                'status',
-                'created_at',
-                'expected_delivery_date',  # Changed from delivery_date
-                'payment_status'
-            ).order_by('-created_at'))
-        }
-        return data
+        writer = ExcelWriter(rows.columns, chunk_size=ReportRows.chunk_size())
+        return writer.write(data['summary'], rows.iter_tuples(), path, on_progress)
 
     @staticmethod
-    def _generate_pdf(data):
-        return PDFGenerator.generate_pdf(data)
-
-    @staticmethod
-    def _generate_excel(data):
-        output = io.BytesIO()
-        
-        # Create Excel writer
-        with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
-            # Write summary
-            pd.DataFrame([data['summary']]).to_excel(writer, sheet_name='Summary', index=False)
-            
-            # Write details
-            detail_key = next(k for k in data.keys() if k != 'summary')
-            pd.DataFrame(data[detail_key]).to_excel(writer, sheet_name='Details', index=False)
+    def _write_csv(data, output, on_progress=None):
+        # Get the detail rows (orders, items, or activities)
+        detail_key = next(k for k in data.keys() if k != 'summary')
+        rows = data[detail_key]
 
-        return output.getvalue()
+        writer = CSVWriter(rows.columns, chunk_size=ReportRows.chunk_size())
+        return writer.write(rows.iter_tuples(), output, on_progress)
 
-    @staticmethod
-    def _generate_csv(data):
-        output = io.StringIO()
-        
-        # Get the detail data (orders, items, or activities)
-        detail_key = next(k for k in data.keys() if k != 'summary')
-        
-        # Convert to DataFrame and save as CSV
-        df = pd.DataFrame(data[detail_key])
-        df.to_csv(output, index=False)
-        
-        return output.getvalue().encode('utf-8')
\ No newline at end of file
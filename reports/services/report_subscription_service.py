@@ -0,0 +1,139 @@
+from datetime import datetime, timedelta
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from django.utils.timezone import now
+from reports.repositories.report_subscription_repository import ReportSubscriptionRepository
+from reports.services.report_service import ReportService
+from reports.utils.report_schedule import ReportSchedule
+from exceptions import LimitExceededException
+from utils import setup_logger
+
+logger = setup_logger(__name__)
+
+class ReportSubscriptionService:
+    """
+    Recurring reports.
+
+    A subscription covers the period that closes at the local midnight
+    starting the day of its scheduled run, so its report can be generated
+    ahead of time. Reports are generated during the off-peak window
+    (REPORT_OFF_PEAK_HOURS) once their period has closed, and outside it
+    only when the scheduled time has passed. They go through
+    ReportService like any other report and are delivered by notification
+    and, if the subscription asks for it, email when the file is ready.
+    """
+
+    @staticmethod
+    def get_user_subscriptions(user):
+        return ReportSubscriptionRepository().get_user_subscriptions(user.id)
+
+    @staticmethod
+    def create_subscription(user, data):
+        schedule = ReportSchedule(data.get('schedule', '0 7 * * 1'))
+        return ReportSubscriptionRepository().create({
+            **data,
+            'user': user,
+            'next_run_at': schedule.next_after(now())
+        })
+
+    @staticmethod
+    def update_subscription(subscription_id, user, data):
+        repository = ReportSubscriptionRepository()
+        subscription = repository.get_user_subscription(subscription_id, user.id)
+        if 'schedule' in data and data['schedule'] != subscription.schedule:
+            data = {**data, 'next_run_at': ReportSchedule(data['schedule']).next_after(now())}
+        return repository.update(subscription.id, data)
+
+    @staticmethod
+    def delete_subscription(subscription_id, user):
+        repository = ReportSubscriptionRepository()
+        subscription = repository.get_user_subscription(subscription_id, user.id)
+        return repository.delete(subscription.id)
+
+    @staticmethod
+    def period_range(subscription, run_at):
+        """Start and inclusive end of the period a run reports on"""
+        local = timezone.localtime(run_at)
+        end = timezone.make_aware(datetime(local.year, local.month, local.day))
+        if subscription.period == 'daily':
+            start = end - timedelta(days=1)
+        elif subscription.period == 'weekly':
+            start = end - timedelta(days=7)
+        elif subscription.period == 'monthly':
+            end = end.replace(day=1)
+            previous = end - timedelta(days=1)
+            start = end.replace(year=previous.year, month=previous.month)
+        else:
+            raise ValueError(f"Invalid subscription period: {subscription.period}")
+        return start, end - timedelta(microseconds=1)
+
+    @staticmethod
+    def in_off_peak(moment):
+        start, end = getattr(settings, 'REPORT_OFF_PEAK_HOURS', (0, 6))
+        hour = timezone.localtime(moment).hour
+        if start <= end:
+            return start <= hour < end
+        # Windows such as (22, 5) wrap around midnight
+        return hour >= start or hour < end
+
+    @staticmethod
+    def run_subscriptions(current=None):
+        """Generate the reports of subscriptions that are due, return the count"""
+        current = current or now()
+        batch_size = getattr(settings, 'REPORT_SUBSCRIPTION_BATCH_SIZE', 20)
+        repository = ReportSubscriptionRepository()
+
+        if ReportSubscriptionService.in_off_peak(current):
+            # Periods close at midnight, so runs up to the end of today
+            # already have all their data
+            local = timezone.localtime(current)
+            run_before = timezone.make_aware(
+                datetime(local.year, local.month, local.day)
+            ) + timedelta(days=1)
+        else:
+            run_before = current
+
+        generated = 0
+        for subscription in repository.get_pending_subscriptions(run_before, batch_size):
+            try:
+                if ReportSubscriptionService._run(repository, subscription, current):
+                    generated += 1
+            except LimitExceededException as e:
+                # Left due and retried on the next run
+                logger.warning(f"Report subscription {subscription.id} postponed: {str(e)}")
+            except Exception as e:
+                logger.error(f"Error running report subscription {subscription.id}: {str(e)}")
+        return generated
+
+    @staticmethod
+    def _run(repository, subscription, current):
+        date_from, date_to = ReportSubscriptionService.period_range(
+            subscription, subscription.next_run_at
+        )
+        if date_to >= current:
+            return False
+
+        schedule = ReportSchedule(subscription.schedule)
+        with transaction.atomic():
+            report = ReportService.generate_report(
+                subscription.user,
+                subscription.report_type,
+                date_from,
+                date_to,
+                format=subscription.format,
+                filters=subscription.filters
+            )
+            # Missed runs are skipped rather than generated one after another
+            repository.update_subscription(
+                subscription.id,
+                last_report=report,
+                last_run_at=current,
+                next_run_at=schedule.next_after(max(subscription.next_run_at, current))
+            )
+
+        if report.status == 'completed':
+            # An identical report was already generated, deliver it now
+            ReportService.notify(report)
+        logger.info(f"Generated report {report.id} for subscription {subscription.id}")
+        return True
@@ -0,0 +1,55 @@
+from celery import shared_task
+from celery.exceptions import SoftTimeLimitExceeded
+from django.conf import settings
+from reports.services.report_service import ReportService
+from reports.services.report_subscription_service import ReportSubscriptionService
+from utils import setup_logger
+
+logger = setup_logger(__name__)
+
+@shared_task(
+    soft_time_limit=getattr(settings, 'REPORT_TASK_SOFT_TIME_LIMIT', 600),
+    time_limit=getattr(settings, 'REPORT_TASK_SOFT_TIME_LIMIT', 600) + 60
+)
+def generate_report_file(report_id):
+    """Generate the file of a queued report"""
+    try:
+        report = ReportService.run_report(report_id)
+        return report.status
+    except SoftTimeLimitExceeded:
+        logger.error(f"Report {report_id} exceeded its time limit")
+        ReportService.mark_failed(report_id, "Report generation took too long")
+        return 'failed'
+    except Exception as e:
+        logger.error(f"Error generating report {report_id}: {str(e)}")
+        return 'failed'
+
+@shared_task
+def fail_stale_reports():
+    """Fail reports left pending or processing by a lost worker"""
+    try:
+        failed = ReportService.fail_stale_reports()
+        if failed:
+            logger.warning(f"Failed {failed} stale reports")
+        return failed
+    except Exception as e:
+        logger.error(f"Error failing stale reports: {str(e)}")
+        return False
+
+@shared_task
+def delete_expired_reports():
+    """Delete finished reports past the retention period"""
+    try:
+        return ReportService.delete_expired_reports()
+    except Exception as e:
+        logger.error(f"Error deleting expired reports: {str(e)}")
+        return False
+
+@shared_task
+def run_report_subscriptions():
+    """Generate the reports of due subscriptions"""
+    try:
+        return ReportSubscriptionService.run_subscriptions()
+    except Exception as e:
+        logger.error(f"Error running report subscriptions: {str(e)}")
+        return False
@@ -0,0 +1,68 @@
+import csv
+import io
+import tracemalloc
+from datetime import datetime, timezone as dt_timezone
+from decimal import Decimal
+from django.test import SimpleTestCase
+from reports.utils.csv_writer import CSVWriter
+
+
+class CountingSink:
+    """Binary file stand-in that keeps nothing but a byte count"""
+    def __init__(self):
+        self.size = 0
+
+    def write(self, chunk):
+        self.size += len(chunk)
+
+
+def synthetic_rows(count):
+    created_at = datetime(2025, 1, 1, tzinfo=dt_timezone.utc)
+    for i in range(count):
+        yield (
+            i,
+            f'ORD-{i:08d}',
+            f'customer{i}@example.com',
+            Decimal('123.45'),
+            'pending',
+            created_at
+        )
+
+
+class CSVWriterTests(SimpleTestCase):
+    COLUMNS = ['id', 'order_number', 'customer_email', 'total_amount', 'status', 'created_at']
+
+    def test_output_matches_csv_module(self):
+        rows = list(synthetic_rows(5))
+        writer = CSVWriter(self.COLUMNS, chunk_size=2)
+
+        chunks = list(writer.iter_chunks(rows))
+
+        self.assertEqual(len(chunks), 3)
+        parsed = list(csv.reader(io.StringIO(b''.join(chunks).decode())))
+        self.assertEqual(parsed[0], self.COLUMNS)
+        self.assertEqual(parsed[1][:4], ['0', 'ORD-00000000', 'customer0@example.com', '123.45'])
+        self.assertEqual(writer.rows_written, 5)
+
+    def test_progress_is_reported_per_chunk(self):
+        progress = []
+        CSVWriter(self.COLUMNS, chunk_size=4).write(
+            synthetic_rows(10),
+            CountingSink(),
+            progress.append
+        )
+        self.assertEqual(progress, [4, 8, 10])
+
+    def test_memory_does_not_grow_with_row_count(self):
+        peaks = {}
+        for count in (20_000, 200_000):
+            sink = CountingSink()
+            tracemalloc.start()
+            CSVWriter(self.COLUMNS, chunk_size=2000).write(synthetic_rows(count), sink)
+            _, peaks[count] = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            self.assertGreater(sink.size, count * 50)
+
+        # One chunk of ~2000 rows is the only thing held at a time
+        self.assertLess(peaks[200_000], 2 * 1024 * 1024)
+        self.assertLess(peaks[200_000], peaks[20_000] * 1.5)
@@ -0,0 +1,74 @@
+import os
+import shutil
+import tempfile
+import tracemalloc
+import zipfile
+from django.core.files.storage import FileSystemStorage
+from django.test import SimpleTestCase
+from reports.utils.excel_writer import ExcelWriter
+from reports.utils.temporary_report_file import TemporaryReportFile
+from reports.tests.test_csv_export import synthetic_rows
+
+
+class ExcelWriterTests(SimpleTestCase):
+    COLUMNS = ['id', 'order_number', 'customer_email', 'total_amount', 'status', 'created_at']
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def write(self, count, **kwargs):
+        path = os.path.join(self.directory, f'{count}.xlsx')
+        writer = ExcelWriter(self.COLUMNS, **kwargs)
+        writer.write({'total_orders': count}, synthetic_rows(count), path)
+        return path, writer
+
+    def test_workbook_has_summary_and_typed_details(self):
+        path, writer = self.write(3)
+
+        self.assertEqual(writer.rows_written, 3)
+        with zipfile.ZipFile(path) as workbook:
+            names = workbook.namelist()
+            details = workbook.read('xl/worksheets/sheet2.xml').decode()
+        self.assertIn('xl/worksheets/sheet1.xml', names)
+        # Amounts are numbers and timestamps are dates, not strings
+        self.assertIn('<v>123.45</v>', details)
+        self.assertIn('<v>45658</v>', details)
+
+    def test_progress_is_reported_per_chunk(self):
+        progress = []
+        path = os.path.join(self.directory, 'progress.xlsx')
+        ExcelWriter(self.COLUMNS, chunk_size=4).write(
+            {}, synthetic_rows(10), path, progress.append
+        )
+        self.assertEqual(progress, [4, 8, 10])
+
+    def test_memory_does_not_grow_with_row_count(self):
+        peaks = {}
+        for count in (2_000, 20_000):
+            tracemalloc.start()
+            self.write(count)
+            _, peaks[count] = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+        self.assertLess(peaks[20_000], 4 * 1024 * 1024)
+        self.assertLess(peaks[20_000], peaks[2_000] * 1.5)
+
+
+class TemporaryReportFileTests(SimpleTestCase):
+    def test_file_system_storage_moves_instead_of_copying(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, ignore_errors=True)
+        output = TemporaryReportFile(suffix='.csv')
+        with open(output.path, 'wb') as handle:
+            handle.write(b'id\n1\n')
+        inode = os.stat(output.path).st_ino
+
+        name = FileSystemStorage(location=directory).save('report.csv', output.open())
+        output.cleanup()
+
+        saved = os.path.join(directory, name)
+        self.assertEqual(os.stat(saved).st_ino, inode)
+        self.assertFalse(os.path.exists(output.path))
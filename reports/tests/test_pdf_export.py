@@ -0,0 +1,86 @@
+import io
+import re
+from unittest import skipUnless
+from django.test import SimpleTestCase, override_settings
+from reports.utils import pdf_generator
+from reports.utils.pdf_generator import PDFGenerator, FlowableStream
+from reports.tests.test_csv_export import synthetic_rows
+
+
+class SyntheticRows:
+    columns = ['id', 'order_number', 'customer_email', 'total_amount', 'status', 'created_at']
+
+    def __init__(self, count):
+        self.total = count
+
+    def iter_tuples(self):
+        return synthetic_rows(self.total)
+
+
+def page_count(pdf):
+    return len(re.findall(rb'/Type /Page\b(?!s)', pdf))
+
+
+@override_settings(REPORT_PDF_ROWS_PER_TABLE=10, REPORT_EXPORT_CHUNK_SIZE=40)
+class PDFGeneratorTests(SimpleTestCase):
+    def render(self, count, **kwargs):
+        output = io.BytesIO()
+        written = PDFGenerator.generate_pdf(
+            {'summary': {'total_orders': count}, 'orders': SyntheticRows(count)},
+            output,
+            **kwargs
+        )
+        return output.getvalue(), written
+
+    def test_rows_are_split_into_page_sized_tables(self):
+        tables = list(PDFGenerator._tables(['a'], ([i] for i in range(25)), [80], 10))
+
+        self.assertEqual([len(table._cellvalues) for table in tables], [11, 11, 6])
+        # Every table repeats the header and shares one style
+        self.assertTrue(all(table._cellvalues[0] == ['a'] for table in tables))
+
+    def test_renders_valid_pdf(self):
+        small, written = self.render(5)
+        large, _ = self.render(100)
+
+        self.assertEqual(written, 5)
+        self.assertTrue(large.startswith(b'%PDF'))
+        self.assertGreater(page_count(large), page_count(small))
+
+    def test_empty_report_has_only_summary(self):
+        pdf, written = self.render(0)
+
+        self.assertEqual(written, 0)
+        self.assertEqual(page_count(pdf), 1)
+
+    def test_progress_is_reported_per_chunk(self):
+        progress = []
+        self.render(100, on_progress=progress.append)
+
+        self.assertEqual(progress, [40, 80, 100])
+
+    def test_story_is_consumed_lazily(self):
+        produced = []
+
+        def flowables():
+            for i in range(3):
+                produced.append(i)
+                yield i
+
+        story = FlowableStream(flowables())
+        self.assertEqual(story[0], 0)
+        self.assertEqual(produced, [0])
+        del story[0]
+        self.assertEqual(len(story), 1)
+        self.assertEqual(produced, [0, 1])
+
+    @skipUnless(pdf_generator.PdfWriter, 'pypdf is not installed')
+    @override_settings(REPORT_PDF_PARALLEL_ROWS=50, REPORT_PDF_SEGMENT_ROWS=30, REPORT_PDF_WORKERS=2)
+    def test_large_reports_are_rendered_in_parallel_segments(self):
+        serial, _ = self.render(49, row_count=49)
+        parallel, written = self.render(100, row_count=100)
+
+        self.assertEqual(written, 100)
+        self.assertTrue(parallel.startswith(b'%PDF'))
+        # Segments start on a new page: 10 of 30 rows per table
+        self.assertGreater(page_count(parallel), page_count(serial))
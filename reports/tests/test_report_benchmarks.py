@@ -0,0 +1,118 @@
+import json
+import os
+import tempfile
+from io import StringIO
+from unittest import skipUnless
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase, TransactionTestCase
+from orders.models import Order, OrderItem
+from reports.benchmarks import ReportBenchmark, SyntheticDataFactory
+from users.models import User, UserActivityLog
+
+# The full benchmark only runs on request, e.g.
+#   REPORT_BENCHMARK=1 REPORT_BENCHMARK_SCALE=medium pytest reports/tests/test_report_benchmarks.py
+# Results go to REPORT_BENCHMARK_OUTPUT (benchmarks/reports-<commit>.json);
+# compare two runs with `manage.py compare_report_benchmarks old.json new.json`
+BENCHMARK = os.environ.get('REPORT_BENCHMARK')
+
+
+class ReportBenchmarkSmokeTests(TestCase):
+    def setUp(self):
+        self.factory = SyntheticDataFactory.for_scale('tiny', seed=7)
+        self.counts = self.factory.create()
+
+    def test_data_is_seeded(self):
+        self.assertEqual(self.counts['orders'], 40)
+        self.assertEqual(OrderItem.objects.count(), self.counts['order_items'])
+        self.assertEqual(UserActivityLog.objects.count(), 60)
+        dates = [order.created_at for order in Order.objects.all()]
+        self.assertTrue(all(self.factory.start <= date < self.factory.end for date in dates))
+
+        first = SyntheticDataFactory.for_scale('tiny', seed=7)
+        second = SyntheticDataFactory.for_scale('tiny', seed=7)
+        self.assertEqual(
+            [first._uuid() for _ in range(3)],
+            [second._uuid() for _ in range(3)]
+        )
+
+    def test_every_combination_is_measured(self):
+        benchmark = ReportBenchmark(User.objects.first(), self.factory.start, self.factory.end)
+
+        results = benchmark.run()
+
+        self.assertEqual(len(results), 12)
+        for result in results:
+            with self.subTest(report_type=result['report_type'], format=result['format']):
+                self.assertGreater(result['wall_time'], 0)
+                self.assertGreater(result['queries'], 0)
+                self.assertGreater(result['peak_rss'], 0)
+                self.assertGreater(result['file_size'], 0)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'results.json')
+            document = benchmark.save(path, results, self.counts)
+            with open(path) as saved:
+                self.assertEqual(json.load(saved)['results'], json.loads(json.dumps(results)))
+            self.assertEqual(document['dataset'], self.counts)
+
+    def test_regressions_are_compared(self):
+        baseline = {'results': [
+            {'report_type': 'sales', 'format': 'csv', 'rows': 10,
+             'wall_time': 1.0, 'queries': 4, 'peak_rss': 100}
+        ]}
+        current = {'results': [
+            {'report_type': 'sales', 'format': 'csv', 'rows': 10,
+             'wall_time': 1.1, 'queries': 8, 'peak_rss': 100}
+        ]}
+
+        regressions = ReportBenchmark.compare(baseline, current)
+        self.assertEqual([r['metric'] for r in regressions], ['queries'])
+
+        with tempfile.TemporaryDirectory() as directory:
+            paths = []
+            for name, document in (('old', baseline), ('new', current)):
+                paths.append(os.path.join(directory, f'{name}.json'))
+                with open(paths[-1], 'w') as output:
+                    json.dump(document, output)
+            out = StringIO()
+            with self.assertRaises(CommandError):
+                call_command('compare_report_benchmarks', *paths, stdout=out)
+            self.assertIn('queries: 4 -> 8', out.getvalue())
+
+            out = StringIO()
+            call_command('compare_report_benchmarks', paths[0], paths[0], stdout=out)
+            self.assertIn('No regressions found', out.getvalue())
+
+
+@skipUnless(BENCHMARK, 'Set REPORT_BENCHMARK=1 to run the report benchmark')
+class ReportBenchmarkSuite(TransactionTestCase):
+    """Committed data, so partition worker threads see it on PostgreSQL"""
+
+    def test_report_generation(self):
+        scale = os.environ.get('REPORT_BENCHMARK_SCALE', 'small')
+        factory = SyntheticDataFactory.for_scale(
+            scale,
+            seed=int(os.environ.get('REPORT_BENCHMARK_SEED', 0))
+        )
+        dataset = {'scale': scale, 'seed': factory.seed, **factory.create()}
+        benchmark = ReportBenchmark(
+            User.objects.order_by('email').first(),
+            factory.start,
+            factory.end,
+            repeat=int(os.environ.get('REPORT_BENCHMARK_REPEAT', 3))
+        )
+
+        results = benchmark.run()
+
+        output = os.environ.get('REPORT_BENCHMARK_OUTPUT') or os.path.join(
+            'benchmarks', f"reports-{benchmark.commit() or 'local'}.json"
+        )
+        benchmark.save(output, results, dataset)
+        for result in results:
+            print(
+                f"{result['report_type']:<14} {result['format']:<6} {result['rows']:>8} rows  "
+                f"{result['wall_time']:8.2f}s  {result['queries']:>5} queries  "
+                f"{result['peak_rss'] / 1024 / 1024:7.1f} MB"
+            )
+        print(f'Saved to {output}')
@@ -0,0 +1,184 @@
+import os
+import shutil
+import tempfile
+from datetime import timedelta
+from decimal import Decimal
+from unittest import mock
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from notifications.models import Notification
+from orders.models import Order
+from reports.models import Report
+from reports.services.report_service import ReportService
+from reports.tests.test_report_generation import read_report
+from users.models import User, UserActivityLog, UserRole
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+@mock.patch('reports.tasks.generate_report_file.apply_async')
+class ReportDeduplicationTests(TestCase):
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    def setUp(self):
+        role = UserRole.objects.create(name='admin')
+        self.user, self.other = [
+            User.objects.create(
+                email=f'{name}@example.com',
+                first_name=name.title(),
+                last_name='User',
+                role=role
+            )
+            for name in ('user', 'other')
+        ]
+        self.date_from = timezone.now() - timedelta(days=1)
+        self.date_to = timezone.now() + timedelta(days=1)
+        self.create_order('ORD-1')
+
+    def create_order(self, order_number):
+        return Order.objects.create(
+            order_number=order_number,
+            customer_name='Customer',
+            customer_email='customer@example.com',
+            customer_phone='123',
+            shipping_address='Address',
+            billing_address='Address',
+            subtotal=Decimal('10.00'),
+            total_amount=Decimal('10.00')
+        )
+
+    def request(self, user, **overrides):
+        kwargs = {'format': 'csv', **overrides}
+        return ReportService.generate_report(
+            user, 'orders', self.date_from, self.date_to, **kwargs
+        )
+
+    def test_fingerprint_is_canonical(self, apply_async):
+        fingerprint = ReportService.fingerprint(
+            'orders', self.date_from, self.date_to, 'csv', {'a': 1, 'b': 2}, 'v1'
+        )
+        self.assertEqual(
+            fingerprint,
+            ReportService.fingerprint(
+                'orders',
+                self.date_from.astimezone(timezone.get_fixed_timezone(120)),
+                self.date_to,
+                'csv',
+                {'b': 2, 'a': 1},
+                'v1'
+            )
+        )
+        self.assertNotEqual(
+            fingerprint,
+            ReportService.fingerprint(
+                'orders', self.date_from, self.date_to, 'csv', {'a': 1, 'b': 2}, 'v2'
+            )
+        )
+
+    def test_same_user_gets_the_existing_report(self, apply_async):
+        first = self.request(self.user)
+        self.assertEqual(self.request(self.user).id, first.id)
+        self.assertEqual(Report.objects.count(), 1)
+
+        self.assertNotEqual(self.request(self.user, format='pdf').id, first.id)
+
+    def test_data_changes_start_a_new_generation(self, apply_async):
+        first = self.request(self.user)
+        self.create_order('ORD-2')
+
+        second = self.request(self.user)
+        self.assertNotEqual(second.id, first.id)
+        self.assertNotEqual(second.data_version, first.data_version)
+
+        Order.objects.filter(order_number='ORD-2').delete()
+        self.assertNotEqual(self.request(self.user).data_version, second.data_version)
+
+    def test_versions_cover_only_the_reported_rows(self, apply_async):
+        first = self.request(self.user, filters={'order_number': 'ORD-1'})
+        self.create_order('ORD-2')
+
+        self.assertEqual(self.request(self.user, filters={'order_number': 'ORD-1'}).id, first.id)
+
+    def test_identical_activity_requests_share_a_report(self, apply_async):
+        # Each request logs an activity, outside the closed range reported on
+        yesterday = timezone.now() - timedelta(days=1)
+        UserActivityLog.objects.create(
+            user=self.user, action='Visited /', timestamp=yesterday - timedelta(days=2)
+        )
+        client = APIClient()
+        client.force_authenticate(self.user)
+        payload = {
+            'report_type': 'user_activity',
+            'format': 'csv',
+            'date_from': (yesterday - timedelta(days=29)).isoformat(),
+            'date_to': yesterday.isoformat()
+        }
+
+        responses = [
+            client.post(reverse('report-generate'), payload, format='json')
+            for _ in range(2)
+        ]
+
+        self.assertEqual([response.status_code for response in responses], [202, 202])
+        self.assertEqual(responses[0].data['data']['id'], responses[1].data['data']['id'])
+        self.assertEqual(Report.objects.count(), 1)
+        self.assertGreater(UserActivityLog.objects.count(), 2)
+
+    def test_concurrent_request_waits_for_the_running_generation(self, apply_async):
+        with self.captureOnCommitCallbacks(execute=True):
+            leader = self.request(self.user)
+            copy = self.request(self.other)
+
+        self.assertEqual(apply_async.call_count, 1)
+        self.assertEqual(copy.shared_from_id, leader.id)
+        self.assertEqual(copy.status, 'pending')
+
+        ReportService.run_report(leader.id)
+        copy.refresh_from_db()
+        leader.refresh_from_db()
+
+        self.assertEqual(copy.status, 'completed')
+        self.assertEqual(copy.row_count, 1)
+        self.assertNotEqual(copy.file.name, leader.file.name)
+        self.assertEqual(copy.file.read(), leader.file.read())
+        self.assertTrue(
+            Notification.objects.filter(user=self.other, related_object_id=copy.id).exists()
+        )
+
+    def test_completed_report_file_is_hard_linked(self, apply_async):
+        with self.captureOnCommitCallbacks(execute=True):
+            leader = ReportService.run_report(self.request(self.user).id)
+            copy = self.request(self.other)
+
+        self.assertEqual(copy.status, 'completed')
+        self.assertEqual(copy.shared_from_id, leader.id)
+        self.assertTrue(os.path.samefile(copy.file.path, leader.file.path))
+        apply_async.assert_called_once()
+
+        # Deleting one report leaves the other's file in place
+        ReportService.delete_report(leader.id, self.user)
+        copy.refresh_from_db()
+        self.assertTrue(read_report(copy).startswith(b'id,order_number'))
+
+    def test_failures_fail_waiting_copies(self, apply_async):
+        leader = self.request(self.user)
+        copy = self.request(self.other)
+
+        ReportService.mark_failed(leader.id, 'boom')
+
+        copy.refresh_from_db()
+        self.assertEqual((copy.status, copy.error_message), ('failed', 'boom'))
+        self.assertNotEqual(self.request(self.other).id, copy.id)
+
+    @override_settings(REPORT_MAX_ACTIVE_GLOBAL=1)
+    def test_copies_do_not_count_towards_limits(self, apply_async):
+        self.request(self.user)
+        self.request(self.other)
+
+        self.assertEqual(Report.objects.filter(status='pending').count(), 2)
@@ -0,0 +1,119 @@
+import shutil
+import tempfile
+from datetime import timedelta
+from unittest import mock
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from dashboard.tests.test_metric_batch import DashboardDataMixin
+from reports.services.report_service import ReportService
+from reports.utils.report_download import ReportDownload
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+class RangeParsingTests(SimpleTestCase):
+    def test_ranges(self):
+        parse = ReportDownload.parse_range
+        self.assertEqual(parse('bytes=0-9', 100), (0, 9))
+        self.assertEqual(parse('bytes=90-', 100), (90, 99))
+        self.assertEqual(parse('bytes=95-200', 100), (95, 99))
+        self.assertEqual(parse('bytes=-10', 100), (90, 99))
+        self.assertEqual(parse('bytes=-500', 100), (0, 99))
+        self.assertIsNone(parse(None, 100))
+        self.assertIsNone(parse('bytes=0-1,5-6', 100))
+        self.assertFalse(parse('bytes=100-', 100))
+        self.assertFalse(parse('bytes=-0', 100))
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT, REPORT_COMPRESSION=None)
+@mock.patch('reports.tasks.generate_report_file.apply_async')
+class ReportDownloadTests(DashboardDataMixin, TestCase):
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    def setUp(self):
+        self.user = self.create_user('admin', 'admin@example.com')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        for i in range(5):
+            self.create_order(f'ORD-{i}')
+
+        report = ReportService.generate_report(
+            self.user,
+            'orders',
+            timezone.now() - timedelta(days=1),
+            timezone.now() + timedelta(days=1),
+            format='csv'
+        )
+        self.report = ReportService.run_report(report.id)
+        self.content = self.report.file.read()
+        self.url = reverse('report-download', kwargs={'report_id': self.report.id})
+
+    def download(self, **headers):
+        return self.client.get(self.url, **headers)
+
+    def test_full_download_is_stable(self, apply_async):
+        first = self.download()
+        second = self.download()
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(b''.join(first.streaming_content), self.content)
+        self.assertEqual(first['Accept-Ranges'], 'bytes')
+        for header in ('ETag', 'Last-Modified', 'Content-Disposition'):
+            self.assertEqual(first[header], second[header])
+
+    def test_conditional_requests(self, apply_async):
+        response = self.download()
+
+        not_modified = self.download(HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified['ETag'], response['ETag'])
+
+        self.assertEqual(
+            self.download(HTTP_IF_MODIFIED_SINCE=response['Last-Modified']).status_code,
+            304
+        )
+        self.assertEqual(self.download(HTTP_IF_NONE_MATCH='"other"').status_code, 200)
+
+    def test_range_requests(self, apply_async):
+        partial = self.download(HTTP_RANGE='bytes=10-19')
+        self.assertEqual(partial.status_code, 206)
+        self.assertEqual(b''.join(partial.streaming_content), self.content[10:20])
+        self.assertEqual(partial['Content-Range'], f'bytes 10-19/{len(self.content)}')
+        self.assertEqual(partial['Content-Length'], '10')
+
+        tail = self.download(HTTP_RANGE='bytes=-5')
+        self.assertEqual(b''.join(tail.streaming_content), self.content[-5:])
+
+        unsatisfiable = self.download(HTTP_RANGE=f'bytes={len(self.content)}-')
+        self.assertEqual(unsatisfiable.status_code, 416)
+        self.assertEqual(unsatisfiable['Content-Range'], f'bytes */{len(self.content)}')
+
+    def test_if_range_falls_back_to_full_file_when_changed(self, apply_async):
+        etag = self.download()['ETag']
+
+        resumed = self.download(HTTP_RANGE='bytes=10-', HTTP_IF_RANGE=etag)
+        self.assertEqual(resumed.status_code, 206)
+
+        restarted = self.download(HTTP_RANGE='bytes=10-', HTTP_IF_RANGE='"stale"')
+        self.assertEqual(restarted.status_code, 200)
+
+    @override_settings(REPORT_DOWNLOAD_OFFLOAD='x-accel-redirect')
+    def test_accel_redirect_offload(self, apply_async):
+        response = self.download(HTTP_RANGE='bytes=0-9')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, b'')
+        self.assertEqual(
+            response['X-Accel-Redirect'],
+            f'/protected-media/{self.report.file.name}'
+        )
+        self.assertIn('ETag', response)
+
+    @override_settings(REPORT_DOWNLOAD_OFFLOAD='x-sendfile')
+    def test_sendfile_offload(self, apply_async):
+        self.assertEqual(self.download()['X-Sendfile'], self.report.file.path)
@@ -0,0 +1,187 @@
+import shutil
+import tempfile
+from datetime import timedelta
+from decimal import Decimal
+from unittest import mock
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from notifications.models import Notification
+from orders.models import Order
+from reports.models import Report
+from reports.repositories.report_repository import ReportRepository
+from reports.services.report_service import ReportService
+from reports.utils.report_compression import ReportCompression
+from users.models import User, UserRole
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+def read_report(report):
+    with ReportCompression.open(report.file.path, report.compression) as content:
+        return content.read()
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+class ReportGenerationTests(TestCase):
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    def setUp(self):
+        self.user = User.objects.create(
+            email='user@example.com',
+            first_name='Test',
+            last_name='User',
+            role=UserRole.objects.create(name='admin')
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        for i in range(3):
+            Order.objects.create(
+                order_number=f'ORD-{i}',
+                customer_name='Customer',
+                customer_email='customer@example.com',
+                customer_phone='123',
+                shipping_address='Address',
+                billing_address='Address',
+                subtotal=Decimal('10.00'),
+                total_amount=Decimal('10.00')
+            )
+
+    def request_report(self, **overrides):
+        payload = {
+            'report_type': 'orders',
+            'format': 'csv',
+            'date_from': (timezone.now() - timedelta(days=1)).isoformat(),
+            'date_to': (timezone.now() + timedelta(days=1)).isoformat(),
+            **overrides
+        }
+        return self.client.post(reverse('report-generate'), payload, format='json')
+
+    @mock.patch('reports.tasks.generate_report_file.apply_async')
+    def test_request_is_accepted_and_queued(self, apply_async):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.request_report()
+
+        self.assertEqual(response.status_code, 202)
+        data = response.json()['data']
+        self.assertEqual(data['status'], 'pending')
+        self.assertEqual(response['Location'], data['status_url'])
+
+        report = Report.objects.get()
+        apply_async.assert_called_once_with(
+            args=[str(report.id)],
+            task_id=report.task_id
+        )
+
+    @override_settings(REPORT_MAX_ACTIVE_PER_USER=1)
+    @mock.patch('reports.tasks.generate_report_file.apply_async')
+    def test_per_user_limit(self, apply_async):
+        self.assertEqual(self.request_report().status_code, 202)
+        self.assertEqual(self.request_report(format='pdf').status_code, 429)
+
+        Report.objects.update(status='completed')
+        self.assertEqual(self.request_report(format='pdf').status_code, 202)
+
+    @override_settings(REPORT_MAX_ACTIVE_GLOBAL=1)
+    @mock.patch('reports.tasks.generate_report_file.apply_async')
+    def test_global_limit(self, apply_async):
+        other = User.objects.create(
+            email='other@example.com',
+            first_name='Other',
+            last_name='User',
+            role=self.user.role
+        )
+        ReportService.generate_report(
+            other,
+            'orders',
+            timezone.now() - timedelta(days=1),
+            timezone.now(),
+            format='csv'
+        )
+        self.assertEqual(self.request_report().status_code, 429)
+
+    @mock.patch('reports.tasks.generate_report_file.apply_async')
+    def test_task_drives_status_and_progress(self, apply_async):
+        self.request_report()
+        report = ReportService.run_report(Report.objects.get().id)
+
+        self.assertEqual(report.status, 'completed')
+        self.assertEqual(report.progress, 100)
+        self.assertEqual((report.row_count, report.rows_processed), (3, 3))
+        self.assertIsNotNone(report.completed_at)
+        self.assertTrue(read_report(report).startswith(b'id,order_number'))
+        self.assertTrue(
+            Notification.objects.filter(
+                user=self.user,
+                related_object_id=report.id
+            ).exists()
+        )
+
+        response = self.client.get(
+            reverse('report-detail', kwargs={'report_id': report.id})
+        )
+        self.assertEqual(response.json()['data']['progress'], 100)
+
+    @override_settings(REPORT_EXPORT_CHUNK_SIZE=2)
+    @mock.patch('reports.tasks.generate_report_file.apply_async')
+    def test_csv_is_streamed_from_the_database(self, apply_async):
+        self.request_report()
+        with mock.patch.object(
+            ReportRepository,
+            'update_report',
+            autospec=True,
+            side_effect=ReportRepository.update_report
+        ) as update_report:
+            report = ReportService.run_report(Report.objects.get().id)
+
+        lines = read_report(report).decode().splitlines()
+        self.assertEqual(len(lines), 4)
+        self.assertEqual(lines[1].split(',')[1], 'ORD-2')
+        processed = [
+            call.kwargs['rows_processed'] for call in update_report.call_args_list
+            if 'rows_processed' in call.kwargs
+        ]
+        self.assertEqual(processed, [2, 3, 3])
+
+    @mock.patch('reports.tasks.generate_report_file.apply_async')
+    def test_every_format_and_type_renders(self, apply_async):
+        for report_type in ReportService.REPORT_GENERATORS:
+            for format in ('pdf', 'excel', 'csv'):
+                with self.subTest(report_type=report_type, format=format):
+                    report = ReportService.generate_report(
+                        self.user,
+                        report_type,
+                        timezone.now() - timedelta(days=1),
+                        timezone.now() + timedelta(days=1),
+                        format=format
+                    )
+                    report = ReportService.run_report(report.id)
+                    self.assertEqual(report.status, 'completed')
+                    self.assertTrue(report.file.size)
+
+    @mock.patch('reports.tasks.generate_report_file.apply_async')
+    def test_failures_are_recorded(self, apply_async):
+        self.request_report()
+        Report.objects.update(format='docx')
+
+        with self.assertRaises(ValueError):
+            ReportService.run_report(Report.objects.get().id)
+
+        report = Report.objects.get()
+        self.assertEqual(report.status, 'failed')
+        self.assertIn('Unsupported format', report.error_message)
+
+    @mock.patch('reports.tasks.generate_report_file.apply_async')
+    def test_stale_reports_are_failed(self, apply_async):
+        self.request_report()
+        Report.objects.update(
+            status='processing',
+            started_at=timezone.now() - timedelta(hours=2)
+        )
+
+        self.assertEqual(ReportService.fail_stale_reports(), 1)
+        self.assertEqual(Report.objects.get().status, 'failed')
@@ -0,0 +1,114 @@
+from datetime import datetime
+from decimal import Decimal
+from django.test import SimpleTestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+from dashboard.tests.test_metric_batch import DashboardDataMixin
+from inventories.models import InventoryItem
+from orders.models import Order
+from reports.services.report_service import ReportService
+from reports.utils.report_scan import ReportPipeline
+from reports.utils.report_partitions import ReportPartitioner, PartitionedRows, merge_summaries
+from users.models import UserActivityLog
+
+
+def aware(*args):
+    return timezone.make_aware(datetime(*args))
+
+
+class ReportPartitionerTests(SimpleTestCase):
+    def test_month_boundaries(self):
+        partitioner = ReportPartitioner('created_at', aware(2024, 11, 15), aware(2025, 2, 10))
+
+        self.assertEqual(partitioner.boundaries(0), [
+            aware(2024, 11, 15),
+            aware(2024, 12, 1),
+            aware(2025, 1, 1),
+            aware(2025, 2, 1),
+            aware(2025, 2, 10)
+        ])
+
+    @override_settings(REPORT_PARTITION_BY='rows', REPORT_PARTITION_ROWS=100)
+    def test_row_estimate_boundaries(self):
+        partitioner = ReportPartitioner('created_at', aware(2025, 1, 1), aware(2025, 1, 4))
+
+        self.assertEqual(partitioner.boundaries(250), [
+            aware(2025, 1, 1),
+            aware(2025, 1, 2),
+            aware(2025, 1, 3),
+            aware(2025, 1, 4)
+        ])
+        self.assertEqual(len(partitioner.boundaries(10)), 2)
+
+    def test_partial_summaries_merge(self):
+        merged = merge_summaries([
+            {'total': Decimal('1.50'), 'count': 2, 'users': {1, 2}},
+            {'total': 0, 'count': 1, 'users': {2, 3}},
+        ])
+
+        self.assertEqual(merged, {'total': Decimal('1.50'), 'count': 3, 'users': {1, 2, 3}})
+
+
+# Live dashboard updates would try to reach the broker on every commit
+@override_settings(REPORT_PARTITION_WORKERS=2, DASHBOARD_LIVE_UPDATES=False)
+class PartitionedReportTests(DashboardDataMixin, TransactionTestCase):
+    def setUp(self):
+        user = self.create_user('admin', 'admin@example.com')
+        other = self.create_user('admin', 'other@example.com')
+        dates = [aware(2024, 12, 31, 23), aware(2025, 1, 10), aware(2025, 1, 20), aware(2025, 3, 1)]
+        for i, created_at in enumerate(dates):
+            order = self.create_order(f'ORD-{i}', total=f'{i + 1}.25')
+            Order.objects.filter(pk=order.pk).update(created_at=created_at)
+            log = UserActivityLog.objects.create(user=(user, other)[i % 2], action='login')
+            UserActivityLog.objects.filter(pk=log.pk).update(timestamp=created_at)
+            item = self.create_item(f'BATCH-{i}', str(i + 1))
+            InventoryItem.objects.filter(pk=item.pk).update(updated_at=created_at)
+
+        self.date_from = aware(2024, 12, 1)
+        self.date_to = aware(2025, 3, 1)
+
+    def generate(self, report_type):
+        generator = getattr(ReportService, ReportService.REPORT_GENERATORS[report_type])
+        return generator(self.date_from, self.date_to)
+
+    def test_partitioned_reports_match_a_single_scan(self):
+        for report_type, detail_key in (
+            ('sales', 'orders'),
+            ('orders', 'orders'),
+            ('inventory', 'items'),
+            ('user_activity', 'activities')
+        ):
+            with self.subTest(report_type=report_type):
+                scanned = self.generate(report_type)
+                with override_settings(REPORT_SCAN_MAX_ROWS=1):
+                    partitioned = self.generate(report_type)
+
+                rows = partitioned[detail_key]
+                self.assertIsInstance(rows, PartitionedRows)
+                self.assertEqual(len(rows.partitions), 3)
+                self.assertEqual(partitioned['summary'], scanned['summary'])
+                self.assertEqual(
+                    list(rows.iter_tuples()),
+                    list(scanned[detail_key].iter_tuples())
+                )
+
+    def test_detail_rows_keep_report_order(self):
+        with override_settings(REPORT_SCAN_MAX_ROWS=1):
+            data = self.generate('orders')
+
+        self.assertEqual(
+            [row[1] for row in data['orders'].iter_tuples()],
+            ['ORD-3', 'ORD-2', 'ORD-1', 'ORD-0']
+        )
+        self.assertEqual(data['summary']['total_value'], Decimal('11.00'))
+
+    def test_detail_rows_of_other_orderings_are_not_partitioned(self):
+        queryset = Order.objects.order_by('order_number')
+        partitioner = ReportPartitioner('created_at', self.date_from, self.date_to)
+        with override_settings(REPORT_SCAN_MAX_ROWS=1):
+            _, rows = ReportPipeline.run(
+                queryset, ('order_number',), None, lambda queryset: {'orders': queryset.count()},
+                partitioner=partitioner
+            )
+
+        self.assertNotIsInstance(rows, PartitionedRows)
+        self.assertEqual([row[0] for row in rows.iter_tuples()], ['ORD-0', 'ORD-1', 'ORD-2', 'ORD-3'])
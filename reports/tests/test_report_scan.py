@@ -0,0 +1,81 @@
+from datetime import timedelta
+from decimal import Decimal
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from dashboard.tests.test_metric_batch import DashboardDataMixin
+from reports.services.report_service import ReportService
+from reports.utils.report_rows import ReportRows
+from reports.utils.report_scan import ColumnScan, ScannedRows
+from users.models import UserActivityLog
+
+
+class ReportScanTests(DashboardDataMixin, TestCase):
+    def setUp(self):
+        self.create_order('ORD-1', status='pending', total='10.25')
+        self.create_order('ORD-2', status='completed', total='20.50')
+        self.create_order('ORD-3', status='pending', total='0.10')
+        self.create_item('B-1', '3', price='1.10')
+        self.create_item('B-2', '12.5', price='2.00')
+        user = self.create_user('admin', 'admin@example.com')
+        other = self.create_user('admin', 'other@example.com')
+        for actor in (user, user, other):
+            UserActivityLog.objects.create(user=actor, action='login', ip_address='127.0.0.1')
+
+        self.date_from = timezone.now() - timedelta(days=1)
+        self.date_to = timezone.now() + timedelta(days=1)
+
+    def generate(self, report_type):
+        generator = getattr(ReportService, ReportService.REPORT_GENERATORS[report_type])
+        return generator(self.date_from, self.date_to)
+
+    def test_summary_and_rows_come_from_one_scan(self):
+        with CaptureQueriesContext(connection) as queries:
+            data = self.generate('orders')
+            rows = list(data['orders'].iter_tuples())
+
+        # A count to pick the strategy and the scan itself
+        self.assertEqual(len(queries), 2)
+        self.assertIsInstance(data['orders'], ScannedRows)
+        self.assertEqual(data['orders'].count(), 3)
+        self.assertEqual([row[1] for row in rows], ['ORD-3', 'ORD-2', 'ORD-1'])
+        self.assertEqual(len(rows[0]), len(data['orders'].columns))
+        self.assertEqual(data['summary'], {
+            'total_orders': 3,
+            'total_value': Decimal('30.85'),
+            'pending_orders': 2,
+            'completed_orders': 1
+        })
+
+    def test_inventory_value_is_sum_of_item_values(self):
+        summary = self.generate('inventory')['summary']
+
+        self.assertEqual(summary['total_value'], Decimal('28.30'))
+        self.assertEqual(summary['low_stock_items'], 1)
+
+    def test_large_amounts_are_summed_exactly(self):
+        amount = Decimal('99999999.99')
+        scan = ColumnScan([(amount, amount), (amount, Decimal('0.01'))], ['quantity', 'price'])
+
+        self.assertEqual(scan.decimal_sum('quantity'), Decimal('199999999.98'))
+        self.assertEqual(
+            scan.decimal_product_sum('quantity', 'price'),
+            amount * amount + amount * Decimal('0.01')
+        )
+        self.assertEqual(scan.count_at_most('price', 10), 1)
+
+    def test_large_reports_are_aggregated_in_sql(self):
+        for report_type in ReportService.REPORT_GENERATORS:
+            with self.subTest(report_type=report_type):
+                scanned = self.generate(report_type)
+                with override_settings(REPORT_SCAN_MAX_ROWS=1):
+                    aggregated = self.generate(report_type)
+
+                detail_key = next(k for k in aggregated if k != 'summary')
+                self.assertIs(type(aggregated[detail_key]), ReportRows)
+                self.assertEqual(aggregated['summary'], scanned['summary'])
+                self.assertEqual(
+                    list(aggregated[detail_key].iter_tuples()),
+                    list(scanned[detail_key].iter_tuples())
+                )
@@ -0,0 +1,133 @@
+import gzip
+import os
+import shutil
+import tempfile
+from datetime import timedelta
+from unittest import mock
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from dashboard.repositories.dashboard_repository import DashboardRepository
+from dashboard.tests.test_metric_batch import DashboardDataMixin
+from exceptions import LimitExceededException
+from reports.models import Report
+from reports.services.report_service import ReportService
+from reports.tests.test_report_generation import read_report
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT, REPORT_COMPRESSION='gzip')
+@mock.patch('reports.tasks.generate_report_file.apply_async')
+class ReportStorageTests(DashboardDataMixin, TestCase):
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    def setUp(self):
+        self.user = self.create_user('admin', 'admin@example.com')
+        for i in range(20):
+            self.create_order(f'ORD-{i}')
+
+    def run_report(self, format='csv', user=None):
+        report = ReportService.generate_report(
+            user or self.user,
+            'orders',
+            timezone.now() - timedelta(days=1),
+            timezone.now() + timedelta(days=1),
+            format=format
+        )
+        return ReportService.run_report(report.id)
+
+    def download(self, report, **headers):
+        client = APIClient()
+        client.force_authenticate(self.user)
+        return client.get(
+            reverse('report-download', kwargs={'report_id': report.id}),
+            **headers
+        )
+
+    def test_configured_formats_are_stored_compressed(self, apply_async):
+        csv = self.run_report('csv')
+        excel = self.run_report('excel')
+
+        self.assertEqual(csv.compression, 'gzip')
+        self.assertTrue(csv.file.name.endswith('.csv.gz'))
+        self.assertEqual(csv.file_size, os.path.getsize(csv.file.path))
+        self.assertLess(csv.file_size, csv.content_size)
+        self.assertIn(b'ORD-19', read_report(csv))
+
+        self.assertIsNone(excel.compression)
+        self.assertEqual(excel.file_size, excel.content_size)
+
+    def test_download_negotiates_encoding(self, apply_async):
+        report = self.run_report('csv')
+        with open(report.file.path, 'rb') as stored:
+            raw = stored.read()
+
+        encoded = self.download(report, HTTP_ACCEPT_ENCODING='gzip, deflate')
+        self.assertEqual(encoded['Content-Encoding'], 'gzip')
+        self.assertEqual(b''.join(encoded.streaming_content), raw)
+
+        plain = self.download(report)
+        self.assertNotIn('Content-Encoding', plain)
+        self.assertIn('Accept-Encoding', plain['Vary'])
+        self.assertEqual(plain['Accept-Ranges'], 'none')
+        self.assertEqual(plain['Content-Length'], str(report.content_size))
+        self.assertEqual(b''.join(plain.streaming_content), gzip.decompress(raw))
+        self.assertTrue(plain['Content-Disposition'].endswith('.csv"'))
+        self.assertNotEqual(plain['ETag'], encoded['ETag'])
+
+    @override_settings(REPORT_RETENTION_DAYS=30, REPORT_RETENTION_BATCH_SIZE=2)
+    def test_expired_reports_are_deleted_in_batches(self, apply_async):
+        expired = [self.run_report(format) for format in ('csv', 'excel', 'pdf')]
+        recent = self.run_report('csv', self.create_user('admin', 'other@example.com'))
+        Report.objects.filter(id__in=[r.id for r in expired]).update(
+            generated_at=timezone.now() - timedelta(days=31)
+        )
+        pending = Report.objects.create(
+            report_type='sales',
+            format='csv',
+            generated_by=self.user,
+            date_from=timezone.now(),
+            date_to=timezone.now(),
+            status='pending'
+        )
+        Report.objects.filter(id=pending.id).update(
+            generated_at=timezone.now() - timedelta(days=31)
+        )
+
+        self.assertEqual(ReportService.delete_expired_reports(), 3)
+
+        self.assertEqual(
+            set(Report.objects.values_list('id', flat=True)),
+            {recent.id, pending.id}
+        )
+        for report in expired:
+            self.assertFalse(os.path.exists(report.file.path))
+        self.assertTrue(os.path.exists(recent.file.path))
+
+    def test_storage_quota_blocks_new_reports(self, apply_async):
+        report = self.run_report('csv')
+
+        with override_settings(REPORT_USER_QUOTA_BYTES=report.file_size):
+            with self.assertRaises(LimitExceededException):
+                self.run_report('excel')
+        with override_settings(REPORT_USER_QUOTA_BYTES=report.file_size + 1):
+            self.run_report('excel')
+
+    def test_storage_metrics(self, apply_async):
+        csv = self.run_report('csv')
+        excel = self.run_report('excel')
+
+        storage = DashboardRepository.get_report_storage()
+
+        self.assertEqual(storage['files'], 2)
+        self.assertEqual(storage['stored_bytes'], csv.file_size + excel.file_size)
+        self.assertEqual(storage['content_bytes'], csv.content_size + excel.content_size)
+        self.assertEqual([row['format'] for row in storage['by_format']], ['csv', 'excel'])
+        self.assertEqual(storage['top_users'][0]['generated_by_id'], str(self.user.id))
+        self.assertLess(storage['compression_ratio'], 1)
+        self.assertEqual(storage['retention_days'], 30)
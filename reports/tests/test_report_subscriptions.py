@@ -0,0 +1,184 @@
+import shutil
+import tempfile
+from datetime import datetime, timedelta
+from unittest import mock
+from django.core import mail
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from dashboard.tests.test_metric_batch import DashboardDataMixin
+from notifications.models import Notification
+from reports.models import ReportSubscription
+from reports.services.report_service import ReportService
+from reports.services.report_subscription_service import ReportSubscriptionService
+from reports.utils.report_schedule import ReportSchedule
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+def aware(*args):
+    return timezone.make_aware(datetime(*args))
+
+
+class ReportScheduleTests(SimpleTestCase):
+    def test_next_after(self):
+        weekly = ReportSchedule('0 7 * * 1')
+        # 2025-01-06 is a Monday
+        self.assertEqual(weekly.next_after(aware(2025, 1, 1, 12)), aware(2025, 1, 6, 7))
+        self.assertEqual(weekly.next_after(aware(2025, 1, 6, 7)), aware(2025, 1, 13, 7))
+
+        business = ReportSchedule('30 6,18 * * mon-fri')
+        self.assertEqual(business.next_after(aware(2025, 1, 3, 19)), aware(2025, 1, 6, 6, 30))
+
+        # Either day field matches when both are restricted
+        either = ReportSchedule('0 0 1 * 0')
+        self.assertEqual(either.next_after(aware(2025, 1, 1, 12)), aware(2025, 1, 5))
+
+        self.assertEqual(ReportSchedule('0 0 29 2 *').next_after(aware(2025, 1, 1)), aware(2028, 2, 29))
+
+    def test_invalid_schedules(self):
+        for expression in ('0 7 * *', '61 7 * * *', '0 7 * * funday'):
+            with self.subTest(expression=expression):
+                with self.assertRaises(ValueError):
+                    ReportSchedule(expression)
+        with self.assertRaises(ValueError):
+            ReportSchedule('0 0 31 2 *').next_after(aware(2025, 1, 1))
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT, REPORT_OFF_PEAK_HOURS=(1, 5))
+@mock.patch('reports.tasks.generate_report_file.apply_async')
+class ReportSubscriptionTests(DashboardDataMixin, TestCase):
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    def setUp(self):
+        self.user = self.create_user('admin', 'manager@example.com')
+        self.subscription = ReportSubscription.objects.create(
+            user=self.user,
+            report_type='orders',
+            format='csv',
+            period='weekly',
+            schedule='0 7 * * 1',
+            next_run_at=aware(2025, 1, 6, 7)
+        )
+
+    def run_at(self, *args):
+        with self.captureOnCommitCallbacks(execute=True):
+            return ReportSubscriptionService.run_subscriptions(aware(*args))
+
+    def test_period_ranges(self, apply_async):
+        run_at = aware(2025, 3, 3, 7)
+        for period, start, end in (
+            ('daily', aware(2025, 3, 2), aware(2025, 3, 3)),
+            ('weekly', aware(2025, 2, 24), aware(2025, 3, 3)),
+            ('monthly', aware(2025, 2, 1), aware(2025, 3, 1))
+        ):
+            with self.subTest(period=period):
+                self.subscription.period = period
+                self.assertEqual(
+                    ReportSubscriptionService.period_range(self.subscription, run_at),
+                    (start, end - timedelta(microseconds=1))
+                )
+
+    def test_generated_off_peak_once_the_period_closed(self, apply_async):
+        # Peak hours before the scheduled time, and off-peak before the period closed
+        self.assertEqual(self.run_at(2025, 1, 5, 12), 0)
+        self.assertEqual(self.run_at(2025, 1, 5, 2), 0)
+
+        self.assertEqual(self.run_at(2025, 1, 6, 2), 1)
+
+        self.subscription.refresh_from_db()
+        report = self.subscription.last_report
+        self.assertEqual(report.generated_by, self.user)
+        self.assertEqual((report.date_from, report.format), (aware(2024, 12, 30), 'csv'))
+        self.assertEqual(self.subscription.next_run_at, aware(2025, 1, 13, 7))
+        apply_async.assert_called_once()
+
+        self.assertEqual(self.run_at(2025, 1, 6, 3), 0)
+
+    def test_overdue_subscriptions_run_outside_the_window(self, apply_async):
+        self.assertEqual(self.run_at(2025, 1, 20, 9), 1)
+
+        self.subscription.refresh_from_db()
+        # Missed runs are skipped
+        self.assertEqual(self.subscription.next_run_at, aware(2025, 1, 27, 7))
+
+    def test_inactive_subscriptions_do_not_run(self, apply_async):
+        self.subscription.is_active = False
+        self.subscription.save()
+
+        self.assertEqual(self.run_at(2025, 1, 20, 9), 0)
+
+    def test_postponed_when_limits_are_reached(self, apply_async):
+        with override_settings(REPORT_MAX_ACTIVE_PER_USER=0):
+            self.assertEqual(self.run_at(2025, 1, 6, 2), 0)
+        self.subscription.refresh_from_db()
+        self.assertIsNone(self.subscription.last_report)
+
+        self.assertEqual(self.run_at(2025, 1, 6, 2), 1)
+
+    @override_settings(TRUSTED_ORIGIN=['https://dfi.example.com'])
+    def test_finished_report_is_delivered(self, apply_async):
+        self.run_at(2025, 1, 6, 2)
+        self.subscription.refresh_from_db()
+
+        report = ReportService.run_report(self.subscription.last_report_id)
+
+        self.assertEqual(report.status, 'completed')
+        self.assertTrue(Notification.objects.filter(
+            user=self.user, related_object_id=report.id
+        ).exists())
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ['manager@example.com'])
+        self.assertIn(
+            f"https://dfi.example.com/reports/{report.id}",
+            mail.outbox[0].alternatives[0][0]
+        )
+
+    def test_reports_without_subscriptions_are_not_emailed(self, apply_async):
+        report = ReportService.generate_report(
+            self.user, 'orders', aware(2025, 1, 1), aware(2025, 1, 2), format='csv'
+        )
+        ReportService.run_report(report.id)
+
+        self.assertEqual(len(mail.outbox), 0)
+
+    def test_subscription_api(self, apply_async):
+        client = APIClient()
+        client.force_authenticate(self.user)
+
+        response = client.post(reverse('report-subscription-list'), {
+            'report_type': 'inventory',
+            'format': 'excel',
+            'period': 'daily',
+            'schedule': '0 6 * * *'
+        }, format='json')
+        self.assertEqual(response.status_code, 201)
+        created = ReportSubscription.objects.get(id=response.data['data']['id'])
+        self.assertEqual(created.user, self.user)
+        self.assertGreater(created.next_run_at, timezone.now())
+
+        invalid = client.post(reverse('report-subscription-list'), {
+            'report_type': 'inventory',
+            'format': 'excel',
+            'schedule': 'every monday'
+        }, format='json')
+        self.assertEqual(invalid.status_code, 400)
+
+        listed = client.get(reverse('report-subscription-list'))
+        self.assertEqual(len(listed.data['data']), 2)
+
+        url = reverse('report-subscription-detail', kwargs={'subscription_id': created.id})
+        self.assertEqual(client.patch(url, {'schedule': '0 6 * * 1'}, format='json').status_code, 200)
+        created.refresh_from_db()
+        self.assertEqual(created.next_run_at.weekday(), 0)
+
+        other = self.create_user('admin', 'other@example.com')
+        client.force_authenticate(other)
+        self.assertEqual(client.delete(url).status_code, 404)
+        client.force_authenticate(self.user)
+        self.assertEqual(client.delete(url).status_code, 204)
+        self.assertFalse(ReportSubscription.objects.filter(id=created.id).exists())
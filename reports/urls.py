@@ -4,7 +4,9 @@ from reports.views import (
     ReportListView,
     ReportDetailView,
     ReportDownloadView,
-    ReportDeleteView
+    ReportDeleteView,
+    ReportSubscriptionListView,
+    ReportSubscriptionDetailView
 )
 
 urlpatterns = [
@@ -13,4 +15,10 @@ urlpatterns = [
     path('<uuid:report_id>', ReportDetailView.as_view(), name='report-detail'),
     path('<uuid:report_id>/download', ReportDownloadView.as_view(), name='report-download'),
     path('<uuid:report_id>/delete', ReportDeleteView.as_view(), name='report-delete'),
+    path('subscriptions', ReportSubscriptionListView.as_view(), name='report-subscription-list'),
+    path(
+        'subscriptions/<uuid:subscription_id>',
+        ReportSubscriptionDetailView.as_view(),
+        name='report-subscription-detail'
+    ),
 ]
\ No newline at end of file
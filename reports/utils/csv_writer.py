@@ -0,0 +1,48 @@
+import csv
+import io
+
+class CSVWriter:
+    """
+    Writes rows as encoded CSV chunks.
+
+    Only one chunk of rows is buffered at a time, so memory stays flat however
+    many rows are written. Chunks can go to a file or be yielded to a
+    StreamingHttpResponse.
+    """
+    def __init__(self, columns, chunk_size=2000, encoding='utf-8'):
+        self.columns = columns
+        self.chunk_size = chunk_size
+        self.encoding = encoding
+        self.rows_written = 0
+
+    def iter_chunks(self, rows):
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(self.columns)
+
+        pending = 0
+        for row in rows:
+            writer.writerow(row)
+            self.rows_written += 1
+            pending += 1
+            if pending >= self.chunk_size:
+                yield self._drain(buffer)
+                pending = 0
+
+        chunk = self._drain(buffer)
+        if chunk:
+            yield chunk
+
+    def _drain(self, buffer):
+        chunk = buffer.getvalue().encode(self.encoding)
+        buffer.seek(0)
+        buffer.truncate(0)
+        return chunk
+
+    def write(self, rows, output, on_progress=None):
+        """Write all rows to a binary file object, reporting rows written"""
+        for chunk in self.iter_chunks(rows):
+            output.write(chunk)
+            if on_progress:
+                on_progress(self.rows_written)
+        return self.rows_written
@@ -0,0 +1,86 @@
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+import xlsxwriter
+
+class ExcelWriter:
+    """
+    Writes a summary sheet and streamed detail rows to an .xlsx file.
+
+    Uses xlsxwriter's constant_memory mode, which flushes each row to disk as
+    soon as the next one starts, so memory stays flat however many rows are
+    written. Cell formats and write functions are resolved once per column.
+    """
+    NUMBER_FORMAT = '#,##0.00'
+    DATETIME_FORMAT = 'yyyy-mm-dd hh:mm:ss'
+    DATE_FORMAT = 'yyyy-mm-dd'
+
+    def __init__(self, columns, chunk_size=2000):
+        self.columns = columns
+        self.chunk_size = chunk_size
+        self.rows_written = 0
+
+    def write(self, summary, rows, path, on_progress=None):
+        """Write the workbook to `path`, reporting rows written per chunk"""
+        workbook = xlsxwriter.Workbook(path, {
+            'constant_memory': True,
+            'remove_timezone': True
+        })
+        try:
+            self._formats = {
+                'number': workbook.add_format({'num_format': self.NUMBER_FORMAT}),
+                'datetime': workbook.add_format({'num_format': self.DATETIME_FORMAT}),
+                'date': workbook.add_format({'num_format': self.DATE_FORMAT}),
+            }
+            header = workbook.add_format({'bold': True})
+
+            summary_sheet = workbook.add_worksheet('Summary')
+            summary_writers = [self._resolve(value) for value in summary.values()]
+            for col, key in enumerate(summary):
+                summary_sheet.write_string(0, col, key, header)
+            for col, (value, writer) in enumerate(zip(summary.values(), summary_writers)):
+                writer(summary_sheet, 1, col, value)
+
+            sheet = workbook.add_worksheet('Details')
+            for col, name in enumerate(self.columns):
+                sheet.write_string(0, col, name, header)
+
+            writers = [None] * len(self.columns)
+            for row_index, row in enumerate(rows, start=1):
+                for col, value in enumerate(row):
+                    if value is None:
+                        continue
+                    if writers[col] is None:
+                        writers[col] = self._resolve(value)
+                    writers[col](sheet, row_index, col, value)
+
+                self.rows_written = row_index
+                if on_progress and row_index % self.chunk_size == 0:
+                    on_progress(row_index)
+        finally:
+            workbook.close()
+
+        if on_progress:
+            on_progress(self.rows_written)
+        return self.rows_written
+
+    def _resolve(self, value):
+        """Pick the write function and format for a column from a sample value"""
+        formats = self._formats
+        if isinstance(value, bool):
+            return lambda sheet, row, col, v: sheet.write_boolean(row, col, v)
+        if isinstance(value, (int, float, Decimal)):
+            return lambda sheet, row, col, v: sheet.write_number(
+                row, col, float(v), formats['number']
+            )
+        if isinstance(value, datetime):
+            return lambda sheet, row, col, v: sheet.write_datetime(
+                row, col, v, formats['datetime']
+            )
+        if isinstance(value, date):
+            return lambda sheet, row, col, v: sheet.write_datetime(
+                row, col, v, formats['date']
+            )
+        if isinstance(value, uuid.UUID):
+            return lambda sheet, row, col, v: sheet.write_string(row, col, str(v))
+        return lambda sheet, row, col, v: sheet.write_string(row, col, str(v))
@@ -2,99 +2,258 @@ from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter, landscape
 from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
 import io
+import multiprocessing
+from django.conf import settings
+from utils import setup_logger
+
+try:
+    from pypdf import PdfWriter
+except ImportError:
+    PdfWriter = None
+
+logger = setup_logger(__name__)
+
+# Shared by every table so styles are built once, not per page
+SUMMARY_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, -1), colors.white),
+    ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 12),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black)
+])
+
+DETAIL_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.grey),  # Header row background
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),  # Header row text color
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),  # Header row font
+    ('FONTSIZE', (0, 0), (-1, 0), 12),  # Header row font size
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),  # Header row padding
+    ('BACKGROUND', (0, 1), (-1, -1), colors.white),  # Data rows background
+    ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),  # Data rows text color
+    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),  # Data rows font
+    ('FONTSIZE', (0, 1), (-1, -1), 10),  # Data rows font size
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),  # Table grid
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey])  # Alternating rows
+])
+
+
+class FlowableStream(list):
+    """
+    Story that pulls flowables from an iterator as the document consumes them.
+
+    Reportlab only ever looks at the front of the story, so detail tables
+    are created page by page instead of all up front.
+    """
+    def __init__(self, flowables):
+        super().__init__()
+        self._source = iter(flowables)
+
+    def _fill(self):
+        if not list.__len__(self):
+            flowable = next(self._source, None)
+            if flowable is not None:
+                self.append(flowable)
+
+    def __len__(self):
+        self._fill()
+        return list.__len__(self)
+
+    def __getitem__(self, index):
+        self._fill()
+        return list.__getitem__(self, index)
+
 
 class PDFGenerator:
+    # Detail rows per table; small enough for a table to fit on one page so
+    # reportlab never has to split (and re-measure) a large table
+    ROWS_PER_TABLE = 24
+
     @staticmethod
-    def generate_pdf(data):
-        """Generate PDF report using reportlab"""
-        buffer = io.BytesIO()
-        doc = SimpleDocTemplate(
-            buffer,
+    def _document(output):
+        return SimpleDocTemplate(
+            output,
             pagesize=landscape(letter),
             rightMargin=72,
             leftMargin=72,
             topMargin=72,
             bottomMargin=72
         )
-        
-        # Create the story (content) for the PDF
-        story = []
+
+    @staticmethod
+    def _summary_flowables(summary, detail_key):
         styles = getSampleStyleSheet()
-        
-        # Add title
         title_style = ParagraphStyle(
             'CustomTitle',
             parent=styles['Heading1'],
             fontSize=24,
             spaceAfter=30
         )
-        title = Paragraph("Report Summary", title_style)
-        story.append(title)
-        
-        # Add summary section
-        summary_title = Paragraph("Summary", styles['Heading2'])
-        story.append(summary_title)
-        story.append(Spacer(1, 12))
-        
+
         # Convert summary dict to table data
-        summary_data = [[k.replace('_', ' ').title(), str(v)] for k, v in data['summary'].items()]
+        summary_data = [[k.replace('_', ' ').title(), str(v)] for k, v in summary]
         summary_table = Table(summary_data, colWidths=[200, 200])
-        summary_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, -1), colors.white),
-            ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
-        story.append(summary_table)
-        story.append(Spacer(1, 20))
-        
-        # Add details section
+        summary_table.setStyle(SUMMARY_STYLE)
+
+        return [
+            Paragraph("Report Summary", title_style),
+            Paragraph("Summary", styles['Heading2']),
+            Spacer(1, 12),
+            summary_table,
+            Spacer(1, 20),
+            Paragraph(f"Detailed {detail_key.title()}", styles['Heading2']),
+            Spacer(1, 12)
+        ]
+
+    @staticmethod
+    def _column_widths(headers, sample):
+        """Column widths from the header and a sample of rows, shared by all tables"""
+        widths = [
+            max(len(str(row[i])) * 8 for row in chain([headers], sample))
+            for i in range(len(headers))
+        ]
+        return [min(max(width, 80), 200) for width in widths]  # Set min/max widths
+
+    @staticmethod
+    def _tables(headers, rows, col_widths, rows_per_table, on_rows=None):
+        """Page-sized detail tables, each with its own header row"""
+        rows = iter(rows)
+        written = 0
+        while True:
+            chunk = list(islice(rows, rows_per_table))
+            if not chunk:
+                return
+            table = Table([headers] + chunk, colWidths=col_widths)
+            table.setStyle(DETAIL_STYLE)
+            written += len(chunk)
+            if on_rows:
+                on_rows(written)
+            yield table
+
+    @staticmethod
+    def _render(output, summary, detail_key, headers, rows, col_widths,
+                rows_per_table, on_rows=None):
+        flowables = PDFGenerator._tables(headers, rows, col_widths, rows_per_table, on_rows)
+        if summary is not None:
+            flowables = chain(
+                PDFGenerator._summary_flowables(summary, detail_key),
+                flowables
+            )
+        PDFGenerator._document(output).build(FlowableStream(flowables))
+
+    @staticmethod
+    def _render_segment(summary, detail_key, headers, rows, col_widths, rows_per_table):
+        """Render one segment of a report in a worker process"""
+        buffer = io.BytesIO()
+        PDFGenerator._render(
+            buffer, summary, detail_key, headers, rows, col_widths, rows_per_table
+        )
+        return buffer.getvalue()
+
+    @staticmethod
+    def _can_render_in_parallel(row_count):
+        threshold = getattr(settings, 'REPORT_PDF_PARALLEL_ROWS', 0)
+        if not threshold or row_count is None or row_count < threshold:
+            return False
+        if PdfWriter is None:
+            logger.warning("pypdf is not installed, rendering PDF serially")
+            return False
+        if multiprocessing.current_process().daemon:
+            # Daemonic pool workers (e.g. Celery prefork) cannot fork children
+            logger.warning("Running in a daemonic process, rendering PDF serially")
+            return False
+        return True
+
+    @staticmethod
+    def generate_pdf(data, output, on_progress=None, row_count=None):
+        """
+        Generate a PDF report using reportlab.
+
+        `output` is a path or binary file object. Detail rows are read from
+        the report's row iterator page by page. Reports with at least
+        REPORT_PDF_PARALLEL_ROWS rows are rendered in segments in a process
+        pool and concatenated.
+        """
+        rows_per_table = getattr(settings, 'REPORT_PDF_ROWS_PER_TABLE', PDFGenerator.ROWS_PER_TABLE)
+        progress_every = getattr(settings, 'REPORT_EXPORT_CHUNK_SIZE', 2000)
+
         detail_key = next(k for k in data.keys() if k != 'summary')
-        details_title = Paragraph(f"Detailed {detail_key.title()}", styles['Heading2'])
-        story.append(details_title)
-        story.append(Spacer(1, 12))
-        
-        # Convert details to table data
-        if data[detail_key]:
-            # Get headers from first item
-            headers = list(data[detail_key][0].keys())
-            detail_data = [headers]  # First row is headers
-            
-            # Add data rows
-            for item in data[detail_key]:
-                row = [str(item[col]) for col in headers]
-                detail_data.append(row)
-            
-            # Calculate column widths based on content
-            col_widths = [max(len(str(row[i])) * 8 for row in detail_data) for i in range(len(headers))]
-            col_widths = [min(max(width, 80), 200) for width in col_widths]  # Set min/max widths
-            
-            detail_table = Table(detail_data, colWidths=col_widths)
-            detail_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.grey),  # Header row background
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),  # Header row text color
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),  # Header row font
-                ('FONTSIZE', (0, 0), (-1, 0), 12),  # Header row font size
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),  # Header row padding
-                ('BACKGROUND', (0, 1), (-1, -1), colors.white),  # Data rows background
-                ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),  # Data rows text color
-                ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),  # Data rows font
-                ('FONTSIZE', (0, 1), (-1, -1), 10),  # Data rows font size
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),  # Data rows alignment
-                ('GRID', (0, 0), (-1, -1), 1, colors.black),  # Table grid
-                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey])  # Alternating rows
-            ]))
-            story.append(detail_table)
-        
-        # Build PDF
-        doc.build(story)
-        pdf = buffer.getvalue()
-        buffer.close()
-        
-        return pdf
\ No newline at end of file
+        rows = data[detail_key]
+        headers = list(rows.columns)
+        summary = list(data['summary'].items())
+
+        values = ([str(value) for value in row] for row in rows.iter_tuples())
+        sample = list(islice(values, rows_per_table))
+        col_widths = PDFGenerator._column_widths(headers, sample)
+        values = chain(sample, values)
+
+        state = {'written': 0, 'reported': 0}
+
+        def on_rows(written):
+            state['written'] = written
+            if on_progress and written - state['reported'] >= progress_every:
+                state['reported'] = written
+                on_progress(written)
+
+        if PDFGenerator._can_render_in_parallel(row_count):
+            PDFGenerator._render_parallel(
+                output, summary, detail_key, headers, values,
+                col_widths, rows_per_table, on_rows
+            )
+        else:
+            PDFGenerator._render(
+                output, summary, detail_key, headers, values,
+                col_widths, rows_per_table, on_rows
+            )
+
+        if on_progress:
+            on_progress(state['written'])
+        return state['written']
+
+    @staticmethod
+    def _render_parallel(output, summary, detail_key, headers, values,
+                         col_widths, rows_per_table, on_rows):
+        segment_rows = getattr(settings, 'REPORT_PDF_SEGMENT_ROWS', 10000)
+        workers = getattr(settings, 'REPORT_PDF_WORKERS', 4)
+
+        writer = PdfWriter()
+        pending = deque()
+        written = 0
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            first = True
+            while True:
+                chunk = list(islice(values, segment_rows))
+                if not chunk and not first:
+                    break
+                pending.append(pool.submit(
+                    PDFGenerator._render_segment,
+                    summary if first else None,
+                    detail_key,
+                    headers,
+                    chunk,
+                    col_widths,
+                    rows_per_table
+                ))
+                first = False
+                # Bound the rows held in memory while workers catch up
+                while len(pending) > workers:
+                    writer.append(io.BytesIO(pending.popleft().result()))
+                written += len(chunk)
+                on_rows(written)
+                if len(chunk) < segment_rows:
+                    break
+
+            while pending:
+                writer.append(io.BytesIO(pending.popleft().result()))
+
+        if isinstance(output, str):
+            with open(output, 'wb') as handle:
+                writer.write(handle)
+        else:
+            writer.write(output)
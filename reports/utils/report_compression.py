@@ -0,0 +1,68 @@
+import gzip
+import shutil
+from django.conf import settings
+from utils import setup_logger
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+logger = setup_logger(__name__)
+
+class ReportCompression:
+    """
+    Compresses stored report files and reads them back.
+
+    Encodings use their HTTP content-coding names so a stored file can be
+    sent as is to clients that accept the encoding.
+    """
+    EXTENSIONS = {
+        'gzip': 'gz',
+        'zstd': 'zst',
+    }
+    CHUNK_SIZE = 64 * 1024
+
+    @staticmethod
+    def available(encoding):
+        if encoding == 'gzip':
+            return True
+        if encoding == 'zstd':
+            return zstandard is not None
+        return False
+
+    @staticmethod
+    def encoding_for(format):
+        """Encoding to store a report format with, or None to store it as is"""
+        if format not in getattr(settings, 'REPORT_COMPRESSED_FORMATS', ()):
+            return None
+        encoding = getattr(settings, 'REPORT_COMPRESSION', None)
+        if not encoding:
+            return None
+        if not ReportCompression.available(encoding):
+            logger.warning(f"Report compression {encoding} is not available, using gzip")
+            return 'gzip'
+        return encoding
+
+    @staticmethod
+    def compress(source_path, target_path, encoding):
+        with open(source_path, 'rb') as source:
+            if encoding == 'gzip':
+                with gzip.open(target_path, 'wb', compresslevel=6) as target:
+                    shutil.copyfileobj(source, target, ReportCompression.CHUNK_SIZE)
+            elif encoding == 'zstd':
+                with open(target_path, 'wb') as target:
+                    zstandard.ZstdCompressor(level=3).copy_stream(source, target)
+            else:
+                raise ValueError(f"Unsupported report compression: {encoding}")
+
+    @staticmethod
+    def open(path, encoding):
+        """Open a stored file for reading its decompressed content"""
+        if encoding is None:
+            return open(path, 'rb')
+        if encoding == 'gzip':
+            return gzip.open(path, 'rb')
+        if encoding == 'zstd' and zstandard is not None:
+            return zstandard.ZstdDecompressor().stream_reader(open(path, 'rb'), closefd=True)
+        raise ValueError(f"Cannot decompress report file with {encoding}")
@@ -0,0 +1,230 @@
+import hashlib
+import os
+import re
+from urllib.parse import quote
+from django.conf import settings
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_http_date_safe, quote_etag
+from reports.models.report import Report
+from reports.utils.report_compression import ReportCompression
+
+CONTENT_TYPES = {
+    'pdf': 'application/pdf',
+    'excel': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    'csv': 'text/csv'
+}
+
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+class ReportDownload:
+    """
+    Response for downloading a completed report file.
+
+    ETag and Last-Modified are derived from the stored report, so repeated
+    downloads are cacheable and resumable: conditional requests get a 304
+    and a single byte range is served as a 206. With REPORT_DOWNLOAD_OFFLOAD
+    set to 'x-accel-redirect' (nginx) or 'x-sendfile' (Apache, lighttpd)
+    the web server sends the file, including ranges, instead of the worker.
+
+    Compressed files are sent as stored, with Content-Encoding, to clients
+    that accept their encoding. Other clients get the decompressed content
+    streamed by the worker, without range support.
+    """
+    BLOCK_SIZE = 64 * 1024
+
+    def __init__(self, report):
+        self.report = report
+        self.path = report.file.path
+        self.stat = os.stat(self.path)
+        # Encoding of the stored file and of the representation being sent
+        self.stored_encoding = report.compression
+        self.encoding = report.compression
+
+    @property
+    def decompressing(self):
+        return self.stored_encoding is not None and self.encoding is None
+
+    @property
+    def size(self):
+        if self.decompressing:
+            return self.report.content_size
+        return self.stat.st_size
+
+    @staticmethod
+    def accepted_encodings(header):
+        """Content codings an Accept-Encoding header allows"""
+        accepted = set()
+        for coding in (header or '').split(','):
+            name, _, params = coding.strip().partition(';')
+            quality = params.strip()
+            if quality.startswith('q='):
+                try:
+                    if float(quality[2:]) == 0:
+                        continue
+                except ValueError:
+                    continue
+            if name:
+                accepted.add(name.strip().lower())
+        return accepted
+
+    def negotiate(self, request):
+        """Send the stored encoding when accepted, else decompress"""
+        if self.stored_encoding is None:
+            return
+        accepted = self.accepted_encodings(request.META.get('HTTP_ACCEPT_ENCODING'))
+        if self.stored_encoding in accepted or '*' in accepted:
+            self.encoding = self.stored_encoding
+        else:
+            self.encoding = None
+
+    @property
+    def last_modified(self):
+        modified = self.report.completed_at
+        return int(modified.timestamp()) if modified else int(self.stat.st_mtime)
+
+    @property
+    def etag(self):
+        version = (
+            f"{self.report.id}:{self.report.file.name}:{self.size}:"
+            f"{self.last_modified}:{self.encoding or 'identity'}"
+        )
+        return quote_etag(hashlib.sha1(version.encode()).hexdigest())
+
+    @property
+    def filename(self):
+        extension = Report.FILE_EXTENSIONS.get(self.report.format, self.report.format)
+        generated = self.report.completed_at or self.report.generated_at
+        return f"{self.report.report_type}_report_{generated.strftime('%Y%m%d_%H%M%S')}.{extension}"
+
+    @property
+    def content_type(self):
+        return CONTENT_TYPES.get(self.report.format, 'application/octet-stream')
+
+    @staticmethod
+    def parse_range(header, size):
+        """
+        Return (start, end) of a single byte range, None to send the whole
+        file, or False when the range cannot be satisfied.
+        """
+        match = RANGE_RE.match(header.strip()) if header else None
+        if not match:
+            # Missing, malformed or multiple ranges are served in full
+            return None
+        first, last = match.groups()
+        if not first and not last:
+            return None
+        if not first:
+            length = int(last)
+            if not length:
+                return False
+            return max(size - length, 0), size - 1
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+        if start >= size or start > end:
+            return False
+        return start, end
+
+    def _range_applies(self, request):
+        """A Range request only applies while If-Range still matches the file"""
+        if_range = request.META.get('HTTP_IF_RANGE')
+        if not if_range:
+            return True
+        if if_range.startswith('"'):
+            return if_range == self.etag
+        return parse_http_date_safe(if_range) == self.last_modified
+
+    def _set_headers(self, response):
+        response['ETag'] = self.etag
+        response['Last-Modified'] = http_date(self.last_modified)
+        response['Accept-Ranges'] = 'none' if self.decompressing else 'bytes'
+        if self.stored_encoding:
+            response['Vary'] = 'Accept-Encoding'
+        if self.encoding:
+            response['Content-Encoding'] = self.encoding
+        response['Content-Disposition'] = f'attachment; filename="{self.filename}"'
+        response['Cache-Control'] = 'private, no-cache'
+        return response
+
+    def _read(self, start, length):
+        with open(self.path, 'rb') as content:
+            content.seek(start)
+            while length > 0:
+                block = content.read(min(self.BLOCK_SIZE, length))
+                if not block:
+                    return
+                length -= len(block)
+                yield block
+
+    def _read_decompressed(self):
+        with ReportCompression.open(self.path, self.stored_encoding) as content:
+            while True:
+                block = content.read(self.BLOCK_SIZE)
+                if not block:
+                    return
+                yield block
+
+    def _offload(self):
+        mode = getattr(settings, 'REPORT_DOWNLOAD_OFFLOAD', None)
+        if not mode:
+            return None
+        response = HttpResponse(content_type=self.content_type)
+        if mode == 'x-accel-redirect':
+            prefix = getattr(settings, 'REPORT_DOWNLOAD_ACCEL_PREFIX', '/protected-media/')
+            response['X-Accel-Redirect'] = prefix + quote(self.report.file.name)
+        elif mode == 'x-sendfile':
+            response['X-Sendfile'] = self.path
+        else:
+            raise ValueError(f"Unknown report download offload mode: {mode}")
+        return response
+
+    def response(self, request):
+        self.negotiate(request)
+        conditional = get_conditional_response(
+            request,
+            etag=self.etag,
+            last_modified=self.last_modified
+        )
+        if conditional is not None:
+            return self._set_headers(conditional)
+
+        if self.decompressing:
+            response = StreamingHttpResponse(
+                self._read_decompressed(),
+                content_type=self.content_type
+            )
+            if self.size:
+                response['Content-Length'] = str(self.size)
+            return self._set_headers(response)
+
+        offloaded = self._offload()
+        if offloaded is not None:
+            # The web server answers Range requests itself
+            return self._set_headers(offloaded)
+
+        byte_range = None
+        if self._range_applies(request):
+            byte_range = self.parse_range(request.META.get('HTTP_RANGE'), self.size)
+
+        if byte_range is False:
+            response = HttpResponse(status=416)
+            response['Content-Range'] = f'bytes */{self.size}'
+            return self._set_headers(response)
+
+        if byte_range is None:
+            response = FileResponse(open(self.path, 'rb'), content_type=self.content_type)
+            # FileResponse guesses an encoding from a .gz name; set it ourselves
+            if 'Content-Encoding' in response:
+                del response['Content-Encoding']
+            return self._set_headers(response)
+
+        start, end = byte_range
+        response = StreamingHttpResponse(
+            self._read(start, end - start + 1),
+            status=206,
+            content_type=self.content_type
+        )
+        response['Content-Length'] = str(end - start + 1)
+        response['Content-Range'] = f'bytes {start}-{end}/{self.size}'
+        return self._set_headers(response)
@@ -0,0 +1,121 @@
+import math
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from django.conf import settings
+from django.db import connection
+from django.utils import timezone
+from reports.utils.report_rows import ReportRows
+
+class ReportPartitioner:
+    """
+    Splits a report's date range into partitions processed in parallel.
+
+    Partitions are whole calendar months (REPORT_PARTITION_BY = 'month') or
+    equal slices of the range sized from the row count so each holds about
+    REPORT_PARTITION_ROWS rows ('rows'). Ranges are half open except the
+    last one, which keeps the inclusive end of the report range.
+    """
+    def __init__(self, date_field, date_from, date_to):
+        self.date_field = date_field
+        self.date_from = date_from
+        self.date_to = date_to
+
+    @staticmethod
+    def workers():
+        return getattr(settings, 'REPORT_PARTITION_WORKERS', 4)
+
+    def boundaries(self, row_count):
+        strategy = getattr(settings, 'REPORT_PARTITION_BY', 'month')
+        if strategy == 'month':
+            points = self._month_starts()
+        elif strategy == 'rows':
+            points = self._row_slices(row_count)
+        else:
+            raise ValueError(f"Unknown report partition strategy: {strategy}")
+        return [self.date_from] + points + [self.date_to]
+
+    def _month_starts(self):
+        start = timezone.localtime(self.date_from)
+        year, month = start.year, start.month
+        points = []
+        while True:
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+            point = timezone.make_aware(datetime(year, month, 1))
+            if point >= self.date_to:
+                return points
+            points.append(point)
+
+    def _row_slices(self, row_count):
+        target = getattr(settings, 'REPORT_PARTITION_ROWS', 100000)
+        parts = max(math.ceil(row_count / target), 1)
+        step = (self.date_to - self.date_from) / parts
+        return [self.date_from + step * i for i in range(1, parts)]
+
+    def partitions(self, queryset, row_count):
+        """Querysets of each partition, in date order"""
+        bounds = self.boundaries(row_count)
+        last = len(bounds) - 2
+        return [
+            queryset.filter(**{
+                f'{self.date_field}__gte': start,
+                f'{self.date_field}__lte' if i == last else f'{self.date_field}__lt': end
+            })
+            for i, (start, end) in enumerate(zip(bounds, bounds[1:]))
+        ]
+
+    @staticmethod
+    def _in_worker(function, queryset):
+        try:
+            return function(queryset)
+        finally:
+            # Worker threads open their own connections
+            connection.close()
+
+    @staticmethod
+    def map(function, querysets):
+        """Apply `function` to each partition in a thread pool, keeping order"""
+        workers = min(ReportPartitioner.workers(), len(querysets))
+        if workers <= 1:
+            return [function(queryset) for queryset in querysets]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(
+                lambda queryset: ReportPartitioner._in_worker(function, queryset),
+                querysets
+            ))
+
+
+def merge_summaries(partials):
+    """
+    Merge partial summaries of partitions.
+
+    Numbers are added and sets (such as distinct user ids) are unioned.
+    """
+    merged = {}
+    for partial in partials:
+        for key, value in partial.items():
+            if key not in merged:
+                merged[key] = set(value) if isinstance(value, set) else value
+            elif isinstance(value, set):
+                merged[key] |= value
+            else:
+                merged[key] += value
+    return merged
+
+
+class PartitionedRows(ReportRows):
+    """Detail rows read partition by partition, concatenated in order"""
+    def __init__(self, queryset, columns, partitions):
+        super().__init__(queryset, columns)
+        self.partitions = partitions
+
+    def iter_tuples(self, chunk_size=None):
+        return chain.from_iterable(
+            ReportRows(partition, self.columns).iter_tuples(chunk_size)
+            for partition in self.partitions
+        )
+
+    def __iter__(self):
+        return chain.from_iterable(
+            ReportRows(partition, self.columns) for partition in self.partitions
+        )
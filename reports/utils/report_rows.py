@@ -0,0 +1,29 @@
+from django.conf import settings
+
+class ReportRows:
+    """
+    Lazy detail rows of a report.
+
+    Wraps a queryset and the columns to export so writers can stream rows
+    from the database instead of holding the whole result in memory.
+    """
+    def __init__(self, queryset, columns):
+        self.queryset = queryset
+        self.columns = list(columns)
+
+    @staticmethod
+    def chunk_size():
+        return getattr(settings, 'REPORT_EXPORT_CHUNK_SIZE', 2000)
+
+    def count(self):
+        return self.queryset.count()
+
+    def iter_tuples(self, chunk_size=None):
+        return self.queryset.values_list(*self.columns).iterator(
+            chunk_size=chunk_size or self.chunk_size()
+        )
+
+    def __iter__(self):
+        return self.queryset.values(*self.columns).iterator(
+            chunk_size=self.chunk_size()
+        )
@@ -0,0 +1,128 @@
+from decimal import Decimal
+import numpy as np
+from django.conf import settings
+from reports.utils.report_rows import ReportRows
+from reports.utils.report_partitions import ReportPartitioner, PartitionedRows, merge_summaries
+
+class ColumnScan:
+    """
+    Rows of one report query with column arrays for computing summaries.
+
+    Decimal columns are read as integers scaled by their decimal places so
+    sums stay exact while being computed by numpy. The integers are Python
+    ints in object arrays: int64 products of large amounts would overflow.
+    """
+    def __init__(self, rows, columns):
+        self.rows = rows
+        self.columns = list(columns)
+        self._positions = {column: i for i, column in enumerate(self.columns)}
+        self._values = None
+
+    def __len__(self):
+        return len(self.rows)
+
+    def values(self, column):
+        if self._values is None:
+            self._values = list(zip(*self.rows)) or [()] * len(self.columns)
+        return self._values[self._positions[column]]
+
+    def array(self, column):
+        return np.asarray(self.values(column), dtype=object)
+
+    def scaled(self, column, places=2):
+        """Decimal column as integers in units of 10**-places, nulls as 0"""
+        return np.fromiter(
+            (
+                int(Decimal(str(value or 0)).scaleb(places).to_integral_value())
+                for value in self.values(column)
+            ),
+            dtype=object,
+            count=len(self)
+        )
+
+    def decimal_sum(self, column, places=2):
+        return self.to_decimal(self.scaled(column, places).sum(), places)
+
+    def decimal_product_sum(self, column, other, places=2):
+        """Exact sum of the row-wise product of two decimal columns"""
+        total = (self.scaled(column, places) * self.scaled(other, places)).sum()
+        return self.to_decimal(total, places * 2)
+
+    def count_at_most(self, column, limit, places=2):
+        return int(np.count_nonzero(
+            self.scaled(column, places) <= round(limit * 10 ** places)
+        ))
+
+    def count_equal(self, column, value):
+        return int(np.count_nonzero(self.array(column) == value))
+
+    @staticmethod
+    def to_decimal(scaled_total, places=2):
+        return Decimal(int(scaled_total)).scaleb(-places)
+
+
+class ScannedRows(ReportRows):
+    """Detail rows already fetched by a ColumnScan, served without a query"""
+    def __init__(self, queryset, columns, scan):
+        super().__init__(queryset, columns)
+        self.scan = scan
+
+    def count(self):
+        return len(self.scan)
+
+    def iter_tuples(self, chunk_size=None):
+        width = len(self.columns)
+        return (row[:width] for row in self.scan.rows)
+
+    def __iter__(self):
+        return (dict(zip(self.columns, row)) for row in self.iter_tuples())
+
+
+class ReportPipeline:
+    """
+    Produces a report's summary and detail rows from a single scan.
+
+    Reports up to REPORT_SCAN_MAX_ROWS rows are fetched once; the summary
+    is computed from the fetched columns and the same rows are exported.
+    Larger reports compute the summary in SQL and stream their detail rows
+    from the database, so memory stays bounded. When a partitioner is given
+    the SQL summary is computed per date partition in parallel, and detail
+    rows of a queryset ordered by the partition field are read partition by
+    partition.
+    """
+    @staticmethod
+    def max_rows():
+        return getattr(settings, 'REPORT_SCAN_MAX_ROWS', 50000)
+
+    @staticmethod
+    def run(queryset, columns, summarize, aggregate, extra_columns=(),
+            finalize=None, partitioner=None):
+        """
+        Return the summary and detail rows of a report.
+
+        `summarize` computes a partial summary from a ColumnScan of `columns`
+        followed by `extra_columns`; `aggregate` computes the same partial
+        summary from a queryset in SQL. Partials must be mergeable with
+        `merge_summaries`; `finalize` turns a partial into the summary.
+        """
+        finalize = finalize or (lambda summary: summary)
+        row_count = queryset.count()
+        if row_count <= ReportPipeline.max_rows():
+            scan_columns = list(columns) + [
+                column for column in extra_columns if column not in columns
+            ]
+            scan = ColumnScan(list(queryset.values_list(*scan_columns)), scan_columns)
+            return finalize(summarize(scan)), ScannedRows(queryset, columns, scan)
+
+        partitions = partitioner.partitions(queryset, row_count) if partitioner else []
+        if len(partitions) < 2:
+            return finalize(aggregate(queryset)), ReportRows(queryset, columns)
+
+        summary = merge_summaries(ReportPartitioner.map(aggregate, partitions))
+        ordering = queryset.query.order_by[:1]
+        if ordering == (f'-{partitioner.date_field}',):
+            partitions = partitions[::-1]
+        elif ordering != (partitioner.date_field,):
+            # Partitions only concatenate in order when ordered by their field
+            return finalize(summary), ReportRows(queryset, columns)
+        return finalize(summary), PartitionedRows(queryset, columns, partitions)
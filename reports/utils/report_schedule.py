@@ -0,0 +1,63 @@
+from datetime import datetime, time, timedelta
+from celery.schedules import crontab_parser, ParseException
+from django.utils import timezone
+
+class ReportSchedule:
+    """
+    Cron expression of a report subscription: minute, hour, day of month,
+    month and day of week, in local time. As in cron, a day matches when
+    either day field matches if both are restricted.
+    """
+    FIELDS = (
+        ('minute', 60, 0),
+        ('hour', 24, 0),
+        ('day_of_month', 31, 1),
+        ('month_of_year', 12, 1),
+        ('day_of_week', 7, 0),
+    )
+    # Far enough to reach any valid day, e.g. Feb 29 on a Monday
+    MAX_DAYS = 366 * 28
+
+    def __init__(self, expression):
+        self.expression = expression
+        parts = expression.split()
+        if len(parts) != len(self.FIELDS):
+            raise ValueError(f"Schedule needs {len(self.FIELDS)} fields: {expression}")
+        self.values = {}
+        for part, (name, max_, min_) in zip(parts, self.FIELDS):
+            try:
+                self.values[name] = crontab_parser(max_, min_).parse(part)
+            except (ParseException, ValueError) as e:
+                raise ValueError(f"Invalid {name.replace('_', ' ')} in schedule: {part}") from e
+        self.any_day_of_month = parts[2] == '*'
+        self.any_day_of_week = parts[4] == '*'
+        self.times = sorted(
+            time(hour, minute)
+            for hour in self.values['hour']
+            for minute in self.values['minute']
+        )
+
+    def _matches_day(self, day):
+        if day.month not in self.values['month_of_year']:
+            return False
+        in_month = day.day in self.values['day_of_month']
+        # Cron counts days of the week from Sunday
+        in_week = (day.weekday() + 1) % 7 in self.values['day_of_week']
+        if self.any_day_of_month:
+            return in_week
+        if self.any_day_of_week:
+            return in_month
+        return in_month or in_week
+
+    def next_after(self, moment):
+        """First scheduled time strictly after `moment`"""
+        local = timezone.localtime(moment).replace(second=0, microsecond=0, tzinfo=None)
+        day = local.date()
+        for _ in range(self.MAX_DAYS):
+            if self._matches_day(day):
+                for at in self.times:
+                    candidate = datetime.combine(day, at)
+                    if candidate > local:
+                        return timezone.make_aware(candidate)
+            day += timedelta(days=1)
+        raise ValueError(f"Schedule never runs: {self.expression}")
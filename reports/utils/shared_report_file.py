@@ -0,0 +1,38 @@
+import os
+from utils import setup_logger
+
+logger = setup_logger(__name__)
+
+def share_report_file(source, report):
+    """
+    Give `report` its own copy of the file of another report.
+
+    On local storage the copy is a hard link, so it takes no space or time
+    and deleting either report leaves the other's file intact. Other
+    storages get a regular copy. Returns the storage name of the copy.
+    """
+    storage = source.storage
+    name = report.file.field.generate_filename(report, os.path.basename(source.name))
+
+    try:
+        source_path = storage.path(source.name)
+    except NotImplementedError:
+        source_path = None
+
+    if source_path is not None:
+        for _ in range(10):
+            name = storage.get_available_name(name)
+            target_path = storage.path(name)
+            try:
+                os.makedirs(os.path.dirname(target_path), exist_ok=True)
+                os.link(source_path, target_path)
+                return name
+            except FileExistsError:
+                # Taken between picking the name and linking, pick another
+                continue
+            except OSError as e:
+                logger.warning(f"Could not hard link report file {source.name}: {str(e)}")
+                break
+
+    with storage.open(source.name, 'rb') as content:
+        return storage.save(name, content)
@@ -0,0 +1,42 @@
+import os
+import tempfile
+from django.conf import settings
+from django.core.files import File
+
+class TemporaryReportFile(File):
+    """
+    A report rendered to a named temporary file.
+
+    Exposes `temporary_file_path` like uploaded temporary files, so
+    FileSystemStorage moves it into place instead of copying its contents.
+    """
+    def __init__(self, suffix=''):
+        fd, path = tempfile.mkstemp(
+            suffix=suffix,
+            dir=getattr(settings, 'FILE_UPLOAD_TEMP_DIR', None)
+        )
+        os.close(fd)
+        super().__init__(None, name=path)
+        self.path = path
+
+    def temporary_file_path(self):
+        return self.path
+
+    def open(self, mode='rb'):
+        self.file = open(self.path, mode)
+        return self
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    @property
+    def size(self):
+        return os.path.getsize(self.path)
+
+    def cleanup(self):
+        """Remove the file if storage copied rather than moved it"""
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
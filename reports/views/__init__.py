@@ -3,11 +3,15 @@ from .generate_view import ReportGenerateView
 from .list_view import ReportListView
 from .download_view import ReportDownloadView
 from .delete_view import ReportDeleteView
+from .subscription_list_view import ReportSubscriptionListView
+from .subscription_detail_view import ReportSubscriptionDetailView
 
 __all__ = [
     'ReportDetailView',
     'ReportGenerateView',
     'ReportListView',
     'ReportDownloadView',
-    'ReportDeleteView'
-]
\ No newline at end of file
+    'ReportDeleteView',
+    'ReportSubscriptionListView',
+    'ReportSubscriptionDetailView'
+]
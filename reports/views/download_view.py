@@ -3,8 +3,7 @@ from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from reports.models.report import Report
-from django.http import FileResponse
-from django.utils.timezone import now
+from reports.utils.report_download import ReportDownload
 import os
 from utils import setup_logger
 
@@ -30,28 +29,13 @@ class ReportDownloadView(APIView):
                     status=status.HTTP_400_BAD_REQUEST
                 )
 
-            file_path = report.file.path
-            if not os.path.exists(file_path):
+            if not os.path.exists(report.file.path):
                 return Response(
                     {"message": "Report file not found"}, 
                     status=status.HTTP_404_NOT_FOUND
                 )
-            
-            content_types = {
-                'pdf': 'application/pdf',
-                'excel': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-                'csv': 'text/csv'
-            }
-
-            timestamp = now().strftime('%Y%m%d_%H%M%S')
-            filename = f"{report.report_type}_report_{timestamp}.{report.format}"
 
-            response = FileResponse(
-                open(file_path, 'rb'),
-                content_type=content_types.get(report.format, 'application/octet-stream')
-            )
-            response['Content-Disposition'] = f'attachment; filename="{filename}"'
-            return response
+            return ReportDownload(report).response(request)
         except Report.DoesNotExist:
             logger.error(f"Report {report_id} not found for user {request.user}")
             return Response(
@@ -3,9 +3,10 @@ from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from drf_yasg.utils import swagger_auto_schema
+from django.urls import reverse
 from reports.serializers import ReportSerializer, ReportGenerateSerializer
 from reports.services.report_service import ReportService
-from django.http import HttpResponse
+from exceptions import LimitExceededException
 from utils import setup_logger
 
 logger = setup_logger(__name__)
@@ -15,7 +16,7 @@ class ReportGenerateView(APIView):
 
     @swagger_auto_schema(
         request_body=ReportGenerateSerializer,
-        responses={201: ReportSerializer()}
+        responses={202: ReportSerializer()}
     )
     def post(self, request):
         try:
@@ -32,40 +33,29 @@ class ReportGenerateView(APIView):
                     user=request.user,
                     **serializer.validated_data
                 )
-                
-                if serializer.validated_data['format'] == 'pdf':
-                    response = HttpResponse(
-                        content=report.file, 
-                        content_type='application/pdf'
-                    )
-                    response['Content-Disposition'] = f'attachment; filename="{report.file.name}"'
-                    return response
-                elif serializer.validated_data['format'] in ['excel', 'csv']:
-                    content_types = {
-                        'excel': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-                        'csv': 'text/csv'
-                    }
-                    response = HttpResponse(
-                        content=report.file,
-                        content_type=content_types[serializer.validated_data['format']]
-                    )
-                    response['Content-Disposition'] = f'attachment; filename="{report.file.name}"'
-                    return response
-                
-                # Default JSON response for report metadata
+            except LimitExceededException as e:
                 return Response({
-                    'status': True,
-                    'message': 'Report generated successfully',
-                    'data': ReportSerializer(report).data
-                }, status=status.HTTP_201_CREATED)
+                    'status': False,
+                    'message': str(e)
+                }, status=status.HTTP_429_TOO_MANY_REQUESTS)
 
-            except Exception as e:
-                logger.error(f"Error generating report: {str(e)}")
-                return Response({
-                    'message': 'Failed to generate report'
-                }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+            # Generation continues in the background; poll the status URL or
+            # wait for the notification sent when it finishes
+            status_url = request.build_absolute_uri(
+                reverse('report-detail', kwargs={'report_id': report.id})
+            )
+            response = Response({
+                'status': True,
+                'message': 'Report generation started',
+                'data': {
+                    **ReportSerializer(report, context={'request': request}).data,
+                    'status_url': status_url
+                }
+            }, status=status.HTTP_202_ACCEPTED)
+            response['Location'] = status_url
+            return response
         except Exception as e:
             logger.error(f"Error generating report: {e}")
             return Response({
                 'message': 'Failed to generate report'
-            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
\ No newline at end of file
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
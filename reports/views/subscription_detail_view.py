@@ -0,0 +1,75 @@
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from drf_yasg.utils import swagger_auto_schema
+from reports.serializers import ReportSubscriptionSerializer
+from reports.services.report_subscription_service import ReportSubscriptionService
+from utils import setup_logger
+
+logger = setup_logger(__name__)
+
+class ReportSubscriptionDetailView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        request_body=ReportSubscriptionSerializer,
+        responses={200: ReportSubscriptionSerializer()}
+    )
+    def patch(self, request, subscription_id):
+        try:
+            logger.info(f"{request.user} is updating report subscription {subscription_id}")
+            serializer = ReportSubscriptionSerializer(data=request.data, partial=True)
+
+            if not serializer.is_valid():
+                return Response({
+                    'message': serializer.errors
+                }, status=status.HTTP_400_BAD_REQUEST)
+
+            subscription = ReportSubscriptionService.update_subscription(
+                subscription_id,
+                request.user,
+                serializer.validated_data
+            )
+            return Response({
+                'status': True,
+                'message': 'Report subscription updated',
+                'data': ReportSubscriptionSerializer(subscription).data
+            }, status=status.HTTP_200_OK)
+        except ValueError as e:
+            logger.error(f"Error updating report subscription {subscription_id}: {e}")
+            return Response(
+                {"message": "Report subscription not found"},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        except Exception as e:
+            logger.error(f"Unexpected error updating report subscription {subscription_id}: {e}")
+            return Response(
+                {"message": "Failed to update report subscription"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+    @swagger_auto_schema(
+        operation_description="Delete a report subscription",
+        responses={
+            204: "Report subscription deleted successfully",
+            404: "Report subscription not found"
+        }
+    )
+    def delete(self, request, subscription_id):
+        try:
+            logger.info(f"{request.user} is deleting report subscription {subscription_id}")
+            ReportSubscriptionService.delete_subscription(subscription_id, request.user)
+            return Response(status=status.HTTP_204_NO_CONTENT)
+        except ValueError as e:
+            logger.error(f"Error deleting report subscription {subscription_id}: {e}")
+            return Response(
+                {"message": "Report subscription not found"},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        except Exception as e:
+            logger.error(f"Unexpected error deleting report subscription {subscription_id}: {e}")
+            return Response(
+                {"message": "Failed to delete report subscription"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
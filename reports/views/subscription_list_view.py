@@ -0,0 +1,59 @@
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from drf_yasg.utils import swagger_auto_schema
+from reports.serializers import ReportSubscriptionSerializer
+from reports.services.report_subscription_service import ReportSubscriptionService
+from utils import setup_logger
+
+logger = setup_logger(__name__)
+
+class ReportSubscriptionListView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(responses={200: ReportSubscriptionSerializer(many=True)})
+    def get(self, request):
+        try:
+            logger.info(f"{request.user} is retrieving their report subscriptions")
+            subscriptions = ReportSubscriptionService.get_user_subscriptions(request.user)
+            return Response({
+                'status': True,
+                'message': 'Report subscriptions retrieved successfully',
+                'data': ReportSubscriptionSerializer(subscriptions, many=True).data
+            }, status=status.HTTP_200_OK)
+        except Exception as e:
+            logger.error(f"Error retrieving report subscriptions: {e}")
+            return Response(
+                {"message": "Failed to retrieve report subscriptions"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+    @swagger_auto_schema(
+        request_body=ReportSubscriptionSerializer,
+        responses={201: ReportSubscriptionSerializer()}
+    )
+    def post(self, request):
+        try:
+            logger.info(f"{request.user} is subscribing to a report")
+            serializer = ReportSubscriptionSerializer(data=request.data)
+
+            if not serializer.is_valid():
+                return Response({
+                    'message': serializer.errors
+                }, status=status.HTTP_400_BAD_REQUEST)
+
+            subscription = ReportSubscriptionService.create_subscription(
+                request.user,
+                serializer.validated_data
+            )
+            return Response({
+                'status': True,
+                'message': 'Report subscription created',
+                'data': ReportSubscriptionSerializer(subscription).data
+            }, status=status.HTTP_201_CREATED)
+        except Exception as e:
+            logger.error(f"Error creating report subscription: {e}")
+            return Response({
+                'message': 'Failed to create report subscription'
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
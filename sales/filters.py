@@ -1,13 +1,15 @@
 import django_filters
 from sales.models import Sale, Payment
+from search.filters import SimilarityFilter, TrigramFilter
 
 class SaleFilter(django_filters.FilterSet):
     """
     Filter set for Sale model.
     """
     invoice_number = django_filters.CharFilter(lookup_expr='icontains')
-    order_number = django_filters.CharFilter(field_name='order__order_number', lookup_expr='icontains')
-    customer_name = django_filters.CharFilter(field_name='order__customer_name', lookup_expr='icontains')
+    order_number = TrigramFilter(field_name='order__order_number')
+    customer_name = TrigramFilter(field_name='order__customer_name')
+    similarity = SimilarityFilter()
     payment_status = django_filters.ChoiceFilter(choices=Sale.PAYMENT_STATUS_CHOICES)
     min_total = django_filters.NumberFilter(field_name='total_amount', lookup_expr='gte')
     max_total = django_filters.NumberFilter(field_name='total_amount', lookup_expr='lte')
@@ -1,4 +1,5 @@
 from django.db import models
+from search.model_indexes import trigram_indexes
 from .base_model import BaseModel
 from orders.models import Order
 from django.db.models import Sum
@@ -42,6 +43,11 @@ class Sale(BaseModel):
         related_name='sales'
     )
 
+    class Meta:
+        indexes = [
+            *trigram_indexes('sale_invoice_number_trgm', 'invoice_number'),
+        ]
+
     def calculate_total(self):
         """Calculate total amount including tax, shipping, and discounts"""
         subtotal = self.order.total_amount
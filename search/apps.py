@@ -1,6 +1,21 @@
 from django.apps import AppConfig
+from django.db.models.signals import pre_migrate, post_migrate
 
 
 class SearchConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'search'
+
+    def ready(self):
+        import search.signals
+        # Not limited to this app, so the extension exists before any
+        # model with a trigram index is migrated
+        pre_migrate.connect(
+            search.signals.create_trigram_extension,
+            dispatch_uid='search.create_trigram_extension'
+        )
+        post_migrate.connect(
+            search.signals.create_search_table,
+            sender=self,
+            dispatch_uid='search.create_search_table'
+        )
@@ -0,0 +1,41 @@
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from .base import SearchBackend, SearchHit
+from .postgres import PostgresSearchBackend
+from .sqlite import SqliteSearchBackend
+from .trigram import NgramTrigramBackend, PostgresTrigramBackend, TrigramBackend
+
+BACKENDS = {
+    'postgresql': PostgresSearchBackend,
+    'sqlite': SqliteSearchBackend,
+}
+
+TRIGRAM_BACKENDS = {
+    'postgresql': PostgresTrigramBackend,
+}
+
+
+def get_search_backend():
+    """Full-text backend of the default database"""
+    try:
+        return BACKENDS[connection.vendor]()
+    except KeyError:
+        raise ImproperlyConfigured(f"Full-text search does not support {connection.vendor}")
+
+
+def get_trigram_backend():
+    """Fuzzy matching backend of the default database; pg_trgm or SearchTrigram"""
+    return TRIGRAM_BACKENDS.get(connection.vendor, NgramTrigramBackend)()
+
+
+__all__ = [
+    'SearchBackend',
+    'SearchHit',
+    'PostgresSearchBackend',
+    'SqliteSearchBackend',
+    'TrigramBackend',
+    'PostgresTrigramBackend',
+    'NgramTrigramBackend',
+    'get_search_backend',
+    'get_trigram_backend'
+]
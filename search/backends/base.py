@@ -0,0 +1,108 @@
+import re
+from dataclasses import dataclass
+from django.utils.html import escape
+from search.models import SearchDocument
+
+TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+
+@dataclass
+class SearchHit:
+    document: SearchDocument
+    rank: float
+    highlight: str
+
+
+class SearchBackend:
+    """
+    Full-text index of the SearchDocuments of the models in SEARCH_INDEXES.
+
+    Queries match every word, the last one as a prefix so results follow
+    the user's typing. One query ranks the documents of every type by
+    relevance, keeping the best `limit` of each, with a highlighted
+    snippet of the matched text.
+
+    Highlights are HTML: the indexed text is user input, so the database
+    marks matches with private use characters, the snippet is escaped and
+    only then are the marks turned into <mark> tags.
+    """
+    HIGHLIGHT_START = '<mark>'
+    HIGHLIGHT_STOP = '</mark>'
+    MARK_START = '\ue000'
+    MARK_STOP = '\ue001'
+    MAX_TERMS = 8
+
+    @classmethod
+    def terms(cls, query):
+        return TOKEN_RE.findall(query)[:cls.MAX_TERMS]
+
+    @classmethod
+    def highlight(cls, snippet):
+        """Escaped snippet with its marked matches in <mark>"""
+        return escape(snippet or '')\
+            .replace(cls.MARK_START, cls.HIGHLIGHT_START)\
+            .replace(cls.MARK_STOP, cls.HIGHLIGHT_STOP)
+
+    def vector(self, text):
+        """search_vector of a document's weighted text, where the database has one"""
+        return None
+
+    def write_text(self, documents):
+        """Index the weighted text of saved documents, given as (document, text) pairs"""
+
+    def remove_text(self, search_index, ids=None):
+        """Drop the indexed text of documents, or of every document of an index"""
+
+    def document(self, search_index, instance):
+        text = search_index.weighted_text(instance)
+        document = SearchDocument(
+            **search_index.document(instance),
+            search_vector=self.vector(text)
+        )
+        return document, text
+
+    def index(self, search_index, instance):
+        document, text = self.document(search_index, instance)
+        fields = {
+            field.name: getattr(document, field.name)
+            for field in SearchDocument._meta.concrete_fields
+            if field.name not in ('id', 'entity', 'object_id', 'updated_at')
+        }
+        document, _ = SearchDocument.objects.update_or_create(
+            entity=search_index.name,
+            object_id=instance.pk,
+            defaults=fields
+        )
+        self.write_text([(document, text)])
+
+    def remove(self, search_index, pk):
+        documents = SearchDocument.objects.filter(entity=search_index.name, object_id=pk)
+        self.remove_text(search_index, list(documents.values_list('id', flat=True)))
+        documents.delete()
+
+    def search(self, query, limit, permissions=None):
+        """
+        Ranked hits of every index for a query, best first.
+
+        `permissions`, when given, limits hits to documents visible with
+        one of them.
+        """
+        raise NotImplementedError
+
+    def rebuild(self, search_index, batch_size=1000):
+        """Index every instance of a model again and return how many"""
+        self.remove_text(search_index)
+        SearchDocument.objects.filter(entity=search_index.name).delete()
+        indexed = 0
+        batch = []
+        for instance in search_index.queryset().order_by('pk').iterator(chunk_size=batch_size):
+            batch.append(self.document(search_index, instance))
+            if len(batch) >= batch_size:
+                indexed += self._create(batch)
+                batch = []
+        return indexed + self._create(batch)
+
+    def _create(self, batch):
+        SearchDocument.objects.bulk_create([document for document, _ in batch])
+        self.write_text(batch)
+        return len(batch)
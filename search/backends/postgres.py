@@ -0,0 +1,71 @@
+from django.conf import settings
+from django.contrib.postgres.search import SearchVector
+from django.db.models import TextField, Value
+from search.models import SearchDocument
+from .base import SearchBackend, SearchHit
+
+
+class PostgresSearchBackend(SearchBackend):
+    """
+    A weighted tsvector column (search_vector) on SearchDocument, with a
+    GIN index.
+
+    Vectors are written with the rest of the document, from the text of
+    the instance, which may come from related rows.
+    """
+
+    @staticmethod
+    def config():
+        return getattr(settings, 'SEARCH_TEXT_CONFIG', 'simple')
+
+    def vector(self, text):
+        config = self.config()
+        vectors = [
+            SearchVector(Value(value, output_field=TextField()), weight=weight, config=config)
+            for weight, value in sorted(text.items())
+        ]
+        combined = vectors[0]
+        for vector in vectors[1:]:
+            combined = combined + vector
+        return combined
+
+    def query(self, query):
+        terms = self.terms(query)
+        if not terms:
+            return None
+        terms[-1] += ':*'
+        return ' & '.join(terms)
+
+    def search(self, query, limit, permissions=None):
+        search_query = self.query(query)
+        if search_query is None or permissions == []:
+            return []
+        visible = ''
+        params = [self.config(), search_query]
+        if permissions is not None:
+            visible = 'AND permission = ANY(%s)'
+            params.append(list(permissions))
+        table = SearchDocument._meta.db_table
+        # Only the kept rows are highlighted, ts_headline being the costly part
+        documents = SearchDocument.objects.raw(
+            f"WITH search_query AS (SELECT to_tsquery(%s::regconfig, %s) AS query), "
+            f"ranked AS ("
+            f"SELECT id, ts_rank(search_vector, search_query.query) AS score, "
+            f"ROW_NUMBER() OVER (PARTITION BY entity ORDER BY ts_rank(search_vector, search_query.query) DESC) AS position "
+            f"FROM {table}, search_query WHERE search_vector @@ search_query.query {visible}"
+            f") "
+            f"SELECT document.*, ranked.score, "
+            f"ts_headline(%s::regconfig, document.content, search_query.query, %s) AS highlight "
+            f"FROM ranked JOIN {table} document ON document.id = ranked.id, search_query "
+            f"WHERE ranked.position <= %s ORDER BY ranked.score DESC",
+            [
+                *params,
+                self.config(),
+                f'StartSel="{self.MARK_START}", StopSel="{self.MARK_STOP}", MaxFragments=2',
+                limit
+            ]
+        )
+        return [
+            SearchHit(document, document.score, self.highlight(document.highlight))
+            for document in documents
+        ]
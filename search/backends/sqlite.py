@@ -0,0 +1,86 @@
+from django.db import connection, connections
+from search.models import SearchDocument
+from .base import SearchBackend, SearchHit
+
+
+class SqliteSearchBackend(SearchBackend):
+    """
+    An FTS5 table of the weighted text of every SearchDocument, whose
+    rowid is the document id.
+
+    Ranked with bm25, weighting the A, B and C columns 10, 4 and 1. The
+    table is created after migrate; see search.signals.
+    """
+    TABLE = 'search_document_fts'
+    WEIGHTS = (10.0, 4.0, 1.0)
+    SNIPPET_TOKENS = 12
+
+    @classmethod
+    def create_table(cls, using=None):
+        with connections[using or 'default'].cursor() as cursor:
+            cursor.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {cls.TABLE} USING fts5("
+                "a, b, c, tokenize='unicode61')"
+            )
+
+    def write_text(self, documents):
+        if not documents:
+            return
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                f"DELETE FROM {self.TABLE} WHERE rowid = %s",
+                [[document.id] for document, _ in documents]
+            )
+            cursor.executemany(
+                f"INSERT INTO {self.TABLE} (rowid, a, b, c) VALUES (%s, %s, %s, %s)",
+                [
+                    [document.id, text.get('A', ''), text.get('B', ''), text.get('C', '')]
+                    for document, text in documents
+                ]
+            )
+
+    def remove_text(self, search_index, ids=None):
+        with connection.cursor() as cursor:
+            if ids is None:
+                cursor.execute(
+                    f"DELETE FROM {self.TABLE} WHERE rowid IN "
+                    f"(SELECT id FROM {SearchDocument._meta.db_table} WHERE entity = %s)",
+                    [search_index.name]
+                )
+            elif ids:
+                cursor.executemany(f"DELETE FROM {self.TABLE} WHERE rowid = %s", [[pk] for pk in ids])
+
+    def match(self, query):
+        terms = [f'"{term}"' for term in self.terms(query)]
+        if not terms:
+            return None
+        terms[-1] += '*'
+        return ' '.join(terms)
+
+    def search(self, query, limit, permissions=None):
+        match = self.match(query)
+        if match is None or permissions == []:
+            return []
+        weights = ', '.join(str(weight) for weight in self.WEIGHTS)
+        visible = ''
+        params = [self.MARK_START, self.MARK_STOP, match]
+        if permissions is not None:
+            visible = f"AND document.permission IN ({', '.join(['%s'] * len(permissions))})"
+            params.extend(permissions)
+        # bm25 scores are lower for better matches, and can't be used in a window
+        documents = SearchDocument.objects.raw(
+            f"SELECT * FROM ("
+            f"SELECT matched.*, ROW_NUMBER() OVER (PARTITION BY entity ORDER BY score DESC) AS position "
+            f"FROM ("
+            f"SELECT document.*, -bm25({self.TABLE}, {weights}) AS score, "
+            f"snippet({self.TABLE}, -1, %s, %s, '…', {self.SNIPPET_TOKENS}) AS highlight "
+            f"FROM {self.TABLE} JOIN {SearchDocument._meta.db_table} document ON document.id = {self.TABLE}.rowid "
+            f"WHERE {self.TABLE} MATCH %s {visible}"
+            f") matched"
+            f") WHERE position <= %s ORDER BY score DESC",
+            [*params, limit]
+        )
+        return [
+            SearchHit(document, document.score, self.highlight(document.highlight))
+            for document in documents
+        ]
@@ -0,0 +1,132 @@
+from math import ceil
+from django.conf import settings
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.db.models import Count, FloatField, OuterRef, Subquery, Value
+from django.db.models.functions import Cast, Coalesce
+from search.models import SearchTrigram
+from search.trigram import trigrams
+
+
+class TrigramBackend:
+    """
+    Fuzzy matching of identifiers and names by shared trigrams.
+
+    A value matches when enough of the query's trigrams appear in it: the
+    word similarity of pg_trgm, from 0 to 1, which scores a fragment such
+    as an order number suffix as well as a whole value. Matches are
+    annotated with their score and ordered best first. Queries too short
+    to have a whole trigram fall back to a substring match, and queries
+    without letters or digits match nothing.
+    """
+    MIN_LENGTH = 3
+
+    @staticmethod
+    def threshold():
+        return getattr(settings, 'SEARCH_TRIGRAM_THRESHOLD', 0.5)
+
+    def match(self, queryset, path, value, threshold=None, score='similarity'):
+        """Rows of `queryset` whose `path` is similar to `value`"""
+        value = (value or '').strip()
+        if len(value) < self.MIN_LENGTH:
+            return queryset.filter(**{f'{path}__icontains': value})\
+                .annotate(**{score: Value(1.0, output_field=FloatField())})
+        if not trigrams(value):
+            return queryset.none()
+        threshold = self.threshold() if threshold is None else threshold
+        return self.similar(queryset, path, value, threshold, score)\
+            .order_by(f'-{score}')
+
+    def similar(self, queryset, path, value, threshold, score):
+        raise NotImplementedError
+
+    def index(self, instance, fields):
+        pass
+
+    def remove(self, model, pk):
+        pass
+
+    def rebuild(self, search_index, batch_size=1000):
+        return 0
+
+
+class PostgresTrigramBackend(TrigramBackend):
+    """
+    pg_trgm on the column itself, through its gin_trgm_ops index.
+
+    The `%>` operator behind trigram_word_similar is what uses the index;
+    it applies pg_trgm.word_similarity_threshold, which is set to
+    SEARCH_TRIGRAM_THRESHOLD for each connection (see search.signals).
+    A lower threshold than that cannot use the index. Nothing has to be
+    kept in step with writes.
+    """
+
+    def similar(self, queryset, path, value, threshold, score):
+        if threshold >= self.threshold():
+            queryset = queryset.filter(**{f'{path}__trigram_word_similar': value})
+        return queryset.annotate(**{score: TrigramWordSimilarity(value, path)})\
+            .filter(**{f'{score}__gte': threshold})
+
+
+class NgramTrigramBackend(TrigramBackend):
+    """
+    Trigrams computed in Python and stored in SearchTrigram, one row each.
+
+    A row matches when it shares at least `threshold` of the query's
+    trigrams, counted with the (model, field, gram) index. Values of
+    related rows, e.g. a sale's order number, are matched through the
+    trigrams of the related model.
+    """
+
+    @staticmethod
+    def label(model):
+        return model._meta.label_lower
+
+    def index(self, instance, fields):
+        model = self.label(type(instance))
+        SearchTrigram.objects.filter(model=model, object_id=instance.pk).delete()
+        SearchTrigram.objects.bulk_create([
+            SearchTrigram(model=model, field=field, object_id=instance.pk, gram=gram)
+            for field in fields
+            for gram in sorted(trigrams(str(getattr(instance, field) or '')))
+        ])
+
+    def remove(self, model, pk):
+        SearchTrigram.objects.filter(model=self.label(model), object_id=pk).delete()
+
+    def rebuild(self, search_index, batch_size=1000):
+        model = self.label(search_index.model)
+        SearchTrigram.objects.filter(model=model).delete()
+        indexed = 0
+        rows = []
+        for instance in search_index.model.objects.order_by('pk').iterator(chunk_size=batch_size):
+            rows.extend(
+                SearchTrigram(model=model, field=field, object_id=instance.pk, gram=gram)
+                for field in search_index.trigram_fields
+                for gram in trigrams(str(getattr(instance, field) or ''))
+            )
+            indexed += 1
+            if len(rows) >= batch_size:
+                SearchTrigram.objects.bulk_create(rows)
+                rows = []
+        SearchTrigram.objects.bulk_create(rows)
+        return indexed
+
+    def similar(self, queryset, path, value, threshold, score):
+        *relations, field = path.split('__')
+        model = queryset.model
+        for relation in relations:
+            model = model._meta.get_field(relation).related_model
+        pk_path = '__'.join([*relations, 'pk'])
+
+        grams = trigrams(value)
+        shared = SearchTrigram.objects.filter(
+            model=self.label(model), field=field, gram__in=grams
+        ).values('object_id').annotate(shared=Count('id'))
+        # Allow for float error, 0.3 * 10 being 3.0000000000000004
+        needed = max(1, ceil(threshold * len(grams) - 1e-9))
+        matched = shared.filter(shared__gte=needed).values('object_id')
+        counted = shared.filter(object_id=OuterRef(pk_path)).values('shared')
+
+        return queryset.filter(**{f'{pk_path}__in': matched}).annotate(**{
+            score: Coalesce(Cast(Subquery(counted), FloatField()), 0.0) / float(len(grams))
+        })
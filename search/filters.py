@@ -0,0 +1,46 @@
+import django_filters
+from django_filters.constants import EMPTY_VALUES
+from search.backends import get_trigram_backend
+
+
+class TrigramFilter(django_filters.CharFilter):
+    """
+    Fuzzy text filter backed by the trigram index.
+
+    Matching rows are annotated with `<field>_similarity` and ordered by
+    it, best first. The threshold is SEARCH_TRIGRAM_THRESHOLD unless the
+    filter set has a SimilarityFilter named `similarity` that was given.
+    """
+
+    @property
+    def score(self):
+        return f"{self.field_name.replace('__', '_')}_similarity"
+
+    def threshold(self):
+        form = getattr(self.parent, 'form', None)
+        if form is None or not hasattr(form, 'cleaned_data'):
+            return None
+        threshold = form.cleaned_data.get('similarity')
+        return None if threshold is None else float(threshold)
+
+    def filter(self, qs, value):
+        if value in EMPTY_VALUES:
+            return qs
+        return get_trigram_backend().match(
+            qs, self.field_name, value,
+            threshold=self.threshold(),
+            score=self.score
+        )
+
+
+class SimilarityFilter(django_filters.NumberFilter):
+    """Similarity threshold, from 0 to 1, of the TrigramFilters of a filter set"""
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault('min_value', 0)
+        kwargs.setdefault('max_value', 1)
+        super().__init__(*args, **kwargs)
+
+    def filter(self, qs, value):
+        # Read by the TrigramFilters themselves
+        return qs
@@ -0,0 +1,181 @@
+from inventories.models import InventoryItem
+from orders.models import Order
+from sales.models import Sale
+
+
+class SearchIndex:
+    """
+    What a model contributes to search.
+
+    `fields` maps a weight, 'A' (most relevant) to 'C', to the field paths
+    indexed with it; paths may follow foreign keys. `result` turns an
+    instance into an entry of the search response, which is stored in its
+    SearchDocument, visible to roles with `permission`.
+
+    `trigram_fields` are the model's own fields indexed for fuzzy
+    matching, and `fuzzy_fields` the paths searched fuzzily, which may
+    reach the trigram fields of related models. `lookups` maps the
+    kinds of QueryClassifier to the indexed fields queries of that kind
+    are looked up in; every index is looked up by primary key.
+    """
+    name = None
+    label = None
+    model = None
+    fields = {}
+    select_related = ()
+    permission = None
+    trigram_fields = ()
+    fuzzy_fields = None
+    lookups = {}
+
+    @classmethod
+    def fuzzy_paths(cls):
+        return cls.trigram_fields if cls.fuzzy_fields is None else cls.fuzzy_fields
+
+    @classmethod
+    def paths(cls):
+        return [path for weight in sorted(cls.fields) for path in cls.fields[weight]]
+
+    @staticmethod
+    def resolve(instance, path):
+        value = instance
+        for attribute in path.split('__'):
+            value = getattr(value, attribute, None)
+            if value is None:
+                return ''
+        return str(value)
+
+    @classmethod
+    def weighted_text(cls, instance):
+        """Text of each weight, as it is indexed"""
+        return {
+            weight: ' '.join(
+                text for text in (cls.resolve(instance, path) for path in paths) if text
+            )
+            for weight, paths in cls.fields.items()
+        }
+
+    @classmethod
+    def document(cls, instance):
+        """Fields of the SearchDocument of an instance, but its vector"""
+        result = cls.result(instance)
+        text = cls.weighted_text(instance)
+        return {
+            'entity': cls.name,
+            'object_id': instance.pk,
+            'title': result['title'][:255],
+            'subtitle': (result['subtitle'] or '')[:255],
+            'url': result['url'],
+            'metadata': result['metadata'],
+            'content': ' · '.join(text[weight] for weight in sorted(text) if text[weight]),
+            'permission': cls.permission
+        }
+
+    @classmethod
+    def queryset(cls):
+        return cls.model.objects.select_related(*cls.select_related)
+
+    @classmethod
+    def result(cls, instance):
+        raise NotImplementedError
+
+
+class InventoryItemIndex(SearchIndex):
+    name = 'inventory'
+    label = 'Inventory'
+    model = InventoryItem
+    fields = {
+        'A': ['name', 'batch_number'],
+        'B': ['dairy_type', 'supplier__name'],
+        'C': ['description'],
+    }
+    select_related = ('supplier',)
+    permission = 'can_view_inventory'
+    trigram_fields = ('batch_number',)
+    lookups = {'batch_number': ['batch_number']}
+
+    @classmethod
+    def result(cls, item):
+        return {
+            'id': str(item.id),
+            'type': 'inventory',
+            'title': item.name,
+            'subtitle': f'{item.quantity} {item.unit} - {item.dairy_type}',
+            'metadata': {
+                'batch_number': item.batch_number,
+                'supplier': item.supplier.name if item.supplier else None,
+                'storage': item.storage_condition,
+            },
+            'url': f'/inventory/{item.id}'
+        }
+
+
+class OrderIndex(SearchIndex):
+    name = 'order'
+    label = 'Orders'
+    model = Order
+    fields = {
+        'A': ['order_number', 'customer_name'],
+        'B': ['customer_email', 'status'],
+        'C': ['shipping_address'],
+    }
+    permission = 'can_view_orders'
+    trigram_fields = ('order_number', 'customer_name')
+    lookups = {
+        'order_number': ['order_number'],
+        'email': ['customer_email'],
+    }
+
+    @classmethod
+    def result(cls, order):
+        return {
+            'id': str(order.id),
+            'type': 'order',
+            'title': f'Order #{str(order.id)[:8]}',
+            'subtitle': f'{order.customer_name} - {order.status}',
+            'metadata': {
+                'total_amount': str(order.total_amount),
+                'date': order.created_at.strftime('%Y-%m-%d'),
+                'status': order.status
+            },
+            'url': f'/sales/orders/{order.id}'
+        }
+
+
+class SaleIndex(SearchIndex):
+    name = 'sale'
+    label = 'Sales'
+    model = Sale
+    fields = {
+        'A': ['invoice_number', 'order__customer_name'],
+        'B': ['seller__email', 'payment_status'],
+        'C': ['order__order_number'],
+    }
+    select_related = ('order', 'seller')
+    permission = 'can_view_sales'
+    fuzzy_fields = ('order__order_number', 'order__customer_name')
+    lookups = {
+        'order_number': ['order__order_number'],
+        'invoice_number': ['invoice_number'],
+        'email': ['seller__email'],
+    }
+
+    @classmethod
+    def result(cls, sale):
+        return {
+            'id': str(sale.id),
+            'type': 'sale',
+            'title': f'Sale #{str(sale.id)[:8]}',
+            'subtitle': f'{sale.order.customer_name if sale.order else "N/A"}',
+            'metadata': {
+                'amount': str(sale.order.total_amount if sale.order else 0),
+                'seller': sale.seller.email if sale.seller else 'Unknown',
+                'status': sale.payment_status,
+                'date': sale.created_at.strftime('%Y-%m-%d')
+            },
+            'url': f'/sales/{sale.id}'
+        }
+
+
+# In the order results are listed
+SEARCH_INDEXES = [InventoryItemIndex, OrderIndex, SaleIndex]
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+from search.indexes import SEARCH_INDEXES
+from search.services.search_index_service import SearchIndexService
+
+class Command(BaseCommand):
+    help = 'Rebuild the search documents and trigram index, e.g. to backfill after bulk imports'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--index',
+            choices=[search_index.name for search_index in SEARCH_INDEXES],
+            action='append',
+            help='Only rebuild this index (may be repeated)'
+        )
+
+    def handle(self, *args, **options):
+        indexes = [
+            search_index for search_index in SEARCH_INDEXES
+            if not options['index'] or search_index.name in options['index']
+        ]
+        for name, count in SearchIndexService.rebuild(indexes).items():
+            self.stdout.write(self.style.SUCCESS(f'Indexed {count} {name} records'))
@@ -0,0 +1,6 @@
+from utils.request_metrics import RequestMetrics
+
+# Latency and count of searches per query path, e.g. 'order_number' for
+# an indexed lookup or 'text' for full-text search; kept apart from the
+# request metrics so searches are not counted twice
+search_metrics = RequestMetrics(key_prefix='search_metrics')
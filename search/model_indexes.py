@@ -0,0 +1,28 @@
+from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
+
+
+def uses_postgresql():
+    return 'postgresql' in settings.DATABASES['default']['ENGINE']
+
+
+def search_vector_indexes(name):
+    """
+    GIN index of the search_vector column on PostgreSQL.
+
+    Other databases keep the column empty and search through their own
+    index (FTS5 on SQLite), and cannot create GIN indexes.
+    """
+    if not uses_postgresql():
+        return []
+    return [GinIndex(fields=['search_vector'], name=name)]
+
+
+def trigram_indexes(name, field):
+    """
+    pg_trgm GIN index of a text field on PostgreSQL, which serves fuzzy
+    matching as well as case-insensitive prefix lookups.
+    """
+    if not uses_postgresql():
+        return []
+    return [GinIndex(fields=[field], opclasses=['gin_trgm_ops'], name=name)]
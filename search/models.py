@@ -0,0 +1,66 @@
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models
+from search.model_indexes import search_vector_indexes
+
+
+class SearchDocument(models.Model):
+    """
+    One searchable record, denormalized from its model by the search
+    signals: what its result shows, its full-text vector and the role
+    permission needed to see it.
+
+    `search_vector` is only filled on PostgreSQL; SQLite keeps the text in
+    an FTS5 table keyed by the document id (see SqliteSearchBackend).
+    """
+    entity = models.CharField(max_length=20)
+    object_id = models.UUIDField()
+    title = models.CharField(max_length=255)
+    subtitle = models.CharField(max_length=255, blank=True)
+    url = models.CharField(max_length=255)
+    metadata = models.JSONField(default=dict)
+    content = models.TextField(blank=True)
+    permission = models.CharField(max_length=50)
+    search_vector = SearchVectorField(null=True, editable=False)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['entity', 'object_id'], name='search_document_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['permission', 'entity']),
+            *search_vector_indexes('search_document_vector_gin'),
+        ]
+
+    def __str__(self):
+        return f"{self.entity} {self.object_id}: {self.title}"
+
+    def result(self):
+        return {
+            'id': str(self.object_id),
+            'type': self.entity,
+            'title': self.title,
+            'subtitle': self.subtitle,
+            'metadata': self.metadata,
+            'url': self.url
+        }
+
+
+class SearchTrigram(models.Model):
+    """
+    One trigram of an indexed text field, for fuzzy matching on databases
+    without pg_trgm. PostgreSQL leaves this table empty.
+    """
+    model = models.CharField(max_length=100)
+    field = models.CharField(max_length=100)
+    object_id = models.UUIDField()
+    gram = models.CharField(max_length=3)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['model', 'field', 'gram']),
+            models.Index(fields=['model', 'object_id']),
+        ]
+
+    def __str__(self):
+        return f"{self.model}.{self.field} {self.object_id}: {self.gram!r}"
@@ -0,0 +1,99 @@
+import re
+import uuid
+from dataclasses import dataclass
+from django.conf import settings
+from django.db.models import Q
+
+# Identifier formats; override with SEARCH_QUERY_PATTERNS
+DEFAULT_PATTERNS = {
+    'order_number': r'ORD-[A-Z0-9-]*',
+    'invoice_number': r'INV-[A-Z0-9-]*',
+    'batch_number': r'(BATCH|LOT)-[A-Z0-9-]*',
+}
+EMAIL_RE = re.compile(r'[^@\s]+@[^@\s]+\.[^@\s]+')
+HEX_RE = re.compile(r'[0-9a-f]+')
+
+
+@dataclass(frozen=True)
+class QueryPlan:
+    """
+    How a search query is answered.
+
+    `kind` is 'uuid', 'uuid_prefix', 'email', an identifier from
+    SEARCH_QUERY_PATTERNS, or 'text' for free text, which is the only
+    kind sent to the full-text and fuzzy indexes.
+    """
+    kind: str
+    value: str
+
+    @property
+    def is_lookup(self):
+        return self.kind != 'text'
+
+    def condition(self, path):
+        """Indexed filter on `path` for this query"""
+        if self.kind == 'uuid':
+            return Q(**{path: uuid.UUID(self.value)})
+        if self.kind == 'uuid_prefix':
+            # UUIDs sort by their hex digits, so a prefix is a pk range
+            padding = 32 - len(self.value)
+            return Q(**{f'{path}__range': (
+                uuid.UUID(self.value + '0' * padding),
+                uuid.UUID(self.value + 'f' * padding)
+            )})
+        if self.kind == 'email':
+            return Q(**{f'{path}__in': {self.value, self.value.lower()}})
+        return Q(**{f'{path}__istartswith': self.value})
+
+
+class QueryClassifier:
+    """
+    Recognizes what a search query is so it can skip full-text search.
+
+    UUIDs, with or without dashes or a leading '#' as in result titles,
+    are looked up by primary key, and prefixes of at least 8 hex digits
+    by primary key range. Digits alone are left to the other kinds, as
+    they are more often part of an order or batch number. Emails are
+    matched exactly and identifiers by prefix, on indexed columns.
+    """
+    UUID_PREFIX_LENGTH = 8
+
+    @staticmethod
+    def patterns():
+        patterns = getattr(settings, 'SEARCH_QUERY_PATTERNS', DEFAULT_PATTERNS)
+        return [
+            (kind, re.compile(pattern, re.IGNORECASE))
+            for kind, pattern in patterns.items()
+        ]
+
+    @classmethod
+    def classify(cls, query):
+        query = query.strip()
+        if not query or any(character.isspace() for character in query):
+            return QueryPlan('text', query)
+
+        plan = cls.classify_uuid(query.lstrip('#').lower())
+        if plan is not None:
+            return plan
+
+        if EMAIL_RE.fullmatch(query):
+            return QueryPlan('email', query)
+
+        for kind, pattern in cls.patterns():
+            if pattern.fullmatch(query):
+                return QueryPlan(kind, query)
+        return QueryPlan('text', query)
+
+    @classmethod
+    def classify_uuid(cls, query):
+        digits = query.replace('-', '')
+        if not cls.UUID_PREFIX_LENGTH <= len(digits) <= 32 or not HEX_RE.fullmatch(digits):
+            return None
+        # Dashes are only accepted where a UUID has them
+        if '-' in query and not str(uuid.UUID(digits.ljust(32, '0'))).startswith(query):
+            return None
+        if len(digits) == 32:
+            return QueryPlan('uuid', digits)
+        if digits.isdigit():
+            return None
+        return QueryPlan('uuid_prefix', digits)
@@ -0,0 +1,7 @@
+from .search_service import SearchService
+from .search_index_service import SearchIndexService
+
+__all__ = [
+    'SearchService',
+    'SearchIndexService'
+]
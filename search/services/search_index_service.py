@@ -0,0 +1,80 @@
+from django.db import transaction
+from search.backends import get_search_backend, get_trigram_backend
+from search.indexes import SEARCH_INDEXES, InventoryItemIndex, SaleIndex
+from utils import setup_logger
+
+logger = setup_logger(__name__)
+
+class SearchIndexService:
+    """Keeps the full-text and trigram indexes in step with writes to indexed models"""
+
+    @staticmethod
+    def index_for(model):
+        return next((index for index in SEARCH_INDEXES if index.model is model), None)
+
+    @staticmethod
+    def index_instances(search_index, instances):
+        backend = get_search_backend()
+        trigram_backend = get_trigram_backend()
+        for instance in instances:
+            try:
+                # A savepoint, so a failed write leaves the caller's transaction usable
+                with transaction.atomic():
+                    backend.index(search_index, instance)
+                    if search_index.trigram_fields:
+                        trigram_backend.index(instance, search_index.trigram_fields)
+            except Exception as e:
+                # Search must never fail a write; rebuild_search_index repairs it
+                logger.error(f"Error indexing {search_index.name} {instance.pk}: {str(e)}")
+
+    @staticmethod
+    def index_instance(instance):
+        search_index = SearchIndexService.index_for(type(instance))
+        if search_index is not None:
+            SearchIndexService.index_instances(search_index, [instance])
+
+    @staticmethod
+    def remove_instance(instance):
+        search_index = SearchIndexService.index_for(type(instance))
+        if search_index is None:
+            return
+        try:
+            with transaction.atomic():
+                get_search_backend().remove(search_index, instance.pk)
+                get_trigram_backend().remove(search_index.model, instance.pk)
+        except Exception as e:
+            logger.error(f"Error removing {search_index.name} {instance.pk} from search: {str(e)}")
+
+    @staticmethod
+    def index_order_sales(order):
+        """Sales are indexed with their order's customer and number"""
+        SearchIndexService.index_instances(
+            SaleIndex,
+            SaleIndex.queryset().filter(order_id=order.pk)
+        )
+
+    @staticmethod
+    def index_seller_sales(user):
+        SearchIndexService.index_instances(
+            SaleIndex,
+            SaleIndex.queryset().filter(seller_id=user.pk).iterator()
+        )
+
+    @staticmethod
+    def index_supplier_items(supplier):
+        SearchIndexService.index_instances(
+            InventoryItemIndex,
+            InventoryItemIndex.queryset().filter(supplier_id=supplier.pk).iterator()
+        )
+
+    @staticmethod
+    def rebuild(indexes=None):
+        """Index every instance again; returns the count per index"""
+        backend = get_search_backend()
+        trigram_backend = get_trigram_backend()
+        counts = {}
+        for search_index in indexes or SEARCH_INDEXES:
+            counts[search_index.name] = backend.rebuild(search_index)
+            if search_index.trigram_fields:
+                trigram_backend.rebuild(search_index)
+        return counts
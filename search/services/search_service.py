@@ -0,0 +1,187 @@
+import time
+from functools import reduce
+from operator import or_
+from django.conf import settings
+from django.db.models import Q
+from django.utils.html import escape
+from search.backends import get_search_backend, get_trigram_backend
+from search.indexes import SEARCH_INDEXES
+from search.metrics import search_metrics
+from search.models import SearchDocument
+from search.query_classifier import QueryClassifier
+from utils import setup_logger
+
+logger = setup_logger(__name__)
+
+class SearchService:
+    @staticmethod
+    def permissions(user):
+        """Permissions whose documents `user` may see; None for all of them"""
+        if user is None or user.is_superuser:
+            return None
+        if user.role is None:
+            return []
+        if user.role.name == 'admin':
+            return None
+        granted = user.role.get_all_permissions()
+        return [
+            search_index.permission for search_index in SEARCH_INDEXES
+            if granted.get(search_index.permission)
+        ]
+
+    @staticmethod
+    def search(query, limit=None, user=None):
+        """
+        Results of every index for a query, grouped by type.
+
+        UUIDs, emails and identifiers recognized by QueryClassifier are
+        looked up on indexed columns; free text, and lookups that found
+        nothing, go to full-text search. Results are read from their
+        SearchDocuments, limited to those `user` may see. The time taken
+        is recorded in search_metrics under the path the query took.
+
+        Every result's `highlight` is HTML-safe: escaped text, with the
+        matched words of full-text results wrapped in <mark>. Lookups and
+        fuzzy matches highlight the escaped value they matched on.
+        """
+        limit = limit or getattr(settings, 'SEARCH_RESULTS_PER_TYPE', 5)
+        permissions = SearchService.permissions(user)
+        indexes = [
+            search_index for search_index in SEARCH_INDEXES
+            if permissions is None or search_index.permission in permissions
+        ]
+        if not indexes:
+            return []
+
+        plan = QueryClassifier.classify(query)
+        started = time.perf_counter()
+        path = plan.kind
+        items = SearchService.lookup(plan, limit, indexes, permissions) if plan.is_lookup else []
+        if not items:
+            if plan.is_lookup:
+                path = f'{plan.kind}:fallback'
+            items = SearchService.text_search(query, limit, indexes, permissions)
+        search_metrics.record(path, (time.perf_counter() - started) * 1000, 200)
+        return SearchService.group(indexes, items)
+
+    @staticmethod
+    def group(indexes, items):
+        labels = {search_index.name: search_index.label for search_index in indexes}
+        groups = {name: [] for name in labels}
+        for item in items:
+            groups[item['type']].append(item)
+        return [
+            {'type': labels[name], 'items': group}
+            for name, group in groups.items() if group
+        ]
+
+    @staticmethod
+    def documents(keys, permissions=None):
+        """SearchDocuments of (entity, object_id) pairs, in the order given"""
+        if not keys:
+            return []
+        entities = {}
+        for entity, object_id in keys:
+            entities.setdefault(entity, []).append(object_id)
+        documents = SearchDocument.objects.filter(reduce(or_, [
+            Q(entity=entity, object_id__in=object_ids)
+            for entity, object_ids in entities.items()
+        ]))
+        if permissions is not None:
+            documents = documents.filter(permission__in=permissions)
+        found = {(document.entity, document.object_id): document for document in documents}
+        # Rows written without signals, e.g. by bulk_create, have no document
+        # until rebuild_search_index runs
+        return [found.get(key) for key in keys]
+
+    @staticmethod
+    def lookup(plan, limit, indexes, permissions=None):
+        """
+        Results of an exact or prefix lookup.
+
+        Indexes without fields for the kind of query are skipped.
+        """
+        matches = []
+        for search_index in indexes:
+            if plan.kind in ('uuid', 'uuid_prefix'):
+                paths = ['pk']
+            else:
+                paths = search_index.lookups.get(plan.kind)
+            if not paths:
+                continue
+            rows = search_index.model.objects\
+                .filter(reduce(or_, [plan.condition(path) for path in paths]))\
+                .order_by(*paths)\
+                .values_list('pk', paths[0])[:limit]
+            matches.extend(((search_index.name, pk), str(value)) for pk, value in rows)
+
+        documents = SearchService.documents([key for key, _ in matches], permissions)
+        return [
+            {
+                **document.result(),
+                'rank': 1.0,
+                'highlight': escape(value),
+                'match': 'exact' if plan.kind in ('uuid', 'email') else 'prefix',
+                'similarity': None
+            }
+            for (_, value), document in zip(matches, documents)
+            if document is not None
+        ]
+
+    @staticmethod
+    def text_search(query, limit, indexes, permissions=None):
+        """
+        Ranked results of every index for free text.
+
+        One full-text query returns the best `limit` documents of each
+        type, each with its relevance `rank` and a `highlight` of the
+        matched text, with matches wrapped in <mark>. When nothing
+        matches, the identifiers and names of each type are matched
+        fuzzily instead, ranked by trigram `similarity`; `match` tells
+        the two apart.
+        """
+        hits = get_search_backend().search(query, limit, permissions)
+        if not hits:
+            return SearchService.fuzzy_search(query, limit, indexes, permissions)
+        return [
+            {
+                **hit.document.result(),
+                'rank': float(hit.rank),
+                'highlight': hit.highlight,
+                'match': 'full_text',
+                'similarity': None
+            }
+            for hit in hits
+        ]
+
+    @staticmethod
+    def fuzzy_search(query, limit, indexes, permissions=None):
+        """Results whose fuzzy fields are similar to the query, best first per type"""
+        backend = get_trigram_backend()
+        matches = []
+        for search_index in indexes:
+            best = {}
+            for path in search_index.fuzzy_paths():
+                rows = backend.match(search_index.model.objects.all(), path, query)\
+                    .values_list('pk', path, 'similarity')[:limit]
+                for pk, value, similarity in rows:
+                    if pk not in best or similarity > best[pk][1]:
+                        best[pk] = (value, similarity)
+            ranked = sorted(best.items(), key=lambda match: -match[1][1])[:limit]
+            matches.extend(
+                ((search_index.name, pk), value, similarity)
+                for pk, (value, similarity) in ranked
+            )
+
+        documents = SearchService.documents([key for key, _, _ in matches], permissions)
+        return [
+            {
+                **document.result(),
+                'rank': float(similarity),
+                'highlight': escape(value),
+                'match': 'fuzzy',
+                'similarity': float(similarity)
+            }
+            for (_, value, similarity), document in zip(matches, documents)
+            if document is not None
+        ]
@@ -0,0 +1,81 @@
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+from inventories.models import InventoryItem
+from orders.models import Order
+from sales.models import Sale
+from suppliers.models import Supplier
+from users.models import User
+from search.backends import SqliteSearchBackend
+from search.services.search_index_service import SearchIndexService
+
+def create_search_table(sender, using='default', **kwargs):
+    """SQLite keeps its full-text index in an FTS5 table outside the models"""
+    if connections[using].vendor == 'sqlite':
+        SqliteSearchBackend.create_table(using)
+
+def create_trigram_extension(sender, using='default', **kwargs):
+    """The gin_trgm_ops indexes need pg_trgm before the models are migrated"""
+    if connections[using].vendor == 'postgresql':
+        with connections[using].cursor() as cursor:
+            cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+@receiver(connection_created)
+def set_trigram_threshold(sender, connection, **kwargs):
+    # The indexed %> operator matches at pg_trgm.word_similarity_threshold
+    if connection.vendor != 'postgresql':
+        return
+    threshold = getattr(settings, 'SEARCH_TRIGRAM_THRESHOLD', 0.5)
+    with connection.cursor() as cursor:
+        cursor.execute("SET pg_trgm.word_similarity_threshold = %s", [threshold])
+
+@receiver(post_save, sender=InventoryItem)
+@receiver(post_save, sender=Sale)
+def index_instance(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    SearchIndexService.index_instance(instance)
+
+@receiver(post_save, sender=Order)
+def index_order(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    SearchIndexService.index_instance(instance)
+    SearchIndexService.index_order_sales(instance)
+
+@receiver(post_delete, sender=InventoryItem)
+@receiver(post_delete, sender=Order)
+@receiver(post_delete, sender=Sale)
+def remove_instance(sender, instance, **kwargs):
+    SearchIndexService.remove_instance(instance)
+
+@receiver(pre_save, sender=User)
+@receiver(pre_save, sender=Supplier)
+def capture_indexed_name(sender, instance, raw=False, update_fields=None, **kwargs):
+    # Seller emails and supplier names are indexed with sales and items
+    field = 'email' if sender is User else 'name'
+    if raw or instance._state.adding:
+        instance._search_previous = None
+        return
+    if update_fields is not None and field not in update_fields:
+        # Saves such as last_login leave the name as it was; skip the query
+        instance._search_previous = getattr(instance, field)
+        return
+    instance._search_previous = sender.objects.filter(pk=instance.pk)\
+        .values_list(field, flat=True).first()
+
+@receiver(post_save, sender=User)
+def index_seller_sales(sender, instance, raw=False, created=False, **kwargs):
+    previous = getattr(instance, '_search_previous', None)
+    if raw or created or previous == instance.email:
+        return
+    SearchIndexService.index_seller_sales(instance)
+
+@receiver(post_save, sender=Supplier)
+def index_supplier_items(sender, instance, raw=False, created=False, **kwargs):
+    previous = getattr(instance, '_search_previous', None)
+    if raw or created or previous == instance.name:
+        return
+    SearchIndexService.index_supplier_items(instance)
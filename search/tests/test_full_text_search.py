@@ -0,0 +1,117 @@
+from decimal import Decimal
+from io import StringIO
+from django.core.management import call_command
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from dashboard.tests.test_metric_batch import DashboardDataMixin
+from sales.models import Sale
+from search.backends import PostgresSearchBackend, SqliteSearchBackend, get_search_backend
+from search.indexes import OrderIndex, SaleIndex
+from search.services.search_service import SearchService
+
+
+class QueryTermTests(SimpleTestCase):
+    def test_last_term_is_a_prefix(self):
+        self.assertEqual(SqliteSearchBackend().match('Fresh mil'), '"Fresh" "mil"*')
+        self.assertEqual(SqliteSearchBackend().match('ORD-00"12'), '"ORD" "00" "12"*')
+        self.assertIsNone(SqliteSearchBackend().match('--'))
+        self.assertIsNone(PostgresSearchBackend().query(' '))
+
+
+class FullTextSearchTests(DashboardDataMixin, TestCase):
+    def setUp(self):
+        self.seller = self.create_user('admin', 'seller@example.com')
+        self.milk = self.create_item('BATCH-MILK-1', '10')
+        self.milk.name = 'Fresh Milk'
+        self.milk.description = 'Whole milk from the valley farm'
+        self.milk.save()
+        self.cheese = self.create_item('BATCH-CHEESE-1', '10')
+        self.cheese.name = 'Cheddar'
+        self.cheese.description = 'Aged with milk cultures'
+        self.cheese.save()
+        self.order = self.create_order('ORD-0042')
+        self.order.customer_name = 'Valley Dairy'
+        self.order.save()
+        self.sale = Sale.objects.create(
+            order=self.order,
+            invoice_number='INV-7',
+            sale_date=timezone.now(),
+            total_amount=Decimal('10.00'),
+            seller=self.seller
+        )
+
+    def search(self, query):
+        return {group['type']: group['items'] for group in SearchService.search(query)}
+
+    def test_backend_follows_the_database(self):
+        self.assertIsInstance(get_search_backend(), SqliteSearchBackend)
+        self.assertEqual(connection.vendor, 'sqlite')
+
+    def test_results_are_ranked_and_highlighted(self):
+        items = self.search('milk')['Inventory']
+
+        # A name match outranks a description match
+        self.assertEqual([item['title'] for item in items], ['Fresh Milk', 'Cheddar'])
+        self.assertGreater(items[0]['rank'], items[1]['rank'])
+        self.assertIn('<mark>Milk</mark>', items[0]['highlight'])
+        self.assertEqual(items[0]['metadata']['batch_number'], 'BATCH-MILK-1')
+
+    def test_prefix_and_all_terms_match(self):
+        self.assertEqual(len(self.search('fres')['Inventory']), 1)
+        self.assertNotIn('Inventory', self.search('fresh cheddar'))
+        self.assertEqual(self.search('ORD-0042')['Orders'][0]['id'], str(self.order.id))
+
+    def test_related_text_is_kept_in_sync(self):
+        self.assertEqual(self.search('valley')['Sales'][0]['id'], str(self.sale.id))
+        self.assertEqual(self.search('seller')['Sales'][0]['id'], str(self.sale.id))
+
+        self.order.customer_name = 'Hilltop Creamery'
+        self.order.save()
+        self.seller.email = 'vendor@example.com'
+        self.seller.save()
+
+        results = self.search('hilltop')
+        self.assertEqual(results['Orders'][0]['id'], str(self.order.id))
+        self.assertEqual(results['Sales'][0]['id'], str(self.sale.id))
+        self.assertIn('Sales', self.search('vendor'))
+        self.assertNotIn('Sales', self.search('seller'))
+
+    def test_deleted_records_leave_the_index(self):
+        self.sale.delete()
+        self.cheese.delete()
+
+        self.assertNotIn('Sales', self.search('INV'))
+        self.assertEqual(len(self.search('milk')['Inventory']), 1)
+
+    def test_rebuild_restores_bulk_changes(self):
+        Sale.objects.filter(pk=self.sale.pk).update(invoice_number='INV-BULK')
+        self.assertNotIn('Sales', self.search('bulk'))
+
+        call_command('rebuild_search_index', index=[SaleIndex.name], stdout=StringIO())
+
+        self.assertIn('Sales', self.search('bulk'))
+
+    def test_search_view(self):
+        client = APIClient()
+        client.force_authenticate(self.seller)
+
+        response = client.get(reverse('search'), {'query': 'valley'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [group['type'] for group in response.data['data']],
+            ['Inventory', 'Orders', 'Sales']
+        )
+        order = response.data['data'][1]['items'][0]
+        self.assertEqual(order['url'], f'/sales/orders/{self.order.id}')
+        self.assertIn('highlight', order)
+
+    def test_weighted_text(self):
+        self.assertEqual(OrderIndex.weighted_text(self.order), {
+            'A': 'ORD-0042 Valley Dairy',
+            'B': 'customer@example.com pending',
+            'C': 'Address'
+        })
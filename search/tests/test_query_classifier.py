@@ -0,0 +1,122 @@
+import uuid
+from decimal import Decimal
+from unittest import mock
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.db import connection
+from django.utils import timezone
+from dashboard.repositories.dashboard_repository import DashboardRepository
+from dashboard.tests.test_metric_batch import DashboardDataMixin
+from sales.models import Sale
+from search.metrics import search_metrics
+from search.query_classifier import QueryClassifier, QueryPlan
+from search.services.search_service import SearchService
+
+
+class QueryClassifierTests(SimpleTestCase):
+    def assertKind(self, query, kind, value=None):
+        plan = QueryClassifier.classify(query)
+        self.assertEqual(plan.kind, kind, query)
+        if value is not None:
+            self.assertEqual(plan.value, value)
+
+    def test_uuids(self):
+        self.assertKind('0F8FAD5B-D9CB-469F-A165-70867728950E', 'uuid', '0f8fad5bd9cb469fa16570867728950e')
+        self.assertKind('0f8fad5bd9cb469fa16570867728950e', 'uuid')
+        self.assertKind('#0f8fad5b', 'uuid_prefix', '0f8fad5b')
+        self.assertKind('0f8fad5b-d9cb-4', 'uuid_prefix', '0f8fad5bd9cb4')
+        # Too short, dashes out of place, or digits alone
+        self.assertKind('0f8fad5', 'text')
+        self.assertKind('0f8f-ad5bd9', 'text')
+        self.assertKind('20240917', 'text')
+
+    def test_identifiers_and_emails(self):
+        self.assertKind('ORD-2024', 'order_number')
+        self.assertKind('inv-20240101-7', 'invoice_number')
+        self.assertKind('BATCH-MILK-1', 'batch_number')
+        self.assertKind('Buyer@Example.com', 'email')
+        self.assertKind('fresh milk', 'text')
+        self.assertKind('ORD 2024', 'text')
+
+    @override_settings(SEARCH_QUERY_PATTERNS={'order_number': r'SO\d+'})
+    def test_patterns_are_configurable(self):
+        self.assertKind('so1234', 'order_number')
+        self.assertKind('ORD-2024', 'text')
+
+    def test_uuid_prefix_is_a_range(self):
+        condition = QueryPlan('uuid_prefix', '0f8fad5b').condition('pk')
+        low, high = dict(condition.children)['pk__range']
+
+        self.assertEqual(str(low), '0f8fad5b-0000-0000-0000-000000000000')
+        self.assertEqual(str(high), '0f8fad5b-ffff-ffff-ffff-ffffffffffff')
+
+
+class SearchRoutingTests(DashboardDataMixin, TestCase):
+    def setUp(self):
+        search_metrics.clear()
+        self.seller = self.create_user('admin', 'seller@example.com')
+        self.item = self.create_item('BATCH-MILK-1', '10')
+        self.order = self.create_order('ORD-20240917')
+        self.order.customer_email = 'buyer@example.com'
+        self.order.save()
+        self.sale = Sale.objects.create(
+            id=uuid.UUID('0f8fad5b-d9cb-469f-a165-70867728950e'),
+            order=self.order,
+            invoice_number='INV-20240917-1',
+            sale_date=timezone.now(),
+            total_amount=Decimal('10.00'),
+            seller=self.seller
+        )
+
+    def tearDown(self):
+        search_metrics.clear()
+
+    def search(self, query):
+        return {group['type']: group['items'] for group in SearchService.search(query)}
+
+    def paths(self):
+        return {row['path']: row['searches'] for row in DashboardRepository.get_search_metrics()}
+
+    def test_identifiers_are_looked_up(self):
+        results = self.search('ord-2024')
+        self.assertEqual(results['Orders'][0]['id'], str(self.order.id))
+        self.assertEqual(results['Orders'][0]['match'], 'prefix')
+        self.assertEqual(results['Sales'][0]['highlight'], 'ORD-20240917')
+        self.assertNotIn('Inventory', results)
+
+        self.assertEqual(self.search('INV-20240917')['Sales'][0]['id'], str(self.sale.id))
+        self.assertEqual(self.search('batch-milk')['Inventory'][0]['id'], str(self.item.id))
+
+        results = self.search('Buyer@Example.com')
+        self.assertEqual(results['Orders'][0]['match'], 'exact')
+        self.assertEqual(list(results), ['Orders'])
+        self.assertEqual(self.search('seller@example.com')['Sales'][0]['id'], str(self.sale.id))
+
+    def test_ids_are_looked_up_by_primary_key(self):
+        results = self.search(str(self.order.id))
+        self.assertEqual(list(results), ['Orders'])
+        self.assertEqual(results['Orders'][0]['highlight'], str(self.order.id))
+
+        results = self.search('#0f8fad5b')
+        self.assertEqual(results['Sales'][0]['id'], str(self.sale.id))
+
+    def test_lookups_skip_full_text_search(self):
+        with mock.patch.object(SearchService, 'text_search') as text_search, \
+                CaptureQueriesContext(connection) as queries:
+            self.search('ORD-20240917')
+
+        text_search.assert_not_called()
+        # Orders and sales, inventory having no order numbers, then their documents
+        self.assertEqual(len(queries), 3)
+
+    def test_paths_are_measured(self):
+        self.search('ORD-20240917')
+        self.search('ORD-2099')
+        self.search('milk')
+        self.search('milk')
+
+        self.assertEqual(self.paths(), {
+            'order_number': 1,
+            'order_number:fallback': 1,
+            'text': 2
+        })
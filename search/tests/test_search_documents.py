@@ -0,0 +1,137 @@
+from decimal import Decimal
+from io import StringIO
+from unittest import mock
+from django.core.management import call_command
+from django.db import DatabaseError, connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from dashboard.tests.test_metric_batch import DashboardDataMixin
+from orders.models import Order
+from sales.models import Sale
+from search.backends import get_search_backend
+from search.models import SearchDocument
+from search.services.search_service import SearchService
+from users.models import User, UserRole
+
+
+class SearchDocumentTests(DashboardDataMixin, TestCase):
+    def setUp(self):
+        self.seller = self.create_user('admin', 'seller@example.com')
+        self.item = self.create_item('BATCH-VALLEY-1', '10')
+        self.item.name = 'Valley Butter'
+        self.item.save()
+        self.order = self.create_order('ORD-0042')
+        self.order.customer_name = 'Valley Dairy'
+        self.order.save()
+        self.sale = Sale.objects.create(
+            order=self.order,
+            invoice_number='INV-7',
+            sale_date=timezone.now(),
+            total_amount=Decimal('10.00'),
+            seller=self.seller
+        )
+
+    def document(self, instance):
+        return SearchDocument.objects.get(object_id=instance.pk)
+
+    def search(self, query, user=None):
+        return {group['type']: group['items'] for group in SearchService.search(query, user=user)}
+
+    def user_with(self, email, **permissions):
+        role = UserRole.objects.create(name=email.split('@')[0], permissions=permissions)
+        return User.objects.create(email=email, first_name='Test', last_name='User', role=role)
+
+    def test_documents_follow_writes(self):
+        document = self.document(self.sale)
+        self.assertEqual(document.entity, 'sale')
+        self.assertEqual(document.subtitle, 'Valley Dairy')
+        self.assertEqual(document.permission, 'can_view_sales')
+        self.assertEqual(document.metadata['seller'], 'seller@example.com')
+
+        self.order.customer_name = 'Hilltop Creamery'
+        self.order.save()
+        self.assertEqual(self.document(self.sale).subtitle, 'Hilltop Creamery')
+
+        self.sale.delete()
+        self.assertFalse(SearchDocument.objects.filter(object_id=self.sale.pk).exists())
+
+    def test_unrelated_user_updates_skip_reindexing(self):
+        self.seller.last_login = timezone.now()
+        with CaptureQueriesContext(connection) as queries:
+            self.seller.save(update_fields=['last_login'])
+
+        self.assertEqual(len(queries), 1)
+
+        self.seller.email = 'dairy@example.com'
+        self.seller.save(update_fields=['email'])
+        self.assertEqual(self.document(self.sale).metadata['seller'], 'dairy@example.com')
+
+    def test_one_query_ranks_every_type(self):
+        with CaptureQueriesContext(connection) as queries:
+            results = SearchService.search('valley')
+
+        self.assertEqual(len(queries), 1)
+        self.assertEqual([group['type'] for group in results], ['Inventory', 'Orders', 'Sales'])
+        self.assertEqual(results[0]['items'][0]['metadata']['batch_number'], 'BATCH-VALLEY-1')
+        self.assertIn('<mark>Valley</mark>', results[1]['items'][0]['highlight'])
+
+    def test_highlights_are_escaped(self):
+        self.order.customer_name = 'Valley <script>alert(1)</script>'
+        self.order.save()
+
+        highlight = self.search('valley')['Orders'][0]['highlight']
+        self.assertIn('<mark>Valley</mark>', highlight)
+        self.assertNotIn('<script>', highlight)
+        self.assertIn('&lt;', highlight)
+
+        self.order.order_number = 'ORD-<b>'
+        self.order.save()
+        self.assertEqual(self.search('ORD-')['Orders'][0]['highlight'], 'ORD-&lt;b&gt;')
+
+    def test_results_per_type_are_limited(self):
+        for number in range(3):
+            order = self.create_order(f'ORD-10{number}')
+            order.customer_name = 'Valley Farm'
+            order.save()
+
+        results = self.search('valley')
+        self.assertEqual(len(results['Orders']), 4)
+        self.assertEqual(len(SearchService.search('valley', limit=2)[1]['items']), 2)
+
+    def test_results_are_limited_to_permitted_roles(self):
+        sales_rep = self.user_with('rep@example.com', can_view_sales=True, can_view_orders=True)
+        self.assertEqual(list(self.search('valley', sales_rep)), ['Orders', 'Sales'])
+        self.assertEqual(list(self.search('ORD-0042', sales_rep)), ['Orders', 'Sales'])
+
+        guest = self.user_with('guest@example.com')
+        self.assertEqual(self.search('valley', guest), {})
+        self.assertEqual(list(self.search('valley', self.seller)), ['Inventory', 'Orders', 'Sales'])
+
+    def test_failed_indexing_is_rolled_back(self):
+        backend = type(get_search_backend())
+        with mock.patch.object(backend, 'write_text', side_effect=DatabaseError('locked')):
+            self.order.customer_name = 'Hilltop Creamery'
+            self.order.save()
+
+        # The document written before the failure was rolled back with it
+        self.assertIn('Valley Dairy', self.document(self.order).subtitle)
+        self.assertEqual(Order.objects.get(pk=self.order.pk).customer_name, 'Hilltop Creamery')
+
+    def test_rebuild_backfills_bulk_writes(self):
+        Order.objects.bulk_create([Order(
+            order_number='ORD-BULK-1',
+            customer_name='Meadow Farm',
+            customer_email='meadow@example.com',
+            customer_phone='123',
+            shipping_address='Address',
+            billing_address='Address',
+            subtotal=Decimal('10.00'),
+            total_amount=Decimal('10.00')
+        )])
+        self.assertNotIn('Orders', self.search('meadow'))
+
+        call_command('rebuild_search_index', index=['order'], stdout=StringIO())
+
+        self.assertEqual(self.search('meadow')['Orders'][0]['title'][:7], 'Order #')
+        self.assertEqual(SearchDocument.objects.filter(entity='order').count(), 2)
@@ -0,0 +1,116 @@
+from decimal import Decimal
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+from dashboard.tests.test_metric_batch import DashboardDataMixin
+from orders.models import Order
+from orders.views.filters import OrderFilter
+from sales.filters import SaleFilter
+from sales.models import Sale
+from search.backends import NgramTrigramBackend, get_trigram_backend
+from search.models import SearchTrigram
+from search.services.search_service import SearchService
+from search.trigram import trigrams, word_similarity
+
+
+class TrigramTests(SimpleTestCase):
+    def test_trigrams_match_pg_trgm(self):
+        self.assertEqual(trigrams('Cat'), {'  c', ' ca', 'cat', 'at '})
+        self.assertEqual(trigrams('ORD-42'), {'  o', ' or', 'ord', 'rd ', '  4', ' 42', '42 '})
+        self.assertEqual(trigrams('--'), set())
+
+    def test_word_similarity(self):
+        self.assertEqual(word_similarity('dairy', 'Valley Dairy'), 1.0)
+        self.assertGreater(word_similarity('valey', 'Valley Dairy'), 0.5)
+        self.assertLess(word_similarity('cheese', 'Valley Dairy'), 0.2)
+
+
+class TrigramSearchTests(DashboardDataMixin, TestCase):
+    def setUp(self):
+        self.seller = self.create_user('admin', 'seller@example.com')
+        self.item = self.create_item('BATCH-7731-A', '10')
+        self.order = self.create_order('ORD-20240917')
+        self.order.customer_name = 'Valley Dairy'
+        self.order.save()
+        self.other = self.create_order('ORD-20230101')
+        self.other.customer_name = 'Hilltop Creamery'
+        self.other.save()
+        self.sale = Sale.objects.create(
+            order=self.order,
+            invoice_number='INV-1',
+            sale_date=timezone.now(),
+            total_amount=Decimal('10.00'),
+            seller=self.seller
+        )
+
+    def search(self, query):
+        return {group['type']: group['items'] for group in SearchService.search(query)}
+
+    def test_backend_follows_the_database(self):
+        self.assertIsInstance(get_trigram_backend(), NgramTrigramBackend)
+
+    def test_misspelled_names_match_fuzzily(self):
+        results = self.search('Valey Diary')
+
+        order = results['Orders'][0]
+        self.assertEqual(order['id'], str(self.order.id))
+        self.assertEqual(order['match'], 'fuzzy')
+        self.assertEqual(order['highlight'], 'Valley Dairy')
+        self.assertGreaterEqual(order['similarity'], 0.5)
+        self.assertEqual(results['Sales'][0]['id'], str(self.sale.id))
+        self.assertEqual(len(results['Orders']), 1)
+
+    def test_full_text_matches_come_first(self):
+        orders = self.search('Valley')['Orders']
+
+        self.assertEqual(orders[0]['match'], 'full_text')
+        self.assertIsNone(orders[0]['similarity'])
+        self.assertEqual(len(orders), 1)
+
+    def test_identifier_fragments_are_ranked(self):
+        matches = list(get_trigram_backend().match(Order.objects.all(), 'order_number', '0917'))
+
+        # 3 of the 5 trigrams of '0917'; the word boundary of ' 09' is missing
+        self.assertEqual(matches, [self.order])
+        self.assertAlmostEqual(matches[0].similarity, 0.6)
+
+        items = self.search('731')['Inventory']
+        self.assertEqual(items[0]['id'], str(self.item.id))
+        self.assertEqual(items[0]['match'], 'fuzzy')
+
+    def test_threshold_is_tunable(self):
+        # 'ORD-2024' shares 8 of its 9 trigrams with one order and 7 with the other
+        orders = get_trigram_backend().match(Order.objects.all(), 'order_number', 'ORD-2024')
+        self.assertEqual(list(orders), [self.order, self.other])
+
+        with override_settings(SEARCH_TRIGRAM_THRESHOLD=0.85):
+            orders = get_trigram_backend().match(Order.objects.all(), 'order_number', 'ORD-2024')
+            self.assertEqual(list(orders), [self.order])
+
+    def test_short_queries_match_substrings(self):
+        orders = get_trigram_backend().match(Order.objects.all(), 'customer_name', 'cr')
+
+        self.assertEqual(list(orders), [self.other])
+
+    def test_filters_rank_by_similarity(self):
+        orders = OrderFilter({'customer_name': 'creamery hilltp'}, queryset=Order.objects.all()).qs
+        self.assertEqual(list(orders), [self.other])
+        self.assertGreater(orders[0].customer_name_similarity, 0.5)
+
+        orders = OrderFilter({'order_number': 'ORD-2024', 'similarity': '0.85'}, queryset=Order.objects.all()).qs
+        self.assertEqual(list(orders), [self.order])
+
+        sales = SaleFilter({'customer_name': 'valey'}, queryset=Sale.objects.all()).qs
+        self.assertEqual(list(sales), [self.sale])
+        self.assertFalse(SaleFilter({'order_number': '0101'}, queryset=Sale.objects.all()).qs.exists())
+
+    def test_trigrams_follow_writes(self):
+        grams = SearchTrigram.objects.filter(object_id=self.other.id, field='customer_name')
+        self.assertEqual(set(grams.values_list('gram', flat=True)), trigrams('Hilltop Creamery'))
+
+        self.other.customer_name = 'Meadow Farm'
+        self.other.save()
+        self.assertIn('Orders', self.search('medow'))
+        self.assertEqual(set(grams.values_list('gram', flat=True)), trigrams('Meadow Farm'))
+
+        self.other.delete()
+        self.assertFalse(SearchTrigram.objects.filter(object_id=self.other.id).exists())
@@ -0,0 +1,26 @@
+import re
+
+# pg_trgm only keeps alphanumeric characters; anything else separates words
+WORD_RE = re.compile(r'[^\W_]+', re.UNICODE)
+
+
+def trigrams(text):
+    """
+    Trigrams of a text as pg_trgm extracts them.
+
+    Words are lowercased and padded with two spaces in front and one
+    behind, so 'cat' gives '  c', ' ca', 'cat' and 'at '.
+    """
+    grams = set()
+    for word in WORD_RE.findall((text or '').lower()):
+        padded = f'  {word} '
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def word_similarity(query, text):
+    """Share of the query's trigrams found in the text, from 0 to 1"""
+    query_grams = trigrams(query)
+    if not query_grams:
+        return 0.0
+    return len(query_grams & trigrams(text)) / len(query_grams)
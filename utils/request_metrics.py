@@ -0,0 +1,247 @@
+import bisect
+import time
+from collections import defaultdict
+from threading import Lock
+from django.conf import settings
+from utils.setup_logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Upper bounds of the latency buckets in milliseconds; the last bucket is
+# open ended
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+OVERFLOW_BUCKET = len(LATENCY_BUCKETS_MS)
+
+def _minute(timestamp):
+    return int(timestamp // 60)
+
+class LocalMetricsStore:
+    """In-process store for development and tests; not shared across workers"""
+
+    def __init__(self):
+        self._minutes = defaultdict(lambda: defaultdict(int))
+        self._lock = Lock()
+
+    def write(self, minutes, retention_minutes):
+        with self._lock:
+            for minute, fields in minutes.items():
+                target = self._minutes[minute]
+                for field, value in fields.items():
+                    target[field] += value
+            oldest = max(self._minutes, default=0) - retention_minutes
+            for minute in [m for m in self._minutes if m < oldest]:
+                del self._minutes[minute]
+
+    def read(self, minutes):
+        with self._lock:
+            return [dict(self._minutes.get(minute, {})) for minute in minutes]
+
+    def clear(self):
+        with self._lock:
+            self._minutes.clear()
+
+class RedisMetricsStore:
+    """Per-minute Redis hashes shared by every worker"""
+    KEY_PREFIX = 'request_metrics'
+
+    def __init__(self, url, key_prefix=None):
+        self.url = url
+        self.key_prefix = key_prefix or self.KEY_PREFIX
+        self._client = None
+
+    @property
+    def client(self):
+        if self._client is None:
+            import redis
+            self._client = redis.Redis.from_url(self.url)
+        return self._client
+
+    def _key(self, minute):
+        return f"{self.key_prefix}:{minute}"
+
+    def write(self, minutes, retention_minutes):
+        pipe = self.client.pipeline(transaction=False)
+        for minute, fields in minutes.items():
+            key = self._key(minute)
+            for field, value in fields.items():
+                pipe.hincrby(key, field, value)
+            pipe.expire(key, retention_minutes * 60)
+        pipe.execute()
+
+    def read(self, minutes):
+        pipe = self.client.pipeline(transaction=False)
+        for minute in minutes:
+            pipe.hgetall(self._key(minute))
+        return [
+            {field.decode(): int(value) for field, value in row.items()}
+            for row in pipe.execute()
+        ]
+
+    def clear(self):
+        keys = list(self.client.scan_iter(f"{self.key_prefix}:*"))
+        if keys:
+            self.client.delete(*keys)
+
+class RequestMetrics:
+    """
+    Per-route latency histograms and status counters.
+
+    Requests are recorded into in-memory per-minute counters, which are
+    flushed to the shared store at most every `flush_interval` seconds.
+    Reads merge the per-minute rows of a sliding window, so percentiles are
+    computed from bucket counts summed across all workers. Other timings
+    kept the same way, such as search paths, use their own `key_prefix`.
+    """
+
+    def __init__(self, store=None, key_prefix=None):
+        self._store = store
+        self.key_prefix = key_prefix
+        self._pending = defaultdict(lambda: defaultdict(int))
+        self._lock = Lock()
+        self._last_flush = time.monotonic()
+
+    @property
+    def store(self):
+        if self._store is None:
+            if getattr(settings, 'REQUEST_METRICS_BACKEND', 'local') == 'redis':
+                self._store = RedisMetricsStore(settings.REQUEST_METRICS_REDIS_URL, self.key_prefix)
+            else:
+                self._store = LocalMetricsStore()
+        return self._store
+
+    @property
+    def flush_interval(self):
+        return getattr(settings, 'REQUEST_METRICS_FLUSH_INTERVAL', 10)
+
+    @property
+    def retention_minutes(self):
+        return getattr(settings, 'REQUEST_METRICS_RETENTION_MINUTES', 24 * 60)
+
+    def record(self, route, duration_ms, status_code, exception=False):
+        """Record one request; flushes when the interval has elapsed"""
+        bucket = bisect.bisect_left(LATENCY_BUCKETS_MS, duration_ms)
+        with self._lock:
+            fields = self._pending[_minute(time.time())]
+            fields[f"{route}|count"] += 1
+            fields[f"{route}|ms"] += int(round(duration_ms))
+            fields[f"{route}|b{bucket}"] += 1
+            fields[f"{route}|s{status_code // 100}xx"] += 1
+            if exception:
+                fields[f"{route}|exc"] += 1
+            due = time.monotonic() - self._last_flush >= self.flush_interval
+
+        if due:
+            self.flush()
+
+    def flush(self):
+        """Write pending counters to the shared store"""
+        with self._lock:
+            pending, self._pending = self._pending, defaultdict(lambda: defaultdict(int))
+            self._last_flush = time.monotonic()
+        if not pending:
+            return
+        try:
+            self.store.write(pending, self.retention_minutes)
+        except Exception as e:
+            # Metrics are best effort; never fail a request over them
+            logger.error(f"Error flushing request metrics: {str(e)}")
+
+    def get_window(self, minutes):
+        """Merge per-route counters for the last `minutes` minutes"""
+        self.flush()
+        current = _minute(time.time())
+        rows = self.store.read(range(current - minutes + 1, current + 1))
+
+        routes = defaultdict(lambda: {
+            'count': 0,
+            'duration_ms': 0,
+            'exceptions': 0,
+            'buckets': [0] * (OVERFLOW_BUCKET + 1),
+            'statuses': defaultdict(int)
+        })
+        for row in rows:
+            for field, value in row.items():
+                route, _, name = field.rpartition('|')
+                stats = routes[route]
+                if name == 'count':
+                    stats['count'] += value
+                elif name == 'ms':
+                    stats['duration_ms'] += value
+                elif name == 'exc':
+                    stats['exceptions'] += value
+                elif name.startswith('b'):
+                    stats['buckets'][int(name[1:])] += value
+                elif name.startswith('s'):
+                    stats['statuses'][name[1:]] += value
+        return routes
+
+    def summarize(self, minutes):
+        """Overall and per-route latency percentiles, throughput and errors"""
+        routes = self.get_window(minutes)
+        overall = {
+            'count': 0,
+            'duration_ms': 0,
+            'exceptions': 0,
+            'buckets': [0] * (OVERFLOW_BUCKET + 1),
+            'statuses': defaultdict(int)
+        }
+        for stats in routes.values():
+            overall['count'] += stats['count']
+            overall['duration_ms'] += stats['duration_ms']
+            overall['exceptions'] += stats['exceptions']
+            overall['buckets'] = [
+                a + b for a, b in zip(overall['buckets'], stats['buckets'])
+            ]
+            for status_class, value in stats['statuses'].items():
+                overall['statuses'][status_class] += value
+
+        return {
+            'window_minutes': minutes,
+            **self._describe(overall, minutes),
+            'routes': {
+                route: self._describe(stats, minutes)
+                for route, stats in routes.items()
+            }
+        }
+
+    @staticmethod
+    def percentile(buckets, quantile):
+        """Estimate a percentile by interpolating inside the matching bucket"""
+        total = sum(buckets)
+        if not total:
+            return None
+        rank = quantile * total
+        cumulative = 0
+        for index, count in enumerate(buckets):
+            if count and cumulative + count >= rank:
+                lower = LATENCY_BUCKETS_MS[index - 1] if index else 0
+                if index == OVERFLOW_BUCKET:
+                    return float(lower)
+                upper = LATENCY_BUCKETS_MS[index]
+                return round(lower + (upper - lower) * (rank - cumulative) / count, 1)
+            cumulative += count
+        return float(LATENCY_BUCKETS_MS[-1])
+
+    @classmethod
+    def _describe(cls, stats, minutes):
+        count = stats['count']
+        statuses = dict(stats['statuses'])
+        return {
+            'requests': count,
+            'throughput_per_minute': round(count / minutes, 2),
+            'average_ms': round(stats['duration_ms'] / count, 1) if count else None,
+            'p50_ms': cls.percentile(stats['buckets'], 0.50),
+            'p95_ms': cls.percentile(stats['buckets'], 0.95),
+            'p99_ms': cls.percentile(stats['buckets'], 0.99),
+            'status_classes': statuses,
+            'exceptions': stats['exceptions'],
+            'client_error_rate': round(statuses.get('4xx', 0) / count, 4) if count else 0,
+            'server_error_rate': round(statuses.get('5xx', 0) / count, 4) if count else 0
+        }
+
+    def clear(self):
+        with self._lock:
+            self._pending = defaultdict(lambda: defaultdict(int))
+        self.store.clear()
+
+request_metrics = RequestMetrics()